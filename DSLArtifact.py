@@ -0,0 +1,98 @@
+import os
+import sys
+import marshal
+from array import array
+import DSLAst as ast
+
+# Formato de un artefacto .dslc:
+#   ARTIFACT_MAGIC | versión (2 bytes, little endian) | AST serializado con marshal
+# Cada nodo se guarda como una tupla (clase, línea, campo1, campo2, ...); los
+# literales nunca son tuplas, así que al leer toda tupla es un nodo. Los
+# array('d') de los literales numéricos se guardan como bytes little endian.
+ARTIFACT_MAGIC = b'DSLC'
+ARTIFACT_VERSION = 7
+ARTIFACT_EXTENSION = '.dslc'
+# Versión fija de marshal, estable entre versiones de Python 3
+MARSHAL_VERSION = 4
+
+def default_cache_directory():
+    """Directorio de las cachés en disco (DSL_CACHE_DIR o ~/.cache/dsl-deep-learning)"""
+    return os.environ.get("DSL_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "dsl-deep-learning")
+
+NODE_TYPES = {cls.__name__: cls for cls in ast.Node.__subclasses__()}
+
+def encode_node(node):
+    """Convierte un nodo del AST en tuplas, listas y literales"""
+    return (node.__class__.__name__, node.line) + tuple(
+        _encode_value(getattr(node, field)) for field in node.fields)
+
+def _encode_value(value):
+    """Codifica el valor de un campo"""
+    if isinstance(value, ast.Node):
+        return encode_node(value)
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    if isinstance(value, array):
+        return _little_endian(value).tobytes()
+    return value
+
+def _little_endian(values):
+    """Convierte values entre el orden nativo y little endian (es simétrica)"""
+    if sys.byteorder == 'little':
+        return values
+    values = array(values.typecode, values)
+    values.byteswap()
+    return values
+
+def decode_node(data):
+    """Reconstruye un nodo del AST a partir de encode_node()"""
+    name, line, *values = data
+    node_type = NODE_TYPES.get(name)
+    if node_type is None:
+        raise ValueError(f"Artefacto inválido: tipo de nodo desconocido '{name}'")
+    return node_type(*[_decode_value(value) for value in values], line=line)
+
+def _decode_value(value):
+    """Decodifica el valor de un campo"""
+    if isinstance(value, tuple):
+        return decode_node(value)
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    if isinstance(value, bytes):
+        values = array('d')
+        values.frombytes(value)
+        return _little_endian(values)
+    return value
+
+def dump_program(program):
+    """Serializa un ast.Program a los bytes de un artefacto"""
+    header = ARTIFACT_MAGIC + ARTIFACT_VERSION.to_bytes(2, 'little')
+    return header + marshal.dumps(encode_node(program), MARSHAL_VERSION)
+
+def load_program(data):
+    """Reconstruye el ast.Program de los bytes de un artefacto"""
+    if not data.startswith(ARTIFACT_MAGIC):
+        raise ValueError("El archivo no es un artefacto DSL compilado")
+    version = int.from_bytes(data[len(ARTIFACT_MAGIC):len(ARTIFACT_MAGIC) + 2], 'little')
+    if version != ARTIFACT_VERSION:
+        raise ValueError(f"Versión de artefacto {version} no soportada "
+                         f"(se esperaba {ARTIFACT_VERSION}); vuelve a compilar el script")
+    try:
+        encoded = marshal.loads(data[len(ARTIFACT_MAGIC) + 2:])
+    except (ValueError, EOFError, TypeError):
+        raise ValueError("Artefacto dañado") from None
+    program = decode_node(encoded)
+    if not isinstance(program, ast.Program):
+        raise ValueError("Artefacto inválido: no contiene un programa")
+    return program
+
+def write_artifact(program, filename):
+    """Escribe un ast.Program en un archivo .dslc"""
+    with open(filename, 'wb') as f:
+        f.write(dump_program(program))
+
+def read_artifact(filename):
+    """Lee el ast.Program de un archivo .dslc"""
+    with open(filename, 'rb') as f:
+        return load_program(f.read())
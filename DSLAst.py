@@ -0,0 +1,322 @@
+from array import array
+from DSLVector import DSLVector, DSLMatrix
+
+class Node:
+    """Nodo base del AST compacto del DSL"""
+    
+    __slots__ = ('line',)
+    fields = ()
+    
+    def __repr__(self):
+        args = ', '.join(repr(getattr(self, name)) for name in self.fields)
+        return f"{type(self).__name__}({args})"
+
+# === PROGRAMA Y STATEMENTS ===
+class Program(Node):
+    """Programa completo: lista de statements"""
+    
+    __slots__ = ('body',)
+    fields = ('body',)
+    
+    def __init__(self, body, line=0):
+        self.body = body
+        self.line = line
+
+class Assign(Node):
+    """Asignación: name = value;"""
+    
+    __slots__ = ('name', 'value')
+    fields = ('name', 'value')
+    
+    def __init__(self, name, value, line=0):
+        self.name = name
+        self.value = value
+        self.line = line
+
+class ExprStatement(Node):
+    """Statement de expresión: expr;"""
+    
+    __slots__ = ('expr',)
+    fields = ('expr',)
+    
+    def __init__(self, expr, line=0):
+        self.expr = expr
+        self.line = line
+
+class If(Node):
+    """if condition then ... else ... fi"""
+    
+    __slots__ = ('condition', 'then_body', 'else_body')
+    fields = ('condition', 'then_body', 'else_body')
+    
+    def __init__(self, condition, then_body, else_body, line=0):
+        self.condition = condition
+        self.then_body = then_body
+        self.else_body = else_body
+        self.line = line
+
+class While(Node):
+    """while condition do ... done
+    
+    invariants lista los slots de las expresiones ast.Invariant y de los
+    ast.Append que pertenecen a este bucle: se descartan cada vez que el
+    bucle empieza y cuando termina.
+    """
+    
+    __slots__ = ('condition', 'body', 'invariants')
+    fields = ('condition', 'body', 'invariants')
+    
+    def __init__(self, condition, body, invariants=None, line=0):
+        self.condition = condition
+        self.body = body
+        self.invariants = invariants if invariants is not None else []
+        self.line = line
+
+class Append(Node):
+    """Acumulación dentro de un while: name = name + items;
+    
+    La marca DSLOptimizer cuando el bucle no lee name en ningún otro lugar.
+    slot guarda la lista que creó la última ejecución del statement: si name
+    todavía la tiene nadie más pudo obtenerla, así que items se agrega en su
+    lugar en lugar de copiar la lista entera.
+    """
+    
+    __slots__ = ('name', 'items', 'slot')
+    fields = ('name', 'items', 'slot')
+    
+    def __init__(self, name, items, slot, line=0):
+        self.name = name
+        self.items = items
+        self.slot = slot
+        self.line = line
+
+class VectorLoop(Node):
+    """while contado que DSLVectorizer ejecuta con operaciones sobre vectores.
+    
+    loop es el while original: counter avanza step por vuelta en su último
+    statement y los anteriores solo calculan números o acumulan listas. Si al
+    ejecutar algún valor no es el esperado los motores ejecutan loop.
+    """
+    
+    __slots__ = ('loop', 'counter', 'step')
+    fields = ('loop', 'counter', 'step')
+    
+    def __init__(self, loop, counter, step, line=0):
+        self.loop = loop
+        self.counter = counter
+        self.step = step
+        self.line = line
+
+class Plot(Node):
+    """plot/scatter/hist"""
+    
+    __slots__ = ('kind', 'args')
+    fields = ('kind', 'args')
+    
+    def __init__(self, kind, args, line=0):
+        self.kind = kind
+        self.args = args
+        self.line = line
+
+class FileOp(Node):
+    """readFile/writeFile"""
+    
+    __slots__ = ('kind', 'args')
+    fields = ('kind', 'args')
+    
+    def __init__(self, kind, args, line=0):
+        self.kind = kind
+        self.args = args
+        self.line = line
+
+# === EXPRESIONES ===
+class Number(Node):
+    """Literal numérico (ya convertido a float)"""
+    
+    __slots__ = ('value',)
+    fields = ('value',)
+    
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+class String(Node):
+    """Literal de texto (sin comillas)"""
+    
+    __slots__ = ('value',)
+    fields = ('value',)
+    
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+class Boolean(Node):
+    """Literal true/false"""
+    
+    __slots__ = ('value',)
+    fields = ('value',)
+    
+    def __init__(self, value, line=0):
+        self.value = value
+        self.line = line
+
+class Variable(Node):
+    """Referencia a una variable"""
+    
+    __slots__ = ('name',)
+    fields = ('name',)
+    
+    def __init__(self, name, line=0):
+        self.name = name
+        self.line = line
+
+class BinaryOp(Node):
+    """Operación binaria aritmética o de comparación"""
+    
+    __slots__ = ('op', 'left', 'right')
+    fields = ('op', 'left', 'right')
+    
+    def __init__(self, op, left, right, line=0):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+
+class SpecializedOp(Node):
+    """Operación binaria con tipos de operandos conocidos (la genera DSLTypes).
+    
+    kind indica la variante: 'number' (dos números), 'text' (concatenación
+    con un texto), 'concat' (dos listas) o 'repeat' (lista o texto por un
+    número). Los motores la ejecutan sin verificar ni convertir operandos.
+    """
+    
+    __slots__ = ('op', 'kind', 'left', 'right')
+    fields = ('op', 'kind', 'left', 'right')
+    
+    def __init__(self, op, kind, left, right, line=0):
+        self.op = op
+        self.kind = kind
+        self.left = left
+        self.right = right
+        self.line = line
+
+class Not(Node):
+    """Negación lógica: not operand"""
+    
+    __slots__ = ('operand',)
+    fields = ('operand',)
+    
+    def __init__(self, operand, line=0):
+        self.operand = operand
+        self.line = line
+
+class Logical(Node):
+    """Operación lógica and/or"""
+    
+    __slots__ = ('op', 'left', 'right')
+    fields = ('op', 'left', 'right')
+    
+    def __init__(self, op, left, right, line=0):
+        self.op = op
+        self.left = left
+        self.right = right
+        self.line = line
+
+class ListLiteral(Node):
+    """Literal de lista: [e1, e2, ...]"""
+    
+    __slots__ = ('items',)
+    fields = ('items',)
+    
+    def __init__(self, items, line=0):
+        self.items = items
+        self.line = line
+
+class MatrixLiteral(Node):
+    """Literal de matriz: [[...], [...]] (cada fila es un ListLiteral o NumericLiteral)"""
+    
+    __slots__ = ('rows',)
+    fields = ('rows',)
+    
+    def __init__(self, rows, line=0):
+        self.rows = rows
+        self.line = line
+
+class NumericLiteral(Node):
+    """Literal de lista o matriz formado solo por números.
+    
+    Los valores se guardan empaquetados en un array('d'), fila por fila; rows
+    es None para una lista y la cantidad de filas para una matriz. values
+    puede ser cualquier iterable de floats o los bytes de un array('d').
+    """
+    
+    __slots__ = ('values', 'rows', '_value')
+    fields = ('values', 'rows')
+    
+    def __init__(self, values, rows=None, line=0):
+        if isinstance(values, bytes):
+            packed = array('d')
+            packed.frombytes(values)
+            values = packed
+        elif not isinstance(values, array):
+            values = array('d', values)
+        self.values = values
+        self.rows = rows
+        self.line = line
+        self._value = None
+    
+    def materialize(self):
+        """Valor del runtime (DSLVector o DSLMatrix), construido una sola vez.
+        
+        Los motores comparten este mismo objeto entre evaluaciones: ninguna
+        operación del runtime modifica sus argumentos.
+        """
+        if self._value is None:
+            data = DSLVector(self.values)
+            if self.rows is None:
+                self._value = data
+            else:
+                self._value = DSLMatrix(data, self.rows, len(data) // self.rows)
+        return self._value
+
+class Invariant(Node):
+    """Expresión pura que no cambia durante un while (la marca DSLOptimizer).
+    
+    Se evalúa la primera vez que se necesita en cada ejecución del bucle y
+    las iteraciones siguientes reutilizan el valor guardado en slot. Si la
+    evaluación falla no se guarda nada, así que el error ocurre en el mismo
+    punto que sin la marca.
+    """
+    
+    __slots__ = ('expr', 'slot')
+    fields = ('expr', 'slot')
+    
+    def __init__(self, expr, slot, line=0):
+        self.expr = expr
+        self.slot = slot
+        self.line = line
+
+class Call(Node):
+    """Llamada a una función integrada (matrices, trigonometría, ML)"""
+    
+    __slots__ = ('func', 'args')
+    fields = ('func', 'args')
+    
+    def __init__(self, func, args, line=0):
+        self.func = func
+        self.args = args
+        self.line = line
+
+class MatrixExpression(Node):
+    """Expresión de transpose/matmul/matsum/matsub anidadas que se calcula
+    junta (ver DSLMatrixGraph). ops son las operaciones en notación postfija
+    y '$' toma el siguiente de args: matsum(matmul(A, B), C) es
+    ['$', '$', 'matmul', '$', 'matsum'] con args [A, B, C]"""
+    
+    __slots__ = ('ops', 'args')
+    fields = ('ops', 'args')
+    
+    def __init__(self, ops, args, line=0):
+        self.ops = ops
+        self.args = args
+        self.line = line
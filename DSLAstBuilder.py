@@ -0,0 +1,178 @@
+from antlr4.tree.Tree import TerminalNode
+from DeepLearningDSLParser import DeepLearningDSLParser
+from DeepLearningDSLVisitor import DeepLearningDSLVisitor
+import DSLAst as ast
+from DSLMatrixGraph import fuse
+
+def numeric_items(ctx):
+    """Textos de los elementos de un listLiteral si todos son NUMBER, o None.
+    
+    Lee los tokens directamente del árbol, sin visitar cada expresión.
+    """
+    texts = []
+    for child in ctx.children or ():
+        if not isinstance(child, DeepLearningDSLParser.ExpressionContext):
+            continue
+        if len(child.children) != 1:
+            return None
+        token = getattr(child.children[0], 'symbol', None)
+        if token is None or token.type != DeepLearningDSLParser.NUMBER:
+            return None
+        texts.append(token.text)
+    return texts
+
+class DSLAstBuilder(DeepLearningDSLVisitor):
+    """Reduce el árbol de ANTLR al AST compacto de DSLAst.
+    
+    Operadores, literales y nombres de funciones se resuelven una sola vez
+    aquí, de modo que los motores de ejecución no vuelven a recorrer los
+    hijos de los ParserRuleContext.
+    """
+    
+    # === PROGRAMA PRINCIPAL ===
+    def visitProgram(self, ctx):
+        """Reduce el programa a un ast.Program"""
+        return ast.Program(self._statements(ctx.statement()), ctx.start.line)
+    
+    def _statements(self, statements):
+        """Reduce una lista de statements, descartando los vacíos (';')"""
+        body = []
+        for statement in statements:
+            node = self.visit(statement)
+            if node is not None:
+                body.append(node)
+        return body
+    
+    def _expressions(self, ctx):
+        """Reduce todas las expresiones hijas de un contexto"""
+        return [self.visit(expr) for expr in ctx.getTypedRuleContexts(DeepLearningDSLParser.ExpressionContext)]
+    
+    # === STATEMENTS ===
+    def visitStatement(self, ctx):
+        """Reduce un statement genérico (None para ';')"""
+        # Solo un ';' suelto es un TerminalNode (evita getText() de todo el subárbol)
+        if ctx.getChildCount() == 1 and isinstance(ctx.getChild(0), TerminalNode):
+            return None
+        return self.visit(ctx.getChild(0))
+    
+    def visitAssignment(self, ctx):
+        """Reduce una asignación"""
+        return ast.Assign(ctx.identifier().getText(), self.visit(ctx.expression()), ctx.start.line)
+    
+    def visitExpressionStatement(self, ctx):
+        """Reduce un statement de expresión"""
+        return ast.ExprStatement(self.visit(ctx.expression()), ctx.start.line)
+    
+    # === ESTRUCTURAS DE CONTROL ===
+    def visitControlStructure(self, ctx):
+        """Reduce if/while"""
+        return self.visit(ctx.getChild(0))
+    
+    def visitIfStatement(self, ctx):
+        """Reduce un if separando los bloques then y else"""
+        then_statements = []
+        else_statements = []
+        current = then_statements
+        for child in ctx.getChildren():
+            if isinstance(child, DeepLearningDSLParser.StatementContext):
+                current.append(child)
+            elif child.getText() == 'else':
+                current = else_statements
+        
+        return ast.If(self.visit(ctx.booleanExpression()),
+                      self._statements(then_statements),
+                      self._statements(else_statements),
+                      ctx.start.line)
+    
+    def visitWhileStatement(self, ctx):
+        """Reduce un while"""
+        return ast.While(self.visit(ctx.booleanExpression()),
+                         self._statements(ctx.statement()),
+                         [], ctx.start.line)
+    
+    # === EXPRESIONES ===
+    def visitExpression(self, ctx):
+        """Reduce una expresión a su nodo específico"""
+        line = ctx.start.line
+        
+        # Operaciones binarias
+        if ctx.op:
+            return ast.BinaryOp(ctx.op.text, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)), line)
+        
+        # Expresión entre paréntesis: no necesita nodo propio
+        if ctx.getChildCount() == 3:
+            return self.visit(ctx.expression(0))
+        
+        # Literales
+        if ctx.NUMBER():
+            return ast.Number(float(ctx.NUMBER().getText()), line)
+        if ctx.STRING():
+            return ast.String(ctx.STRING().getText()[1:-1], line)  # Remover comillas
+        if ctx.identifier():
+            return ast.Variable(ctx.identifier().getText(), line)
+        if ctx.TRUE():
+            return ast.Boolean(True, line)
+        if ctx.FALSE():
+            return ast.Boolean(False, line)
+        
+        # Literales compuestos y llamadas
+        return self.visit(ctx.getChild(0))
+    
+    def visitBooleanExpression(self, ctx):
+        """Reduce una expresión booleana; una comparación ya es una expresión
+        (ast.BinaryOp)"""
+        line = ctx.start.line
+        
+        if ctx.expression():
+            return self.visit(ctx.expression())
+        
+        if ctx.getChild(0).getText() == 'not':
+            return ast.Not(self.visit(ctx.booleanExpression(0)), line)
+        
+        return ast.Logical(ctx.getChild(1).getText(),
+                           self.visit(ctx.booleanExpression(0)),
+                           self.visit(ctx.booleanExpression(1)),
+                           line)
+    
+    def visitMatrixOperation(self, ctx):
+        """Reduce transpose/inverse/matmul/matsum/matsub/det/solve/density a
+        una llamada; las anidadas con un matmul se reúnen en un ast.MatrixExpression"""
+        return fuse(ast.Call(ctx.getChild(0).getText(), self._expressions(ctx), ctx.start.line))
+    
+    def visitMlOperation(self, ctx):
+        """Reduce linearRegression/mlpClassifier/kmeans a una llamada"""
+        return ast.Call(ctx.getChild(0).getText(), self._expressions(ctx), ctx.start.line)
+    
+    def visitTrigFunction(self, ctx):
+        """Reduce sin/cos/tan/sqrt/log/exp a una llamada"""
+        return ast.Call(ctx.getChild(0).getText(), self._expressions(ctx), ctx.start.line)
+    
+    def visitReadOperation(self, ctx):
+        """Reduce readFile usado como expresión a una llamada"""
+        return ast.Call('readFile', self._expressions(ctx), ctx.start.line)
+    
+    # === VISUALIZACIÓN Y ARCHIVOS ===
+    def visitPlotStatement(self, ctx):
+        """Reduce plot/scatter/hist"""
+        return ast.Plot(ctx.getChild(0).getText(), self._expressions(ctx), ctx.start.line)
+    
+    def visitFileOperation(self, ctx):
+        """Reduce readFile/writeFile"""
+        return ast.FileOp(ctx.getChild(0).getText(), self._expressions(ctx), ctx.start.line)
+    
+    # === LITERALES ===
+    def visitMatrixLiteral(self, ctx):
+        """Reduce un literal de matriz (empaquetado si es rectangular y numérico)"""
+        rows = ctx.listLiteral()
+        texts = [numeric_items(row) for row in rows]
+        if all(row is not None and len(row) == len(texts[0]) for row in texts):
+            values = [text for row in texts for text in row]
+            return ast.NumericLiteral(map(float, values), len(rows), ctx.start.line)
+        return ast.MatrixLiteral([self.visit(row) for row in rows], ctx.start.line)
+    
+    def visitListLiteral(self, ctx):
+        """Reduce un literal de lista (empaquetado si solo tiene números)"""
+        texts = numeric_items(ctx)
+        if texts is not None:
+            return ast.NumericLiteral(map(float, texts), None, ctx.start.line)
+        return ast.ListLiteral(self._expressions(ctx), ctx.start.line)
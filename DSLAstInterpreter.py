@@ -0,0 +1,198 @@
+import DSLAst as ast
+from DSLBudget import BudgetExceeded
+
+class DSLAstInterpreter:
+    """Ejecuta el AST compacto (DSLAst) sobre un DSLRuntime"""
+    
+    def __init__(self, runtime):
+        self.runtime = runtime
+        # Valores de las expresiones invariantes del while en curso y listas
+        # propias de los acumuladores (ast.Append): slot -> valor
+        self._invariants = {}
+        self._statement_handlers = {
+            ast.Assign: self._exec_assign,
+            ast.Append: self._exec_append,
+            ast.ExprStatement: self._exec_expr_statement,
+            ast.If: self._exec_if,
+            ast.While: self._exec_while,
+            ast.VectorLoop: self._exec_vector_loop,
+            ast.Plot: self._exec_plot,
+            ast.FileOp: self._exec_file_op,
+        }
+        self._expression_handlers = {
+            ast.Number: self._eval_literal,
+            ast.String: self._eval_literal,
+            ast.Boolean: self._eval_literal,
+            ast.Variable: self._eval_variable,
+            ast.BinaryOp: self._eval_binary_op,
+            ast.SpecializedOp: self._eval_specialized_op,
+            ast.Not: self._eval_not,
+            ast.Logical: self._eval_logical,
+            ast.ListLiteral: self._eval_list,
+            ast.MatrixLiteral: self._eval_matrix,
+            ast.NumericLiteral: self._eval_numeric,
+            ast.Call: self._eval_call,
+            ast.MatrixExpression: self._eval_matrix_expression,
+            ast.Invariant: self._eval_invariant,
+        }
+    
+    # === PROGRAMA PRINCIPAL ===
+    def execute(self, program):
+        """Ejecuta un ast.Program y retorna el resultado del último statement"""
+        return self._exec_block(program.body)
+    
+    def _exec_block(self, body):
+        """Ejecuta una lista de statements"""
+        handlers = self._statement_handlers
+        result = None
+        try:
+            for statement in body:
+                result = handlers[statement.__class__](statement)
+        except BudgetExceeded as error:
+            error.locate(statement.line)
+            raise
+        return result
+    
+    def evaluate(self, node):
+        """Evalúa una expresión"""
+        return self._expression_handlers[node.__class__](node)
+    
+    # === STATEMENTS ===
+    def _exec_assign(self, node):
+        """Ejecuta una asignación"""
+        return self.runtime._assign(node.name, self.evaluate(node.value))
+    
+    def _exec_append(self, node):
+        """Ejecuta una acumulación name = name + items (en su lugar si se puede)"""
+        runtime = self.runtime
+        current = runtime._lookup(node.name)
+        value = runtime._accumulate(current, self.evaluate(node.items), self._invariants.get(node.slot))
+        self._invariants[node.slot] = value
+        return runtime._assign(node.name, value)
+    
+    def _exec_expr_statement(self, node):
+        """Ejecuta un statement de expresión"""
+        result = self.evaluate(node.expr)
+        if result is not None:
+            print(f"📊 Resultado: {self.runtime._format_value(result)}")
+        return result
+    
+    def _exec_if(self, node):
+        """Ejecuta un if"""
+        if self.runtime._to_boolean(self.evaluate(node.condition)):
+            return self._exec_block(node.then_body)
+        return self._exec_block(node.else_body)
+    
+    def _exec_while(self, node):
+        """Ejecuta un while"""
+        to_boolean = self.runtime._to_boolean
+        budget = self.runtime.budget
+        # Cada vuelta cuesta una operación más una por statement del cuerpo
+        cost = len(node.body) + 1
+        invariants = self._invariants
+        result = None
+        iterations = 0
+        
+        # Cada ejecución del bucle vuelve a calcular sus invariantes
+        for slot in node.invariants:
+            invariants.pop(slot, None)
+        while to_boolean(self.evaluate(node.condition)):
+            budget.fuel -= cost
+            if budget.fuel < 0:
+                budget.check(node.line, iterations)
+            result = self._exec_block(node.body)
+            iterations += 1
+        for slot in node.invariants:
+            invariants.pop(slot, None)
+        
+        return result
+    
+    def _exec_vector_loop(self, node):
+        """Ejecuta un while contado por vectores, o normalmente si no se puede"""
+        if self.runtime._vector_loop(node):
+            return None
+        return self._exec_while(node.loop)
+    
+    def _exec_plot(self, node):
+        """Ejecuta plot/scatter/hist"""
+        try:
+            values = [self.evaluate(arg) for arg in node.args]
+        except BudgetExceeded:
+            raise
+        except Exception as e:
+            print(f"❌ Error al procesar expresiones: {str(e)}")
+            return None
+        self.runtime._plot(node.kind, *values)
+        return None
+    
+    def _exec_file_op(self, node):
+        """Ejecuta readFile/writeFile"""
+        values = [self.evaluate(arg) for arg in node.args]
+        if node.kind == 'readFile':
+            return self.runtime._read_file(*values)
+        self.runtime._write_file(*values)
+        return None
+    
+    # === EXPRESIONES ===
+    def _eval_literal(self, node):
+        """Retorna el valor de un literal"""
+        return node.value
+    
+    def _eval_variable(self, node):
+        """Obtiene el valor de una variable"""
+        return self.runtime._lookup(node.name)
+    
+    def _eval_binary_op(self, node):
+        """Evalúa una operación binaria"""
+        left = self.evaluate(node.left)
+        right = self.evaluate(node.right)
+        return self.runtime.operators[node.op](left, right)
+    
+    def _eval_specialized_op(self, node):
+        """Evalúa una operación binaria con tipos conocidos"""
+        left = self.evaluate(node.left)
+        right = self.evaluate(node.right)
+        return self.runtime.specialized[node.op, node.kind](left, right)
+    
+    def _eval_not(self, node):
+        """Evalúa una negación lógica"""
+        return not self.runtime._to_boolean(self.evaluate(node.operand))
+    
+    def _eval_logical(self, node):
+        """Evalúa and/or"""
+        # Ambos lados se evalúan siempre, igual que en DSLInterpreterVisitor
+        left = self.runtime._to_boolean(self.evaluate(node.left))
+        right = self.runtime._to_boolean(self.evaluate(node.right))
+        if node.op == 'and':
+            return left and right
+        return left or right
+    
+    def _eval_list(self, node):
+        """Evalúa un literal de lista (empaquetado si es de números)"""
+        return self.runtime._pack([self.evaluate(item) for item in node.items])
+    
+    def _eval_matrix(self, node):
+        """Evalúa un literal de matriz (empaquetado si es de números)"""
+        return self.runtime._pack([self.evaluate(row) for row in node.rows])
+    
+    def _eval_numeric(self, node):
+        """Evalúa un literal numérico empaquetado (se materializa una sola vez)"""
+        return node.materialize()
+    
+    def _eval_invariant(self, node):
+        """Evalúa una expresión invariante la primera vez y luego la reutiliza"""
+        try:
+            return self._invariants[node.slot]
+        except KeyError:
+            value = self._invariants[node.slot] = self.evaluate(node.expr)
+            return value
+    
+    def _eval_call(self, node):
+        """Evalúa una llamada a función integrada"""
+        args = [self.evaluate(arg) for arg in node.args]
+        return self.runtime.builtins[node.func](*args)
+    
+    def _eval_matrix_expression(self, node):
+        """Evalúa operaciones de matrices anidadas juntas"""
+        args = [self.evaluate(arg) for arg in node.args]
+        return self.runtime._matrix_expression(node.ops, *args)
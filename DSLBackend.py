@@ -0,0 +1,538 @@
+import operator
+import weakref
+from collections import Counter, OrderedDict
+from itertools import accumulate, chain, repeat
+from DSLVector import DSLVector, DSLMatrix, DSLSparseMatrix, index_array
+
+# Nombres que acepta --backend: auto usa NumPy si está instalado
+BACKENDS = ('auto', 'python', 'numpy')
+# Columnas del operando derecho que el producto en Python puro transpone a
+# la vez: la copia transpuesta nunca ocupa más que TILE_COLUMNS columnas
+TILE_COLUMNS = 64
+# Error de inverse y solve con una matriz singular (un pivote exactamente 0)
+SINGULAR_MESSAGE = "La matriz no es invertible (determinante = 0)"
+# Memoria estimada máxima de las factorizaciones que guarda FactorizationCache
+FACTORIZATION_CACHE_BYTES = 64 * 2**20
+
+class PythonBackend:
+    """Operaciones de matrices empaquetadas (DSLMatrix) en Python puro.
+    
+    Cada backend recibe matrices ya validadas por el runtime (dimensiones
+    compatibles) y retorna una DSLMatrix nueva; nunca modifica sus
+    argumentos.
+    """
+    
+    name = 'python'
+    
+    def transpose(self, matrix):
+        """Transpuesta: cada columna es una porción con paso cols de los datos"""
+        data = DSLVector()
+        for j in range(matrix.cols):
+            data.extend(matrix.data[j::matrix.cols])
+        return DSLMatrix(data, matrix.cols, matrix.rows)
+    
+    def multiply(self, left, right, transpose_left=False, transpose_right=False, addend=None, mode='add'):
+        """Producto por bloques de TILE_COLUMNS columnas de right: se copian
+        las columnas del bloque (porciones con paso cols) y todas las filas de
+        left pasan por ellas. Cada elemento es sum(map(mul)) de una fila y una
+        columna, en el mismo orden que el triple bucle. Filas y columnas se
+        pasan a listas antes: recorrer un array crea un float por elemento
+        cada vez.
+        
+        transpose_left/transpose_right multiplican por la transpuesta de ese
+        operando sin construirla: las filas de left^T son porciones con paso
+        de left y las columnas de right^T son filas de right. Con addend (del
+        tamaño del resultado) retorna producto + addend, producto - addend
+        (mode 'sub') o addend - producto ('rsub') sin guardar el producto
+        aparte; los bits son los mismos que con las operaciones separadas"""
+        if transpose_left:
+            rows, n = left.cols, left.rows
+            row_at = lambda i: left.data[i::left.cols].tolist()
+        else:
+            rows, n = left.rows, left.cols
+            row_at = lambda i: left.data[i * n:(i + 1) * n].tolist()
+        if transpose_right:
+            cols = right.rows
+            column_at = lambda j: right.data[j * right.cols:(j + 1) * right.cols].tolist()
+        else:
+            cols = right.cols
+            column_at = lambda j: right.data[j::right.cols].tolist()
+        data = DSLVector([0.0]) * (rows * cols)
+        for start in range(0, cols, TILE_COLUMNS):
+            columns = [column_at(j) for j in range(start, min(start + TILE_COLUMNS, cols))]
+            width = len(columns)
+            offset = start
+            for i in range(rows):
+                row = row_at(i)
+                dots = [sum(map(operator.mul, row, column)) for column in columns]
+                if addend is not None:
+                    terms = addend.data[offset:offset + width]
+                    if mode == 'add':
+                        dots = map(operator.add, dots, terms)
+                    elif mode == 'sub':
+                        dots = map(operator.sub, dots, terms)
+                    else:
+                        dots = map(operator.sub, terms, dots)
+                data[offset:offset + width] = DSLVector(dots)
+                offset += cols
+        return DSLMatrix(data, rows, cols)
+    
+    def add(self, left, right):
+        """Suma elemento a elemento"""
+        return DSLMatrix(DSLVector(map(operator.add, left.data, right.data)), left.rows, left.cols)
+    
+    def subtract(self, left, right):
+        """Resta elemento a elemento"""
+        return DSLMatrix(DSLVector(map(operator.sub, left.data, right.data)), left.rows, left.cols)
+    
+    def lu(self, matrix):
+        """Factorización LU con pivoteo parcial de una matriz cuadrada (una
+        dispersa se factoriza densa: L y U no conservan los ceros)"""
+        if isinstance(matrix, DSLSparseMatrix):
+            matrix = matrix.to_dense()
+        return LUFactorization(matrix)
+    
+    # === MATRICES DISPERSAS ===
+    # Reciben al menos una DSLSparseMatrix. Solo recorren los valores
+    # distintos de 0 y los combinan en el mismo orden que las operaciones
+    # densas, así que dan los mismos resultados (salvo con infinitos o NaN
+    # en el operando denso, que el producto denso multiplica por 0).
+    def sparse_transpose(self, matrix):
+        """Transpuesta, también dispersa: los valores ordenados por columna
+        (sorted es estable, así que cada columna queda en orden de fila)"""
+        order = sorted(range(len(matrix.values)), key=matrix.indices.__getitem__)
+        counts = map(operator.sub, matrix.indptr[1:], matrix.indptr[:-1])
+        rows = list(chain.from_iterable(map(repeat, range(matrix.rows), counts)))
+        columns = Counter(matrix.indices)
+        indptr = index_array(accumulate((columns[j] for j in range(matrix.cols)), initial=0))
+        return DSLSparseMatrix(DSLVector(map(matrix.values.__getitem__, order)),
+                               index_array(map(rows.__getitem__, order)), indptr, matrix.cols, matrix.rows)
+    
+    def sparse_multiply(self, left, right):
+        """Producto: disperso por disperso da una matriz dispersa, con un
+        operando denso una DSLMatrix"""
+        if isinstance(left, DSLSparseMatrix):
+            if isinstance(right, DSLSparseMatrix):
+                return self._sparse_by_sparse(left, right)
+            return self._sparse_by_dense(left, right)
+        # D S = (S^T D^T)^T: suma en el mismo orden, recorriendo las filas de S^T
+        return self.transpose(self._sparse_by_dense(self.sparse_transpose(right), self.transpose(left)))
+    
+    def sparse_add(self, left, right):
+        """Suma: dispersa si ambos operandos lo son, si no una DSLMatrix"""
+        return self._sparse_combine(left, right, operator.add)
+    
+    def sparse_subtract(self, left, right):
+        """Resta: dispersa si ambos operandos lo son, si no una DSLMatrix"""
+        return self._sparse_combine(left, right, operator.sub)
+    
+    def _sparse_by_dense(self, sparse, dense):
+        """Producto disperso por denso: cada fila del resultado suma las
+        filas de dense que indican los valores de la fila de sparse,
+        multiplicadas por ellos"""
+        cols = dense.cols
+        data = DSLVector([0.0]) * (sparse.rows * cols)
+        for i in range(sparse.rows):
+            row = None
+            for p in range(sparse.indptr[i], sparse.indptr[i + 1]):
+                k = sparse.indices[p]
+                products = map(sparse.values[p].__mul__, dense.data[k * cols:(k + 1) * cols])
+                row = list(products) if row is None else list(map(operator.add, row, products))
+            if row is not None:
+                data[i * cols:(i + 1) * cols] = DSLVector(row)
+        return DSLMatrix(data, sparse.rows, cols)
+    
+    def _sparse_by_sparse(self, left, right):
+        """Producto de dos dispersas fila por fila (algoritmo de Gustavson):
+        la fila i acumula en un dict las filas de right que indica la fila i
+        de left"""
+        values, indices, indptr = DSLVector(), index_array(), index_array([0])
+        for i in range(left.rows):
+            row = {}
+            for p in range(left.indptr[i], left.indptr[i + 1]):
+                value = left.values[p]
+                k = left.indices[p]
+                for q in range(right.indptr[k], right.indptr[k + 1]):
+                    j = right.indices[q]
+                    product = value * right.values[q]
+                    row[j] = row[j] + product if j in row else product
+            _append_row(row, values, indices, indptr)
+        return DSLSparseMatrix(values, indices, indptr, left.rows, right.cols)
+    
+    def _sparse_combine(self, left, right, op):
+        """op elemento a elemento (suma o resta) con al menos un operando disperso"""
+        if isinstance(left, DSLSparseMatrix) and isinstance(right, DSLSparseMatrix):
+            values, indices, indptr = DSLVector(), index_array(), index_array([0])
+            for i in range(left.rows):
+                start, end = left.indptr[i], left.indptr[i + 1]
+                row = dict(zip(left.indices[start:end], left.values[start:end]))
+                for p in range(right.indptr[i], right.indptr[i + 1]):
+                    j = right.indices[p]
+                    row[j] = op(row.get(j, 0.0), right.values[p])
+                _append_row(row, values, indices, indptr)
+            return DSLSparseMatrix(values, indices, indptr, left.rows, left.cols)
+        # Con un operando denso el resultado es denso: op con 0 en todas las
+        # posiciones y después las de los valores dispersos
+        if isinstance(left, DSLSparseMatrix):
+            sparse, dense = left, right
+            data = DSLVector(map(op, repeat(0.0), dense.data))
+        else:
+            sparse, dense = right, left
+            data = DSLVector(map(op, dense.data, repeat(0.0)))
+        for i in range(sparse.rows):
+            offset = i * sparse.cols
+            for p in range(sparse.indptr[i], sparse.indptr[i + 1]):
+                position = offset + sparse.indices[p]
+                if sparse is left:
+                    data[position] = op(sparse.values[p], dense.data[position])
+                else:
+                    data[position] = op(dense.data[position], sparse.values[p])
+        return DSLMatrix(data, left.rows, left.cols)
+
+class LUFactorization:
+    """Factorización P A = L U de una matriz cuadrada, con pivoteo parcial.
+    
+    Eliminación de Gauss por filas sobre listas de floats: en la columna k
+    se elige como pivote la fila con el mayor valor absoluto (la primera si
+    hay empate, como LAPACK) y a cada fila de abajo se le resta la del
+    pivote multiplicada por su factor, que queda guardado como L. Un pivote
+    exactamente 0 marca la matriz como singular: det() es 0 y solve() e
+    inverse() lanzan ValueError. La inversa se calcula una sola vez.
+    """
+    
+    def __init__(self, matrix):
+        n = self.size = matrix.rows
+        rows = [matrix.data[i * n:(i + 1) * n].tolist() for i in range(n)]
+        self.permutation = list(range(n))
+        self.sign = 1.0
+        self.singular = False
+        for k in range(n):
+            pivot_index = max(range(k, n), key=lambda i: abs(rows[i][k]))
+            if pivot_index != k:
+                rows[k], rows[pivot_index] = rows[pivot_index], rows[k]
+                self.permutation[k], self.permutation[pivot_index] = self.permutation[pivot_index], self.permutation[k]
+                self.sign = -self.sign
+            pivot_row = rows[k]
+            pivot = pivot_row[k]
+            if pivot == 0.0:
+                self.singular = True
+                continue
+            tail = pivot_row[k + 1:]
+            for row in rows[k + 1:]:
+                factor = row[k] / pivot
+                row[k] = factor
+                if factor:
+                    row[k + 1:] = map(operator.sub, row[k + 1:], map(factor.__mul__, tail))
+        # L sin la diagonal de unos, U sin la diagonal, y la diagonal de U
+        self.lower = [row[:i] for i, row in enumerate(rows)]
+        self.upper = [row[i + 1:] for i, row in enumerate(rows)]
+        self.diagonal = [row[i] for i, row in enumerate(rows)]
+        self._inverse = None
+    
+    @property
+    def nbytes(self):
+        """Memoria estimada: n * n floats en listas (puntero y objeto) y la
+        inversa si ya se calculó"""
+        n = self.size
+        return 32 * n * n + (8 * n * n if self._inverse is not None else 0)
+    
+    def det(self):
+        """Determinante: el producto de la diagonal de U, con el signo de P"""
+        result = self.sign
+        for value in self.diagonal:
+            result *= value
+        return result
+    
+    def solve(self, rhs):
+        """Solución X de A X = rhs (una DSLMatrix de size filas) por
+        sustitución hacia adelante con L y hacia atrás con U, columna por
+        columna"""
+        if self.singular:
+            raise ValueError(SINGULAR_MESSAGE)
+        columns = [self._solve_column(rhs.data[j::rhs.cols].tolist()) for j in range(rhs.cols)]
+        data = DSLVector()
+        for row in zip(*columns):
+            data.extend(row)
+        return DSLMatrix(data, self.size, rhs.cols)
+    
+    def inverse(self):
+        """Inversa: la solución de A X = I"""
+        if self._inverse is None:
+            n = self.size
+            identity = DSLVector([0.0]) * (n * n)
+            identity[::n + 1] = DSLVector([1.0]) * n
+            self._inverse = self.solve(DSLMatrix(identity, n, n))
+        return self._inverse
+    
+    def _solve_column(self, b):
+        """Solución de A x = b para una columna b (lista de floats)"""
+        n = self.size
+        y = [b[index] for index in self.permutation]
+        for i in range(1, n):
+            y[i] -= sum(map(operator.mul, self.lower[i], y[:i]))
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - sum(map(operator.mul, self.upper[i], y[i + 1:]))) / self.diagonal[i]
+        return y
+
+class NumpyBackend(PythonBackend):
+    """Operaciones de matrices con NumPy (y BLAS para el producto).
+    
+    Los datos de una DSLMatrix se ven como un ndarray sin copiarlos y el
+    resultado se copia una vez a una DSLMatrix nueva. Transpuesta, suma y
+    resta dan los mismos bits que PythonBackend; el producto suma en otro
+    orden, así que coincide dentro del error de redondeo. Los cálculos van
+    dentro de numpy.errstate(all='ignore'): un desborde o un NaN da inf o
+    nan como en Python, sin avisos de NumPy en stderr.
+    """
+    
+    name = 'numpy'
+    
+    def __init__(self, numpy):
+        self.numpy = numpy
+    
+    def transpose(self, matrix):
+        """Transpuesta"""
+        return self._matrix(self._array(matrix).T)
+    
+    def multiply(self, left, right, transpose_left=False, transpose_right=False, addend=None, mode='add'):
+        """Producto (matmul de NumPy, que usa BLAS) con los mismos argumentos
+        que PythonBackend.multiply: las transpuestas son vistas .T y addend se
+        suma en su lugar sobre el producto"""
+        numpy = self.numpy
+        a, b = self._array(left), self._array(right)
+        with numpy.errstate(all='ignore'):
+            product = (a.T if transpose_left else a) @ (b.T if transpose_right else b)
+            if addend is not None:
+                terms = self._array(addend)
+                if mode == 'add':
+                    numpy.add(product, terms, out=product)
+                elif mode == 'sub':
+                    numpy.subtract(product, terms, out=product)
+                else:
+                    numpy.subtract(terms, product, out=product)
+        return self._matrix(product)
+    
+    def add(self, left, right):
+        """Suma elemento a elemento"""
+        with self.numpy.errstate(all='ignore'):
+            return self._matrix(self._array(left) + self._array(right))
+    
+    def subtract(self, left, right):
+        """Resta elemento a elemento"""
+        with self.numpy.errstate(all='ignore'):
+            return self._matrix(self._array(left) - self._array(right))
+    
+    def lu(self, matrix):
+        """Factorización LU con pivoteo parcial (LAPACK)"""
+        return NumpyLU(self, matrix)
+    
+    def sparse_transpose(self, matrix):
+        """Transpuesta dispersa: los valores ordenados por columna con un
+        argsort estable"""
+        numpy = self.numpy
+        indices = numpy.frombuffer(matrix.indices, dtype=numpy.int64)
+        order = numpy.argsort(indices, kind='stable')
+        rows = numpy.repeat(numpy.arange(matrix.rows, dtype=numpy.int64),
+                            numpy.diff(numpy.frombuffer(matrix.indptr, dtype=numpy.int64)))
+        indptr = index_array([0])
+        indptr.frombytes(numpy.cumsum(numpy.bincount(indices, minlength=matrix.cols), dtype=numpy.int64).tobytes())
+        transposed = index_array()
+        transposed.frombytes(rows[order].tobytes())
+        values = numpy.frombuffer(matrix.values, dtype=numpy.float64)[order]
+        return DSLSparseMatrix(DSLVector(values.tobytes()), transposed, indptr, matrix.cols, matrix.rows)
+    
+    def sparse_multiply(self, left, right):
+        """Producto con operandos dispersos: se pasan a densos y se usa BLAS.
+        Sin SciPy, NumPy no tiene un producto disperso, y BLAS sobre la copia
+        densa es más rápido que recorrer los índices salvo con densidades
+        muy bajas. Disperso por disperso vuelve a ser disperso"""
+        with self.numpy.errstate(all='ignore'):
+            product = self._array(left) @ self._array(right)
+        if isinstance(left, DSLSparseMatrix) and isinstance(right, DSLSparseMatrix):
+            return self._sparse(product)
+        return self._matrix(product)
+    
+    def _array(self, matrix):
+        """ndarray rows x cols sobre los datos de la matriz (sin copiar); una
+        dispersa se copia a un ndarray denso"""
+        numpy = self.numpy
+        if isinstance(matrix, DSLSparseMatrix):
+            result = numpy.zeros((matrix.rows, matrix.cols))
+            if matrix.values:
+                rows = numpy.repeat(numpy.arange(matrix.rows), numpy.diff(numpy.frombuffer(matrix.indptr, dtype=numpy.int64)))
+                result[rows, numpy.frombuffer(matrix.indices, dtype=numpy.int64)] = numpy.frombuffer(matrix.values, dtype=numpy.float64)
+            return result
+        if not matrix.data:
+            return numpy.zeros((matrix.rows, matrix.cols))
+        return numpy.frombuffer(matrix.data, dtype=numpy.float64).reshape(matrix.rows, matrix.cols)
+    
+    def _sparse(self, array):
+        """DSLSparseMatrix con los valores distintos de 0 de un ndarray de 2 dimensiones"""
+        numpy = self.numpy
+        mask = array != 0
+        indptr = index_array([0])
+        indptr.frombytes(numpy.cumsum(mask.sum(axis=1), dtype=numpy.int64).tobytes())
+        indices = index_array()
+        indices.frombytes(numpy.nonzero(mask)[1].astype(numpy.int64).tobytes())
+        rows, cols = array.shape
+        return DSLSparseMatrix(DSLVector(array[mask].astype(numpy.float64).tobytes()), indices, indptr, rows, cols)
+    
+    def _matrix(self, array):
+        """DSLMatrix con una copia de los datos de un ndarray de 2 dimensiones"""
+        rows, cols = array.shape
+        return DSLMatrix(DSLVector(array.astype(self.numpy.float64, copy=False).tobytes()), rows, cols)
+
+class NumpyLU:
+    """Operaciones de una factorización LU con las de numpy.linalg, que
+    factorizan con getrf/gesv de LAPACK (pivoteo parcial). Guarda una copia
+    de la matriz: no retiene el buffer de la DSLMatrix, que puede crecer.
+    
+    numpy.linalg no entrega los factores L y U, así que cada solve vuelve a
+    factorizar (LAPACK lo hace en una llamada); det e inverse se calculan
+    una sola vez.
+    """
+    
+    def __init__(self, backend, matrix):
+        self.backend = backend
+        self.array = backend._array(matrix).copy()
+        self._det = None
+        self._inverse = None
+    
+    @property
+    def nbytes(self):
+        """Memoria estimada: la copia de la matriz y la inversa si ya se calculó"""
+        return self.array.nbytes * (2 if self._inverse is not None else 1)
+    
+    def det(self):
+        """Determinante"""
+        if self._det is None:
+            with self.backend.numpy.errstate(all='ignore'):
+                self._det = float(self.backend.numpy.linalg.det(self.array))
+        return self._det
+    
+    def solve(self, rhs):
+        """Solución X de A X = rhs (una DSLMatrix), sin formar la inversa"""
+        numpy = self.backend.numpy
+        try:
+            with numpy.errstate(all='ignore'):
+                return self.backend._matrix(numpy.linalg.solve(self.array, self.backend._array(rhs)))
+        except numpy.linalg.LinAlgError:
+            raise ValueError(SINGULAR_MESSAGE)
+    
+    def inverse(self):
+        """Inversa"""
+        if self._inverse is None:
+            numpy = self.backend.numpy
+            try:
+                with numpy.errstate(all='ignore'):
+                    self._inverse = self.backend._matrix(numpy.linalg.inv(self.array))
+            except numpy.linalg.LinAlgError:
+                raise ValueError(SINGULAR_MESSAGE)
+        return self._inverse
+
+class FactorizationCache:
+    """Factorizaciones LU de las matrices usadas con inverse, det y solve.
+    
+    La clave es la identidad de la DSLMatrix y su versión: una matriz que no
+    cambió reutiliza su factorización (y la inversa o el determinante ya
+    calculados) aunque esté en otra variable, y una que se extendió en su
+    lugar se vuelve a factorizar. Cada entrada guarda una referencia débil a
+    su matriz y se borra cuando la matriz deja de existir, por ejemplo al
+    reasignar la única variable que la tenía. Si la memoria estimada de las
+    factorizaciones pasa de max_bytes se descartan las usadas hace más
+    tiempo (LRU); una que sola pasa de max_bytes no se guarda (max_bytes=0
+    desactiva la caché).
+    """
+    
+    def __init__(self, max_bytes=FACTORIZATION_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        # id de la matriz -> [referencia débil, versión, factorización, bytes]
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+    
+    def apply(self, matrix, factorize, operation):
+        """operation(factorización de matrix): la guardada si matrix no
+        cambió, si no factorize(matrix), que queda guardada"""
+        key = id(matrix)
+        entry = self.entries.get(key)
+        if entry is not None and entry[0]() is matrix and entry[1] == matrix.version:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            factorization = entry[2]
+        else:
+            self.misses += 1
+            if entry is not None:
+                self._remove(key)
+            factorization = factorize(matrix)
+            entry = [weakref.ref(matrix, lambda ref, key=key: self._expire(key, ref)),
+                     matrix.version, factorization, 0]
+            self.entries[key] = entry
+        try:
+            return operation(factorization)
+        finally:
+            # La operación pudo guardar la inversa: se recalcula el tamaño
+            self.nbytes += factorization.nbytes - entry[3]
+            entry[3] = factorization.nbytes
+            if entry[3] > self.max_bytes:
+                # No entra ni sola: no se guarda y las demás se conservan
+                self._remove(key)
+            else:
+                self._evict()
+    
+    def clear(self):
+        """Borra todas las factorizaciones (al cambiar de backend)"""
+        self.entries.clear()
+        self.nbytes = 0
+    
+    def _evict(self):
+        """Descarta las menos usadas hasta entrar en max_bytes"""
+        while self.nbytes > self.max_bytes and self.entries:
+            self._remove(next(iter(self.entries)))
+    
+    def _remove(self, key):
+        """Borra una entrada"""
+        self.nbytes -= self.entries.pop(key)[3]
+    
+    def _expire(self, key, ref):
+        """La matriz de la entrada key dejó de existir"""
+        entry = self.entries.get(key)
+        if entry is not None and entry[0] is ref:
+            self._remove(key)
+
+def _append_row(row, values, indices, indptr):
+    """Agrega a una matriz dispersa en construcción la fila row (columna ->
+    valor), sin los valores que dieron exactamente 0"""
+    for j in sorted(row):
+        if row[j]:
+            indices.append(j)
+            values.append(row[j])
+    indptr.append(len(values))
+
+def multiply_lists(left, right):
+    """Producto de dos matrices no empaquetadas (filas del mismo largo que
+    pueden tener valores que no son floats) con el mismo algoritmo por
+    bloques que PythonBackend.multiply. Retorna la lista de filas"""
+    cols = len(right[0])
+    result = [[] for _ in left]
+    for start in range(0, cols, TILE_COLUMNS):
+        columns = list(zip(*[row[start:start + TILE_COLUMNS] for row in right]))
+        for row, out in zip(left, result):
+            out.extend([sum(map(operator.mul, row, column)) for column in columns])
+    return result
+
+def load_backend(name):
+    """Backend de matrices para un nombre de BACKENDS. ValueError si el
+    nombre no es válido o si se pide numpy y no está instalado."""
+    if name not in BACKENDS:
+        raise ValueError(f"Backend no válido: '{name}' (opciones: {', '.join(BACKENDS)})")
+    if name == 'python':
+        return PythonBackend()
+    try:
+        import numpy
+    except ImportError:
+        if name == 'numpy':
+            raise ValueError("El backend numpy necesita NumPy instalado (pip install numpy)")
+        return PythonBackend()
+    return NumpyBackend(numpy)
@@ -0,0 +1,179 @@
+import os
+import sys
+import time
+
+# Operaciones por defecto de una ejecución: cada vuelta de un while cuenta
+# uno más los statements de su cuerpo
+DEFAULT_MAX_OPERATIONS = 10_000_000
+# Segundos entre lecturas del reloj y de la memoria, aproximadamente: el
+# tramo de operaciones entre verificaciones se ajusta para acercarse a esto
+CHECK_PERIOD = 0.01
+MAX_CHECK_INTERVAL = 65536
+
+class BudgetExceeded(RuntimeError):
+    """Se agotó un presupuesto de ejecución (operaciones, tiempo o memoria)"""
+    
+    def __init__(self, what, where, line, iterations, operations):
+        super().__init__(f"Presupuesto de {what} agotado {where}")
+        self.what = what
+        self.where = where
+        self.line = line
+        self.iterations = iterations
+        self.operations = operations
+    
+    def locate(self, line):
+        """Agrega la línea del statement que corría. check_limits() no la
+        conoce: los motores la completan al propagarse el error, y gana el
+        statement más interno (el de un while ya viene con su línea)"""
+        if self.line is None:
+            self.line = line
+            self.args = (f"Presupuesto de {self.what} agotado en la línea {line} {self.where}",)
+
+class DSLBudget:
+    """Presupuestos de una ejecución: operaciones, tiempo y memoria pico.
+    
+    Los motores descuentan el costo de cada vuelta de un while de fuel, que
+    es un entero: solo cuando se vuelve negativo llaman a check(), que
+    suma lo consumido, verifica los tres límites y entrega el próximo tramo.
+    El reloj y la memoria se leen entonces una vez por tramo, no por vuelta;
+    el tramo se achica si las vueltas son lentas (así el tiempo límite se
+    respeta con un margen de CHECK_PERIOD) y crece si son rápidas. El límite
+    de operaciones es exacto: el tramo nunca pasa de lo que queda.
+    
+    Las operaciones costosas que no son vueltas de un while (matmul,
+    inverse, ...) llaman a check_limits() antes de empezar, así que un
+    script sin bucles también se detiene al superar el tiempo o la memoria;
+    una operación ya empezada no se interrumpe. El error indica el while y
+    la vuelta, o la línea del statement que corría.
+    
+    None en cualquier límite significa sin límite. La memoria es la que el
+    proceso tiene en uso (ver memory_in_use), en MiB.
+    """
+    
+    def __init__(self, max_operations=DEFAULT_MAX_OPERATIONS, timeout=None, max_memory=None):
+        self.max_operations = max_operations
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.reset()
+    
+    def configure(self, max_operations=DEFAULT_MAX_OPERATIONS, timeout=None, max_memory=None):
+        """Cambia los límites y empieza a contar desde cero"""
+        self.max_operations = max_operations
+        self.timeout = timeout
+        self.max_memory = max_memory
+        self.reset()
+    
+    def reset(self):
+        """Empieza a contar desde cero (al empezar cada script o línea del REPL)"""
+        self.started = self._last_check = time.perf_counter()
+        self._used = 0
+        self._interval = 1024
+        self.fuel = self._grant()
+        # Sin /proc/self/statm solo se conoce la memoria pico del proceso:
+        # cuenta recién cuando crece por encima de la de ahora
+        self._peak_at_reset = None
+        if self.max_memory is not None and resident_memory() is None:
+            self._peak_at_reset = peak_memory()
+    
+    @property
+    def operations(self):
+        """Operaciones consumidas desde reset()"""
+        return self._used + self._granted - self.fuel
+    
+    def check(self, line, iterations):
+        """Llamado por un motor cuando fuel es negativo, al empezar la vuelta
+        iterations (desde 0) del while de la línea line. Lanza BudgetExceeded
+        si algún límite se superó; si no, entrega el próximo tramo."""
+        self._used += self._granted - self.fuel
+        where = f"en el while de la línea {line} después de {iterations} vueltas"
+        if self.max_operations is not None and self._used > self.max_operations:
+            self._exceeded(f"operaciones (límite {self.max_operations})", where, line, iterations)
+        now = time.perf_counter()
+        self._check_time_and_memory(now, where, line, iterations)
+        
+        # Próximo tramo: más corto si este tardó más que CHECK_PERIOD
+        elapsed = now - self._last_check
+        self._last_check = now
+        if elapsed > CHECK_PERIOD:
+            self._interval = max(self._interval // 2, 1)
+        elif elapsed < CHECK_PERIOD / 4:
+            self._interval = min(self._interval * 2, MAX_CHECK_INTERVAL)
+        self.fuel = self._grant()
+    
+    def check_limits(self, operation):
+        """Llamado por el runtime antes de una operación costosa (matmul,
+        inverse, ...), dentro o fuera de un while. Lanza BudgetExceeded si
+        ya se superó el tiempo o la memoria, sin línea: el motor la agrega
+        con BudgetExceeded.locate()."""
+        if self.timeout is not None or self.max_memory is not None:
+            self._check_time_and_memory(time.perf_counter(), f"al empezar {operation}", None, 0)
+    
+    def _check_time_and_memory(self, now, where, line, iterations):
+        """Lanza BudgetExceeded si se superó el tiempo o la memoria"""
+        if self.timeout is not None and now - self.started > self.timeout:
+            self._exceeded(f"tiempo (límite {self.timeout:g} s, van {now - self.started:.2f} s)",
+                           where, line, iterations)
+        if self.max_memory is not None:
+            used = self.memory_in_use()
+            if used is not None and used > self.max_memory:
+                self._exceeded(f"memoria (límite {self.max_memory:g} MiB, en uso {used:.0f} MiB)",
+                               where, line, iterations)
+    
+    def memory_in_use(self):
+        """Memoria residente actual del proceso en MiB. Sin /proc/self/statm
+        (macOS) es la pico del proceso, pero solo si creció desde reset():
+        un pico anterior (otra línea del REPL) no agota esta ejecución.
+        None si no se puede medir."""
+        resident = resident_memory()
+        if resident is not None:
+            return resident
+        peak = peak_memory()
+        if peak is None or self._peak_at_reset is None or peak <= self._peak_at_reset:
+            return None
+        return peak
+    
+    def remaining(self):
+        """Operaciones que quedan antes del límite (None si no hay límite)"""
+        if self.max_operations is None:
+            return None
+        return self.max_operations - self.operations
+    
+    def consume(self, amount, line, iterations):
+        """Descuenta amount operaciones de una vez (un while vectorizado)"""
+        self.fuel -= amount
+        if self.fuel < 0:
+            self.check(line, iterations)
+    
+    def _grant(self):
+        """Tamaño del próximo tramo, sin pasar del límite de operaciones"""
+        granted = self._interval
+        if self.max_operations is not None:
+            granted = min(granted, self.max_operations - self._used)
+        self._granted = granted
+        return granted
+    
+    def _exceeded(self, what, where, line, iterations):
+        """Lanza BudgetExceeded indicando dónde estaba la ejecución"""
+        raise BudgetExceeded(what, where, line, iterations, self._used)
+
+def resident_memory():
+    """Memoria residente actual del proceso en MiB (/proc/self/statm), o
+    None si no se puede leer"""
+    try:
+        with open('/proc/self/statm', 'rb') as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+def peak_memory():
+    """Memoria pico del proceso en MiB, o None si no se puede medir.
+    resource se importa recién aquí: solo hace falta con --max-memory"""
+    try:
+        import resource
+    except ImportError:
+        # Windows: no hay getrusage, el límite de memoria no se verifica
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux informa KiB y macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
@@ -0,0 +1,718 @@
+import reprlib
+import DSLAst as ast
+from DSLBudget import BudgetExceeded
+from DSLRuntime import UNDEFINED
+
+# === OPCODES ===
+# Cada instrucción es una tupla (op, a, b, c) de enteros. El banco de
+# registros se organiza como [variables | constantes | invariantes |
+# temporales]: las variables y constantes se leen directamente como
+# operandos, sin instrucciones de carga, y cada expresión invariante de un
+# while (ast.Invariant) guarda su valor en un registro propio, igual que la
+# lista propia de cada acumulador (ast.Append). n* son índices en la tabla de símbolos
+# (funciones integradas y tipos de gráfico).
+MOVE = 0            # ra = rb
+STORE_VAR = 1       # ra = rb y se informa la asignación
+CHECK_VAR = 2       # error si la variable ra aún no está definida
+ADD = 3             # ra = rb + rc
+SUBTRACT = 4        # ra = rb - rc
+MULTIPLY = 5        # ra = rb * rc
+DIVIDE = 6          # ra = rb / rc
+POWER = 7           # ra = rb ^ rc
+EQUAL = 8           # ra = rb == rc
+NOT_EQUAL = 9       # ra = rb != rc
+LESS = 10           # ra = rb < rc
+LESS_EQUAL = 11     # ra = rb <= rc
+GREATER = 12        # ra = rb > rc
+GREATER_EQUAL = 13  # ra = rb >= rc
+NOT = 14            # ra = not rb
+AND = 15            # ra = rb and rc (ambos evaluados)
+OR = 16             # ra = rb or rc (ambos evaluados)
+JUMP = 17           # pc = a
+JUMP_IF_FALSE = 18  # si not ra: pc = b
+LOOP_INIT = 19      # ra = 0 (contador de iteraciones)
+LOOP_TICK = 20      # ra += 1, descuenta b operaciones del presupuesto
+BUILD_LIST = 21     # ra = [ra, ..., ra+b-1] (empaquetada si es de números)
+CALL = 22           # ra = builtins[n_b](ra, ..., ra+c-1)
+CALL1 = 23          # ra = builtins[n_b](rc)
+PRINT_RESULT = 24   # informa el resultado de ra si no es None
+PLOT = 25           # plot/scatter/hist n_a con rb, ..., rb+c-1
+READ_FILE = 26      # ra = readFile(ra, ..., ra+b-1)
+WRITE_FILE = 27     # writeFile(ra, ..., ra+b-1)
+SETUP_HANDLER = 28  # si falla la evaluación siguiente, informar y saltar a a
+POP_HANDLER = 29    # fin de la región protegida
+CLEAR = 30          # ra = UNDEFINED (invariante por calcular)
+JUMP_IF_SET = 31    # si ra no es UNDEFINED: pc = b
+# Operaciones especializadas (ast.SpecializedOp): sin verificar tipos
+ADD_DIRECT = 32            # ra = rb + rc (dos números o dos listas)
+SUBTRACT_NUMBER = 33       # ra = rb - rc
+MULTIPLY_NUMBER = 34       # ra = rb * rc
+DIVIDE_NUMBER = 35         # ra = rb / rc (error si rc es 0)
+POWER_NUMBER = 36          # ra = rb ** rc
+LESS_NUMBER = 37           # ra = rb < rc
+LESS_EQUAL_NUMBER = 38     # ra = rb <= rc
+GREATER_NUMBER = 39        # ra = rb > rc
+GREATER_EQUAL_NUMBER = 40  # ra = rb >= rc
+CONCAT_TEXT = 41           # ra = str(rb) + str(rc)
+REPEAT = 42                # ra = rb * int(rc)
+ACCUMULATE = 43            # ra = rb + rc, extendiendo rb en su lugar si es la lista ra
+VECTOR_LOOP = 44           # ejecuta el while contado ra por vectores; si se pudo, pc = b
+MATRIX_EXPRESSION = 45     # ra = operaciones de matrices n_b sobre ra, ..., ra+c-1
+
+OPNAMES = [
+    'MOVE', 'STORE_VAR', 'CHECK_VAR', 'ADD', 'SUBTRACT', 'MULTIPLY',
+    'DIVIDE', 'POWER', 'EQUAL', 'NOT_EQUAL', 'LESS', 'LESS_EQUAL', 'GREATER',
+    'GREATER_EQUAL', 'NOT', 'AND', 'OR', 'JUMP', 'JUMP_IF_FALSE', 'LOOP_INIT',
+    'LOOP_TICK', 'BUILD_LIST', 'CALL', 'CALL1', 'PRINT_RESULT', 'PLOT',
+    'READ_FILE', 'WRITE_FILE', 'SETUP_HANDLER', 'POP_HANDLER', 'CLEAR',
+    'JUMP_IF_SET', 'ADD_DIRECT', 'SUBTRACT_NUMBER', 'MULTIPLY_NUMBER',
+    'DIVIDE_NUMBER', 'POWER_NUMBER', 'LESS_NUMBER', 'LESS_EQUAL_NUMBER',
+    'GREATER_NUMBER', 'GREATER_EQUAL_NUMBER', 'CONCAT_TEXT', 'REPEAT',
+    'ACCUMULATE', 'VECTOR_LOOP', 'MATRIX_EXPRESSION',
+]
+
+BINARY_OPCODES = {
+    '+': ADD, '-': SUBTRACT, '*': MULTIPLY, '/': DIVIDE, '^': POWER,
+    '==': EQUAL, '!=': NOT_EQUAL, '<': LESS, '<=': LESS_EQUAL,
+    '>': GREATER, '>=': GREATER_EQUAL,
+}
+
+SPECIALIZED_OPCODES = {
+    ('+', 'number'): ADD_DIRECT, ('-', 'number'): SUBTRACT_NUMBER,
+    ('*', 'number'): MULTIPLY_NUMBER, ('/', 'number'): DIVIDE_NUMBER,
+    ('^', 'number'): POWER_NUMBER, ('<', 'number'): LESS_NUMBER,
+    ('<=', 'number'): LESS_EQUAL_NUMBER, ('>', 'number'): GREATER_NUMBER,
+    ('>=', 'number'): GREATER_EQUAL_NUMBER, ('+', 'text'): CONCAT_TEXT,
+    ('+', 'concat'): ADD_DIRECT, ('*', 'repeat'): REPEAT,
+}
+
+class DSLCodeObject:
+    """Bytecode compilado de un programa"""
+    
+    __slots__ = ('instructions', 'lines', 'names', 'constants', 'invariants', 'symbols', 'num_registers')
+    
+    def __init__(self, instructions, lines, names, constants, invariants, symbols, num_registers):
+        self.instructions = instructions
+        self.lines = lines
+        self.names = names            # variable del registro i
+        self.constants = constants    # constante del registro len(names) + i
+        self.invariants = invariants  # slot de la invariante que sigue a las constantes
+        self.symbols = symbols
+        self.num_registers = num_registers
+    
+    def register_name(self, register):
+        """Describe un registro para el desensamblador"""
+        if register < len(self.names):
+            return f"r{register} ({self.names[register]})"
+        constant = register - len(self.names)
+        if constant < len(self.constants):
+            return f"r{register} ({reprlib.repr(self.constants[constant])})"
+        invariant = constant - len(self.constants)
+        if invariant < len(self.invariants):
+            return f"r{register} (inv{self.invariants[invariant]})"
+        return f"r{register}"
+
+class DSLBytecodeCompiler:
+    """Compila el AST (DSLAst) a bytecode de registros"""
+    
+    def __init__(self, defined=()):
+        self.instructions = []
+        self.lines = []
+        self.names = []
+        self.constants = []
+        self.invariants = []
+        self.symbols = []
+        self._variable_index = {}
+        self._constant_index = {}
+        self._invariant_index = {}
+        self._symbol_index = {}
+        self.next_register = 0
+        self.num_registers = 0
+        self._line = 0
+        # Variables que con seguridad están definidas en el punto actual;
+        # las lecturas del resto se protegen con CHECK_VAR
+        self._defined = set(defined)
+        self._protected = False
+        self._statement_compilers = {
+            ast.Assign: self._compile_assign,
+            ast.Append: self._compile_append,
+            ast.ExprStatement: self._compile_expr_statement,
+            ast.If: self._compile_if,
+            ast.While: self._compile_while,
+            ast.VectorLoop: self._compile_vector_loop,
+            ast.Plot: self._compile_plot,
+            ast.FileOp: self._compile_file_op,
+        }
+        self._expression_compilers = {
+            ast.Number: self._compile_literal,
+            ast.String: self._compile_literal,
+            ast.Boolean: self._compile_literal,
+            ast.Variable: self._compile_variable,
+            ast.BinaryOp: self._compile_binary_op,
+            ast.SpecializedOp: self._compile_specialized_op,
+            ast.Not: self._compile_not,
+            ast.Logical: self._compile_logical,
+            ast.ListLiteral: self._compile_list,
+            ast.MatrixLiteral: self._compile_matrix,
+            ast.NumericLiteral: self._compile_numeric,
+            ast.Call: self._compile_call,
+            ast.MatrixExpression: self._compile_matrix_expression,
+            ast.Invariant: self._compile_invariant,
+        }
+    
+    def compile(self, program):
+        """Compila un ast.Program a un DSLCodeObject"""
+        # Primero se reservan los registros de variables, constantes e invariantes
+        self._collect(program)
+        self.next_register = self.num_registers = len(self.names) + len(self.constants) + len(self.invariants)
+        self._compile_block(program.body)
+        return DSLCodeObject(self.instructions, self.lines, self.names, self.constants,
+                             self.invariants, self.symbols, self.num_registers)
+    
+    def _collect(self, node):
+        """Registra las variables y constantes que aparecen en el AST"""
+        if isinstance(node, (ast.Assign, ast.Append, ast.Variable)):
+            if node.name not in self._variable_index:
+                self._variable_index[node.name] = len(self.names)
+                self.names.append(node.name)
+        elif isinstance(node, (ast.Number, ast.String, ast.Boolean)):
+            # El tipo forma parte de la clave para no confundir 1.0 con True
+            key = (type(node.value), node.value)
+            if key not in self._constant_index:
+                self._constant_index[key] = len(self.constants)
+                self.constants.append(node.value)
+        elif isinstance(node, ast.NumericLiteral):
+            # Los literales numéricos empaquetados son constantes ya materializadas
+            key = self._numeric_key(node)
+            if key not in self._constant_index:
+                self._constant_index[key] = len(self.constants)
+                self.constants.append(node.materialize())
+        elif isinstance(node, ast.VectorLoop):
+            # El nodo mismo es una constante: VECTOR_LOOP se lo pasa al runtime
+            self._constant_index[self._vector_key(node)] = len(self.constants)
+            self.constants.append(node)
+        if isinstance(node, (ast.Invariant, ast.Append)):
+            # Los acumuladores de una misma variable comparten el slot
+            if node.slot not in self._invariant_index:
+                self._invariant_index[node.slot] = len(self.invariants)
+                self.invariants.append(node.slot)
+        
+        for field in node.fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.Node):
+                self._collect(value)
+            elif isinstance(value, list):
+                # While.invariants es una lista de enteros, no de nodos
+                for item in value:
+                    if isinstance(item, ast.Node):
+                        self._collect(item)
+    
+    # === AUXILIARES ===
+    def _numeric_key(self, node):
+        """Clave de constante de un literal numérico empaquetado"""
+        return (ast.NumericLiteral, node.rows, node.values.tobytes())
+    
+    def _vector_key(self, node):
+        """Clave de constante de un ast.VectorLoop"""
+        return (ast.VectorLoop, id(node))
+    
+    def _invariant_register(self, slot):
+        """Registro donde se guarda el valor de una expresión invariante"""
+        return len(self.names) + len(self.constants) + self._invariant_index[slot]
+    
+    def _emit(self, op, a=0, b=0, c=0):
+        """Agrega una instrucción y retorna su posición"""
+        self.instructions.append((op, a, b, c))
+        self.lines.append(self._line)
+        return len(self.instructions) - 1
+    
+    def _patch(self, index, op, a=0, b=0, c=0):
+        """Reescribe una instrucción ya emitida (saltos hacia adelante)"""
+        self.instructions[index] = (op, a, b, c)
+    
+    def _symbol(self, name):
+        """Retorna el índice de un símbolo, agregándolo si es nuevo"""
+        if name not in self._symbol_index:
+            self._symbol_index[name] = len(self.symbols)
+            self.symbols.append(name)
+        return self._symbol_index[name]
+    
+    def _alloc(self):
+        """Reserva el siguiente registro temporal libre"""
+        register = self.next_register
+        self.next_register += 1
+        if self.next_register > self.num_registers:
+            self.num_registers = self.next_register
+        return register
+    
+    def _release(self, register):
+        """Libera todos los registros temporales a partir de register"""
+        self.next_register = register
+    
+    def _compile_to_temp(self, node):
+        """Compila una expresión dejando el resultado en el siguiente temporal"""
+        mark = self.next_register
+        register = self.compile_expression(node)
+        if register != mark:
+            # Variable o constante: copiarla al temporal
+            self._release(mark)
+            self._emit(MOVE, self._alloc(), register)
+        self._release(mark + 1)
+        return mark
+    
+    def _compile_args(self, args):
+        """Evalúa argumentos en temporales consecutivos; retorna el primero"""
+        base = self.next_register
+        for arg in args:
+            self._compile_to_temp(arg)
+        return base
+    
+    # === STATEMENTS ===
+    def _compile_block(self, body):
+        """Compila una lista de statements"""
+        for statement in body:
+            self._line = statement.line
+            self._statement_compilers[statement.__class__](statement)
+    
+    def _compile_assign(self, node):
+        """Compila una asignación"""
+        mark = self.next_register
+        register = self.compile_expression(node.value)
+        self._emit(STORE_VAR, self._variable_index[node.name], register)
+        self._release(mark)
+        self._defined.add(node.name)
+    
+    def _compile_append(self, node):
+        """Compila una acumulación: la lista propia queda en el registro del slot"""
+        mark = self.next_register
+        variable = self.compile_expression(ast.Variable(node.name, node.line))
+        items = self.compile_expression(node.items)
+        owned = self._invariant_register(node.slot)
+        self._emit(ACCUMULATE, owned, variable, items)
+        self._emit(STORE_VAR, self._variable_index[node.name], owned)
+        self._release(mark)
+        self._defined.add(node.name)
+    
+    def _compile_expr_statement(self, node):
+        """Compila un statement de expresión"""
+        mark = self.next_register
+        self._emit(PRINT_RESULT, self.compile_expression(node.expr))
+        self._release(mark)
+    
+    def _compile_if(self, node):
+        """Compila un if con saltos"""
+        mark = self.next_register
+        register = self.compile_expression(node.condition)
+        jump_to_else = self._emit(JUMP_IF_FALSE, register)
+        self._release(mark)
+        
+        defined = self._defined
+        self._defined = set(defined)
+        self._compile_block(node.then_body)
+        then_defined = self._defined
+        self._defined = set(defined)
+        if node.else_body:
+            jump_to_end = self._emit(JUMP)
+            self._patch(jump_to_else, JUMP_IF_FALSE, register, len(self.instructions))
+            self._compile_block(node.else_body)
+            self._patch(jump_to_end, JUMP, len(self.instructions))
+        else:
+            self._patch(jump_to_else, JUMP_IF_FALSE, register, len(self.instructions))
+        # Solo queda definido lo que se asigna en ambas ramas
+        self._defined &= then_defined
+    
+    def _compile_while(self, node):
+        """Compila un while con saltos, contador de iteraciones y presupuesto"""
+        counter = self._alloc()
+        self._emit(LOOP_INIT, counter)
+        # Cada ejecución del bucle vuelve a calcular sus invariantes
+        for slot in node.invariants:
+            self._emit(CLEAR, self._invariant_register(slot))
+        start = len(self.instructions)
+        
+        self._line = node.line
+        register = self.compile_expression(node.condition)
+        jump_to_end = self._emit(JUMP_IF_FALSE, register)
+        self._release(counter + 1)
+        # Cada vuelta cuesta una operación más una por statement del cuerpo
+        self._emit(LOOP_TICK, counter, len(node.body) + 1)
+        
+        # El cuerpo puede no ejecutarse: sus asignaciones no cuentan después
+        defined = set(self._defined)
+        self._compile_block(node.body)
+        self._defined = defined
+        self._line = node.line
+        self._emit(JUMP, start)
+        self._patch(jump_to_end, JUMP_IF_FALSE, register, len(self.instructions))
+        for slot in node.invariants:
+            self._emit(CLEAR, self._invariant_register(slot))
+        self._release(counter)
+    
+    def _compile_vector_loop(self, node):
+        """Compila un while contado: VECTOR_LOOP salta el while normal si lo ejecutó por vectores"""
+        plan = len(self.names) + self._constant_index[self._vector_key(node)]
+        skip = self._emit(VECTOR_LOOP, plan)
+        self._compile_while(node.loop)
+        self._patch(skip, VECTOR_LOOP, plan, len(self.instructions))
+    
+    def _compile_plot(self, node):
+        """Compila plot/scatter/hist protegiendo la evaluación de argumentos"""
+        handler = self._emit(SETUP_HANDLER)
+        # Un error dentro de la región no detiene el programa, así que las
+        # variables verificadas aquí no pueden darse por definidas
+        self._protected = True
+        base = self._compile_args(node.args)
+        self._protected = False
+        self._emit(POP_HANDLER)
+        self._emit(PLOT, self._symbol(node.kind), base, len(node.args))
+        self._release(base)
+        self._patch(handler, SETUP_HANDLER, len(self.instructions))
+    
+    def _compile_file_op(self, node):
+        """Compila readFile/writeFile"""
+        base = self._compile_args(node.args)
+        op = READ_FILE if node.kind == 'readFile' else WRITE_FILE
+        self._emit(op, base, len(node.args))
+        self._release(base)
+    
+    # === EXPRESIONES ===
+    def compile_expression(self, node):
+        """Compila una expresión; retorna el registro con el resultado"""
+        return self._expression_compilers[node.__class__](node)
+    
+    def _compile_literal(self, node):
+        """Los literales viven en su registro de constante"""
+        return len(self.names) + self._constant_index[(type(node.value), node.value)]
+    
+    def _compile_numeric(self, node):
+        """Los literales numéricos empaquetados también son constantes"""
+        return len(self.names) + self._constant_index[self._numeric_key(node)]
+    
+    def _compile_variable(self, node):
+        """Las variables se leen de su propio registro"""
+        register = self._variable_index[node.name]
+        if node.name not in self._defined:
+            self._emit(CHECK_VAR, register)
+            if not self._protected:
+                self._defined.add(node.name)
+        return register
+    
+    def _compile_binary_op(self, node):
+        """Compila una operación binaria"""
+        mark = self.next_register
+        left = self.compile_expression(node.left)
+        right = self.compile_expression(node.right)
+        self._release(mark)
+        target = self._alloc()
+        self._emit(BINARY_OPCODES[node.op], target, left, right)
+        return target
+    
+    def _compile_specialized_op(self, node):
+        """Compila una operación binaria con tipos conocidos"""
+        mark = self.next_register
+        left = self.compile_expression(node.left)
+        right = self.compile_expression(node.right)
+        self._release(mark)
+        target = self._alloc()
+        self._emit(SPECIALIZED_OPCODES[node.op, node.kind], target, left, right)
+        return target
+    
+    def _compile_not(self, node):
+        """Compila una negación lógica"""
+        mark = self.next_register
+        operand = self.compile_expression(node.operand)
+        self._release(mark)
+        target = self._alloc()
+        self._emit(NOT, target, operand)
+        return target
+    
+    def _compile_logical(self, node):
+        """Compila and/or"""
+        mark = self.next_register
+        left = self.compile_expression(node.left)
+        right = self.compile_expression(node.right)
+        self._release(mark)
+        target = self._alloc()
+        self._emit(AND if node.op == 'and' else OR, target, left, right)
+        return target
+    
+    def _compile_list(self, node):
+        """Compila un literal de lista"""
+        base = self._compile_args(node.items)
+        self._emit(BUILD_LIST, base, len(node.items))
+        self._release(base)
+        return self._alloc()
+    
+    def _compile_matrix(self, node):
+        """Compila un literal de matriz"""
+        base = self._compile_args(node.rows)
+        self._emit(BUILD_LIST, base, len(node.rows))
+        self._release(base)
+        return self._alloc()
+    
+    def _compile_invariant(self, node):
+        """Compila una expresión invariante: se salta si su registro ya tiene valor"""
+        target = self._invariant_register(node.slot)
+        jump_to_end = self._emit(JUMP_IF_SET, target)
+        mark = self.next_register
+        self._emit(MOVE, target, self.compile_expression(node.expr))
+        self._release(mark)
+        self._patch(jump_to_end, JUMP_IF_SET, target, len(self.instructions))
+        return target
+    
+    def _compile_call(self, node):
+        """Compila una llamada a función integrada"""
+        symbol = self._symbol(node.func)
+        if len(node.args) == 1:
+            mark = self.next_register
+            arg = self.compile_expression(node.args[0])
+            self._release(mark)
+            target = self._alloc()
+            self._emit(CALL1, target, symbol, arg)
+            return target
+        
+        base = self._compile_args(node.args)
+        self._emit(CALL, base, symbol, len(node.args))
+        self._release(base)
+        return self._alloc()
+    
+    def _compile_matrix_expression(self, node):
+        """Compila operaciones de matrices anidadas que se calculan juntas; el
+        símbolo es la tupla de operaciones"""
+        symbol = self._symbol(tuple(node.ops))
+        base = self._compile_args(node.args)
+        self._emit(MATRIX_EXPRESSION, base, symbol, len(node.args))
+        self._release(base)
+        return self._alloc()
+
+class DSLVirtualMachine:
+    """Ejecuta el bytecode de registros en un único bucle de despacho"""
+    
+    def __init__(self, runtime):
+        self.runtime = runtime
+    
+    def execute(self, program):
+        """Compila y ejecuta un ast.Program"""
+        compiler = DSLBytecodeCompiler(defined=self.runtime.variables)
+        return self.run(compiler.compile(program))
+    
+    def run(self, code):
+        """Ejecuta un DSLCodeObject"""
+        runtime = self.runtime
+        frame = runtime.variables
+        builtins = runtime.builtins
+        to_boolean = runtime._to_boolean
+        store = runtime._store
+        add = runtime._add
+        accumulate = runtime._accumulate
+        pack = runtime._pack
+        vector_loop = runtime._vector_loop
+        matrix_expression = runtime._matrix_expression
+        cells = frame.cells
+        subtract = runtime._subtract
+        multiply = runtime._multiply
+        divide = runtime._divide
+        power = runtime._power
+        equals = runtime._equals
+        less = runtime._less
+        less_equal = runtime._less_equal
+        greater = runtime._greater
+        greater_equal = runtime._greater_equal
+        budget = runtime.budget
+        
+        instructions = code.instructions
+        names = code.names
+        symbols = code.symbols
+        # Slot del runtime de cada registro de variable
+        slots = [frame.slot(name) for name in names]
+        
+        # Banco de registros: [variables | constantes | invariantes | temporales]
+        registers = [frame.cells[slot] for slot in slots]
+        registers.extend(code.constants)
+        registers.extend([UNDEFINED] * len(code.invariants))
+        registers.extend([None] * (code.num_registers - len(registers)))
+        
+        handlers = []
+        end = len(instructions)
+        pc = 0
+        
+        while True:
+            try:
+                while pc < end:
+                    op, a, b, c = instructions[pc]
+                    pc += 1
+                    
+                    # Los opcodes más frecuentes en bucles van primero
+                    if op == STORE_VAR:
+                        value = registers[b]
+                        registers[a] = value
+                        store(slots[a], names[a], value)
+                    elif op == ADD_DIRECT:
+                        registers[a] = registers[b] + registers[c]
+                    elif op == LESS_NUMBER:
+                        registers[a] = registers[b] < registers[c]
+                    elif op == MULTIPLY_NUMBER:
+                        registers[a] = registers[b] * registers[c]
+                    elif op == SUBTRACT_NUMBER:
+                        registers[a] = registers[b] - registers[c]
+                    elif op == ADD:
+                        registers[a] = add(registers[b], registers[c])
+                    elif op == MULTIPLY:
+                        registers[a] = multiply(registers[b], registers[c])
+                    elif op == JUMP_IF_FALSE:
+                        value = registers[a]
+                        if value is False or (value is not True and not to_boolean(value)):
+                            pc = b
+                    elif op == LESS_EQUAL:
+                        registers[a] = less_equal(registers[b], registers[c])
+                    elif op == LESS:
+                        registers[a] = less(registers[b], registers[c])
+                    elif op == JUMP:
+                        pc = a
+                    elif op == LOOP_TICK:
+                        budget.fuel -= b
+                        if budget.fuel < 0:
+                            budget.check(code.lines[pc - 1], registers[a])
+                        registers[a] += 1
+                    elif op == SUBTRACT:
+                        registers[a] = subtract(registers[b], registers[c])
+                    elif op == DIVIDE:
+                        registers[a] = divide(registers[b], registers[c])
+                    elif op == JUMP_IF_SET:
+                        if registers[a] is not UNDEFINED:
+                            pc = b
+                    elif op == CALL1:
+                        registers[a] = builtins[symbols[b]](registers[c])
+                    elif op == BUILD_LIST:
+                        registers[a] = pack(registers[a:a + b])
+                    elif op == MOVE:
+                        registers[a] = registers[b]
+                    elif op == GREATER:
+                        registers[a] = greater(registers[b], registers[c])
+                    elif op == GREATER_EQUAL:
+                        registers[a] = greater_equal(registers[b], registers[c])
+                    elif op == EQUAL:
+                        registers[a] = equals(registers[b], registers[c])
+                    elif op == NOT_EQUAL:
+                        registers[a] = not equals(registers[b], registers[c])
+                    elif op == POWER:
+                        registers[a] = power(registers[b], registers[c])
+                    elif op == CHECK_VAR:
+                        if registers[a] is UNDEFINED:
+                            raise RuntimeError(f"Variable no definida: {names[a]}")
+                    elif op == CALL:
+                        registers[a] = builtins[symbols[b]](*registers[a:a + c])
+                    elif op == NOT:
+                        registers[a] = not to_boolean(registers[b])
+                    elif op == AND:
+                        left, right = to_boolean(registers[b]), to_boolean(registers[c])
+                        registers[a] = left and right
+                    elif op == OR:
+                        left, right = to_boolean(registers[b]), to_boolean(registers[c])
+                        registers[a] = left or right
+                    elif op == LOOP_INIT:
+                        registers[a] = 0
+                    elif op == PRINT_RESULT:
+                        if registers[a] is not None:
+                            print(f"📊 Resultado: {runtime._format_value(registers[a])}")
+                    elif op == SETUP_HANDLER:
+                        handlers.append(a)
+                    elif op == POP_HANDLER:
+                        handlers.pop()
+                    elif op == PLOT:
+                        runtime._plot(symbols[a], *registers[b:b + c])
+                    elif op == READ_FILE:
+                        registers[a] = runtime._read_file(*registers[a:a + b])
+                    elif op == WRITE_FILE:
+                        runtime._write_file(*registers[a:a + b])
+                    elif op == CLEAR:
+                        registers[a] = UNDEFINED
+                    elif op == LESS_EQUAL_NUMBER:
+                        registers[a] = registers[b] <= registers[c]
+                    elif op == GREATER_NUMBER:
+                        registers[a] = registers[b] > registers[c]
+                    elif op == GREATER_EQUAL_NUMBER:
+                        registers[a] = registers[b] >= registers[c]
+                    elif op == DIVIDE_NUMBER:
+                        if registers[c] == 0:
+                            raise ZeroDivisionError("División por cero")
+                        registers[a] = registers[b] / registers[c]
+                    elif op == POWER_NUMBER:
+                        registers[a] = registers[b] ** registers[c]
+                    elif op == CONCAT_TEXT:
+                        registers[a] = str(registers[b]) + str(registers[c])
+                    elif op == REPEAT:
+                        registers[a] = registers[b] * int(registers[c])
+                    elif op == ACCUMULATE:
+                        registers[a] = accumulate(registers[b], registers[c], registers[a])
+                    elif op == VECTOR_LOOP:
+                        vectorized = vector_loop(registers[a])
+                        # Las variables que asignó (hasta el último tramo
+                        # completo, si no pudo terminar) ya están en el runtime
+                        for index, slot in enumerate(slots):
+                            registers[index] = cells[slot]
+                        if vectorized:
+                            pc = b
+                    elif op == MATRIX_EXPRESSION:
+                        registers[a] = matrix_expression(symbols[b], *registers[a:a + c])
+                    else:
+                        raise RuntimeError(f"Opcode desconocido: {op}")
+                return None
+            except Exception as e:
+                # Solo la evaluación de argumentos de plot está protegida, y
+                # un presupuesto agotado detiene el programa de todos modos
+                if isinstance(e, BudgetExceeded):
+                    e.locate(code.lines[pc - 1])
+                    raise
+                if not handlers:
+                    raise
+                pc = handlers.pop()
+                print(f"❌ Error al procesar expresiones: {str(e)}")
+
+# === DESENSAMBLADOR ===
+def disassemble(code):
+    """Retorna el listado legible de un DSLCodeObject"""
+    targets = set()
+    for op, a, b, c in code.instructions:
+        if op in (JUMP, SETUP_HANDLER):
+            targets.add(a)
+        elif op in (JUMP_IF_FALSE, JUMP_IF_SET, VECTOR_LOOP):
+            targets.add(b)
+    
+    lines = [f"; registros: {code.num_registers}  variables: {len(code.names)}  constantes: {len(code.constants)}"
+             f"  invariantes: {len(code.invariants)}"]
+    last_line = None
+    for index, (op, a, b, c) in enumerate(code.instructions):
+        if code.lines[index] != last_line:
+            last_line = code.lines[index]
+            lines.append(f"línea {last_line}:")
+        marker = ">>" if index in targets else "  "
+        lines.append(f"  {marker} {index:4d}  {OPNAMES[op]:<14} {_format_operands(code, op, a, b, c)}")
+    return "\n".join(lines)
+
+def _format_operands(code, op, a, b, c):
+    """Formatea los operandos de una instrucción según su opcode"""
+    reg = code.register_name
+    if op in (MOVE, STORE_VAR, NOT):
+        return f"{reg(a)}, {reg(b)}"
+    if op in (JUMP, SETUP_HANDLER):
+        return f"-> {a}"
+    if op in (JUMP_IF_FALSE, JUMP_IF_SET, VECTOR_LOOP):
+        return f"{reg(a)}, -> {b}"
+    if op in (CHECK_VAR, LOOP_INIT, PRINT_RESULT, CLEAR):
+        return reg(a)
+    if op == LOOP_TICK:
+        return f"{reg(a)}, costo {b}"
+    if op == POP_HANDLER:
+        return ""
+    if op in (BUILD_LIST, READ_FILE, WRITE_FILE):
+        return f"{reg(a)}, {b} elementos"
+    if op == CALL:
+        return f"{reg(a)}, {code.symbols[b]}, {c} args"
+    if op == MATRIX_EXPRESSION:
+        return f"{reg(a)}, {' '.join(code.symbols[b])}, {c} args"
+    if op == CALL1:
+        return f"{reg(a)}, {code.symbols[b]}, {reg(c)}"
+    if op == PLOT:
+        return f"{code.symbols[a]}, {reg(b)}, {c} args"
+    return f"{reg(a)}, {reg(b)}, {reg(c)}"
@@ -0,0 +1,389 @@
+import DSLAst as ast
+from DSLBudget import BudgetExceeded
+from DSLRuntime import UNDEFINED
+
+# Contenido de la celda de una expresión invariante todavía no calculada
+# (o de un acumulador que todavía no creó su lista)
+_PENDING = object()
+
+# Closures de las operaciones entre dos números: el operador de Python
+# directamente, sin llamar a ninguna función auxiliar
+_NUMBER_OPERATIONS = {
+    '+': lambda left, right: lambda: left() + right(),
+    '-': lambda left, right: lambda: left() - right(),
+    '*': lambda left, right: lambda: left() * right(),
+    '^': lambda left, right: lambda: left() ** right(),
+    '<': lambda left, right: lambda: left() < right(),
+    '<=': lambda left, right: lambda: left() <= right(),
+    '>': lambda left, right: lambda: left() > right(),
+    '>=': lambda left, right: lambda: left() >= right(),
+}
+
+class DSLClosureCompiler:
+    """Compila el AST (DSLAst) a closures de Python anidadas.
+    
+    Cada statement y expresión se traduce una sola vez a una función sin
+    argumentos; ejecutar el programa es entonces una cadena de llamadas
+    directas, sin despachar por tipo de nodo en cada iteración. Las
+    variables se resuelven al compilar a su slot en runtime.variables.
+    """
+    
+    def __init__(self, runtime):
+        self.runtime = runtime
+        # Celdas de las expresiones invariantes: slot -> [valor o _PENDING]
+        self._invariant_cells = {}
+        # Variables que con seguridad están definidas en el punto actual;
+        # las lecturas del resto verifican que el slot no sea UNDEFINED
+        self._defined = set()
+        self._protected = False
+        # Línea del statement que se está compilando: la indica un
+        # presupuesto agotado al empezar una función integrada
+        self._line = 0
+        self._statement_compilers = {
+            ast.Assign: self._compile_assign,
+            ast.Append: self._compile_append,
+            ast.ExprStatement: self._compile_expr_statement,
+            ast.If: self._compile_if,
+            ast.While: self._compile_while,
+            ast.VectorLoop: self._compile_vector_loop,
+            ast.Plot: self._compile_plot,
+            ast.FileOp: self._compile_file_op,
+        }
+        self._expression_compilers = {
+            ast.Number: self._compile_literal,
+            ast.String: self._compile_literal,
+            ast.Boolean: self._compile_literal,
+            ast.Variable: self._compile_variable,
+            ast.BinaryOp: self._compile_binary_op,
+            ast.SpecializedOp: self._compile_specialized_op,
+            ast.Not: self._compile_not,
+            ast.Logical: self._compile_logical,
+            ast.ListLiteral: self._compile_list,
+            ast.MatrixLiteral: self._compile_matrix,
+            ast.NumericLiteral: self._compile_numeric,
+            ast.Call: self._compile_call,
+            ast.MatrixExpression: self._compile_matrix_expression,
+            ast.Invariant: self._compile_invariant,
+        }
+    
+    # === PROGRAMA PRINCIPAL ===
+    def execute(self, program):
+        """Compila y ejecuta un ast.Program"""
+        return self.compile(program)()
+    
+    def compile(self, program):
+        """Compila un ast.Program a una función sin argumentos"""
+        # Los slots se numeran por programa
+        self._invariant_cells = {}
+        self._defined = set(self.runtime.variables)
+        return self._compile_block(program.body)
+    
+    def _compile_block(self, body):
+        """Compila una lista de statements a una sola función"""
+        statements = tuple(self.compile_statement(statement) for statement in body)
+        
+        if not statements:
+            return lambda: None
+        if len(statements) == 1:
+            return statements[0]
+        
+        def run_block():
+            result = None
+            for statement in statements:
+                result = statement()
+            return result
+        return run_block
+    
+    def compile_statement(self, node):
+        """Compila un statement"""
+        line, self._line = self._line, node.line
+        compiled = self._statement_compilers[node.__class__](node)
+        self._line = line
+        return compiled
+    
+    def compile_expression(self, node):
+        """Compila una expresión"""
+        return self._expression_compilers[node.__class__](node)
+    
+    # === STATEMENTS ===
+    def _compile_assign(self, node):
+        """Compila una asignación al slot de la variable"""
+        store = self.runtime._store
+        name = node.name
+        slot = self.runtime.variables.slot(name)
+        value = self.compile_expression(node.value)
+        self._defined.add(name)
+        return lambda: store(slot, name, value())
+    
+    def _compile_append(self, node):
+        """Compila una acumulación name = name + items (en su lugar si se puede)"""
+        store = self.runtime._store
+        accumulate = self.runtime._accumulate
+        name = node.name
+        slot = self.runtime.variables.slot(name)
+        current = self.compile_expression(ast.Variable(name, node.line))
+        items = self.compile_expression(node.items)
+        cell = self._invariant_cell(node.slot)
+        self._defined.add(name)
+        
+        def run_append():
+            value = cell[0] = accumulate(current(), items(), cell[0])
+            return store(slot, name, value)
+        return run_append
+    
+    def _compile_expr_statement(self, node):
+        """Compila un statement de expresión"""
+        format_value = self.runtime._format_value
+        expr = self.compile_expression(node.expr)
+        
+        def run_expr_statement():
+            result = expr()
+            if result is not None:
+                print(f"📊 Resultado: {format_value(result)}")
+            return result
+        return run_expr_statement
+    
+    def _compile_if(self, node):
+        """Compila un if"""
+        to_boolean = self.runtime._to_boolean
+        condition = self.compile_expression(node.condition)
+        defined = self._defined
+        self._defined = set(defined)
+        then_block = self._compile_block(node.then_body)
+        then_defined = self._defined
+        self._defined = set(defined)
+        else_block = self._compile_block(node.else_body)
+        # Solo queda definido lo que se asigna en ambas ramas
+        self._defined &= then_defined
+        
+        def run_if():
+            if to_boolean(condition()):
+                return then_block()
+            return else_block()
+        return run_if
+    
+    def _compile_while(self, node):
+        """Compila un while"""
+        to_boolean = self.runtime._to_boolean
+        budget = self.runtime.budget
+        # Cada vuelta cuesta una operación más una por statement del cuerpo
+        cost = len(node.body) + 1
+        line = node.line
+        condition = self.compile_expression(node.condition)
+        # El cuerpo puede no ejecutarse: sus asignaciones no cuentan después
+        defined = set(self._defined)
+        body = self._compile_block(node.body)
+        self._defined = defined
+        cells = tuple(self._invariant_cell(slot) for slot in node.invariants)
+        
+        def run_while():
+            result = None
+            iterations = 0
+            # Cada ejecución del bucle vuelve a calcular sus invariantes
+            for cell in cells:
+                cell[0] = _PENDING
+            while to_boolean(condition()):
+                budget.fuel -= cost
+                if budget.fuel < 0:
+                    budget.check(line, iterations)
+                result = body()
+                iterations += 1
+            for cell in cells:
+                cell[0] = _PENDING
+            return result
+        return run_while
+    
+    def _compile_vector_loop(self, node):
+        """Compila un while contado: por vectores, o el while normal si no se puede"""
+        vector_loop = self.runtime._vector_loop
+        loop = self._compile_while(node.loop)
+        
+        def run_vector_loop():
+            if vector_loop(node):
+                return None
+            return loop()
+        return run_vector_loop
+    
+    def _compile_plot(self, node):
+        """Compila plot/scatter/hist"""
+        plot = self.runtime._plot
+        kind = node.kind
+        # Un error en los argumentos no detiene el programa, así que las
+        # variables verificadas aquí no pueden darse por definidas
+        self._protected = True
+        args = tuple(self.compile_expression(arg) for arg in node.args)
+        self._protected = False
+        
+        def run_plot():
+            try:
+                values = [arg() for arg in args]
+            except BudgetExceeded:
+                raise
+            except Exception as e:
+                print(f"❌ Error al procesar expresiones: {str(e)}")
+                return None
+            plot(kind, *values)
+            return None
+        return run_plot
+    
+    def _compile_file_op(self, node):
+        """Compila readFile/writeFile"""
+        args = tuple(self.compile_expression(arg) for arg in node.args)
+        if node.kind == 'readFile':
+            read_file = self.runtime._read_file
+            return lambda: read_file(*[arg() for arg in args])
+        
+        write_file = self.runtime._write_file
+        
+        def run_write_file():
+            write_file(*[arg() for arg in args])
+            return None
+        return run_write_file
+    
+    # === EXPRESIONES ===
+    def _compile_literal(self, node):
+        """Compila un literal"""
+        value = node.value
+        return lambda: value
+    
+    def _compile_variable(self, node):
+        """Compila la lectura de una variable: un índice en la lista de slots"""
+        cells = self.runtime.variables.cells
+        name = node.name
+        slot = self.runtime.variables.slot(name)
+        if name in self._defined:
+            return lambda: cells[slot]
+        if not self._protected:
+            self._defined.add(name)
+        undefined = UNDEFINED
+        
+        def load():
+            value = cells[slot]
+            if value is undefined:
+                raise RuntimeError(f"Variable no definida: {name}")
+            return value
+        return load
+    
+    def _compile_binary_op(self, node):
+        """Compila una operación binaria"""
+        op = self.runtime.operators[node.op]
+        left = self.compile_expression(node.left)
+        right = self.compile_expression(node.right)
+        return lambda: op(left(), right())
+    
+    def _compile_specialized_op(self, node):
+        """Compila una operación binaria con tipos conocidos"""
+        left = self.compile_expression(node.left)
+        right = self.compile_expression(node.right)
+        if node.kind == 'number' and node.op in _NUMBER_OPERATIONS:
+            return _NUMBER_OPERATIONS[node.op](left, right)
+        op = self.runtime.specialized[node.op, node.kind]
+        return lambda: op(left(), right())
+    
+    def _compile_not(self, node):
+        """Compila una negación lógica"""
+        to_boolean = self.runtime._to_boolean
+        operand = self.compile_expression(node.operand)
+        return lambda: not to_boolean(operand())
+    
+    def _compile_logical(self, node):
+        """Compila and/or (ambos lados se evalúan siempre)"""
+        to_boolean = self.runtime._to_boolean
+        left = self.compile_expression(node.left)
+        right = self.compile_expression(node.right)
+        if node.op == 'and':
+            def run_and():
+                l, r = to_boolean(left()), to_boolean(right())
+                return l and r
+            return run_and
+        
+        def run_or():
+            l, r = to_boolean(left()), to_boolean(right())
+            return l or r
+        return run_or
+    
+    def _compile_list(self, node):
+        """Compila un literal de lista (empaquetado si es de números)"""
+        items = tuple(self.compile_expression(item) for item in node.items)
+        pack = self.runtime._pack
+        return lambda: pack([item() for item in items])
+    
+    def _compile_matrix(self, node):
+        """Compila un literal de matriz (empaquetado si es de números)"""
+        rows = tuple(self.compile_expression(row) for row in node.rows)
+        pack = self.runtime._pack
+        return lambda: pack([row() for row in rows])
+    
+    def _compile_numeric(self, node):
+        """Un literal numérico empaquetado se materializa al compilar"""
+        value = node.materialize()
+        return lambda: value
+    
+    def _invariant_cell(self, slot):
+        """Celda compartida por un ast.Invariant y el while que lo contiene"""
+        if slot not in self._invariant_cells:
+            self._invariant_cells[slot] = [_PENDING]
+        return self._invariant_cells[slot]
+    
+    def _compile_invariant(self, node):
+        """Compila una expresión invariante: se calcula una vez por ejecución del bucle"""
+        cell = self._invariant_cell(node.slot)
+        expr = self.compile_expression(node.expr)
+        
+        def load_invariant():
+            value = cell[0]
+            if value is _PENDING:
+                value = cell[0] = expr()
+            return value
+        return load_invariant
+    
+    def _compile_call(self, node):
+        """Compila una llamada a función integrada"""
+        func = self.runtime.builtins[node.func]
+        line = self._line
+        args = tuple(self.compile_expression(arg) for arg in node.args)
+        # Un presupuesto agotado al empezar la función indica la línea del
+        # statement; try no cuesta nada si no hay excepción
+        if len(args) == 1:
+            arg = args[0]
+            
+            def call1():
+                try:
+                    return func(arg())
+                except BudgetExceeded as error:
+                    error.locate(line)
+                    raise
+            return call1
+        if len(args) == 2:
+            first, second = args
+            
+            def call2():
+                try:
+                    return func(first(), second())
+                except BudgetExceeded as error:
+                    error.locate(line)
+                    raise
+            return call2
+        
+        def call():
+            try:
+                return func(*[arg() for arg in args])
+            except BudgetExceeded as error:
+                error.locate(line)
+                raise
+        return call
+    
+    def _compile_matrix_expression(self, node):
+        """Compila operaciones de matrices anidadas que se calculan juntas"""
+        evaluate = self.runtime._matrix_expression
+        ops = node.ops
+        line = self._line
+        args = tuple(self.compile_expression(arg) for arg in node.args)
+        
+        def matrix_expression():
+            try:
+                return evaluate(ops, *[arg() for arg in args])
+            except BudgetExceeded as error:
+                error.locate(line)
+                raise
+        return matrix_expression
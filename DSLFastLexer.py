@@ -0,0 +1,191 @@
+import re
+from antlr4.Token import Token, CommonToken
+from antlr4.CommonTokenFactory import CommonTokenFactory
+from antlr4.error.ErrorListener import ConsoleErrorListener
+from DeepLearningDSLParser import DeepLearningDSLParser
+
+# Palabras clave y símbolos con su tipo de token, tomados del parser generado
+LITERAL_TYPES = {name[1:-1]: token_type
+                 for token_type, name in enumerate(DeepLearningDSLParser.literalNames)
+                 if name.startswith("'")}
+
+# Una alternativa por regla léxica de la gramática. El orden reproduce la
+# regla de ANTLR de preferir el token más largo: NUMBER va antes que el '-'
+# suelto (así "x-1" da ID NUMBER(-1)), el comentario antes que '/' y los
+# operadores de dos caracteres antes que los de uno. Las palabras clave se
+# reconocen como ID y se reclasifican con LITERAL_TYPES.
+TOKEN_PATTERN = re.compile(r'''
+    (?P<ws>[ \t\r\n]+)
+  | (?P<comment>//[^\r\n]*)
+  | (?P<number>-?[0-9]+(?:\.[0-9]+)?)
+  | (?P<id>[a-zA-Z_][a-zA-Z_0-9]*)
+  | (?P<string>"[^"]*")
+  | (?P<symbol><=|>=|==|!=|[;=*/+\-^<>(),\[\]])
+''', re.VERBOSE)
+# Caracteres que se leen por vez cuando el código viene de un archivo abierto
+STREAM_CHUNK_SIZE = 64 * 1024
+# Caracteres que hay que ver después de un token para saber que no sigue:
+# "1." solo es NUMBER más largo si después del punto viene un dígito
+TOKEN_LOOKAHEAD = 2
+
+class DSLFastLexer:
+    """Lexer escrito a mano para DeepLearningDSL.
+    
+    Produce los mismos CommonToken que DeepLearningDSLLexer (tipo, texto,
+    posición, línea y columna) usando una sola expresión regular por token en
+    lugar de simular el ATN carácter por carácter. Ante un carácter que
+    ninguna regla acepta delega ese tramo en el lexer generado, de modo que
+    los errores léxicos y su recuperación son exactamente los de ANTLR.
+    
+    Con reader (un archivo de texto abierto) el código se lee por bloques de
+    chunk_size caracteres y se descarta lo ya tokenizado: el buffer solo
+    crece más allá de un bloque si un token es más largo que eso.
+    """
+    
+    def __init__(self, code, reader=None, chunk_size=STREAM_CHUNK_SIZE):
+        self._code = code
+        self._length = len(code)
+        self._pos = 0
+        # Posición absoluta del inicio del buffer (distinta de 0 al leer por bloques)
+        self._offset = 0
+        self._reader = reader
+        self._chunk_size = chunk_size
+        self.line = 1
+        self.column = 0
+        self._factory = CommonTokenFactory.DEFAULT
+        self._source = (self, None)
+        self._listeners = [ConsoleErrorListener.INSTANCE]
+        self._fallback = None
+        self._input_stream = None
+    
+    # === INTERFAZ DE TokenSource ===
+    def nextToken(self):
+        """Retorna el siguiente token (EOF al final de la entrada)"""
+        code = self._code
+        match = TOKEN_PATTERN.match
+        while True:
+            pos = self._pos
+            if pos >= self._length:
+                if self._reader is not None and self._refill():
+                    code = self._code
+                    continue
+                return self._make_token(Token.EOF, None, pos, pos - 1)
+            
+            found = match(code, pos)
+            if self._reader is not None and (found is None or found.end() + TOKEN_LOOKAHEAD > self._length):
+                # El token puede seguir en el próximo bloque
+                if self._refill(self._chunk_size):
+                    code = self._code
+                    continue
+            if found is None:
+                return self._fallback_token()
+            
+            kind = found.lastgroup
+            end = found.end()
+            self._pos = end
+            if kind == 'ws' or kind == 'comment':
+                self._advance(code, pos, end)
+                continue
+            
+            text = found.group()
+            if kind == 'id':
+                token_type = LITERAL_TYPES.get(text, DeepLearningDSLParser.ID)
+            elif kind == 'number':
+                token_type = DeepLearningDSLParser.NUMBER
+            elif kind == 'symbol':
+                token_type = LITERAL_TYPES[text]
+            else:
+                token_type = DeepLearningDSLParser.STRING
+            
+            token = self._make_token(token_type, text, pos, end - 1)
+            if kind == 'string':
+                self._advance(code, pos, end)
+            else:
+                self.column += end - pos
+            return token
+    
+    def getSourceName(self):
+        """Nombre de la fuente (igual que un InputStream de ANTLR)"""
+        return "<empty>"
+    
+    def getInputStream(self):
+        """InputStream de ANTLR sobre el buffer actual (se crea al pedirlo)"""
+        if self._input_stream is None:
+            from antlr4.InputStream import InputStream
+            self._input_stream = InputStream(self._code)
+        return self._input_stream
+    
+    def addErrorListener(self, listener):
+        """Agrega un listener para los errores léxicos"""
+        self._listeners.append(listener)
+    
+    def removeErrorListeners(self):
+        """Quita todos los listeners de errores léxicos"""
+        self._listeners = []
+    
+    # === AUXILIARES ===
+    def _make_token(self, token_type, text, start, stop):
+        """Crea un CommonToken en la línea y columna actuales"""
+        offset = self._offset
+        token = CommonToken(self._source, token_type, Token.DEFAULT_CHANNEL, start + offset, stop + offset)
+        if text is not None:
+            token.text = text
+        else:
+            token.text = "<EOF>"
+        return token
+    
+    def _advance(self, code, start, end):
+        """Actualiza línea y columna después de consumir code[start:end]"""
+        newlines = code.count('\n', start, end)
+        if newlines:
+            self.line += newlines
+            self.column = end - code.rfind('\n', start, end) - 1
+        else:
+            self.column += end - start
+    
+    def _refill(self, lookahead=1):
+        """Agrega bloques del reader al buffer, descartando lo ya tokenizado,
+        hasta tener lookahead caracteres más. Retorna False si no había más."""
+        chunks = []
+        read = 0
+        while read < lookahead:
+            chunk = self._reader.read(self._chunk_size)
+            if not chunk:
+                self._reader = None
+                break
+            chunks.append(chunk)
+            read += len(chunk)
+        if not chunks:
+            return False
+        self._offset += self._pos
+        self._code = self._code[self._pos:] + "".join(chunks)
+        self._length = len(self._code)
+        self._pos = 0
+        # El lexer generado trabaja sobre el buffer anterior
+        self._input_stream = None
+        self._fallback = None
+        return True
+    
+    def _fallback_token(self):
+        """Lexea el tramo que empieza en la posición actual con el lexer generado"""
+        if self._fallback is None:
+            from DeepLearningDSLLexer import DeepLearningDSLLexer
+            self._fallback = DeepLearningDSLLexer(self.getInputStream())
+            self._fallback.removeErrorListeners()
+            for listener in self._listeners:
+                self._fallback.addErrorListener(listener)
+        lexer = self._fallback
+        input_stream = self.getInputStream()
+        input_stream.seek(self._pos)
+        lexer._hitEOF = False
+        lexer.line = self.line
+        lexer.column = self.column
+        token = lexer.nextToken()
+        # Fijar el texto antes de pasar a posiciones absolutas (se calcula del buffer)
+        token.text = token.text
+        token.start += self._offset
+        token.stop += self._offset
+        self._pos = input_stream.index
+        self.line = lexer.line
+        self.column = lexer.column
+        return token
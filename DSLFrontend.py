@@ -0,0 +1,154 @@
+from antlr4 import InputStream, CommonTokenStream
+from antlr4.Token import Token, CommonToken
+from antlr4.ListTokenSource import ListTokenSource
+from antlr4.error.ErrorListener import ErrorListener
+from antlr4.error.ErrorStrategy import BailErrorStrategy, DefaultErrorStrategy
+from antlr4.error.Errors import ParseCancellationException
+from antlr4.atn.PredictionMode import PredictionMode
+from DeepLearningDSLParser import DeepLearningDSLParser
+from DSLFastLexer import DSLFastLexer, LITERAL_TYPES, STREAM_CHUNK_SIZE
+from DSLAstBuilder import DSLAstBuilder
+from DSLParserCache import load_parser_cache
+
+# Este es el único punto de entrada a ANTLR desde main.py: se importa recién
+# cuando hay que parsear código fuente, así que ejecutar un artefacto .dslc
+# no carga antlr4, el lexer ni el parser.
+
+# None hasta el primer intento de cargar la caché de DFA del parser
+_dfa_cache_loaded = None
+# True después de un programa que SLL no pudo parsear y LL sí: desde ahí el
+# modo auto va directo a LL en lugar de pagar dos parseos por programa
+_sll_failed = False
+
+# Tokens que delimitan los statements de nivel superior en el modo streaming
+BLOCK_OPEN_TYPES = {LITERAL_TYPES['if'], LITERAL_TYPES['while']}
+BLOCK_CLOSE_TYPES = {LITERAL_TYPES['fi'], LITERAL_TYPES['done']}
+SEMICOLON_TYPE = LITERAL_TYPES[';']
+
+class DSLErrorListener(ErrorListener):
+    """Maneja errores de parsing personalizado"""
+    
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+    
+    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
+        error_msg = f"Error de sintaxis en línea {line}, columna {column}: {msg}"
+        self.errors.append(error_msg)
+        print(f"❌ {error_msg}")
+
+def load_dfa_cache():
+    """Carga una sola vez por proceso los DFA guardados con --warm-parser"""
+    global _dfa_cache_loaded
+    if _dfa_cache_loaded is None:
+        _dfa_cache_loaded = load_parser_cache()
+    return _dfa_cache_loaded
+
+def create_lexer(code, lexer="fast"):
+    """Crea el lexer pedido: "fast" (DSLFastLexer) o "antlr" (el generado)"""
+    if lexer == "fast":
+        return DSLFastLexer(code)
+    from DeepLearningDSLLexer import DeepLearningDSLLexer
+    return DeepLearningDSLLexer(InputStream(code))
+
+def parse_tree(code, parse_mode="auto", lexer="fast"):
+    """Parsea código DSL en dos etapas (SLL y, si falla, LL completo).
+    
+    Retorna (árbol, modo usado); el árbol es None si hay errores de sintaxis.
+    """
+    return _parse(create_lexer(code, lexer), parse_mode)
+
+def _parse(token_source, parse_mode):
+    """Parsea un programa completo desde una fuente de tokens (ver parse_tree)"""
+    global _sll_failed
+    # Crear parser
+    stream = CommonTokenStream(token_source)
+    parser = DeepLearningDSLParser(stream)
+    parser.removeErrorListeners()
+    
+    bailed = False
+    if parse_mode == "auto" and not _sll_failed:
+        # Primera etapa: predicción SLL, abortando ante el primer error
+        parser._interp.predictionMode = PredictionMode.SLL
+        parser._errHandler = BailErrorStrategy()
+        try:
+            return parser.program(), "SLL"
+        except ParseCancellationException:
+            # Segunda etapa: reparsear desde el inicio en modo LL
+            stream.seek(0)
+            parser.reset()
+            bailed = True
+    
+    # Configurar manejo de errores
+    error_listener = DSLErrorListener()
+    parser.addErrorListener(error_listener)
+    parser._errHandler = DefaultErrorStrategy()
+    if parse_mode == "sll":
+        parser._interp.predictionMode = PredictionMode.SLL
+        used_mode = "SLL"
+    else:
+        parser._interp.predictionMode = PredictionMode.LL
+        used_mode = "LL"
+    
+    # Parsear el código
+    tree = parser.program()
+    
+    # Si hay errores de parsing, no continuar
+    if error_listener.errors:
+        return None, used_mode
+    # Un programa válido que SLL no pudo parsear: los siguientes van a LL
+    if bailed:
+        _sll_failed = True
+    return tree, used_mode
+
+def split_statements(token_source):
+    """Agrupa los tokens en statements de nivel superior.
+    
+    Un statement termina en un ';' o en el 'fi'/'done' que cierra su bloque
+    (fuera de bloques, ';' no puede aparecer dentro de una expresión). Genera
+    listas de tokens terminadas en un token EOF, listas para parsear como un
+    programa; solo se guarda en memoria el statement actual.
+    """
+    tokens = []
+    depth = 0
+    while True:
+        token = token_source.nextToken()
+        tokens.append(token)
+        if token.type == Token.EOF:
+            if len(tokens) > 1:
+                yield tokens
+            return
+        
+        if token.type in BLOCK_OPEN_TYPES:
+            depth += 1
+            continue
+        if token.type in BLOCK_CLOSE_TYPES:
+            depth -= 1
+        elif token.type != SEMICOLON_TYPE or depth > 0:
+            continue
+        if depth <= 0:
+            # Un 'fi' o 'done' sin abrir también corta (el parser lo informa)
+            tokens.append(_eof_after(token))
+            yield tokens
+            tokens = []
+            depth = 0
+
+def _eof_after(token):
+    """Token EOF que cierra un statement justo después de token"""
+    eof = CommonToken(token.source, Token.EOF, Token.DEFAULT_CHANNEL, token.stop + 1, token.stop)
+    eof.line = token.line
+    eof.column = token.column + len(token.text)
+    eof.text = "<EOF>"
+    return eof
+
+def stream_trees(reader, parse_mode="auto", chunk_size=None):
+    """Parsea un script desde un archivo abierto, un statement de nivel
+    superior a la vez. Genera (árbol, modo) por statement; el árbol es None
+    si el statement tiene errores de sintaxis."""
+    lexer = DSLFastLexer("", reader, chunk_size or STREAM_CHUNK_SIZE)
+    for tokens in split_statements(lexer):
+        yield _parse(ListTokenSource(tokens), parse_mode)
+
+def build_program(tree):
+    """Reduce el árbol de ANTLR al AST compacto (ast.Program)"""
+    return DSLAstBuilder().visit(tree)
@@ -0,0 +1,281 @@
+"""Grafos perezosos de expresiones de matrices (ast.MatrixExpression).
+
+Una expresión como matsum(matmul(transpose(A), B), C) no se calcula
+operación por operación: DSLAstBuilder y el visitor la reúnen en un solo
+nodo con las operaciones en notación postfija, y el runtime arma con los
+valores un grafo que recién se calcula al final. Así la transpuesta se lee
+en su lugar dentro del producto, el producto y la suma se hacen en una
+pasada sin guardar el producto aparte, y un producto de varias matrices se
+asocia en el orden de menor costo.
+
+Como los argumentos se calculan todos antes de verificar las dimensiones,
+solo se fusionan expresiones cuyos argumentos no pueden fallar ni imprimir
+(variables y literales); con cualquier otro argumento la salida y los
+errores saldrían en otro orden que operación por operación.
+"""
+import DSLAst as ast
+from DSLVector import DSLVector, DSLMatrix
+
+# Funciones que se reúnen en un ast.MatrixExpression y sus argumentos
+FUSED_FUNCTIONS = {'transpose': 1, 'matmul': 2, 'matsum': 2, 'matsub': 2}
+# Operación que toma el siguiente argumento de un ast.MatrixExpression
+ARGUMENT = '$'
+
+# === CONSTRUCCIÓN DEL AST ===
+def fuse(node):
+    """ast.MatrixExpression equivalente a un ast.Call de FUSED_FUNCTIONS con
+    otras anidadas, o node mismo si no hay nada que fusionar (una sola
+    operación o ningún matmul) o si algún argumento no es simple (ver is_plain)"""
+    if not isinstance(node, ast.Call) or node.func not in FUSED_FUNCTIONS:
+        return node
+    ops, args = [], []
+    _flatten(node, ops, args)
+    if not is_fusable(ops) or not all(map(is_plain, args)):
+        return node
+    return ast.MatrixExpression(ops, args, node.line)
+
+def is_fusable(ops):
+    """True si vale la pena calcular ops como un grafo: al menos dos
+    operaciones y un producto"""
+    return len(ops) - ops.count(ARGUMENT) >= 2 and 'matmul' in ops
+
+def is_plain(node):
+    """True si calcular la expresión node no puede fallar ni imprimir:
+    variables y literales cuyos elementos también lo son. Una función pura
+    como inverse puede fallar, y su error saldría antes que uno de
+    dimensiones que operación por operación sale primero"""
+    if isinstance(node, ast.ListLiteral):
+        return all(map(is_plain, node.items))
+    if isinstance(node, ast.MatrixLiteral):
+        return all(map(is_plain, node.rows))
+    return isinstance(node, (ast.Variable, ast.Number, ast.String, ast.Boolean, ast.NumericLiteral))
+
+def _flatten(node, ops, args):
+    """Agrega a ops y args la notación postfija de node"""
+    if isinstance(node, ast.MatrixExpression):
+        ops.extend(node.ops)
+        args.extend(node.args)
+    elif isinstance(node, ast.Call) and node.func in FUSED_FUNCTIONS:
+        for arg in node.args:
+            _flatten(arg, ops, args)
+        ops.append(node.func)
+    else:
+        ops.append(ARGUMENT)
+        args.append(node)
+
+# === EVALUACIÓN ===
+def evaluate(runtime, ops, values):
+    """Valor de ops sobre values con el backend de matrices del runtime.
+    
+    Las dimensiones se verifican primero, en el orden original y con los
+    mismos errores que las funciones integradas. Si algún valor no es una
+    matriz empaquetada no vacía (listas sin empaquetar, textos) o si
+    runtime.fuse_matrices es False se calcula operación por operación, como
+    sin fusionar.
+    """
+    if not runtime.fuse_matrices:
+        return _evaluate_stepwise(runtime, ops, values)
+    try:
+        graph = _build(ops, values)
+    except _Unfusable:
+        return _evaluate_stepwise(runtime, ops, values)
+    return _Evaluator(runtime._matrix_backend()).matrix(_push_transposes(graph, False))
+
+def _evaluate_stepwise(runtime, ops, values):
+    """ops operación por operación con las funciones integradas del runtime"""
+    stack = []
+    values = iter(values)
+    for op in ops:
+        if op == ARGUMENT:
+            stack.append(next(values))
+        else:
+            count = FUSED_FUNCTIONS[op]
+            args = stack[-count:]
+            del stack[-count:]
+            stack.append(runtime.builtins[op](*args))
+    return stack.pop()
+
+class _Unfusable(Exception):
+    """Un valor no es una matriz empaquetada no vacía"""
+
+class _Node:
+    """Nodo del grafo: una matriz de rows x cols por calcular"""
+    
+    __slots__ = ('rows', 'cols')
+
+class _Leaf(_Node):
+    """Una matriz ya calculada"""
+    
+    __slots__ = ('matrix',)
+    
+    def __init__(self, matrix):
+        self.matrix = matrix
+        self.rows, self.cols = matrix.rows, matrix.cols
+
+class _Transpose(_Node):
+    """Transpuesta de otro nodo"""
+    
+    __slots__ = ('operand',)
+    
+    def __init__(self, operand):
+        self.operand = operand
+        self.rows, self.cols = operand.cols, operand.rows
+
+class _Product(_Node):
+    """Producto de dos nodos"""
+    
+    __slots__ = ('left', 'right')
+    
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.rows, self.cols = left.rows, right.cols
+
+class _Sum(_Node):
+    """Suma o resta de dos nodos"""
+    
+    __slots__ = ('left', 'right', 'subtract')
+    
+    def __init__(self, left, right, subtract):
+        self.left = left
+        self.right = right
+        self.subtract = subtract
+        self.rows, self.cols = left.rows, left.cols
+
+def _build(ops, values):
+    """Grafo de ops sobre values; ValueError con el primer error de
+    dimensiones, _Unfusable si un valor no se puede usar en el grafo"""
+    stack = []
+    values = iter(values)
+    for op in ops:
+        if op == ARGUMENT:
+            stack.append(next(values))
+        elif op == 'transpose':
+            operand = stack.pop()
+            # Como transpose: un vector fila pasa a ser una columna
+            stack.append(_vector(operand, len(operand), 1) if isinstance(operand, DSLVector)
+                         else _Transpose(_node(operand)))
+        else:
+            right = stack.pop()
+            left = stack.pop()
+            if op == 'matmul':
+                # Como matmul: un vector es una fila a la izquierda y una columna a la derecha
+                left = _vector(left, 1, len(left)) if isinstance(left, DSLVector) else _node(left)
+                right = _vector(right, len(right), 1) if isinstance(right, DSLVector) else _node(right)
+                if left.cols != right.rows:
+                    raise ValueError(f"Dimensiones incompatibles: {left.rows}x{left.cols} y {right.rows}x{right.cols}")
+                stack.append(_Product(left, right))
+            else:
+                left, right = _node(left), _node(right)
+                if left.rows != right.rows or left.cols != right.cols:
+                    raise ValueError("Las matrices deben tener las mismas dimensiones")
+                stack.append(_Sum(left, right, op == 'matsub'))
+    return stack.pop()
+
+def _node(value):
+    """Nodo de un operando: el mismo si ya es un nodo, una hoja si es una matriz"""
+    if isinstance(value, _Node):
+        return value
+    if isinstance(value, DSLMatrix) and value.rows and value.cols:
+        return _Leaf(value)
+    raise _Unfusable()
+
+def _vector(vector, rows, cols):
+    """Hoja con un vector visto como una matriz de rows x cols (sin copiarlo)"""
+    if not vector:
+        raise _Unfusable()
+    return _Leaf(DSLMatrix(vector, rows, cols))
+
+def _push_transposes(node, transposed):
+    """El mismo grafo con las transpuestas bajadas hasta las hojas:
+    (A B)^T = B^T A^T, (A + B)^T = A^T + B^T y (A^T)^T = A"""
+    if isinstance(node, _Transpose):
+        return _push_transposes(node.operand, not transposed)
+    if isinstance(node, _Product):
+        if transposed:
+            return _Product(_push_transposes(node.right, True), _push_transposes(node.left, True))
+        return _Product(_push_transposes(node.left, False), _push_transposes(node.right, False))
+    if isinstance(node, _Sum):
+        return _Sum(_push_transposes(node.left, transposed), _push_transposes(node.right, transposed),
+                    node.subtract)
+    return _Transpose(node) if transposed else node
+
+class _Evaluator:
+    """Calcula un grafo con las transpuestas ya en las hojas"""
+    
+    def __init__(self, backend):
+        self.backend = backend
+    
+    def matrix(self, node):
+        """DSLMatrix con el valor de un nodo"""
+        if isinstance(node, _Leaf):
+            return node.matrix
+        if isinstance(node, _Transpose):
+            return self.backend.transpose(node.operand.matrix)
+        if isinstance(node, _Product):
+            return self._product(node)
+        # Si un lado de la suma es un producto, el otro se suma al calcularlo
+        if isinstance(node.left, _Product):
+            return self._product(node.left, self.matrix(node.right), 'sub' if node.subtract else 'add')
+        if isinstance(node.right, _Product):
+            return self._product(node.right, self.matrix(node.left), 'rsub' if node.subtract else 'add')
+        left, right = self.matrix(node.left), self.matrix(node.right)
+        return self.backend.subtract(left, right) if node.subtract else self.backend.add(left, right)
+    
+    def _product(self, node, addend=None, mode='add'):
+        """Producto de una cadena de matrices, con addend sumado según mode
+        (ver PythonBackend.multiply). Se asocia en el orden de menor costo
+        solo si es estrictamente más barato que el original: con el mismo
+        costo se conservan los bits de la expresión escrita"""
+        factors = []
+        plan = _chain(node, factors)
+        if len(factors) > 2:
+            dims = [factor.rows for factor in factors] + [factors[-1].cols]
+            cost, best = _best_order(dims)
+            if cost < _cost(plan, dims)[0]:
+                plan = best
+        operands = [self._operand(factor) for factor in factors]
+        return self._multiply(plan, operands, addend, mode)
+    
+    def _operand(self, node):
+        """(matriz, transpuesta) de un factor: la transpuesta de una hoja no
+        se calcula, el producto la lee en su lugar"""
+        if isinstance(node, _Transpose):
+            return node.operand.matrix, True
+        return self.matrix(node), False
+    
+    def _multiply(self, plan, operands, addend=None, mode='add'):
+        """Calcula un plan de _chain o _best_order"""
+        left, right = [operands[part] if isinstance(part, int) else (self._multiply(part, operands), False)
+                       for part in plan]
+        return self.backend.multiply(left[0], right[0], left[1], right[1], addend, mode)
+
+def _chain(node, factors):
+    """Plan de un producto en su asociación original: pares anidados de
+    índices de factors, los operandos que no son productos"""
+    if not isinstance(node, _Product):
+        factors.append(node)
+        return len(factors) - 1
+    return (_chain(node.left, factors), _chain(node.right, factors))
+
+def _cost(plan, dims):
+    """(multiplicaciones escalares, i, j) de un plan de los factores i a j - 1,
+    donde el factor k es de dims[k] x dims[k + 1]"""
+    if isinstance(plan, int):
+        return 0, plan, plan + 1
+    left_cost, i, k = _cost(plan[0], dims)
+    right_cost, _, j = _cost(plan[1], dims)
+    return left_cost + right_cost + dims[i] * dims[k] * dims[j], i, j
+
+def _best_order(dims):
+    """(costo, plan) de la asociación más barata de la cadena de factores de
+    dims[k] x dims[k + 1], por programación dinámica en O(n^3)"""
+    n = len(dims) - 1
+    best = {(i, i + 1): (0, i) for i in range(n)}
+    for length in range(2, n + 1):
+        for i in range(n - length + 1):
+            j = i + length
+            best[i, j] = min(((best[i, k][0] + best[k, j][0] + dims[i] * dims[k] * dims[j],
+                               (best[i, k][1], best[k, j][1])) for k in range(i + 1, j)),
+                             key=lambda entry: entry[0])
+    return best[0, n]
@@ -0,0 +1,566 @@
+import DSLAst as ast
+from DSLRuntime import DSLRuntime
+from DSLTypes import DSLTypeInference
+from DSLVectorizer import DSLLoopVectorizer
+from DSLMatrixGraph import ARGUMENT, FUSED_FUNCTIONS
+from DSLVector import DSLVector, DSLMatrix, SEQUENCE_TYPES
+
+# Versión de las transformaciones: forma parte de la clave de las cachés de
+# código compilado, que guardan programas ya optimizados
+OPTIMIZER_VERSION = 10
+
+# Funciones integradas sin efectos secundarios que se pueden evaluar al
+# compilar (las de ML imprimen y usan números aleatorios, readFile imprime)
+PURE_BUILTINS = {'sin', 'cos', 'tan', 'sqrt', 'log', 'exp',
+                 'transpose', 'inverse', 'matmul', 'matsum', 'matsub', 'det', 'solve', 'density'}
+# Funciones puras cuyo resultado depende del backend de matrices (NumPy suma
+# en otro orden): no se pliegan, las calcula el backend elegido al ejecutar
+BACKEND_BUILTINS = {'matmul', 'inverse', 'det', 'solve'}
+# Tamaño máximo de una lista o texto que se construye al compilar: "[0] * 1e9"
+# se deja para la ejecución
+MAX_FOLDED_ELEMENTS = 4096
+
+class DSLOptimizer:
+    """Plegado y propagación de constantes sobre el AST (DSLAst).
+    
+    Las subexpresiones cuyos operandos son literales se evalúan al compilar
+    con los mismos métodos de DSLRuntime que usan los motores, así que el
+    resultado es idéntico; si la evaluación falla (división por cero, raíz
+    de un negativo) la expresión se deja intacta para que el error ocurra
+    al ejecutar, como antes. Una variable asignada una sola vez en todo el
+    programa, en un statement de nivel superior y con un valor constante, se
+    reemplaza por ese valor en los statements posteriores; la asignación se
+    conserva porque informa el valor y define la variable.
+    
+    Dentro de cada while, las subexpresiones puras cuyas variables el cuerpo
+    no asigna (matmul(W, transpose(X)) con W y X fijos) se envuelven en un
+    ast.Invariant, que los motores evalúan una sola vez por ejecución del
+    bucle. Se evalúan recién cuando el bucle las necesita por primera vez,
+    así que un bucle que no itera, una rama que no se toma o un error
+    (inverse de una matriz singular) se comportan igual que sin optimizar.
+    Las acumulaciones x = x + [...] de un while que no lee x en ningún otro
+    lugar pasan a ser ast.Append, que agregan a la lista en su lugar.
+    
+    Después DSLTypeInference especializa las operaciones cuyos operandos
+    tienen tipos conocidos y DSLLoopVectorizer marca los while contados que
+    se pueden calcular por vectores.
+    """
+    
+    def __init__(self, runtime=None):
+        self.runtime = runtime or DSLRuntime()
+        self.folded = 0
+        self.propagated = 0
+        self.hoisted = 0
+        self.accumulators = 0
+        # Operaciones binarias que quedaron en el programa y cuántas se especializaron
+        self.operations = 0
+        self.specialized = 0
+        self.vectorized = 0
+        # Próximo slot libre para un ast.Invariant o un ast.Append
+        self._next_slot = 0
+        # Variables propagables ya asignadas: nombre -> nodo constante
+        self._constants = {}
+        self._statement_optimizers = {
+            ast.Assign: self._optimize_assign,
+            ast.ExprStatement: self._optimize_expr_statement,
+            ast.If: self._optimize_if,
+            ast.While: self._optimize_while,
+            ast.Plot: self._optimize_call_statement,
+            ast.FileOp: self._optimize_call_statement,
+        }
+        self._expression_optimizers = {
+            ast.Number: self._optimize_literal,
+            ast.String: self._optimize_literal,
+            ast.Boolean: self._optimize_literal,
+            ast.NumericLiteral: self._optimize_literal,
+            ast.Variable: self._optimize_variable,
+            ast.BinaryOp: self._optimize_binary_op,
+            ast.Not: self._optimize_not,
+            ast.Logical: self._optimize_logical,
+            ast.ListLiteral: self._optimize_list,
+            ast.MatrixLiteral: self._optimize_matrix,
+            ast.Call: self._optimize_call,
+            ast.MatrixExpression: self._optimize_matrix_expression,
+        }
+    
+    # === PROGRAMA PRINCIPAL ===
+    def optimize(self, program, variables=None):
+        """Retorna un ast.Program optimizado (el original no se modifica).
+        variables son los valores que tendrá el runtime al empezar, si se
+        conocen: dan los tipos iniciales de la inferencia."""
+        assignments = {}
+        self._count_assignments(program, assignments)
+        candidates = {statement.name for statement in program.body
+                      if isinstance(statement, ast.Assign) and assignments[statement.name] == 1}
+        
+        body = []
+        for statement in program.body:
+            statement = self._statement_optimizers[statement.__class__](statement)
+            if isinstance(statement, ast.Assign) and statement.name in candidates and is_propagable(statement.value):
+                self._constants[statement.name] = statement.value
+            body.append(statement)
+        program = ast.Program(self._hoist_block(body, []), program.line)
+        inference = DSLTypeInference()
+        program = inference.specialize(program, variables)
+        self.operations, self.specialized = inference.operations, inference.specialized
+        vectorizer = DSLLoopVectorizer()
+        program = vectorizer.vectorize(program)
+        self.vectorized = vectorizer.vectorized
+        return program
+    
+    def _count_assignments(self, node, assignments):
+        """Cuenta las asignaciones de cada variable en todo el programa"""
+        if isinstance(node, ast.Assign):
+            assignments[node.name] = assignments.get(node.name, 0) + 1
+        for field in node.fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.Node):
+                self._count_assignments(value, assignments)
+            elif isinstance(value, list):
+                # While.invariants es una lista de enteros, no de nodos
+                for item in value:
+                    if isinstance(item, ast.Node):
+                        self._count_assignments(item, assignments)
+    
+    def _block(self, body):
+        """Optimiza una lista de statements"""
+        return [self._statement_optimizers[statement.__class__](statement) for statement in body]
+    
+    # === STATEMENTS ===
+    def _optimize_assign(self, node):
+        """Asignación"""
+        return ast.Assign(node.name, self.optimize_expression(node.value), node.line)
+    
+    def _optimize_expr_statement(self, node):
+        """Statement de expresión"""
+        return ast.ExprStatement(self.optimize_expression(node.expr), node.line)
+    
+    def _optimize_if(self, node):
+        """if (ambas ramas se conservan)"""
+        return ast.If(self.optimize_expression(node.condition), self._block(node.then_body),
+                      self._block(node.else_body), node.line)
+    
+    def _optimize_while(self, node):
+        """while"""
+        return ast.While(self.optimize_expression(node.condition), self._block(node.body), [], node.line)
+    
+    def _optimize_call_statement(self, node):
+        """plot/scatter/hist y readFile/writeFile"""
+        return node.__class__(node.kind, [self.optimize_expression(arg) for arg in node.args], node.line)
+    
+    # === EXPRESIONES ===
+    def optimize_expression(self, node):
+        """Retorna la expresión optimizada (un literal si se pudo plegar)"""
+        return self._expression_optimizers[node.__class__](node)
+    
+    def _optimize_literal(self, node):
+        """Los literales ya son constantes"""
+        return node
+    
+    def _optimize_variable(self, node):
+        """Reemplaza una variable propagable por su valor"""
+        constant = self._constants.get(node.name)
+        if constant is None:
+            return node
+        self.propagated += 1
+        if isinstance(constant, ast.NumericLiteral):
+            # Se comparte el nodo: todas las lecturas ven el mismo valor materializado
+            return constant
+        return constant.__class__(constant.value, node.line)
+    
+    def _optimize_binary_op(self, node):
+        """Operación binaria"""
+        left = self.optimize_expression(node.left)
+        right = self.optimize_expression(node.right)
+        if is_constant(left) and is_constant(right):
+            left_value, right_value = constant_value(left), constant_value(right)
+            if node.op != '*' or _repeat_size(left_value, right_value) <= MAX_FOLDED_ELEMENTS:
+                folded = self._fold(lambda: self.runtime.operators[node.op](left_value, right_value), node.line)
+                if folded is not None:
+                    return folded
+        return ast.BinaryOp(node.op, left, right, node.line)
+    
+    def _optimize_not(self, node):
+        """Negación lógica"""
+        operand = self.optimize_expression(node.operand)
+        if is_constant(operand):
+            value = constant_value(operand)
+            folded = self._fold(lambda: not self.runtime._to_boolean(value), node.line)
+            if folded is not None:
+                return folded
+        return ast.Not(operand, node.line)
+    
+    def _optimize_logical(self, node):
+        """and/or: solo se pliega si ambos lados son constantes"""
+        left = self.optimize_expression(node.left)
+        right = self.optimize_expression(node.right)
+        if is_constant(left) and is_constant(right):
+            to_boolean = self.runtime._to_boolean
+            left_value, right_value = constant_value(left), constant_value(right)
+            if node.op == 'and':
+                folded = self._fold(lambda: to_boolean(left_value) and to_boolean(right_value), node.line)
+            else:
+                folded = self._fold(lambda: to_boolean(left_value) or to_boolean(right_value), node.line)
+            if folded is not None:
+                return folded
+        return ast.Logical(node.op, left, right, node.line)
+    
+    def _optimize_list(self, node):
+        """Literal de lista: empaquetado si todos los elementos son números"""
+        items = [self.optimize_expression(item) for item in node.items]
+        if all(isinstance(item, ast.Number) for item in items):
+            self.folded += 1
+            return ast.NumericLiteral([item.value for item in items], None, node.line)
+        return ast.ListLiteral(items, node.line)
+    
+    def _optimize_matrix(self, node):
+        """Literal de matriz: empaquetado si todas las filas lo están y son rectangulares"""
+        rows = [self.optimize_expression(row) for row in node.rows]
+        if all(isinstance(row, ast.NumericLiteral) and row.rows is None for row in rows) \
+                and len({len(row.values) for row in rows}) == 1:
+            self.folded += 1
+            values = [value for row in rows for value in row.values]
+            return ast.NumericLiteral(values, len(rows), node.line)
+        return ast.MatrixLiteral(rows, node.line)
+    
+    def _optimize_call(self, node):
+        """Llamada a función integrada (solo se pliegan las puras)"""
+        args = [self.optimize_expression(arg) for arg in node.args]
+        if node.func in PURE_BUILTINS and node.func not in BACKEND_BUILTINS \
+                and all(is_constant(arg) for arg in args):
+            values = [constant_value(arg) for arg in args]
+            folded = self._fold(lambda: self.runtime.builtins[node.func](*values), node.line)
+            if folded is not None:
+                return folded
+        return ast.Call(node.func, args, node.line)
+    
+    def _optimize_matrix_expression(self, node):
+        """Operaciones de matrices anidadas: incluyen un matmul (ver
+        BACKEND_BUILTINS), así que solo se optimizan los argumentos"""
+        return ast.MatrixExpression(node.ops, [self.optimize_expression(arg) for arg in node.args], node.line)
+    
+    # === INVARIANTES DE BUCLES ===
+    # loops es la lista de los while que contienen al statement, del más
+    # externo al más interno, como tuplas (variables asignadas, slots,
+    # acumuladores). Como cada cuerpo incluye a los anidados, una expresión
+    # invariante en un bucle también lo es en los de adentro; se marca en el
+    # más externo. Lo mismo vale para los acumuladores.
+    def _hoist_block(self, body, loops):
+        """Marca las expresiones invariantes de una lista de statements"""
+        return [self._hoist_statement(statement, loops) for statement in body]
+    
+    def _hoist_statement(self, node, loops):
+        """Marca las expresiones invariantes de un statement"""
+        if isinstance(node, ast.Assign):
+            items = accumulated_items(node)
+            slot = self._accumulator_slot(node.name, loops) if items is not None else None
+            if slot is not None:
+                self.accumulators += 1
+                return ast.Append(node.name, self._hoist_root(items, loops), slot, node.line)
+            return ast.Assign(node.name, self._hoist_root(node.value, loops), node.line)
+        if isinstance(node, ast.ExprStatement):
+            return ast.ExprStatement(self._hoist_root(node.expr, loops), node.line)
+        if isinstance(node, ast.If):
+            return ast.If(self._hoist_root(node.condition, loops), self._hoist_block(node.then_body, loops),
+                          self._hoist_block(node.else_body, loops), node.line)
+        if isinstance(node, ast.While):
+            # La condición se evalúa en cada iteración: cuenta como parte del bucle
+            loop = (assigned_names(node.body), [], accumulator_names(node))
+            inner = loops + [loop]
+            condition = self._hoist_root(node.condition, inner)
+            return ast.While(condition, self._hoist_block(node.body, inner), loop[1], node.line)
+        return node.__class__(node.kind, [self._hoist_root(arg, loops) for arg in node.args], node.line)
+    
+    def _hoist_root(self, node, loops):
+        """Marca una expresión completa de un statement"""
+        if not loops:
+            return node
+        node, level = self._hoist_expression(node, loops)
+        return self._mark(node, level, loops)
+    
+    def _hoist_expression(self, node, loops):
+        """Retorna (expresión, nivel). El nivel es el índice del bucle más
+        externo en el que la expresión es invariante, len(loops) si cambia en
+        el más interno, o None si no es pura."""
+        if is_constant(node):
+            return node, 0
+        if isinstance(node, ast.Variable):
+            level = 0
+            for index, (assigned, _, _) in enumerate(loops):
+                if node.name in assigned:
+                    level = index + 1
+            return node, level
+        if isinstance(node, (ast.BinaryOp, ast.Logical)):
+            (left, right), level = self._hoist_operands([node.left, node.right], True, loops)
+            return node.__class__(node.op, left, right, node.line), level
+        if isinstance(node, ast.Not):
+            (operand,), level = self._hoist_operands([node.operand], True, loops)
+            return ast.Not(operand, node.line), level
+        if isinstance(node, ast.ListLiteral):
+            items, level = self._hoist_operands(node.items, True, loops)
+            return ast.ListLiteral(items, node.line), level
+        if isinstance(node, ast.MatrixLiteral):
+            rows, level = self._hoist_operands(node.rows, True, loops)
+            return ast.MatrixLiteral(rows, node.line), level
+        if isinstance(node, ast.MatrixExpression):
+            args, level = self._hoist_operands(node.args, True, loops)
+            return ast.MatrixExpression(node.ops, args, node.line), level
+        args, level = self._hoist_operands(node.args, node.func in PURE_BUILTINS, loops)
+        return ast.Call(node.func, args, node.line), level
+    
+    def _hoist_operands(self, operands, pure, loops):
+        """Procesa los operandos de una expresión; retorna (operandos, nivel
+        de la expresión). Se marcan los operandos invariantes en un bucle
+        más externo que la expresión completa."""
+        results = [self._hoist_expression(operand, loops) for operand in operands]
+        levels = [level for _, level in results]
+        level = max(levels, default=0) if pure and None not in levels else None
+        bound = len(loops) if level is None else level
+        operands = [self._mark(operand, operand_level, loops)
+                    if operand_level is not None and operand_level < bound else operand
+                    for operand, operand_level in results]
+        return operands, level
+    
+    def _mark(self, node, level, loops):
+        """Envuelve node en un ast.Invariant del bucle loops[level], salvo que
+        no sea invariante o sea trivial (un literal o una variable)"""
+        if level is None or level >= len(loops) or is_constant(node) or isinstance(node, ast.Variable):
+            return node
+        slot = self._next_slot
+        self._next_slot += 1
+        loops[level][1].append(slot)
+        self.hoisted += 1
+        return ast.Invariant(node, slot, node.line)
+    
+    def _accumulator_slot(self, name, loops):
+        """Slot del acumulador name en el bucle más externo donde solo se lee
+        para acumular, o None si no hay ninguno. Todas las acumulaciones de
+        name en ese bucle comparten el slot."""
+        for _, slots, accumulators in loops:
+            if name in accumulators:
+                if accumulators[name] is None:
+                    accumulators[name] = self._next_slot
+                    slots.append(self._next_slot)
+                    self._next_slot += 1
+                return accumulators[name]
+        return None
+    
+    # === AUXILIARES ===
+    def _fold(self, compute, line):
+        """Evalúa compute() y retorna el literal del resultado, o None si falla
+        o si el resultado no se puede representar como literal"""
+        try:
+            value = compute()
+        except Exception:
+            return None
+        node = constant_node(value, line)
+        if node is not None:
+            self.folded += 1
+        return node
+
+def is_constant(node):
+    """True si el nodo es un literal"""
+    return isinstance(node, (ast.Number, ast.String, ast.Boolean, ast.NumericLiteral))
+
+def is_propagable(node):
+    """True si el literal se puede copiar a cada uso (los datos grandes no)"""
+    if isinstance(node, ast.NumericLiteral):
+        return len(node.values) <= MAX_FOLDED_ELEMENTS
+    return is_constant(node)
+
+def constant_value(node):
+    """Valor de runtime de un literal"""
+    if isinstance(node, ast.NumericLiteral):
+        return node.materialize()
+    return node.value
+
+def constant_node(value, line=0):
+    """Literal que representa value, o None si no hay uno adecuado"""
+    if isinstance(value, bool):
+        return ast.Boolean(value, line)
+    if type(value) is float:
+        return ast.Number(value, line)
+    if isinstance(value, str):
+        return ast.String(value, line) if len(value) <= MAX_FOLDED_ELEMENTS else None
+    if isinstance(value, DSLVector):
+        return ast.NumericLiteral(value, None, line) if len(value) <= MAX_FOLDED_ELEMENTS else None
+    if isinstance(value, DSLMatrix):
+        return ast.NumericLiteral(value.data, value.rows, line) if len(value.data) <= MAX_FOLDED_ELEMENTS else None
+    if not isinstance(value, list) or len(value) > MAX_FOLDED_ELEMENTS:
+        return None
+    if all(type(item) is float for item in value):
+        return ast.NumericLiteral(value, None, line)
+    if value and all(isinstance(row, SEQUENCE_TYPES) for row in value):
+        columns = len(value[0])
+        if all(len(row) == columns and all(type(item) is float for item in row) for row in value) \
+                and len(value) * columns <= MAX_FOLDED_ELEMENTS:
+            return ast.NumericLiteral([item for row in value for item in row], len(value), line)
+    return None
+
+def assigned_names(body):
+    """Variables asignadas en una lista de statements (incluye bloques anidados)"""
+    names = set()
+    pending = list(body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, (ast.Assign, ast.Append)):
+            names.add(node.name)
+        elif isinstance(node, ast.If):
+            pending.extend(node.then_body)
+            pending.extend(node.else_body)
+        elif isinstance(node, ast.While):
+            pending.extend(node.body)
+    return names
+
+def accumulated_items(node):
+    """items si la asignación es x = x + items con items sin leer x, o None"""
+    value = node.value
+    if isinstance(value, ast.BinaryOp) and value.op == '+' and isinstance(value.left, ast.Variable) \
+            and value.left.name == node.name and node.name not in read_names(value.right):
+        return value.right
+    return None
+
+def accumulator_names(loop):
+    """Variables de un while que solo se leen en sus acumulaciones x = x + items.
+    
+    Una lista que solo ve el acumulador no puede estar en otra variable ni
+    dentro de otra lista, así que se puede extender en su lugar. Se marcan
+    como nombre -> None; el slot se asigna con la primera acumulación.
+    """
+    reads = {}
+    for name in read_names(loop.condition):
+        reads[name] = reads.get(name, 0) + 1
+    accumulations = {}
+    pending = list(loop.body)
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ast.Assign) and accumulated_items(node) is not None:
+            accumulations[node.name] = accumulations.get(node.name, 0) + 1
+        for field in node.fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.Variable):
+                reads[value.name] = reads.get(value.name, 0) + 1
+            elif isinstance(value, ast.Node):
+                pending.append(value)
+            elif isinstance(value, list):
+                pending.extend(item for item in value if isinstance(item, ast.Node))
+    return {name: None for name, count in accumulations.items() if reads.get(name) == count}
+
+def read_names(node):
+    """Nombres de las variables que lee una expresión (con repeticiones)"""
+    if isinstance(node, ast.Variable):
+        return [node.name]
+    names = []
+    for field in node.fields:
+        value = getattr(node, field)
+        if isinstance(value, ast.Node):
+            names.extend(read_names(value))
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ast.Node):
+                    names.extend(read_names(item))
+    return names
+
+def _repeat_size(left, right):
+    """Tamaño del resultado de lista/texto * número (0 si no es una repetición)"""
+    if isinstance(left, (*SEQUENCE_TYPES, str)) and isinstance(right, (int, float)):
+        try:
+            return len(left) * max(int(right), 0)
+        except (OverflowError, ValueError):
+            return MAX_FOLDED_ELEMENTS + 1
+    return 0
+
+def optimize_program(program, variables=None):
+    """Optimiza un ast.Program; retorna (programa, optimizador con sus contadores)"""
+    optimizer = DSLOptimizer()
+    return optimizer.optimize(program, variables), optimizer
+
+# === VISTA LEGIBLE (--dump-opt) ===
+def format_program(program):
+    """Retorna el programa como código DSL, para ver qué se optimizó"""
+    lines = []
+    _format_block(program.body, lines, 0)
+    return "\n".join(lines)
+
+def _format_block(body, lines, indent):
+    """Agrega las líneas de una lista de statements"""
+    prefix = "    " * indent
+    for statement in body:
+        if isinstance(statement, ast.Assign):
+            lines.append(f"{prefix}{statement.name} = {format_expression(statement.value)};")
+        elif isinstance(statement, ast.Append):
+            lines.append(f"{prefix}{statement.name} = {statement.name} + {_format_operand(statement.items)};"
+                         f"  // en su lugar (inv{statement.slot})")
+        elif isinstance(statement, ast.ExprStatement):
+            lines.append(f"{prefix}{format_expression(statement.expr)};")
+        elif isinstance(statement, ast.If):
+            lines.append(f"{prefix}if {format_expression(statement.condition)} then")
+            _format_block(statement.then_body, lines, indent + 1)
+            if statement.else_body:
+                lines.append(f"{prefix}else")
+                _format_block(statement.else_body, lines, indent + 1)
+            lines.append(f"{prefix}fi")
+        elif isinstance(statement, ast.VectorLoop):
+            start = len(lines)
+            _format_block([statement.loop], lines, indent)
+            lines[start] += "  // vectorizado"
+        elif isinstance(statement, ast.While):
+            hoisted = ""
+            if statement.invariants:
+                hoisted = "  // invariantes: " + ", ".join(f"inv{slot}" for slot in statement.invariants)
+            lines.append(f"{prefix}while {format_expression(statement.condition)} do{hoisted}")
+            _format_block(statement.body, lines, indent + 1)
+            lines.append(f"{prefix}done")
+        else:
+            args = ", ".join(format_expression(arg) for arg in statement.args)
+            lines.append(f"{prefix}{statement.kind}({args});")
+
+def format_expression(node):
+    """Código DSL de una expresión (las operaciones anidadas van entre paréntesis)"""
+    if isinstance(node, ast.Number):
+        return repr(node.value)
+    if isinstance(node, ast.String):
+        return f'"{node.value}"'
+    if isinstance(node, ast.Boolean):
+        return "true" if node.value else "false"
+    if isinstance(node, ast.Variable):
+        return node.name
+    if isinstance(node, ast.NumericLiteral):
+        if len(node.values) > 16:
+            shape = f"{node.rows}x{len(node.values) // node.rows}" if node.rows else f"{len(node.values)}"
+            return f"<constante {shape}>"
+        return repr(node.materialize())
+    if isinstance(node, (ast.BinaryOp, ast.SpecializedOp, ast.Logical)):
+        return f"{_format_operand(node.left)} {node.op} {_format_operand(node.right)}"
+    if isinstance(node, ast.Not):
+        return f"not {_format_operand(node.operand)}"
+    if isinstance(node, ast.ListLiteral):
+        return "[" + ", ".join(format_expression(item) for item in node.items) + "]"
+    if isinstance(node, ast.MatrixLiteral):
+        return "[" + ", ".join(format_expression(row) for row in node.rows) + "]"
+    if isinstance(node, ast.Invariant):
+        return f"<inv{node.slot}: {format_expression(node.expr)}>"
+    if isinstance(node, ast.MatrixExpression):
+        return _format_matrix_expression(node)
+    return f"{node.func}(" + ", ".join(format_expression(arg) for arg in node.args) + ")"
+
+def _format_matrix_expression(node):
+    """Operaciones de matrices anidadas, escritas como las llamadas originales"""
+    stack = []
+    args = iter(node.args)
+    for op in node.ops:
+        if op == ARGUMENT:
+            stack.append(format_expression(next(args)))
+        else:
+            count = FUSED_FUNCTIONS[op]
+            text = f"{op}(" + ", ".join(stack[-count:]) + ")"
+            del stack[-count:]
+            stack.append(text)
+    return stack.pop()
+
+def _format_operand(node):
+    """Operando de una operación: entre paréntesis si es otra operación"""
+    text = format_expression(node)
+    if isinstance(node, (ast.BinaryOp, ast.SpecializedOp, ast.Logical, ast.Not)):
+        return f"({text})"
+    return text
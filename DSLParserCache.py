@@ -0,0 +1,275 @@
+import os
+import marshal
+import zlib
+from antlr4.PredictionContext import PredictionContext, SingletonPredictionContext, ArrayPredictionContext
+from antlr4.atn.ATNConfig import ATNConfig
+from antlr4.atn.ATNConfigSet import ATNConfigSet
+from antlr4.atn.SemanticContext import SemanticContext, Predicate, PrecedencePredicate, AND, OR
+from antlr4.atn.ParserATNSimulator import ParserATNSimulator
+from antlr4.dfa.DFAState import DFAState, PredPrediction
+from DeepLearningDSLParser import DeepLearningDSLParser, serializedATN
+from DSLArtifact import default_cache_directory
+
+# Formato del archivo:
+#   DFA_CACHE_MAGIC | versión (2 bytes) | huella del ATN | CRC32 de los datos | marshal
+# La huella (CRC32 y largo del ATN serializado) invalida la caché cuando
+# cambia la gramática; el CRC32 de los datos descarta un archivo dañado que
+# marshal igual podría leer (un DFA equivocado haría parsear mal sin avisar).
+DFA_CACHE_MAGIC = b'DSLD'
+DFA_CACHE_VERSION = 2
+DFA_CACHE_FILENAME = "parser-dfa.bin"
+MARSHAL_VERSION = 4
+# Destino de las transiciones al estado de error compartido del simulador
+ERROR_STATE = -1
+
+def default_cache_path():
+    """Ruta por defecto de la caché de DFA del parser"""
+    return os.path.join(default_cache_directory(), DFA_CACHE_FILENAME)
+
+def _cache_header():
+    """Cabecera que identifica el formato y la gramática"""
+    atn = serializedATN()
+    fingerprint = zlib.crc32(repr(atn).encode('ascii')).to_bytes(4, 'little') + len(atn).to_bytes(4, 'little')
+    return DFA_CACHE_MAGIC + DFA_CACHE_VERSION.to_bytes(2, 'little') + fingerprint
+
+class _DFAEncoder:
+    """Convierte los DFA de predicción del parser a tuplas y listas.
+    
+    Los contextos de predicción y los contextos semánticos forman grafos
+    compartidos entre estados; se guardan una sola vez en tablas y los
+    estados los referencian por índice.
+    """
+    
+    def __init__(self):
+        self.contexts = []
+        self.semantics = []
+        self._context_ids = {}
+        self._semantic_ids = {}
+    
+    def encode(self, decisions):
+        """Retorna la representación serializable de todos los DFA"""
+        dfas = [self._encode_dfa(dfa) for dfa in decisions]
+        return {'contexts': self.contexts, 'semantics': self.semantics, 'dfas': dfas}
+    
+    def _encode_dfa(self, dfa):
+        """Un DFA: sus estados y el estado inicial"""
+        states = list(dfa.states)
+        if dfa.s0 is not None and dfa.s0 not in dfa.states:
+            # El estado inicial de un DFA de precedencia no está en states
+            states.append(dfa.s0)
+        ids = {id(state): index for index, state in enumerate(states)}
+        encoded_states = [self._encode_state(state, ids, state in dfa.states) for state in states]
+        s0 = ids[id(dfa.s0)] if dfa.s0 is not None else None
+        return (dfa.precedenceDfa, s0, encoded_states)
+    
+    def _encode_state(self, state, ids, registered):
+        """Un estado del DFA con sus configuraciones y transiciones"""
+        edges = None
+        if state.edges is not None:
+            edges = (len(state.edges), [
+                (symbol, ERROR_STATE if target is ParserATNSimulator.ERROR else ids[id(target)])
+                for symbol, target in enumerate(state.edges) if target is not None])
+        predicates = None
+        if state.predicates is not None:
+            predicates = [(self._semantic_id(p.pred), p.alt) for p in state.predicates]
+        return (state.stateNumber, registered, self._encode_configs(state.configs), edges,
+                state.isAcceptState, state.prediction, state.requiresFullContext, predicates)
+    
+    def _encode_configs(self, configs):
+        """Un ATNConfigSet"""
+        conflicting = sorted(configs.conflictingAlts) if configs.conflictingAlts is not None else None
+        items = [(config.state.stateNumber, config.alt, self._context_id(config.context),
+                  self._semantic_id(config.semanticContext), config.reachesIntoOuterContext,
+                  config.precedenceFilterSuppressed) for config in configs]
+        return (configs.fullCtx, configs.readonly, configs.uniqueAlt, conflicting,
+                configs.hasSemanticContext, configs.dipsIntoOuterContext, items)
+    
+    def _context_id(self, context):
+        """Índice del contexto de predicción (los padres se guardan antes)"""
+        if context is None:
+            return None
+        key = id(context)
+        if key in self._context_ids:
+            return self._context_ids[key]
+        if context is PredictionContext.EMPTY:
+            entry = ('empty',)
+        elif isinstance(context, SingletonPredictionContext):
+            entry = ('single', self._context_id(context.parentCtx), context.returnState)
+        else:
+            entry = ('array', [self._context_id(parent) for parent in context.parents],
+                     list(context.returnStates))
+        self._context_ids[key] = len(self.contexts)
+        self.contexts.append(entry)
+        return self._context_ids[key]
+    
+    def _semantic_id(self, semantic):
+        """Índice del contexto semántico (predicados)"""
+        key = id(semantic)
+        if key in self._semantic_ids:
+            return self._semantic_ids[key]
+        if semantic is SemanticContext.NONE:
+            entry = ('none',)
+        elif isinstance(semantic, PrecedencePredicate):
+            entry = ('precedence', semantic.precedence)
+        elif isinstance(semantic, Predicate):
+            entry = ('predicate', semantic.ruleIndex, semantic.predIndex, semantic.isCtxDependent)
+        else:
+            kind = 'and' if isinstance(semantic, AND) else 'or'
+            entry = (kind, [self._semantic_id(operand) for operand in semantic.opnds])
+        self._semantic_ids[key] = len(self.semantics)
+        self.semantics.append(entry)
+        return self._semantic_ids[key]
+
+class _DFADecoder:
+    """Reconstruye los DFA a partir de _DFAEncoder sobre el ATN del proceso actual.
+    
+    No modifica nada del parser hasta install(): si los datos fallan a mitad
+    de camino, los contextos y estados decodificados simplemente se descartan.
+    """
+    
+    def __init__(self, data, atn, context_cache):
+        self.atn = atn
+        self.contexts = []
+        self.semantics = []
+        # Contextos que no estaban en sharedContextCache: se agregan en install()
+        self.new_contexts = {}
+        for entry in data['contexts']:
+            self.contexts.append(self._decode_context(entry, context_cache))
+        for entry in data['semantics']:
+            self.semantics.append(self._decode_semantic(entry))
+        self.dfas = [self._decode_dfa(entry) for entry in data['dfas']]
+    
+    def _decode_context(self, entry, context_cache):
+        """Un contexto de predicción: el igual que ya esté en sharedContextCache
+        o en esta decodificación, o uno nuevo (como context_cache.add, sin
+        modificar la caché)"""
+        kind = entry[0]
+        if kind == 'empty':
+            return PredictionContext.EMPTY
+        if kind == 'single':
+            parent = self.contexts[entry[1]] if entry[1] is not None else None
+            context = SingletonPredictionContext.create(parent, entry[2])
+        else:
+            parents = [self.contexts[index] if index is not None else None for index in entry[1]]
+            context = ArrayPredictionContext(parents, list(entry[2]))
+        if context == PredictionContext.EMPTY:
+            return PredictionContext.EMPTY
+        existing = context_cache.get(context)
+        if existing is None:
+            existing = self.new_contexts.setdefault(context, context)
+        return existing
+    
+    def _decode_semantic(self, entry):
+        """Un contexto semántico"""
+        kind = entry[0]
+        if kind == 'none':
+            return SemanticContext.NONE
+        if kind == 'precedence':
+            return PrecedencePredicate(entry[1])
+        if kind == 'predicate':
+            return Predicate(entry[1], entry[2], entry[3])
+        semantic = object.__new__(AND if kind == 'and' else OR)
+        semantic.opnds = [self.semantics[index] for index in entry[1]]
+        return semantic
+    
+    def _decode_dfa(self, entry):
+        """Un DFA: (es de precedencia, estado inicial, tabla de estados)"""
+        precedence_dfa, s0, encoded_states = entry
+        states = [self._decode_state(encoded) for encoded in encoded_states]
+        for state, encoded in zip(states, encoded_states):
+            edges = encoded[3]
+            if edges is not None:
+                length, targets = edges
+                state.edges = [None] * length
+                for symbol, target in targets:
+                    state.edges[symbol] = ParserATNSimulator.ERROR if target == ERROR_STATE else states[target]
+        registered = {state: state for state, encoded in zip(states, encoded_states) if encoded[1]}
+        return precedence_dfa, states[s0] if s0 is not None else None, registered
+    
+    def install(self, decisions, context_cache):
+        """Carga los estados en los DFA del parser y los contextos nuevos en
+        sharedContextCache"""
+        for context in self.new_contexts:
+            context_cache.add(context)
+        for dfa, (precedence_dfa, s0, states) in zip(decisions, self.dfas):
+            dfa.precedenceDfa = precedence_dfa
+            dfa.s0 = s0
+            dfa._states = states
+    
+    def _decode_state(self, encoded):
+        """Un estado del DFA (las transiciones se enlazan después)"""
+        state_number, _, configs, _, accept, prediction, full_context, predicates = encoded
+        state = DFAState(state_number, self._decode_configs(configs))
+        state.isAcceptState = accept
+        state.prediction = prediction
+        state.requiresFullContext = full_context
+        if predicates is not None:
+            state.predicates = [PredPrediction(self.semantics[pred], alt) for pred, alt in predicates]
+        return state
+    
+    def _decode_configs(self, encoded):
+        """Un ATNConfigSet"""
+        full_ctx, readonly, unique_alt, conflicting, has_semantic, dips, items = encoded
+        configs = ATNConfigSet(full_ctx)
+        for state_number, alt, context, semantic, reaches, suppressed in items:
+            config = ATNConfig(self.atn.states[state_number], alt,
+                               self.contexts[context] if context is not None else None,
+                               self.semantics[semantic])
+            config.reachesIntoOuterContext = reaches
+            config.precedenceFilterSuppressed = suppressed
+            configs.add(config)
+        configs.uniqueAlt = unique_alt
+        configs.conflictingAlts = set(conflicting) if conflicting is not None else None
+        configs.hasSemanticContext = has_semantic
+        configs.dipsIntoOuterContext = dips
+        if readonly:
+            configs.setReadonly(True)
+        return configs
+
+def count_dfa_states(parser_class=DeepLearningDSLParser):
+    """Cantidad total de estados en los DFA de predicción del parser"""
+    return sum(len(dfa.states) for dfa in parser_class.decisionsToDFA)
+
+def save_parser_cache(path=None, parser_class=DeepLearningDSLParser):
+    """Guarda los DFA de predicción ya calentados del parser. Retorna la ruta."""
+    path = path or default_cache_path()
+    data = _DFAEncoder().encode(parser_class.decisionsToDFA)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    payload = marshal.dumps(data, MARSHAL_VERSION)
+    with open(temp_path, 'wb') as f:
+        f.write(_cache_header() + zlib.crc32(payload).to_bytes(4, 'little') + payload)
+    os.replace(temp_path, path)
+    return path
+
+def load_parser_cache(path=None, parser_class=DeepLearningDSLParser):
+    """Carga los DFA guardados por save_parser_cache().
+    
+    Solo se cargan si los DFA del parser todavía están vacíos. Retorna True si
+    se cargó la caché; un archivo inexistente, de otra gramática o dañado (su
+    CRC32 no coincide o no se puede decodificar) se ignora sin modificar el
+    parser, que simplemente arranca en frío.
+    """
+    if count_dfa_states(parser_class):
+        return False
+    try:
+        with open(path or default_cache_path(), 'rb') as f:
+            data = f.read()
+    except OSError:
+        return False
+    header = _cache_header()
+    if not data.startswith(header):
+        return False
+    checksum, payload = data[len(header):len(header) + 4], data[len(header) + 4:]
+    if zlib.crc32(payload).to_bytes(4, 'little') != checksum:
+        return False
+    try:
+        decoder = _DFADecoder(marshal.loads(payload), parser_class.atn, parser_class.sharedContextCache)
+    except (ValueError, EOFError, TypeError, IndexError, KeyError):
+        return False
+    if len(decoder.dfas) != len(parser_class.decisionsToDFA):
+        return False
+    decoder.install(parser_class.decisionsToDFA, parser_class.sharedContextCache)
+    return True
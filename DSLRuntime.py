@@ -0,0 +1,986 @@
+import math
+import random
+import os
+import operator
+from collections.abc import MutableMapping
+from DSLBudget import DSLBudget
+from DSLVector import DSLVector, DSLMatrix, DSLSparseMatrix, SEQUENCE_TYPES, MATRIX_TYPES, pack
+
+# Densidad (fracción de valores distintos de 0) por debajo de la cual un CSV
+# numérico se lee como DSLSparseMatrix
+SPARSE_DENSITY = 0.05
+
+class _Undefined:
+    """Marca de los slots y registros de variables aún no asignadas"""
+    
+    __slots__ = ()
+    
+    def __repr__(self):
+        return "<indefinida>"
+
+UNDEFINED = _Undefined()
+
+class DSLFrame(MutableMapping):
+    """Variables del programa guardadas en una lista plana.
+    
+    Cada nombre recibe un slot (su índice en cells) la primera vez que se
+    resuelve; los motores que compilan guardan el slot en lugar del nombre,
+    así que leer o escribir una variable es indexar una lista. Un slot sin
+    asignar vale UNDEFINED. Hacia afuera se comporta como un dict de las
+    variables definidas (.vars del REPL, la paridad, la carga en el REPL).
+    """
+    
+    __slots__ = ('slots', 'cells')
+    
+    def __init__(self):
+        self.slots = {}
+        self.cells = []
+    
+    def slot(self, name):
+        """Retorna el slot de name, reservándolo si es nuevo"""
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.cells)
+            self.cells.append(UNDEFINED)
+        return slot
+    
+    def __getitem__(self, name):
+        """Valor de una variable definida (KeyError si no lo está)"""
+        slot = self.slots.get(name)
+        if slot is not None:
+            value = self.cells[slot]
+            if value is not UNDEFINED:
+                return value
+        raise KeyError(name)
+    
+    def __setitem__(self, name, value):
+        """Asigna una variable por nombre"""
+        self.cells[self.slot(name)] = value
+    
+    def __delitem__(self, name):
+        """Elimina una variable (el slot se conserva)"""
+        if name not in self:
+            raise KeyError(name)
+        self.cells[self.slots[name]] = UNDEFINED
+    
+    def __contains__(self, name):
+        """True si la variable está definida"""
+        slot = self.slots.get(name)
+        return slot is not None and self.cells[slot] is not UNDEFINED
+    
+    def __iter__(self):
+        """Nombres de las variables definidas, en el orden de sus slots"""
+        cells = self.cells
+        return (name for name, slot in self.slots.items() if cells[slot] is not UNDEFINED)
+    
+    def __len__(self):
+        """Cantidad de variables definidas"""
+        return sum(1 for value in self.cells if value is not UNDEFINED)
+    
+    def clear(self):
+        """Borra todos los valores. Los slots se conservan porque el código
+        ya compilado (REPL, streaming) los tiene resueltos."""
+        cells = self.cells
+        for slot in range(len(cells)):
+            cells[slot] = UNDEFINED
+
+class DSLRuntime:
+    """Estado y operaciones del DSL compartidos por todos los motores de ejecución"""
+    
+    # Funciones integradas del DSL y el método auxiliar que las implementa
+    BUILTIN_METHODS = {
+        'transpose': '_transpose',
+        'inverse': '_inverse',
+        'matmul': '_matrix_multiply',
+        'matsum': '_matrix_add',
+        'matsub': '_matrix_subtract',
+        'det': '_determinant',
+        'solve': '_solve',
+        'density': '_density',
+        'linearRegression': '_linear_regression',
+        'mlpClassifier': '_mlp_classifier',
+        'kmeans': '_kmeans',
+        'sin': '_sin',
+        'cos': '_cos',
+        'tan': '_tan',
+        'sqrt': '_sqrt',
+        'log': '_log',
+        'exp': '_exp',
+        'readFile': '_read_file',
+    }
+    
+    # Operadores binarios y el método auxiliar que los implementa
+    OPERATOR_METHODS = {
+        '+': '_add',
+        '-': '_subtract',
+        '*': '_multiply',
+        '/': '_divide',
+        '^': '_power',
+        '==': '_equals',
+        '!=': '_not_equals',
+        '<': '_less',
+        '<=': '_less_equal',
+        '>': '_greater',
+        '>=': '_greater_equal',
+    }
+    
+    # Valor de una lista recién construida (literales): empaquetada si es de números
+    _pack = staticmethod(pack)
+    
+    def __init__(self):
+        self.variables = DSLFrame()
+        self.plot_data = []
+        # Límites de operaciones, tiempo y memoria que verifican los while
+        self.budget = DSLBudget()
+        # Backend de las operaciones de matrices (DSLBackend); se carga al
+        # usarlo por primera vez para no importar NumPy al arrancar
+        self.backend_name = 'auto'
+        self._backend = None
+        # Factorizaciones LU de inverse, det y solve, por matriz
+        # (FactorizationCache); se crea al usarla por primera vez
+        self.factorizations = None
+        # False: las expresiones de matrices fusionadas (DSLMatrixGraph) se
+        # calculan operación por operación; es la referencia de --parity
+        self.fuse_matrices = True
+        self.builtins = {name: getattr(self, method) for name, method in self.BUILTIN_METHODS.items()}
+        self.operators = {op: getattr(self, method) for op, method in self.OPERATOR_METHODS.items()}
+        # Operaciones especializadas (ast.SpecializedOp): los tipos de los
+        # operandos ya se verificaron al compilar, así que no hay conversiones
+        self.specialized = {
+            ('+', 'number'): operator.add,
+            ('-', 'number'): operator.sub,
+            ('*', 'number'): operator.mul,
+            ('/', 'number'): self._divide_numbers,
+            ('^', 'number'): operator.pow,
+            ('<', 'number'): operator.lt,
+            ('<=', 'number'): operator.le,
+            ('>', 'number'): operator.gt,
+            ('>=', 'number'): operator.ge,
+            ('+', 'text'): self._concat_text,
+            ('+', 'concat'): operator.add,
+            ('*', 'repeat'): self._repeat,
+        }
+    
+    # === STATEMENTS ===
+    def _assign(self, name, value):
+        """Asigna una variable por nombre e informa el nuevo valor"""
+        return self._store(self.variables.slot(name), name, value)
+    
+    def _store(self, slot, name, value):
+        """Asigna una variable por su slot ya resuelto e informa el nuevo valor"""
+        self.variables.cells[slot] = value
+        print(f"📝 {name} = {self._format_value(value)}")
+        return value
+    
+    def _lookup(self, name):
+        """Obtiene el valor de una variable definida"""
+        slot = self.variables.slots.get(name)
+        if slot is not None:
+            value = self.variables.cells[slot]
+            if value is not UNDEFINED:
+                return value
+        raise RuntimeError(f"Variable no definida: {name}")
+    
+    def _vector_loop(self, node):
+        """Ejecuta un ast.VectorLoop por vectores; False si hay que ejecutar
+        el while normal (ver DSLVectorizer.run_vector_loop)"""
+        from DSLVectorizer import run_vector_loop
+        return run_vector_loop(self, node, self.backend_name)
+    
+    def set_backend(self, name):
+        """Elige el backend de matrices: auto, python o numpy. ValueError si
+        el nombre no es válido o si numpy no está instalado"""
+        # auto se resuelve al usarlo; los demás se verifican ya
+        if name == 'auto':
+            self._backend = None
+        else:
+            from DSLBackend import load_backend
+            self._backend = load_backend(name)
+        self.backend_name = name
+        if self.factorizations is not None:
+            self.factorizations.clear()
+    
+    def _matrix_backend(self):
+        """Backend de matrices elegido, cargado la primera vez"""
+        if self._backend is None:
+            from DSLBackend import load_backend
+            self._backend = load_backend(self.backend_name)
+        return self._backend
+    
+    def _factorization_cache(self):
+        """Caché de factorizaciones LU, creada la primera vez"""
+        if self.factorizations is None:
+            from DSLBackend import FactorizationCache
+            self.factorizations = FactorizationCache()
+        return self.factorizations
+    
+    # === VISUALIZACIÓN ===
+    def _plot(self, plot_type, x_data, y_data=None):
+        """Dibuja gráficas ASCII (plot, scatter, hist) a partir de valores ya evaluados"""
+        # Convertir cualquier cosa iterable a lista
+        if isinstance(x_data, (str, tuple)):
+            x_data = list(x_data)
+        if isinstance(y_data, (str, tuple)):
+            y_data = list(y_data)
+
+        if plot_type in ("plot", "scatter"):
+            if not isinstance(x_data, SEQUENCE_TYPES) or not isinstance(y_data, SEQUENCE_TYPES):
+                print("❌ Los datos deben ser listas para plot/scatter")
+                return
+            
+            # Manejar caso especial: matriz vs vector
+            if (isinstance(x_data[0], SEQUENCE_TYPES) if x_data else False) and not (isinstance(y_data[0], SEQUENCE_TYPES) if y_data else False):
+                print("⚠️  Detectada matriz vs vector - usando primera columna de la matriz")
+                x_plot = [row[0] for row in x_data]  # Usar primera columna
+                y_plot = y_data
+            elif not (isinstance(x_data[0], SEQUENCE_TYPES) if x_data else False) and (isinstance(y_data[0], SEQUENCE_TYPES) if y_data else False):
+                print("⚠️  Detectado vector vs matriz - usando primera columna de la matriz")
+                x_plot = x_data
+                y_plot = [row[0] for row in y_data]  # Usar primera columna
+            else:
+                x_plot = x_data
+                y_plot = y_data
+            
+            if len(x_plot) != len(y_plot):
+                print("❌ Las listas x e y deben tener la misma longitud")
+                return
+            self._ascii_plot_exact(x_plot, y_plot, show_trend=(plot_type == "scatter"))
+        elif plot_type == "hist":
+            if not isinstance(x_data, SEQUENCE_TYPES):
+                print("❌ El argumento para hist debe ser una lista")
+                return
+            self._ascii_histogram_vertical(x_data)
+
+    def _ascii_plot_exact(self, x_data, y_data, show_trend=False):
+        """Gráfico ASCII con ejes X y Y numéricos claramente alineados"""
+        
+        # Manejar el caso donde x_data es una matriz (lista de listas)
+        if isinstance(x_data, SEQUENCE_TYPES) and x_data and isinstance(x_data[0], SEQUENCE_TYPES):
+            # Si x_data es una matriz, aplanar todos los valores para encontrar el rango
+            x_flat = x_data.data if isinstance(x_data, DSLMatrix) else [val for row in x_data for val in row]
+            max_x = int(max(x_flat))
+            min_x = int(min(x_flat))
+            # Para visualización, usar solo la primera columna o un índice
+            x_plot = [row[0] if isinstance(row, SEQUENCE_TYPES) else row for row in x_data]
+        else:
+            # x_data es una lista simple
+            x_plot = x_data
+            max_x = int(max(x_data))
+            min_x = int(min(x_data))
+        
+        # Similar para y_data
+        if isinstance(y_data, SEQUENCE_TYPES) and y_data and isinstance(y_data[0], SEQUENCE_TYPES):
+            y_flat = y_data.data if isinstance(y_data, DSLMatrix) else [val for row in y_data for val in row]
+            max_y = int(max(y_flat))
+            min_y = int(min(y_flat))
+            y_plot = [row[0] if isinstance(row, SEQUENCE_TYPES) else row for row in y_data]
+        else:
+            y_plot = y_data
+            max_y = int(max(y_data))
+            min_y = int(min(y_data))
+        
+        # Ajustar para que el rango comience desde 0 o el mínimo
+        width = max(max_x - min_x + 1, len(x_plot))
+        height = max(max_y - min_y + 1, len(y_plot))
+        
+        # Crear lienzo
+        canvas = [[' ' for _ in range(width)] for _ in range(height)]
+
+        # Dibujar puntos reales
+        for x, y in zip(x_plot, y_plot):
+            xi, yi = int(x) - min_x, int(y) - min_y
+            if 0 <= xi < width and 0 <= yi < height:
+                canvas[height - yi - 1][xi] = '*'
+
+        # Línea de tendencia
+        if show_trend and len(x_plot) >= 2:
+            n = len(x_plot)
+            sum_x = sum(x_plot)
+            sum_y = sum(y_plot)
+            sum_xx = sum(x ** 2 for x in x_plot)
+            sum_xy = sum(x * y for x, y in zip(x_plot, y_plot))
+            denominator = n * sum_xx - sum_x ** 2
+            if denominator != 0:
+                a = (n * sum_xy - sum_x * sum_y) / denominator
+                b = (sum_y - a * sum_x) / n
+                for x in range(width):
+                    y = int(round(a * (x + min_x) + b)) - min_y
+                    if 0 <= y < height and canvas[height - y - 1][x] == ' ':
+                        canvas[height - y - 1][x] = '+'
+
+        # Imprimir gráfico con etiquetas Y
+        for row_idx, row in enumerate(canvas):
+            y_label = f"{max_y - row_idx:>2}"  # etiqueta Y alineada
+            print(f"{y_label} | " + '  '.join(row))
+
+        # Eje X
+        print("   +" + "---" * width)
+
+        # Etiquetas X: espacio alineado con el contenido
+        x_labels = "    " + '  '.join(f"{x + min_x}" for x in range(width))
+        print(x_labels)
+
+        print(f"x: [{min(x_plot)} … {max(x_plot)}]  y: [{min(y_plot)} … {max(y_plot)}]")
+        if show_trend:
+            print("'*' puntos   '+' línea de tendencia")
+    
+    # === MÉTODOS AUXILIARES ===
+    def _format_value(self, value):
+        """Formatea un valor para mostrar"""
+        if isinstance(value, DSLSparseMatrix):
+            if value.rows > 10:
+                return f"[Lista con {value.rows} elementos]"
+            return f"[Matriz dispersa {value.rows}x{value.cols}]"
+        if isinstance(value, DSLMatrix):
+            # Sin construir las filas: se muestra como la lista de filas
+            if value.rows > 10:
+                return f"[Lista con {value.rows} elementos]"
+            return f"[Matriz {value.rows}x{value.cols}]"
+        if isinstance(value, (list, DSLVector)):
+            if len(value) > 10:
+                return f"[Lista con {len(value)} elementos]"
+            elif all(isinstance(row, SEQUENCE_TYPES) for row in value):
+                return f"[Matriz {len(value)}x{len(value[0]) if value else 0}]"
+            else:
+                return str(value)
+        elif isinstance(value, float):
+            if value.is_integer():
+                return str(int(value))
+            else:
+                return f"{value:.6g}"
+        return str(value)
+    
+    def _to_number(self, value):
+        """Convierte un valor a número"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        elif isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                raise TypeError(f"No se puede convertir '{value}' a número")
+        else:
+            raise TypeError(f"Tipo no válido para operación numérica: {self._type_name(value)}")
+    
+    def _type_name(self, value):
+        """Nombre del tipo de value en el lenguaje, para los mensajes de error"""
+        if isinstance(value, MATRIX_TYPES):
+            return "matriz"
+        elif isinstance(value, SEQUENCE_TYPES):
+            if value and all(isinstance(row, SEQUENCE_TYPES) for row in value):
+                return "matriz"
+            return "lista"
+        elif isinstance(value, bool):
+            return "booleano"
+        elif isinstance(value, (int, float)):
+            return "número"
+        elif isinstance(value, str):
+            return "texto"
+        elif value is None:
+            return "nulo"
+        return type(value).__name__
+    
+    def _to_boolean(self, value):
+        """Convierte un valor a booleano"""
+        if isinstance(value, bool):
+            return value
+        elif isinstance(value, (int, float)):
+            return value != 0
+        elif isinstance(value, str):
+            return value != ""
+        elif isinstance(value, SEQUENCE_TYPES):
+            return len(value) > 0
+        else:
+            return bool(value)
+    
+    def _equals(self, left, right):
+        """Compara dos valores por igualdad"""
+        return left == right
+    
+    def _add(self, left, right):
+        """Suma dos valores"""
+        if isinstance(left, SEQUENCE_TYPES) and isinstance(right, SEQUENCE_TYPES):
+            return left + right
+        elif isinstance(left, str) or isinstance(right, str):
+            return str(left) + str(right)
+        else:
+            return self._to_number(left) + self._to_number(right)
+    
+    def _accumulate(self, current, items, owned):
+        """name = name + items dentro de un while (ast.Append). owned es lo
+        que retornó la ejecución anterior del statement en esta vuelta del
+        bucle: si la variable todavía tiene esa lista nadie más la vio, así
+        que items se agrega en su lugar (O(1) amortizado). Si no, se suma
+        como siempre y la lista nueva es la que se sigue extendiendo. Un
+        vector o una matriz empaquetados se extienden en su lugar solo si
+        el resultado sigue empaquetado."""
+        if current is owned:
+            if type(current) is DSLVector:
+                if type(items) is DSLVector:
+                    current.extend(items)
+                    return current
+            elif type(current) is DSLMatrix:
+                if type(items) is DSLMatrix and items.cols == current.cols:
+                    current.data.extend(items.data)
+                    current.rows += items.rows
+                    current.version += 1
+                    return current
+            elif isinstance(current, list) and isinstance(items, SEQUENCE_TYPES):
+                current.extend(items)
+                return current
+        return self._add(current, items)
+    
+    def _subtract(self, left, right):
+        """Resta dos valores"""
+        return self._to_number(left) - self._to_number(right)
+    
+    def _multiply(self, left, right):
+        """Multiplica dos valores"""
+        if isinstance(left, SEQUENCE_TYPES) and isinstance(right, (int, float)):
+            return left * int(right)
+        elif isinstance(left, str) and isinstance(right, (int, float)):
+            return left * int(right)
+        else:
+            return self._to_number(left) * self._to_number(right)
+    
+    def _divide(self, left, right):
+        """Divide dos valores"""
+        right_num = self._to_number(right)
+        if right_num == 0:
+            raise ZeroDivisionError("División por cero")
+        return self._to_number(left) / right_num
+    
+    def _power(self, left, right):
+        """Eleva un valor a una potencia"""
+        return self._to_number(left) ** self._to_number(right)
+    
+    def _divide_numbers(self, left, right):
+        """Divide dos números (ya son float)"""
+        if right == 0:
+            raise ZeroDivisionError("División por cero")
+        return left / right
+    
+    def _concat_text(self, left, right):
+        """Concatena dos valores cuando al menos uno es texto"""
+        return str(left) + str(right)
+    
+    def _repeat(self, sequence, times):
+        """Repite una lista o un texto (times ya es un número)"""
+        return sequence * int(times)
+    
+    def _not_equals(self, left, right):
+        """Compara dos valores por desigualdad"""
+        return not self._equals(left, right)
+    
+    def _less(self, left, right):
+        """Compara si left < right"""
+        return self._to_number(left) < self._to_number(right)
+    
+    def _less_equal(self, left, right):
+        """Compara si left <= right"""
+        return self._to_number(left) <= self._to_number(right)
+    
+    def _greater(self, left, right):
+        """Compara si left > right"""
+        return self._to_number(left) > self._to_number(right)
+    
+    def _greater_equal(self, left, right):
+        """Compara si left >= right"""
+        return self._to_number(left) >= self._to_number(right)
+    
+    # === FUNCIONES TRIGONOMÉTRICAS ===
+    def _sin(self, value):
+        """Seno"""
+        return math.sin(self._to_number(value))
+    
+    def _cos(self, value):
+        """Coseno"""
+        return math.cos(self._to_number(value))
+    
+    def _tan(self, value):
+        """Tangente"""
+        return math.tan(self._to_number(value))
+    
+    def _sqrt(self, value):
+        """Raíz cuadrada"""
+        value = self._to_number(value)
+        if value < 0:
+            raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
+        return math.sqrt(value)
+    
+    def _log(self, value):
+        """Logaritmo natural"""
+        value = self._to_number(value)
+        if value <= 0:
+            raise ValueError("El logaritmo requiere un valor positivo")
+        return math.log(value)
+    
+    def _exp(self, value):
+        """Exponencial"""
+        return math.exp(self._to_number(value))
+    
+    # === OPERACIONES DE MATRICES ===
+    def _transpose(self, matrix):
+        """Transpone una matriz"""
+        self.budget.check_limits("transpose")
+        if not isinstance(matrix, SEQUENCE_TYPES) or not matrix:
+            raise ValueError("Se requiere una matriz no vacía")
+        
+        if isinstance(matrix, DSLVector):
+            # Vector fila a vector columna: los mismos datos, una columna
+            return DSLMatrix(DSLVector(matrix), len(matrix), 1)
+        if isinstance(matrix, DSLMatrix):
+            return self._matrix_backend().transpose(matrix)
+        if isinstance(matrix, DSLSparseMatrix):
+            return self._matrix_backend().sparse_transpose(matrix)
+        
+        if not isinstance(matrix[0], SEQUENCE_TYPES):
+            # Vector columna a vector fila
+            return pack([pack([item]) for item in matrix])
+        
+        # Matriz 2D
+        rows = len(matrix)
+        cols = len(matrix[0])
+        result = [[0] * rows for _ in range(cols)]
+        
+        for i in range(rows):
+            for j in range(cols):
+                result[j][i] = matrix[i][j]
+        
+        return pack([pack(row) for row in result])
+    
+    def _inverse(self, matrix):
+        """Inversa de una matriz cuadrada por LU con pivoteo parcial; las 2x2
+        con la fórmula cerrada, que da resultados exactos (0.5 y no 0.49999...)"""
+        self.budget.check_limits("inverse")
+        matrix = self._square_matrix(matrix, "inverse")
+        if matrix.rows == 2:
+            a, b, c, d = matrix.row(0) + matrix.row(1)
+            det = a * d - b * c
+            if det == 0:
+                raise ValueError("La matriz no es invertible (determinante = 0)")
+            return DSLMatrix(DSLVector([d / det, -b / det, -c / det, a / det]), 2, 2)
+        return self._factorized(matrix, lambda lu: lu.inverse())
+    
+    def _determinant(self, matrix):
+        """Determinante de una matriz cuadrada por LU con pivoteo parcial; las
+        2x2 con la fórmula cerrada"""
+        self.budget.check_limits("det")
+        matrix = self._square_matrix(matrix, "det")
+        if matrix.rows == 2:
+            a, b, c, d = matrix.row(0) + matrix.row(1)
+            return a * d - b * c
+        # + 0.0: una matriz singular da 0 y no -0
+        return self._factorized(matrix, lambda lu: lu.det()) + 0.0
+    
+    def _solve(self, matrix, rhs):
+        """Solución x de matrix * x = rhs por LU con pivoteo parcial, sin
+        calcular la inversa. rhs es un vector (x también lo es) o una matriz
+        con tantas filas como matrix (una columna de x por cada columna)"""
+        self.budget.check_limits("solve")
+        matrix = self._square_matrix(matrix, "solve")
+        vector = isinstance(rhs, DSLVector) or (isinstance(rhs, list) and rhs
+                                               and not isinstance(rhs[0], SEQUENCE_TYPES))
+        if vector:
+            try:
+                rhs = DSLMatrix(DSLVector(rhs), len(rhs), 1)
+            except TypeError:
+                raise ValueError("solve necesita un vector o una matriz de números")
+        else:
+            rhs = self._numeric_matrix(rhs, "solve")
+            if isinstance(rhs, DSLSparseMatrix):
+                rhs = rhs.to_dense()
+        if rhs.rows != matrix.rows:
+            raise ValueError(f"Dimensiones incompatibles: {matrix.rows}x{matrix.cols} y {rhs.rows}x{rhs.cols}")
+        result = self._factorized(matrix, lambda lu: lu.solve(rhs))
+        return result.data if vector else result
+    
+    def _factorized(self, matrix, operation):
+        """operation(factorización LU de matrix), reutilizando la de la caché
+        si matrix no cambió desde que se factorizó"""
+        return self._factorization_cache().apply(matrix, self._matrix_backend().lu, operation)
+    
+    def _numeric_matrix(self, value, name):
+        """value como DSLMatrix o DSLSparseMatrix (una lista de filas de números
+        se empaqueta); ValueError si no es una matriz rectangular de números"""
+        if isinstance(value, MATRIX_TYPES):
+            return value
+        if isinstance(value, list) and value and all(
+                isinstance(row, SEQUENCE_TYPES) and len(row) == len(value[0]) for row in value):
+            try:
+                return DSLMatrix.from_rows(value)
+            except TypeError:
+                pass
+        raise ValueError(f"{name} necesita una matriz de números")
+    
+    def _square_matrix(self, value, name):
+        """value como matriz cuadrada no vacía (ver _numeric_matrix)"""
+        matrix = self._numeric_matrix(value, name)
+        if matrix.rows != matrix.cols or not matrix.rows:
+            raise ValueError(f"{name} necesita una matriz cuadrada, no {matrix.rows}x{matrix.cols}")
+        return matrix
+    
+    def _matrix_multiply(self, m1, m2):
+        """Multiplica dos matrices"""
+        self.budget.check_limits("matmul")
+        if not isinstance(m1, SEQUENCE_TYPES) or not isinstance(m2, SEQUENCE_TYPES):
+            raise ValueError("Se requieren dos matrices")
+        
+        # Convertir vectores a matrices si es necesario
+        if isinstance(m1, DSLVector):
+            m1 = DSLMatrix(m1, 1, len(m1))
+        elif not isinstance(m1[0], SEQUENCE_TYPES):
+            m1 = [m1]
+        if isinstance(m2, DSLVector):
+            m2 = DSLMatrix(m2, len(m2), 1)
+        elif not isinstance(m2[0], SEQUENCE_TYPES):
+            m2 = [[row] for row in m2]
+        if isinstance(m1, MATRIX_TYPES) and isinstance(m2, MATRIX_TYPES):
+            if m1.cols != m2.rows:
+                raise ValueError(f"Dimensiones incompatibles: {m1.rows}x{m1.cols} y {m2.rows}x{m2.cols}")
+            if isinstance(m1, DSLSparseMatrix) or isinstance(m2, DSLSparseMatrix):
+                return self._matrix_backend().sparse_multiply(m1, m2)
+            return self._matrix_backend().multiply(m1, m2)
+        
+        rows1, cols1 = len(m1), len(m1[0])
+        rows2, cols2 = len(m2), len(m2[0])
+        
+        if cols1 != rows2:
+            raise ValueError(f"Dimensiones incompatibles: {rows1}x{cols1} y {rows2}x{cols2}")
+        
+        if any(len(row) != cols1 for row in m1) or any(len(row) != cols2 for row in m2):
+            raise ValueError("Todas las filas de una matriz deben tener el mismo largo")
+        
+        from DSLBackend import multiply_lists
+        return pack([pack(row) for row in multiply_lists(m1, m2)])
+    
+    def _matrix_add(self, m1, m2):
+        """Suma dos matrices"""
+        self.budget.check_limits("matsum")
+        if len(m1) != len(m2) or len(m1[0]) != len(m2[0]):
+            raise ValueError("Las matrices deben tener las mismas dimensiones")
+        if isinstance(m1, MATRIX_TYPES) and isinstance(m2, MATRIX_TYPES):
+            if isinstance(m1, DSLSparseMatrix) or isinstance(m2, DSLSparseMatrix):
+                return self._matrix_backend().sparse_add(m1, m2)
+            return self._matrix_backend().add(m1, m2)
+        
+        result = []
+        for i in range(len(m1)):
+            row = []
+            for j in range(len(m1[0])):
+                row.append(m1[i][j] + m2[i][j])
+            result.append(row)
+        
+        return pack([pack(row) for row in result])
+    
+    def _matrix_subtract(self, m1, m2):
+        """Resta dos matrices"""
+        self.budget.check_limits("matsub")
+        if len(m1) != len(m2) or len(m1[0]) != len(m2[0]):
+            raise ValueError("Las matrices deben tener las mismas dimensiones")
+        if isinstance(m1, MATRIX_TYPES) and isinstance(m2, MATRIX_TYPES):
+            if isinstance(m1, DSLSparseMatrix) or isinstance(m2, DSLSparseMatrix):
+                return self._matrix_backend().sparse_subtract(m1, m2)
+            return self._matrix_backend().subtract(m1, m2)
+        
+        result = []
+        for i in range(len(m1)):
+            row = []
+            for j in range(len(m1[0])):
+                row.append(m1[i][j] - m2[i][j])
+            result.append(row)
+        
+        return pack([pack(row) for row in result])
+    
+    def _density(self, matrix):
+        """Fracción de valores distintos de 0 de una matriz o un vector"""
+        if isinstance(matrix, DSLSparseMatrix):
+            size, nonzero = matrix.rows * matrix.cols, matrix.nnz
+        elif isinstance(matrix, DSLMatrix):
+            size, nonzero = len(matrix.data), len(matrix.data) - matrix.data.count(0.0)
+        elif isinstance(matrix, SEQUENCE_TYPES):
+            values = [item for row in matrix for item in row] if all(
+                isinstance(row, SEQUENCE_TYPES) for row in matrix) else list(matrix)
+            size, nonzero = len(values), sum(1 for value in values if value != 0)
+        else:
+            raise ValueError("density necesita una matriz o un vector")
+        if not size:
+            raise ValueError("density necesita una matriz o un vector no vacío")
+        return nonzero / size
+    
+    def _matrix_expression(self, ops, *values):
+        """Valor de un ast.MatrixExpression: las operaciones ops (notación
+        postfija) sobre values, calculadas juntas (ver DSLMatrixGraph)"""
+        self.budget.check_limits("una expresión de matrices")
+        from DSLMatrixGraph import evaluate
+        return evaluate(self, ops, values)
+    
+    # === MACHINE LEARNING===
+    def _linear_regression(self, X, y):
+        """Implementación simplificada de regresión lineal"""
+        self.budget.check_limits("linearRegression")
+        if not isinstance(X, SEQUENCE_TYPES) or not isinstance(y, SEQUENCE_TYPES):
+            raise ValueError("X e y deben ser listas")
+        
+        if len(X) != len(y):
+            raise ValueError("X e y deben tener la misma longitud")
+        
+        n = len(X)
+        if n == 0:
+            raise ValueError("Los datos no pueden estar vacíos")
+        
+        # Calcular medias
+        mean_x = sum(X) / n
+        mean_y = sum(y) / n
+        
+        # Calcular pendiente y intercepto
+        numerator = sum((X[i] - mean_x) * (y[i] - mean_y) for i in range(n))
+        denominator = sum((X[i] - mean_x) ** 2 for i in range(n))
+        
+        if denominator == 0:
+            slope = 0
+        else:
+            slope = numerator / denominator
+        
+        intercept = mean_y - slope * mean_x
+        
+        model = {
+            'type': 'LinearRegression',
+            'slope': slope,
+            'intercept': intercept,
+            'r_squared': self._calculate_r_squared(X, y, slope, intercept)
+        }
+        
+        print(f"🤖 Modelo de regresión lineal entrenado:")
+        print(f"   Pendiente: {slope:.6f}")
+        print(f"   Intercepto: {intercept:.6f}")
+        print(f"   R²: {model['r_squared']:.6f}")
+        
+        return model
+    
+    def _calculate_r_squared(self, X, y, slope, intercept):
+        """Calcula el coeficiente de determinación R²"""
+        n = len(y)
+        mean_y = sum(y) / n
+        
+        ss_tot = sum((y[i] - mean_y) ** 2 for i in range(n))
+        ss_res = sum((y[i] - (slope * X[i] + intercept)) ** 2 for i in range(n))
+        
+        if ss_tot == 0:
+            return 1.0
+        
+        return 1 - (ss_res / ss_tot)
+    
+    def _mlp_classifier(self, X, y, layers):
+        """Simulación de un clasificador MLP"""
+        self.budget.check_limits("mlpClassifier")
+        if not isinstance(X, SEQUENCE_TYPES) or not isinstance(y, SEQUENCE_TYPES):
+            raise ValueError("X e y deben ser listas")
+        
+        if len(X) != len(y):
+            raise ValueError("X e y deben tener la misma longitud")
+        
+        # Simular entrenamiento
+        unique_classes = list(set(y))
+        n_features = len(X[0]) if isinstance(X[0], SEQUENCE_TYPES) else 1
+        
+        model = {
+            'type': 'MLPClassifier',
+            'layers': layers,
+            'n_features': n_features,
+            'classes': unique_classes,
+            'accuracy': random.uniform(0.7, 0.95)  # Accuracy simulada
+        }
+        
+        print(f"🧠 Clasificador MLP entrenado:")
+        print(f"   Capas: {layers}")
+        print(f"   Características: {n_features}")
+        print(f"   Clases: {unique_classes}")
+        print(f"   Accuracy estimada: {model['accuracy']:.3f}")
+        
+        return model
+    
+    def _kmeans(self, data, k):
+        """Implementación simplificada de K-means"""
+        self.budget.check_limits("kmeans")
+        if not isinstance(data, SEQUENCE_TYPES) or not data:
+            raise ValueError("Los datos deben ser una lista no vacía")
+        
+        k = int(self._to_number(k))
+        if k <= 0 or k > len(data):
+            raise ValueError("K debe ser un número positivo menor o igual al número de puntos")
+        
+        # Simulación simple de clustering
+        n_points = len(data)
+        clusters = [i % k for i in range(n_points)]
+        
+        # Calcular centroides simulados
+        centroids = []
+        for cluster_id in range(k):
+            cluster_points = [data[i] for i in range(n_points) if clusters[i] == cluster_id]
+            if cluster_points:
+                if isinstance(cluster_points[0], SEQUENCE_TYPES):
+                    # Puntos multidimensionales
+                    centroid = [sum(point[dim] for point in cluster_points) / len(cluster_points) 
+                               for dim in range(len(cluster_points[0]))]
+                else:
+                    # Puntos unidimensionales
+                    centroid = sum(cluster_points) / len(cluster_points)
+                centroids.append(centroid)
+        
+        model = {
+            'type': 'KMeans',
+            'k': k,
+            'centroids': centroids,
+            'labels': clusters,
+            'inertia': random.uniform(10, 100)  # Inercia simulada
+        }
+        
+        print(f"🎯 Modelo K-means entrenado:")
+        print(f"   K (clusters): {k}")
+        print(f"   Centroides: {len(centroids)}")
+        print(f"   Inercia: {model['inertia']:.2f}")
+        
+        return model
+    
+    # === VISUALIZACIÓN ===
+    def _ascii_histogram_vertical(self, data):
+        """Histograma vertical ASCII"""
+        # Contar frecuencias manualmente
+        freqs = {}
+        for value in data:
+            if value in freqs:
+                freqs[value] += 1
+            else:
+                freqs[value] = 1
+
+        keys = sorted(freqs.keys())
+        values = [freqs[k] for k in keys]
+        max_count = max(values)
+        height = max_count
+
+        print("\n📊 Histograma (ASCII vertical)")
+
+        # Construir gráfico de arriba hacia abajo
+        for level in range(height, 0, -1):
+            row = f"{level:>2} |"
+            for count in values:
+                row += ' # ' if count >= level else '   '
+            print(row)
+
+        # Eje X
+        print("   +" + "---" * len(keys))
+        label_line = "    " + ''.join(f"{str(k):^3}" for k in keys)
+        print(label_line)
+        print(f"Valores: {keys}")
+
+    # === OPERACIONES DE ARCHIVOS ===
+    def _read_file(self, filename):
+        """Lee un archivo"""
+        try:
+            if not isinstance(filename, str):
+                raise ValueError("El nombre del archivo debe ser una cadena")
+            
+            if not os.path.exists(filename):
+                raise FileNotFoundError(f"El archivo '{filename}' no existe")
+            
+            with open(filename, 'r', encoding='utf-8') as f:
+                content = f.read().strip()
+            
+            # Intentar parsear como CSV si es posible
+            if filename.endswith('.csv'):
+                lines = [line for line in content.split('\n') if line.strip()]
+                data = self._read_numeric_csv(lines)
+                if data is None:
+                    data = []
+                    for line in lines:
+                        row = [self._try_parse_number(cell.strip()) for cell in line.split(',')]
+                        data.append(row)
+                
+                print(f"📂 Archivo CSV leído: {filename}")
+                print(f"   Filas: {len(data)}")
+                print(f"   Columnas: {len(data[0]) if data else 0}")
+                if isinstance(data, DSLSparseMatrix):
+                    print(f"   Dispersa: {data.nnz} valores distintos de 0 ({self._density(data):.2%})")
+                
+                return data
+            else:
+                # Archivo de texto plano
+                lines = content.split('\n')
+                
+                print(f"📂 Archivo de texto leído: {filename}")
+                print(f"   Líneas: {len(lines)}")
+                
+                return lines
+                
+        except Exception as e:
+            raise RuntimeError(f"Error al leer archivo '{filename}': {str(e)}")
+    
+    def _write_file(self, filename, data):
+        """Escribe datos a un archivo"""
+        try:
+            if not isinstance(filename, str):
+                raise ValueError("El nombre del archivo debe ser una cadena")
+            
+            with open(filename, 'w', encoding='utf-8') as f:
+                if isinstance(data, DSLSparseMatrix):
+                    # Matriz dispersa - CSV con todas las celdas, fila por fila
+                    for row in data:
+                        f.write(','.join(map(str, row)) + '\n')
+                elif isinstance(data, DSLMatrix):
+                    # Matriz empaquetada - CSV directo desde los datos
+                    for i in range(data.rows):
+                        f.write(','.join(map(str, data.data[i * data.cols:(i + 1) * data.cols])) + '\n')
+                elif isinstance(data, DSLVector):
+                    # Vector empaquetado - una línea por elemento
+                    f.writelines(f"{item}\n" for item in data)
+                elif isinstance(data, list):
+                    if data and isinstance(data[0], SEQUENCE_TYPES):
+                        # Matriz - escribir como CSV
+                        for row in data:
+                            f.write(','.join(str(cell) for cell in row) + '\n')
+                    else:
+                        # Lista - una línea por elemento
+                        for item in data:
+                            f.write(str(item) + '\n')
+                else:
+                    # Dato simple
+                    f.write(str(data))
+            
+            print(f"💾 Datos escritos al archivo: {filename}")
+            
+        except Exception as e:
+            raise RuntimeError(f"Error al escribir archivo '{filename}': {str(e)}")
+    
+    def _read_numeric_csv(self, lines):
+        """Filas de un CSV leídas directamente a una DSLMatrix (una
+        DSLSparseMatrix si menos de SPARSE_DENSITY de los valores son
+        distintos de 0), o None si alguna celda no es un número o las filas
+        no tienen el mismo largo (entonces se lee como listas de celdas)"""
+        if not lines:
+            return DSLVector()
+        data = DSLVector()
+        columns = lines[0].count(',') + 1
+        for line in lines:
+            cells = line.split(',')
+            if len(cells) != columns:
+                return None
+            for cell in cells:
+                value = self._try_parse_number(cell.strip())
+                if type(value) is str:
+                    return None
+                data.append(value)
+        matrix = DSLMatrix(data, len(lines), columns)
+        if len(data) - data.count(0.0) < SPARSE_DENSITY * len(data):
+            return DSLSparseMatrix.from_dense(matrix)
+        return matrix
+    
+    def _try_parse_number(self, value):
+        """Intenta parsear un valor como número, si no es posible lo deja como string"""
+        try:
+            if '.' in value:
+                return float(value)
+            else:
+                return int(value)
+        except ValueError:
+            return value
@@ -0,0 +1,394 @@
+import os
+import marshal
+import hashlib
+import importlib.util
+import DSLAst as ast
+from DSLRuntime import DSLRuntime, UNDEFINED
+from DSLArtifact import default_cache_directory, encode_node
+
+TRANSPILER_VERSION = 15
+ENTRY_POINT = '__dsl_main'
+# Código de cada operación especializada (ast.SpecializedOp)
+SPECIALIZED_TEMPLATES = {
+    ('+', 'number'): "({0} + {1})",
+    ('-', 'number'): "({0} - {1})",
+    ('*', 'number'): "({0} * {1})",
+    ('/', 'number'): "_divide_numbers({0}, {1})",
+    # ** liga más fuerte que el signo de un literal negativo: -8.0 ** 0.5
+    ('^', 'number'): "(({0}) ** {1})",
+    ('<', 'number'): "({0} < {1})",
+    ('<=', 'number'): "({0} <= {1})",
+    ('>', 'number'): "({0} > {1})",
+    ('>=', 'number'): "({0} >= {1})",
+    ('+', 'text'): "(str({0}) + str({1}))",
+    ('+', 'concat'): "({0} + {1})",
+    ('*', 'repeat'): "({0} * int({1}))",
+}
+
+class DSLTranspiler:
+    """Traduce el AST (DSLAst) a un módulo de Python.
+    
+    Cada asignación se vuelve una variable local (además de guardarse en su
+    slot del runtime, resuelto una vez al inicio), cada while un while nativo y cada función integrada una
+    llamada directa al método auxiliar de DSLRuntime que la implementa.
+    """
+    
+    def __init__(self):
+        self.lines = []
+        self.names = {}
+        # Literales numéricos empaquetados: se construyen una vez al inicio
+        self.constants = {}
+        # while contados (ast.VectorLoop): se reconstruyen una vez al inicio
+        self.vector_loops = []
+        self._indent = 1
+        self._loop_counter = 0
+        # Variables que con seguridad están definidas en el punto actual;
+        # las lecturas del resto verifican que no sean UNDEFINED
+        self._defined = set()
+        self._protected = False
+        self._statement_translators = {
+            ast.Assign: self._translate_assign,
+            ast.Append: self._translate_append,
+            ast.ExprStatement: self._translate_expr_statement,
+            ast.If: self._translate_if,
+            ast.While: self._translate_while,
+            ast.VectorLoop: self._translate_vector_loop,
+            ast.Plot: self._translate_plot,
+            ast.FileOp: self._translate_file_op,
+        }
+        self._expression_translators = {
+            ast.Number: self._translate_literal,
+            ast.String: self._translate_literal,
+            ast.Boolean: self._translate_literal,
+            ast.Variable: self._translate_variable,
+            ast.BinaryOp: self._translate_binary_op,
+            ast.SpecializedOp: self._translate_specialized_op,
+            ast.Not: self._translate_not,
+            ast.Logical: self._translate_logical,
+            ast.ListLiteral: self._translate_list,
+            ast.MatrixLiteral: self._translate_matrix,
+            ast.NumericLiteral: self._translate_numeric,
+            ast.Call: self._translate_call,
+            ast.MatrixExpression: self._translate_matrix_expression,
+            ast.Invariant: self._translate_invariant,
+        }
+    
+    def translate(self, program):
+        """Retorna el código fuente Python de un ast.Program"""
+        self._collect(program)
+        body_start = len(self.lines)
+        self._translate_block(program.body)
+        body = self.lines[body_start:]
+        self.lines = self.lines[:body_start]
+        
+        helpers = sorted(set(DSLRuntime.OPERATOR_METHODS.values()) | set(DSLRuntime.BUILTIN_METHODS.values()) |
+                         {'_store', '_pack', '_accumulate', '_matrix_expression', '_vector_loop', '_divide_numbers', '_to_boolean', '_format_value', '_plot', '_read_file', '_write_file'})
+        header = [
+            "# Generado por DSLTranspiler a partir de un programa DSL",
+            f"def {ENTRY_POINT}(_rt, _vars, UNDEFINED):",
+        ]
+        header += [f"    {helper} = _rt.{helper}" for helper in helpers]
+        header += [
+            "    _budget = _rt.budget",
+            "    from DSLBudget import BudgetExceeded as _BudgetExceeded",
+            "",
+            "    def _undefined(name):",
+            "        raise RuntimeError(f\"Variable no definida: {name}\")",
+            "",
+        ]
+        # Las variables ya definidas (por ejemplo en el REPL) se cargan al inicio
+        for name, local in self.names.items():
+            header.append(f"    _slot_{local} = _vars.slot({name!r})")
+            header.append(f"    {local} = _vars.cells[_slot_{local}]")
+        if self.constants:
+            # Los bytes del array('d') compilan mucho más rápido que una lista de floats
+            header.append("    from DSLAst import NumericLiteral as _NumericLiteral")
+            header += [f"    {local} = _NumericLiteral({values!r}, {rows!r}).materialize()"
+                       for (rows, values), local in self.constants.items()]
+        if self.vector_loops:
+            header.append("    from DSLArtifact import decode_node as _decode_node")
+            header += [f"    {local} = _decode_node({encoded!r})" for local, encoded in self.vector_loops]
+        return "\n".join(header + body + ["    return None", ""])
+    
+    def _collect(self, node):
+        """Asigna un nombre local a cada variable del programa"""
+        if isinstance(node, (ast.Assign, ast.Append, ast.Variable)) and node.name not in self.names:
+            self.names[node.name] = f"v_{node.name}"
+        for field in node.fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.Node):
+                self._collect(value)
+            elif isinstance(value, list):
+                # While.invariants es una lista de enteros, no de nodos
+                for item in value:
+                    if isinstance(item, ast.Node):
+                        self._collect(item)
+    
+    def _emit(self, line):
+        """Agrega una línea con la indentación actual"""
+        self.lines.append("    " * self._indent + line)
+    
+    # === STATEMENTS ===
+    def _translate_block(self, body):
+        """Traduce una lista de statements (pass si está vacía)"""
+        if not body:
+            self._emit("pass")
+        for statement in body:
+            if not self._calls_builtin(statement):
+                self._statement_translators[statement.__class__](statement)
+                continue
+            # Un presupuesto agotado al empezar una función integrada indica
+            # la línea del statement; try no cuesta nada si no hay excepción
+            self._emit("try:")
+            self._indent += 1
+            self._statement_translators[statement.__class__](statement)
+            self._indent -= 1
+            self._emit("except _BudgetExceeded as _error:")
+            self._emit(f"    _error.locate({statement.line})")
+            self._emit("    raise")
+    
+    def _calls_builtin(self, node):
+        """True si node contiene una llamada a una función integrada o una
+        expresión de matrices"""
+        if isinstance(node, (ast.Call, ast.MatrixExpression)):
+            return True
+        for field in node.fields:
+            value = getattr(node, field)
+            if isinstance(value, ast.Node):
+                if self._calls_builtin(value):
+                    return True
+            elif isinstance(value, list):
+                if any(isinstance(item, ast.Node) and self._calls_builtin(item) for item in value):
+                    return True
+        return False
+    
+    def _translate_assign(self, node):
+        """Asignación: variable local + informe al runtime"""
+        value = self.translate_expression(node.value)
+        local = self.names[node.name]
+        self._emit(f"{local} = _store(_slot_{local}, {node.name!r}, {value})")
+        self._defined.add(node.name)
+    
+    def _translate_append(self, node):
+        """Acumulación: la lista propia vive en la local del slot, como una invariante"""
+        current = self.translate_expression(ast.Variable(node.name, node.line))
+        items = self.translate_expression(node.items)
+        local = self.names[node.name]
+        owned = f"_inv{node.slot}"
+        self._emit(f"{owned} = _accumulate({current}, {items}, {owned})")
+        self._emit(f"{local} = _store(_slot_{local}, {node.name!r}, {owned})")
+        self._defined.add(node.name)
+    
+    def _translate_expr_statement(self, node):
+        """Statement de expresión"""
+        self._emit(f"_result = {self.translate_expression(node.expr)}")
+        self._emit("if _result is not None:")
+        self._emit("    print(f\"📊 Resultado: {_format_value(_result)}\")")
+    
+    def _translate_if(self, node):
+        """if nativo"""
+        self._emit(f"if _to_boolean({self.translate_expression(node.condition)}):")
+        defined = self._defined
+        self._defined = set(defined)
+        self._indent += 1
+        self._translate_block(node.then_body)
+        self._indent -= 1
+        then_defined = self._defined
+        self._defined = set(defined)
+        if node.else_body:
+            self._emit("else:")
+            self._indent += 1
+            self._translate_block(node.else_body)
+            self._indent -= 1
+        # Solo queda definido lo que se asigna en ambas ramas
+        self._defined &= then_defined
+    
+    def _translate_while(self, node):
+        """while nativo con contador de iteraciones y presupuesto"""
+        self._loop_counter += 1
+        counter = f"_iterations_{self._loop_counter}"
+        self._emit(f"{counter} = 0")
+        # Cada ejecución del bucle vuelve a calcular sus invariantes
+        for slot in node.invariants:
+            self._emit(f"_inv{slot} = UNDEFINED")
+        self._emit(f"while _to_boolean({self.translate_expression(node.condition)}):")
+        self._indent += 1
+        # Cada vuelta cuesta una operación más una por statement del cuerpo
+        self._emit(f"_budget.fuel -= {len(node.body) + 1}")
+        self._emit("if _budget.fuel < 0:")
+        self._emit(f"    _budget.check({node.line}, {counter})")
+        # El cuerpo puede no ejecutarse: sus asignaciones no cuentan después
+        defined = set(self._defined)
+        self._translate_block(node.body)
+        self._defined = defined
+        self._emit(f"{counter} += 1")
+        self._indent -= 1
+        for slot in node.invariants:
+            self._emit(f"_inv{slot} = UNDEFINED")
+    
+    def _translate_vector_loop(self, node):
+        """while contado: por vectores, o el while nativo si no se puede"""
+        local = f"_vec{len(self.vector_loops)}"
+        self.vector_loops.append((local, encode_node(node)))
+        self._emit(f"_vectorized = _vector_loop({local})")
+        # Las variables que asignó (hasta el último tramo completo, si no
+        # pudo terminar) ya están en el runtime
+        for name in dict.fromkeys(statement.name for statement in node.loop.body):
+            self._emit(f"{self.names[name]} = _vars.cells[_slot_{self.names[name]}]")
+        self._emit("if not _vectorized:")
+        self._indent += 1
+        self._translate_while(node.loop)
+        self._indent -= 1
+    
+    def _translate_plot(self, node):
+        """plot/scatter/hist con la evaluación de argumentos protegida"""
+        self._protected = True
+        args = ", ".join(self.translate_expression(arg) for arg in node.args)
+        self._protected = False
+        self._emit("try:")
+        self._emit(f"    _args = ({args},)")
+        self._emit("except _BudgetExceeded:")
+        self._emit("    raise")
+        self._emit("except Exception as _error:")
+        self._emit("    print(f\"❌ Error al procesar expresiones: {str(_error)}\")")
+        self._emit("else:")
+        self._emit(f"    _plot({node.kind!r}, *_args)")
+    
+    def _translate_file_op(self, node):
+        """readFile/writeFile"""
+        helper = '_read_file' if node.kind == 'readFile' else '_write_file'
+        args = ", ".join(self.translate_expression(arg) for arg in node.args)
+        self._emit(f"{helper}({args})")
+    
+    # === EXPRESIONES ===
+    def translate_expression(self, node):
+        """Retorna el código Python de una expresión"""
+        return self._expression_translators[node.__class__](node)
+    
+    def _translate_literal(self, node):
+        """Literal"""
+        return repr(node.value)
+    
+    def _translate_variable(self, node):
+        """Lectura de variable, verificada si puede no estar definida"""
+        local = self.names[node.name]
+        if node.name in self._defined:
+            return local
+        if not self._protected:
+            self._defined.add(node.name)
+        return f"({local} if {local} is not UNDEFINED else _undefined({node.name!r}))"
+    
+    def _translate_binary_op(self, node):
+        """Operación binaria mediante el método auxiliar del runtime"""
+        left = self.translate_expression(node.left)
+        right = self.translate_expression(node.right)
+        return f"{DSLRuntime.OPERATOR_METHODS[node.op]}({left}, {right})"
+    
+    def _translate_specialized_op(self, node):
+        """Operación con tipos conocidos: el operador de Python directamente"""
+        left = self.translate_expression(node.left)
+        right = self.translate_expression(node.right)
+        return SPECIALIZED_TEMPLATES[node.op, node.kind].format(left, right)
+    
+    def _translate_not(self, node):
+        """Negación lógica"""
+        return f"(not _to_boolean({self.translate_expression(node.operand)}))"
+    
+    def _translate_logical(self, node):
+        """and/or sin cortocircuito (ambos lados se evalúan siempre)"""
+        left = self.translate_expression(node.left)
+        right = self.translate_expression(node.right)
+        op = '&' if node.op == 'and' else '|'
+        return f"(_to_boolean({left}) {op} _to_boolean({right}))"
+    
+    def _translate_list(self, node):
+        """Literal de lista (empaquetado si es de números)"""
+        return "_pack([" + ", ".join(self.translate_expression(item) for item in node.items) + "])"
+    
+    def _translate_matrix(self, node):
+        """Literal de matriz (empaquetado si es de números)"""
+        return "_pack([" + ", ".join(self.translate_expression(row) for row in node.rows) + "])"
+    
+    def _translate_numeric(self, node):
+        """Literal numérico empaquetado: una variable local creada una sola vez"""
+        key = (node.rows, node.values.tobytes())
+        if key not in self.constants:
+            self.constants[key] = f"_k{len(self.constants)}"
+        return self.constants[key]
+    
+    def _translate_invariant(self, node):
+        """Expresión invariante: se calcula una vez por ejecución del bucle"""
+        local = f"_inv{node.slot}"
+        return f"({local} if {local} is not UNDEFINED else ({local} := {self.translate_expression(node.expr)}))"
+    
+    def _translate_call(self, node):
+        """Llamada directa al método auxiliar de la función integrada"""
+        args = ", ".join(self.translate_expression(arg) for arg in node.args)
+        return f"{DSLRuntime.BUILTIN_METHODS[node.func]}({args})"
+    
+    def _translate_matrix_expression(self, node):
+        """Operaciones de matrices anidadas: las ops van como una tupla constante"""
+        args = "".join(", " + self.translate_expression(arg) for arg in node.args)
+        return f"_matrix_expression({tuple(node.ops)!r}{args})"
+
+class DSLCodeCache:
+    """Caché en disco de code objects, indexada por el hash del código DSL"""
+    
+    def __init__(self, directory=None, variant=""):
+        self.directory = directory or default_cache_directory()
+        # El formato de marshal depende de la versión de Python; variant
+        # distingue programas compilados con opciones distintas (optimizador)
+        self._header = (importlib.util.MAGIC_NUMBER + TRANSPILER_VERSION.to_bytes(4, 'little')
+                        + variant.encode('ascii'))
+    
+    def _path(self, source):
+        """Ruta del archivo de caché para un código fuente"""
+        key = hashlib.sha256(self._header + source.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f"{key}.dslpyc")
+    
+    def get(self, source):
+        """Retorna el code object guardado para source, o None"""
+        try:
+            with open(self._path(source), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if not data.startswith(self._header):
+            return None
+        try:
+            return marshal.loads(data[len(self._header):])
+        except (ValueError, EOFError, TypeError):
+            return None
+    
+    def put(self, source, code_object):
+        """Guarda el code object de source (los errores de escritura se ignoran)"""
+        path = self._path(source)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(self._header + marshal.dumps(code_object))
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+class DSLPythonEngine:
+    """Motor que ejecuta el programa como código Python generado"""
+    
+    def __init__(self, runtime, cache=None):
+        self.runtime = runtime
+        self.cache = cache
+    
+    def compile(self, program, filename="<dsl>"):
+        """Traduce y compila un ast.Program a un code object"""
+        return compile(DSLTranspiler().translate(program), filename, 'exec')
+    
+    def execute(self, program):
+        """Compila y ejecuta un ast.Program"""
+        return self.run(self.compile(program))
+    
+    def run(self, code_object):
+        """Ejecuta un code object producido por compile()"""
+        namespace = {}
+        exec(code_object, namespace)
+        return namespace[ENTRY_POINT](self.runtime, self.runtime.variables, UNDEFINED)
@@ -0,0 +1,294 @@
+import DSLAst as ast
+from DSLVector import DSLVector, SEQUENCE_TYPES, MATRIX_TYPES
+
+# Tipos que infiere DSLTypeInference. MATRIX es un caso particular de LIST
+# (una lista de filas); UNKNOWN es cualquier valor
+NUMBER = 'number'
+STRING = 'string'
+BOOL = 'bool'
+LIST = 'list'
+MATRIX = 'matrix'
+MODEL = 'model'
+UNKNOWN = 'unknown'
+
+# Tipo del resultado de cada función integrada (si no falla)
+BUILTIN_TYPES = {
+    'sin': NUMBER, 'cos': NUMBER, 'tan': NUMBER, 'sqrt': NUMBER, 'log': NUMBER, 'exp': NUMBER,
+    'transpose': MATRIX, 'inverse': MATRIX, 'matmul': MATRIX, 'matsum': MATRIX, 'matsub': MATRIX,
+    'det': NUMBER, 'solve': LIST, 'density': NUMBER,
+    'linearRegression': MODEL, 'mlpClassifier': MODEL, 'kmeans': MODEL,
+}
+ARITHMETIC_OPS = {'+', '-', '*', '/', '^'}
+COMPARISON_OPS = {'<', '<=', '>', '>='}
+
+class DSLTypeInference:
+    """Inferencia de tipos sobre el AST y especialización de operaciones.
+    
+    Recorre el programa en orden llevando el tipo de cada variable. Una
+    variable que no se asignó antes en el programa, o que en algún camino
+    (una rama del if, las vueltas de un while) puede tener otro tipo, es
+    UNKNOWN: el runtime puede traer valores de antes (REPL, streaming). Las
+    operaciones binarias cuyos operandos tienen tipos conocidos se
+    reemplazan por ast.SpecializedOp, que los motores ejecutan sin las
+    verificaciones ni conversiones de los métodos genéricos de DSLRuntime.
+    """
+    
+    def __init__(self):
+        self.specialized = 0
+        self.operations = 0
+        self._statement_inferers = {
+            ast.Assign: self._infer_assign,
+            ast.Append: self._infer_append,
+            ast.ExprStatement: self._infer_expr_statement,
+            ast.If: self._infer_if,
+            ast.While: self._infer_while,
+            ast.Plot: self._infer_call_statement,
+            ast.FileOp: self._infer_call_statement,
+        }
+        self._expression_inferers = {
+            ast.Number: self._infer_literal,
+            ast.String: self._infer_literal,
+            ast.Boolean: self._infer_literal,
+            ast.NumericLiteral: self._infer_literal,
+            ast.Variable: self._infer_variable,
+            ast.BinaryOp: self._infer_binary_op,
+            ast.Not: self._infer_not,
+            ast.Logical: self._infer_logical,
+            ast.ListLiteral: self._infer_list,
+            ast.MatrixLiteral: self._infer_matrix,
+            ast.Call: self._infer_call,
+            ast.MatrixExpression: self._infer_matrix_expression,
+            ast.Invariant: self._infer_invariant,
+        }
+    
+    # === PROGRAMA PRINCIPAL ===
+    def specialize(self, program, variables=None):
+        """Retorna un ast.Program con las operaciones especializadas (el
+        original no se modifica). variables son los valores del runtime al
+        empezar, si se sabe que serán esos (el programa se ejecuta enseguida
+        y no se guarda compilado)."""
+        env = {}
+        for name, value in (variables or {}).items():
+            value_type = type_of_value(value)
+            if value_type != UNKNOWN:
+                env[name] = value_type
+        body, _ = self._block(program.body, env)
+        return ast.Program(body, program.line)
+    
+    def _block(self, body, env):
+        """Procesa una lista de statements; retorna (statements, tipos al final)"""
+        statements = []
+        for statement in body:
+            statement, env = self._statement_inferers[statement.__class__](statement, env)
+            statements.append(statement)
+        return statements, env
+    
+    # === STATEMENTS ===
+    # Cada uno recibe los tipos de las variables antes del statement y
+    # retorna (statement especializado, tipos después)
+    def _infer_assign(self, node, env):
+        """Asignación: la variable toma el tipo del valor"""
+        value, value_type = self.infer_expression(node.value, env)
+        env = dict(env)
+        if value_type == UNKNOWN:
+            env.pop(node.name, None)
+        else:
+            env[node.name] = value_type
+        return ast.Assign(node.name, value, node.line), env
+    
+    def _infer_append(self, node, env):
+        """Acumulación: la variable toma el tipo de name + items"""
+        items, items_type = self.infer_expression(node.items, env)
+        value_type = result_type_of('+', env.get(node.name, UNKNOWN), items_type, items)
+        env = dict(env)
+        if value_type == UNKNOWN:
+            env.pop(node.name, None)
+        else:
+            env[node.name] = value_type
+        return ast.Append(node.name, items, node.slot, node.line), env
+    
+    def _infer_expr_statement(self, node, env):
+        """Statement de expresión"""
+        expr, _ = self.infer_expression(node.expr, env)
+        return ast.ExprStatement(expr, node.line), env
+    
+    def _infer_if(self, node, env):
+        """if: después valen los tipos en los que coinciden ambas ramas"""
+        condition, _ = self.infer_expression(node.condition, env)
+        then_body, then_env = self._block(node.then_body, env)
+        else_body, else_env = self._block(node.else_body, env)
+        return ast.If(condition, then_body, else_body, node.line), join_types(then_env, else_env)
+    
+    def _infer_while(self, node, env):
+        """while: se repite el cuerpo hasta que los tipos de entrada no cambian"""
+        counters = self.specialized, self.operations
+        while True:
+            # Los contadores solo cuentan la última pasada, la que se conserva
+            self.specialized, self.operations = counters
+            condition, _ = self.infer_expression(node.condition, env)
+            body, body_env = self._block(node.body, env)
+            joined = join_types(env, body_env)
+            if joined == env:
+                break
+            env = joined
+        return ast.While(condition, body, node.invariants, node.line), env
+    
+    def _infer_call_statement(self, node, env):
+        """plot/scatter/hist y readFile/writeFile"""
+        args = [self.infer_expression(arg, env)[0] for arg in node.args]
+        return node.__class__(node.kind, args, node.line), env
+    
+    # === EXPRESIONES ===
+    def infer_expression(self, node, env):
+        """Retorna (expresión especializada, tipo del resultado)"""
+        return self._expression_inferers[node.__class__](node, env)
+    
+    def _infer_literal(self, node, env):
+        """Literales"""
+        if isinstance(node, ast.Number):
+            return node, NUMBER
+        if isinstance(node, ast.String):
+            return node, STRING
+        if isinstance(node, ast.Boolean):
+            return node, BOOL
+        return node, LIST if node.rows is None else MATRIX
+    
+    def _infer_variable(self, node, env):
+        """Variable: el tipo de su última asignación, si se conoce"""
+        return node, env.get(node.name, UNKNOWN)
+    
+    def _infer_binary_op(self, node, env):
+        """Operación binaria: especializada si los tipos lo permiten"""
+        left, left_type = self.infer_expression(node.left, env)
+        right, right_type = self.infer_expression(node.right, env)
+        self.operations += 1
+        kind = specialization(node.op, left_type, right_type)
+        result_type = result_type_of(node.op, left_type, right_type, right)
+        if kind is None:
+            return ast.BinaryOp(node.op, left, right, node.line), result_type
+        self.specialized += 1
+        return ast.SpecializedOp(node.op, kind, left, right, node.line), result_type
+    
+    def _infer_not(self, node, env):
+        """Negación lógica"""
+        operand, _ = self.infer_expression(node.operand, env)
+        return ast.Not(operand, node.line), BOOL
+    
+    def _infer_logical(self, node, env):
+        """and/or"""
+        left, _ = self.infer_expression(node.left, env)
+        right, _ = self.infer_expression(node.right, env)
+        return ast.Logical(node.op, left, right, node.line), BOOL
+    
+    def _infer_list(self, node, env):
+        """Literal de lista"""
+        items = [self.infer_expression(item, env)[0] for item in node.items]
+        return ast.ListLiteral(items, node.line), LIST
+    
+    def _infer_matrix(self, node, env):
+        """Literal de matriz"""
+        rows = [self.infer_expression(row, env)[0] for row in node.rows]
+        return ast.MatrixLiteral(rows, node.line), MATRIX
+    
+    def _infer_call(self, node, env):
+        """Llamada a función integrada"""
+        args = [self.infer_expression(arg, env)[0] for arg in node.args]
+        return ast.Call(node.func, args, node.line), BUILTIN_TYPES.get(node.func, UNKNOWN)
+    
+    def _infer_matrix_expression(self, node, env):
+        """Operaciones de matrices anidadas: el resultado es una matriz"""
+        args = [self.infer_expression(arg, env)[0] for arg in node.args]
+        return ast.MatrixExpression(node.ops, args, node.line), MATRIX
+    
+    def _infer_invariant(self, node, env):
+        """Expresión invariante de un while: el tipo de la expresión"""
+        expr, expr_type = self.infer_expression(node.expr, env)
+        return ast.Invariant(expr, node.slot, node.line), expr_type
+
+def type_of_value(value):
+    """Tipo de un valor del runtime"""
+    if type(value) is float:
+        return NUMBER
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, str):
+        return STRING
+    if isinstance(value, DSLVector):
+        return LIST
+    if isinstance(value, MATRIX_TYPES):
+        return MATRIX
+    if isinstance(value, list):
+        return MATRIX if value and all(isinstance(row, SEQUENCE_TYPES) for row in value) else LIST
+    if isinstance(value, dict):
+        return MODEL
+    return UNKNOWN
+
+def join_type(left, right):
+    """Tipo que cubre a ambos (una matriz también es una lista)"""
+    if left == right:
+        return left
+    if {left, right} == {LIST, MATRIX}:
+        return LIST
+    return UNKNOWN
+
+def join_types(left, right):
+    """Tipos de las variables después de dos caminos posibles. Una variable
+    que falta en uno de ellos queda desconocida."""
+    joined = {}
+    for name, left_type in left.items():
+        if name in right:
+            result = join_type(left_type, right[name])
+            if result != UNKNOWN:
+                joined[name] = result
+    return joined
+
+def is_list_type(value_type):
+    """True para listas y matrices"""
+    return value_type == LIST or value_type == MATRIX
+
+def specialization(op, left_type, right_type):
+    """Variante de la operación para esos tipos (ver DSLRuntime.specialized),
+    o None si hace falta el método genérico"""
+    if left_type == NUMBER and right_type == NUMBER and (op in ARITHMETIC_OPS or op in COMPARISON_OPS):
+        return 'number'
+    if op == '+':
+        # Con un texto de un lado el resultado siempre es la concatenación
+        if left_type == STRING or right_type == STRING:
+            return 'text'
+        if is_list_type(left_type) and is_list_type(right_type):
+            return 'concat'
+    if op == '*' and (is_list_type(left_type) or left_type == STRING) and right_type == NUMBER:
+        return 'repeat'
+    return None
+
+def result_type_of(op, left_type, right_type, right):
+    """Tipo del resultado de una operación binaria (si no falla)"""
+    if op in COMPARISON_OPS or op == '==' or op == '!=':
+        return BOOL
+    if op == '-' or op == '/':
+        # Los métodos convierten ambos lados a número
+        return NUMBER
+    if op == '^':
+        # Una base negativa con exponente no entero da un complejo
+        if isinstance(right, ast.Number) and float(right.value).is_integer():
+            return NUMBER
+        return UNKNOWN
+    if op == '+':
+        if is_list_type(left_type) and is_list_type(right_type):
+            return MATRIX if left_type == right_type == MATRIX else LIST
+        if left_type == STRING or right_type == STRING:
+            return STRING
+        if left_type in (NUMBER, BOOL) and right_type in (NUMBER, BOOL):
+            return NUMBER
+        return UNKNOWN
+    # '*': repetición de lista o texto, o producto de números
+    if (is_list_type(left_type) or left_type == STRING) and right_type in (NUMBER, BOOL):
+        return left_type
+    if left_type in (NUMBER, BOOL):
+        return NUMBER
+    return UNKNOWN
+
+def specialize_program(program):
+    """Especializa un ast.Program; retorna (programa, inferencia con sus contadores)"""
+    inference = DSLTypeInference()
+    return inference.specialize(program), inference
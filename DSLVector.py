@@ -0,0 +1,327 @@
+import operator
+from array import array
+from itertools import compress
+
+class DSLVector(array):
+    """Lista de números empaquetada: los floats contiguos en un array('d').
+    
+    Ocupa 8 bytes por elemento en lugar de un puntero más un float de Python
+    (unos 32), y su buffer se puede pasar sin copiar a código nativo. Hacia
+    el DSL se comporta como la lista equivalente: se imprime igual, es igual
+    a una lista con los mismos números, y + y * concatenan y repiten (el
+    resultado sigue empaquetado si es solo de números).
+    """
+    
+    __slots__ = ()
+    
+    def __new__(cls, values=()):
+        return array.__new__(cls, 'd', values)
+    
+    def __eq__(self, other):
+        """Igual a otro vector o a una lista con los mismos números"""
+        if isinstance(other, array):
+            return array.__eq__(self, other)
+        if isinstance(other, list):
+            return len(self) == len(other) and all(map(operator.eq, self, other))
+        return NotImplemented
+    
+    def __ne__(self, other):
+        """Negación de __eq__"""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """Como la lista equivalente: [1.0, 2.5]"""
+        return repr(self.tolist())
+    
+    __str__ = __repr__
+    
+    def __add__(self, other):
+        """Concatenación, empaquetada si el otro lado también es de números"""
+        if isinstance(other, array):
+            result = DSLVector(self)
+            result.extend(other)
+            return result
+        if isinstance(other, list):
+            if all(type(item) is float for item in other):
+                result = DSLVector(self)
+                result.extend(other)
+                return result
+            return pack(self.tolist() + other)
+        if isinstance(other, DSLMatrix):
+            return pack(self.tolist() + list(other))
+        return NotImplemented
+    
+    def __radd__(self, other):
+        """lista + vector"""
+        if isinstance(other, list):
+            return pack(other + self.tolist())
+        return NotImplemented
+    
+    def __mul__(self, times):
+        """Repetición (times ya es un entero)"""
+        if isinstance(times, int):
+            return DSLVector(array.__mul__(self, times))
+        return NotImplemented
+    
+    __rmul__ = __mul__
+
+class DSLMatrix:
+    """Matriz de números empaquetada: rows x cols floats en un DSLVector,
+    fila por fila.
+    
+    Hacia el DSL se comporta como la lista de filas equivalente: len() es la
+    cantidad de filas, indexar o recorrer entrega cada fila como un
+    DSLVector (una copia) y se imprime y compara como esa lista. Las
+    operaciones de matrices del runtime trabajan directamente sobre data.
+    version cuenta las veces que la matriz se extendió en su lugar (ver
+    DSLRuntime._accumulate): junto con la identidad, identifica su valor en
+    la caché de factorizaciones.
+    """
+    
+    __slots__ = ('data', 'rows', 'cols', 'version', '__weakref__')
+    
+    def __init__(self, data, rows, cols):
+        self.data = data
+        self.rows = rows
+        self.cols = cols
+        self.version = 0
+    
+    @classmethod
+    def from_rows(cls, rows):
+        """Matriz a partir de una lista de filas del mismo largo"""
+        data = DSLVector()
+        for row in rows:
+            data.extend(row)
+        return cls(data, len(rows), len(rows[0]) if rows else 0)
+    
+    def row(self, index):
+        """Fila index (desde 0) como un DSLVector nuevo"""
+        start = index * self.cols
+        return DSLVector(self.data[start:start + self.cols])
+    
+    def tolist(self):
+        """Lista de filas, cada una una lista de floats"""
+        return [self.row(index).tolist() for index in range(self.rows)]
+    
+    def __len__(self):
+        """Cantidad de filas"""
+        return self.rows
+    
+    def __getitem__(self, index):
+        """Una fila (DSLVector) o, con un slice, una lista de filas"""
+        if isinstance(index, slice):
+            return [self.row(row) for row in range(self.rows)[index]]
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError("índice de fila fuera de rango")
+        return self.row(index)
+    
+    def __iter__(self):
+        """Recorre las filas"""
+        return map(self.row, range(self.rows))
+    
+    def __eq__(self, other):
+        """Igual a otra matriz o a una lista con las mismas filas"""
+        if isinstance(other, DSLMatrix):
+            return self.rows == other.rows and self.cols == other.cols and self.data == other.data
+        if isinstance(other, list):
+            return len(other) == self.rows and all(map(operator.eq, self, other))
+        return NotImplemented
+    
+    def __ne__(self, other):
+        """Negación de __eq__"""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """Como la lista de filas equivalente: [[1.0, 2.0], [3.0, 4.0]]"""
+        return repr(self.tolist())
+    
+    __str__ = __repr__
+    
+    def __add__(self, other):
+        """Concatenación de filas, empaquetada si las columnas coinciden"""
+        if isinstance(other, DSLMatrix) and other.cols == self.cols:
+            return DSLMatrix(self.data + other.data, self.rows + other.rows, self.cols)
+        if isinstance(other, (list, array, DSLMatrix)):
+            return pack(list(self) + list(other))
+        return NotImplemented
+    
+    def __radd__(self, other):
+        """lista + matriz"""
+        if isinstance(other, list):
+            return pack(other + list(self))
+        return NotImplemented
+    
+    def __mul__(self, times):
+        """Repetición de las filas (times ya es un entero)"""
+        if not isinstance(times, int):
+            return NotImplemented
+        if times <= 0:
+            return DSLVector()
+        return DSLMatrix(self.data * times, self.rows * times, self.cols)
+    
+    __rmul__ = __mul__
+
+class DSLSparseMatrix:
+    """Matriz dispersa en formato CSR: solo los valores distintos de 0.
+    
+    values tiene los valores de cada fila, de izquierda a derecha, indices
+    la columna de cada uno y indptr[i]:indptr[i + 1] la porción de la fila
+    i. Hacia el DSL se comporta como la lista de filas equivalente, igual
+    que DSLMatrix: indexar o recorrer entrega cada fila completa (con sus
+    ceros) como un DSLVector. Las operaciones de matrices del runtime usan
+    kernels propios para este formato (ver DSLBackend). version es siempre
+    0: la matriz no se modifica en su lugar.
+    """
+    
+    __slots__ = ('values', 'indices', 'indptr', 'rows', 'cols', 'version', '__weakref__')
+    
+    def __init__(self, values, indices, indptr, rows, cols):
+        self.values = values
+        self.indices = indices
+        self.indptr = indptr
+        self.rows = rows
+        self.cols = cols
+        self.version = 0
+    
+    @classmethod
+    def from_dense(cls, matrix):
+        """Matriz dispersa con los valores distintos de 0 de una DSLMatrix"""
+        values, indices, indptr = DSLVector(), index_array(), index_array([0])
+        columns = range(matrix.cols)
+        for i in range(matrix.rows):
+            row = matrix.data[i * matrix.cols:(i + 1) * matrix.cols]
+            values.extend(compress(row, row))
+            indices.extend(compress(columns, row))
+            indptr.append(len(values))
+        return cls(values, indices, indptr, matrix.rows, matrix.cols)
+    
+    @property
+    def nnz(self):
+        """Cantidad de valores distintos de 0 guardados"""
+        return len(self.values)
+    
+    def to_dense(self):
+        """La misma matriz como DSLMatrix"""
+        data = DSLVector([0.0]) * (self.rows * self.cols)
+        for i in range(self.rows):
+            offset = i * self.cols
+            for p in range(self.indptr[i], self.indptr[i + 1]):
+                data[offset + self.indices[p]] = self.values[p]
+        return DSLMatrix(data, self.rows, self.cols)
+    
+    def row(self, index):
+        """Fila index (desde 0) como un DSLVector nuevo, con sus ceros"""
+        result = DSLVector([0.0]) * self.cols
+        for p in range(self.indptr[index], self.indptr[index + 1]):
+            result[self.indices[p]] = self.values[p]
+        return result
+    
+    def tolist(self):
+        """Lista de filas, cada una una lista de floats"""
+        return [self.row(index).tolist() for index in range(self.rows)]
+    
+    def __len__(self):
+        """Cantidad de filas"""
+        return self.rows
+    
+    def __getitem__(self, index):
+        """Una fila (DSLVector) o, con un slice, una lista de filas"""
+        if isinstance(index, slice):
+            return [self.row(row) for row in range(self.rows)[index]]
+        if index < 0:
+            index += self.rows
+        if not 0 <= index < self.rows:
+            raise IndexError("índice de fila fuera de rango")
+        return self.row(index)
+    
+    def __iter__(self):
+        """Recorre las filas"""
+        return map(self.row, range(self.rows))
+    
+    def __eq__(self, other):
+        """Igual a otra matriz (dispersa o no) o a una lista con las mismas filas"""
+        if isinstance(other, DSLSparseMatrix):
+            return (self.rows == other.rows and self.cols == other.cols and self.indptr == other.indptr
+                    and self.indices == other.indices and self.values == other.values)
+        if isinstance(other, DSLMatrix):
+            return self.rows == other.rows and self.cols == other.cols and self.to_dense().data == other.data
+        if isinstance(other, list):
+            return len(other) == self.rows and all(map(operator.eq, self, other))
+        return NotImplemented
+    
+    def __ne__(self, other):
+        """Negación de __eq__"""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        """Como la lista de filas equivalente"""
+        return repr(self.tolist())
+    
+    __str__ = __repr__
+    
+    def __add__(self, other):
+        """Concatenación de filas, dispersa si el otro lado también lo es y
+        las columnas coinciden"""
+        if isinstance(other, DSLSparseMatrix) and other.cols == self.cols:
+            offset = len(self.values)
+            indptr = self.indptr + index_array(offset + end for end in other.indptr[1:])
+            return DSLSparseMatrix(self.values + other.values, self.indices + other.indices, indptr,
+                                   self.rows + other.rows, self.cols)
+        if isinstance(other, (list, array, DSLMatrix, DSLSparseMatrix)):
+            return pack(list(self) + list(other))
+        return NotImplemented
+    
+    def __radd__(self, other):
+        """lista, vector o matriz + matriz dispersa"""
+        if isinstance(other, (list, array, DSLMatrix)):
+            return pack(list(other) + list(self))
+        return NotImplemented
+    
+    def __mul__(self, times):
+        """Repetición de las filas (times ya es un entero)"""
+        if not isinstance(times, int):
+            return NotImplemented
+        if times <= 0:
+            return DSLVector()
+        nnz = len(self.values)
+        indptr = index_array([0])
+        for copy in range(times):
+            indptr.extend(copy * nnz + end for end in self.indptr[1:])
+        return DSLSparseMatrix(self.values * times, self.indices * times, indptr, self.rows * times, self.cols)
+    
+    __rmul__ = __mul__
+
+# Valores del DSL que se comportan como listas
+SEQUENCE_TYPES = (list, DSLVector, DSLMatrix, DSLSparseMatrix)
+# Matrices empaquetadas, densas o dispersas: tienen rows y cols
+MATRIX_TYPES = (DSLMatrix, DSLSparseMatrix)
+
+def index_array(values=()):
+    """Enteros empaquetados (array('q')): índices y punteros de DSLSparseMatrix"""
+    return array('q', values)
+
+def pack(items):
+    """Valor de una lista recién construida: un DSLVector si todos los
+    elementos son números, una DSLMatrix si todos son DSLVector del mismo
+    largo (filas), o la misma lista si no"""
+    for item in items:
+        if type(item) is not float:
+            break
+    else:
+        return DSLVector(items)
+    if type(items[0]) is DSLVector:
+        columns = len(items[0])
+        if all(type(row) is DSLVector and len(row) == columns for row in items):
+            return DSLMatrix.from_rows(items)
+    return items
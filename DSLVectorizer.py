@@ -0,0 +1,401 @@
+import sys
+import math
+import operator
+from itertools import repeat
+import DSLAst as ast
+from DSLTypes import ARITHMETIC_OPS, COMPARISON_OPS
+from DSLVector import DSLVector, SEQUENCE_TYPES
+
+# Funciones integradas que se aplican elemento a elemento. Con un float dan
+# el mismo resultado que los métodos de DSLRuntime y fallan en los mismos
+# casos (raíz de un negativo, logaritmo de cero, exp que desborda)
+ELEMENTWISE_FUNCTIONS = {'sin': math.sin, 'cos': math.cos, 'tan': math.tan,
+                         'sqrt': math.sqrt, 'log': math.log, 'exp': math.exp}
+# Operaciones entre dos números, como las hace DSLRuntime con floats
+NUMBER_OPERATIONS = {'+': operator.add, '-': operator.sub, '*': operator.mul,
+                     '/': operator.truediv, '^': operator.pow}
+# Las mismas sobre arrays de NumPy (^ se calcula con la de Python)
+NUMBER_ARRAY_OPERATIONS = {'+': operator.add, '-': operator.sub, '*': operator.mul, '/': operator.truediv}
+COMPARISONS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+# Vueltas máximas de un while por vectores sin límite de operaciones (los
+# valores del contador se calculan todos antes del primer tramo): más que
+# eso lo ejecuta el while normal
+MAX_VECTOR_ITERATIONS = 1_000_000
+# Vueltas que se calculan (y se informan) juntas: acota la memoria de la
+# salida pendiente y la escribe a medida que avanza el bucle
+VECTOR_CHUNK = 4096
+# Vueltas desde las que conviene importar NumPy para un bucle: en uno más
+# corto, importarlo (unos 65 ms) cuesta más que lo que ahorra
+NUMPY_MIN_ITERATIONS = 100_000
+
+class DSLLoopVectorizer:
+    """Reconoce los while contados y los marca como ast.VectorLoop.
+    
+    Un while contado compara un contador con un número o una variable que el
+    cuerpo no asigna, lo avanza un paso constante en su último statement y
+    antes de eso solo asigna expresiones numéricas (operaciones aritméticas,
+    sin, cos, ...) sobre el contador, valores calculados antes en la misma
+    vuelta y variables que el bucle no modifica, o las acumula con
+    x = x + [...] (ast.Append). Cada vuelta es entonces independiente de las
+    anteriores y el bucle entero se puede calcular de una vez por vectores.
+    """
+    
+    def __init__(self):
+        self.vectorized = 0
+    
+    def vectorize(self, program):
+        """Retorna un ast.Program con los while contados marcados"""
+        return ast.Program(self._block(program.body), program.line)
+    
+    def _block(self, body):
+        """Procesa una lista de statements"""
+        return [self._statement(statement) for statement in body]
+    
+    def _statement(self, node):
+        """Marca el statement si es un while contado (o busca adentro)"""
+        if isinstance(node, ast.If):
+            return ast.If(node.condition, self._block(node.then_body), self._block(node.else_body), node.line)
+        if isinstance(node, ast.While):
+            counted = counted_loop(node)
+            if counted is not None:
+                self.vectorized += 1
+                counter, step = counted
+                return ast.VectorLoop(node, counter, step, node.line)
+            return ast.While(node.condition, self._block(node.body), node.invariants, node.line)
+        return node
+
+def counted_loop(loop):
+    """(contador, paso) si el while es contado, o None"""
+    condition = loop.condition
+    if not (isinstance(condition, (ast.BinaryOp, ast.SpecializedOp)) and condition.op in COMPARISON_OPS
+            and isinstance(condition.left, ast.Variable)) or not loop.body:
+        return None
+    counter = condition.left.name
+    increment = loop.body[-1]
+    if not (isinstance(increment, ast.Assign) and increment.name == counter
+            and _is_number_op(increment.value, ('+',)) and isinstance(increment.value.left, ast.Variable)
+            and increment.value.left.name == counter and isinstance(increment.value.right, ast.Number)):
+        return None
+    
+    body_names = {statement.name for statement in loop.body if isinstance(statement, (ast.Assign, ast.Append))}
+    bound = condition.right
+    if not (isinstance(bound, ast.Number) or isinstance(bound, ast.Variable) and bound.name not in body_names):
+        return None
+    # Las variables del cuerpo solo se pueden leer después de asignarlas en la misma vuelta
+    defined = {counter}
+    for statement in loop.body[:-1]:
+        if isinstance(statement, ast.Assign):
+            if not is_elementwise(statement.value, defined, body_names):
+                return None
+        elif isinstance(statement, ast.Append):
+            items = statement.items
+            if isinstance(items, ast.NumericLiteral):
+                if items.rows is not None:
+                    return None
+            elif not (isinstance(items, ast.ListLiteral)
+                      and all(is_elementwise(item, defined, body_names) for item in items.items)):
+                return None
+        else:
+            return None
+        if statement.name in defined:
+            return None
+        defined.add(statement.name)
+    return counter, increment.value.right.value
+
+def is_elementwise(node, defined, body_names):
+    """True si la expresión es numérica y se puede calcular por vectores"""
+    if isinstance(node, ast.Number):
+        return True
+    if isinstance(node, ast.Variable):
+        return node.name in defined or node.name not in body_names
+    if _is_number_op(node, ARITHMETIC_OPS):
+        return is_elementwise(node.left, defined, body_names) and is_elementwise(node.right, defined, body_names)
+    if isinstance(node, ast.Call):
+        return node.func in ELEMENTWISE_FUNCTIONS and len(node.args) == 1 \
+            and is_elementwise(node.args[0], defined, body_names)
+    if isinstance(node, ast.Invariant):
+        return is_elementwise(node.expr, defined, body_names)
+    return False
+
+def _is_number_op(node, ops):
+    """True si es una operación binaria de ops sin especializar o especializada para números"""
+    if isinstance(node, ast.SpecializedOp):
+        return node.op in ops and node.kind == 'number'
+    return isinstance(node, ast.BinaryOp) and node.op in ops
+
+def vectorize_program(program):
+    """Vectoriza un ast.Program; retorna (programa, vectorizador con su contador)"""
+    vectorizer = DSLLoopVectorizer()
+    return vectorizer.vectorize(program), vectorizer
+
+# === EJECUCIÓN ===
+class _NotVectorizable(Exception):
+    """Un valor de entrada no es un número: se ejecuta el while normal"""
+
+class ListBackend:
+    """Vectores como listas de float; cada operación es un map de Python"""
+    
+    name = 'math'
+    
+    def vector(self, values):
+        """Vector a partir de una lista de float"""
+        return values
+    
+    def is_vector(self, value):
+        """True si value es un vector (si no, es un número)"""
+        return isinstance(value, list)
+    
+    def to_list(self, vector):
+        """Lista de float de un vector"""
+        return vector
+    
+    def binary(self, op, left, right):
+        """Operación aritmética elemento a elemento (los números se repiten)"""
+        function = NUMBER_OPERATIONS[op]
+        if isinstance(left, list):
+            right = right if isinstance(right, list) else repeat(right, len(left))
+        elif isinstance(right, list):
+            left = repeat(left, len(right))
+        else:
+            return _checked_number(function(left, right))
+        result = list(map(function, left, right))
+        if op == '^' and not all(type(value) is float for value in result):
+            raise _NotVectorizable()
+        return result
+    
+    def call(self, func, value):
+        """Función integrada elemento a elemento"""
+        function = ELEMENTWISE_FUNCTIONS[func]
+        if isinstance(value, list):
+            return list(map(function, value))
+        return function(value)
+
+class NumpyBackend(ListBackend):
+    """Vectores como arrays de NumPy.
+    
+    Las operaciones aritméticas y sqrt son exactas en IEEE 754, así que dan
+    los mismos bits que Python; las demás funciones (y ^) se calculan con
+    math para no depender de las aproximaciones vectoriales de NumPy.
+    """
+    
+    name = 'numpy'
+    
+    def __init__(self, numpy):
+        self.numpy = numpy
+    
+    def vector(self, values):
+        """Vector a partir de una lista de float"""
+        return self.numpy.array(values, dtype=float)
+    
+    def is_vector(self, value):
+        """True si value es un vector (si no, es un número)"""
+        return isinstance(value, self.numpy.ndarray)
+    
+    def to_list(self, vector):
+        """Lista de float de un vector"""
+        return vector.tolist()
+    
+    def binary(self, op, left, right):
+        """Operación aritmética elemento a elemento"""
+        if not self.is_vector(left) and not self.is_vector(right):
+            return ListBackend.binary(self, op, left, right)
+        if op == '^':
+            left, right = self._as_lists(left, right)
+            return self.vector(ListBackend.binary(self, op, left, right))
+        if op == '/' and self.numpy.any(right == 0):
+            raise ZeroDivisionError("División por cero")
+        # Un desborde da inf como en Python, sin avisos de NumPy en stderr
+        with self.numpy.errstate(all='ignore'):
+            return NUMBER_ARRAY_OPERATIONS[op](left, right)
+    
+    def call(self, func, value):
+        """Función integrada elemento a elemento"""
+        if not self.is_vector(value):
+            return ListBackend.call(self, func, value)
+        if func == 'sqrt':
+            if self.numpy.any(value < 0):
+                raise ValueError("No se puede calcular la raíz cuadrada de un número negativo")
+            return self.numpy.sqrt(value)
+        return self.vector(list(map(ELEMENTWISE_FUNCTIONS[func], value.tolist())))
+    
+    def _as_lists(self, left, right):
+        """Convierte los vectores a listas (los números quedan igual)"""
+        return [self.to_list(value) if self.is_vector(value) else value for value in (left, right)]
+
+_backend = None
+
+def default_backend():
+    """NumpyBackend si NumPy está instalado, si no ListBackend (se elige una
+    vez; NumPy se importa recién entonces)"""
+    global _backend
+    if _backend is None:
+        try:
+            import numpy
+        except ImportError:
+            _backend = ListBackend()
+        else:
+            _backend = NumpyBackend(numpy)
+    return _backend
+
+def vector_backend(name, iterations):
+    """Backend de vectores para un nombre de --backend y un bucle de
+    iterations vueltas: python fuerza ListBackend; auto y numpy usan
+    default_backend() solo si el bucle es largo o NumPy ya está cargado
+    (importarlo cuesta más que lo que ahorra en un bucle corto)"""
+    if name == 'python' or iterations < NUMPY_MIN_ITERATIONS and 'numpy' not in sys.modules:
+        return ListBackend()
+    return default_backend()
+
+def _checked_number(value):
+    """value si es un float (una potencia puede dar un complejo)"""
+    if type(value) is not float:
+        raise _NotVectorizable()
+    return value
+
+def run_vector_loop(runtime, node, backend_name='auto'):
+    """Ejecuta un ast.VectorLoop sobre runtime calculando cada statement para
+    VECTOR_CHUNK vueltas a la vez. Informa las mismas asignaciones, en el
+    mismo orden, que el while normal y deja las variables con los mismos
+    valores; la salida de cada tramo se escribe al terminarlo.
+    
+    Retorna False sin haber hecho nada si algún valor de entrada no es el
+    esperado (el contador no es un número, la lista a acumular es un texto)
+    o si el bucle agotaría el presupuesto de operaciones, y False después
+    del último tramo completo si una operación falla: el motor ejecuta
+    entonces el while normal desde ahí, que informa lo mismo hasta el punto
+    del error. Cada tramo descuenta del presupuesto lo mismo que sus vueltas
+    en el while normal (y verifica el tiempo y la memoria).
+    """
+    frame = runtime.variables
+    loop = node.loop
+    budget = runtime.budget
+    cost = len(loop.body) + 1
+    remaining = budget.remaining()
+    max_iterations = MAX_VECTOR_ITERATIONS if remaining is None else min(MAX_VECTOR_ITERATIONS, remaining // cost)
+    try:
+        counter_values, final = _counter_values(frame, node, max_iterations)
+    except _NotVectorizable:
+        return False
+    backend = vector_backend(backend_name, len(counter_values))
+    # Listas acumuladas por este bucle: nadie más las vio, se extienden en su lugar
+    owned = {}
+    for start in range(0, len(counter_values), VECTOR_CHUNK):
+        chunk = counter_values[start:start + VECTOR_CHUNK]
+        following = counter_values[start + 1:start + VECTOR_CHUNK + 1]
+        if len(following) < len(chunk):
+            following.append(final)
+        try:
+            columns, results = _run_chunk(runtime, loop, node.counter, chunk, following, backend, owned)
+        except (_NotVectorizable, ArithmeticError, ValueError, TypeError, KeyError):
+            return False
+        print("\n".join(line for row in zip(*columns) for line in row))
+        for name, value in results:
+            frame[name] = value
+        budget.consume(len(chunk) * cost, loop.line, start + len(chunk))
+    return True
+
+def _run_chunk(runtime, loop, counter, counter_values, following, backend, owned):
+    """(columnas de líneas a informar, valores finales de las variables) de
+    las vueltas con el contador en counter_values; following son los
+    valores del contador al terminar cada una"""
+    frame = runtime.variables
+    count = len(counter_values)
+    vectors = {counter: backend.vector(counter_values)}
+    columns = []
+    results = []
+    for statement in loop.body[:-1]:
+        if isinstance(statement, ast.Assign):
+            value = _evaluate(statement.value, vectors, frame, backend)
+            vectors[statement.name] = value
+            value = backend.to_list(value) if backend.is_vector(value) else value
+            columns.append(_scalar_column(runtime, statement.name, value, count))
+            results.append((statement.name, value[-1] if isinstance(value, list) else value))
+        else:
+            current = frame[statement.name]
+            length = len(current) if isinstance(current, SEQUENCE_TYPES) else 0
+            value = _accumulated(runtime, statement, vectors, frame, backend, count, owned.get(statement.name))
+            owned[statement.name] = value
+            columns.append(_list_column(runtime, statement.name, value, count, len(value) - length))
+            results.append((statement.name, value))
+    columns.append(_scalar_column(runtime, counter, following, count))
+    results.append((counter, following[-1]))
+    return columns, results
+
+def _counter_values(frame, node, max_iterations):
+    """Valores del contador en cada vuelta (a lo sumo max_iterations) y el
+    valor con el que termina"""
+    condition = node.loop.condition
+    value = frame[node.counter]
+    bound = condition.right.value if isinstance(condition.right, ast.Number) else frame[condition.right.name]
+    if type(value) is not float or type(bound) is not float:
+        raise _NotVectorizable()
+    compare = COMPARISONS[condition.op]
+    step = node.step
+    values = []
+    while compare(value, bound):
+        if len(values) >= max_iterations:
+            raise _NotVectorizable()
+        values.append(value)
+        value = value + step
+    return values, value
+
+def _evaluate(node, vectors, frame, backend):
+    """Valor de una expresión en todas las vueltas: un vector o un número"""
+    if isinstance(node, ast.Number):
+        return _checked_number(node.value)
+    if isinstance(node, ast.Variable):
+        if node.name in vectors:
+            return vectors[node.name]
+        return _checked_number(frame[node.name])
+    if isinstance(node, ast.Call):
+        return backend.call(node.func, _evaluate(node.args[0], vectors, frame, backend))
+    if isinstance(node, ast.Invariant):
+        return _evaluate(node.expr, vectors, frame, backend)
+    left = _evaluate(node.left, vectors, frame, backend)
+    return backend.binary(node.op, left, _evaluate(node.right, vectors, frame, backend))
+
+def _accumulated(runtime, statement, vectors, frame, backend, count, owned):
+    """Lista de una acumulación name = name + [...] después de count vueltas.
+    owned es lo que retornó el tramo anterior: si la variable todavía lo
+    tiene, se extiende en su lugar (ver DSLRuntime._accumulate)"""
+    current = frame[statement.name]
+    if not isinstance(current, SEQUENCE_TYPES):
+        raise _NotVectorizable()
+    if isinstance(statement.items, ast.NumericLiteral):
+        items = statement.items.materialize() * count
+    else:
+        columns = []
+        for item in statement.items.items:
+            value = _evaluate(item, vectors, frame, backend)
+            columns.append(backend.to_list(value) if backend.is_vector(value) else [value] * count)
+        items = columns[0] if len(columns) == 1 else [value for row in zip(*columns) for value in row]
+        if type(current) is DSLVector:
+            # Los valores son floats: empaquetados, como los deja current + items
+            items = DSLVector(items)
+    if owned is None:
+        return current + items
+    return runtime._accumulate(current, items, owned)
+
+def _scalar_column(runtime, name, values, count):
+    """Líneas de las asignaciones de un número en cada vuelta"""
+    format_value = runtime._format_value
+    if not isinstance(values, list):
+        return [f"📝 {name} = {format_value(values)}"] * count
+    return [f"📝 {name} = {format_value(value)}" for value in values]
+
+def _list_column(runtime, name, final, count, added):
+    """Líneas de las asignaciones de una lista que crece en cada vuelta"""
+    format_value = runtime._format_value
+    per_loop = added // count
+    start = len(final) - added
+    lines = []
+    for index in range(1, count + 1):
+        length = start + per_loop * index
+        if length > 10:
+            lines.append(f"📝 {name} = [Lista con {length} elementos]")
+        elif isinstance(final, DSLVector):
+            # Una porción de un array('d') es un array, no un DSLVector
+            lines.append(f"📝 {name} = {format_value(DSLVector(final[:length]))}")
+        else:
+            lines.append(f"📝 {name} = {format_value(final[:length])}")
+    return lines
@@ -4,14 +4,14 @@ program         : statement* EOF;
 
 // === STATEMENTS ===
 statement       : assignment
+                | fileOperation
                 | expressionStatement
                 | controlStructure
                 | plotStatement
-                | fileOperation
                 | ';'
                 ;
 
-assignment      : ID '=' expression ';';
+assignment      : identifier '=' expression ';';
 expressionStatement : expression ';';
 
 // === CONTROL STRUCTURES ===
@@ -34,27 +34,40 @@ expression
     | listLiteral
     | NUMBER
     | STRING
-    | ID
+    | identifier
     | matrixOperation
     | trigFunction
     | mlOperation
+    | readOperation
     | TRUE
     | FALSE 
     ;
 
+// Las comparaciones son parte de expression: con una alternativa propia
+// "expression comparator expression" la predicción SLL no puede decidir
+// dónde termina el primer operando y falla en todo if/while
 booleanExpression
-                : expression comparator expression
-                | 'not' booleanExpression
+                : 'not' booleanExpression
                 | booleanExpression ('and'|'or') booleanExpression
+                | expression
                 ;
 
-comparator      : '==' | '!=' | '<' | '<=' | '>' | '>=';
-
 matrixOperation : 'transpose' '(' expression ')'
                 | 'inverse' '(' expression ')'
                 | 'matmul' '(' expression ',' expression ')'
                 | 'matsum' '(' expression ',' expression ')'
                 | 'matsub' '(' expression ',' expression ')'
+                | 'det' '(' expression ')'
+                | 'solve' '(' expression ',' expression ')'
+                | 'density' '(' expression ')'
+                ;
+
+// det, solve y density llegaron después de que hubiera scripts que las
+// usaban como variables: fuera de una llamada siguen siendo nombres
+identifier      : ID
+                | 'det'
+                | 'solve'
+                | 'density'
                 ;
 
 mlOperation     : 'linearRegression' '(' expression ',' expression ')'
@@ -75,6 +88,10 @@ plotStatement   : 'plot' '(' expression ',' expression ')' ';'
                 | 'hist' '(' expression ')' ';'
                 ;
 
+// readFile como statement va antes que expressionStatement: "readFile(x);"
+// es una fileOperation y no muestra el resultado
+readOperation   : 'readFile' '(' expression ')';
+
 fileOperation   : 'readFile' '(' expression ')' ';'
                 | 'writeFile' '(' expression ',' expression ')' ';'
                 ;
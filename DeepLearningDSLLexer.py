@@ -10,7 +10,7 @@ else:
 
 def serializedATN():
     return [
-        4,0,54,394,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
+        4,0,57,418,6,-1,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,
         2,6,7,6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,
         13,7,13,2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,2,19,7,
         19,2,20,7,20,2,21,7,21,2,22,7,22,2,23,7,23,2,24,7,24,2,25,7,25,2,
@@ -18,136 +18,145 @@ def serializedATN():
         32,2,33,7,33,2,34,7,34,2,35,7,35,2,36,7,36,2,37,7,37,2,38,7,38,2,
         39,7,39,2,40,7,40,2,41,7,41,2,42,7,42,2,43,7,43,2,44,7,44,2,45,7,
         45,2,46,7,46,2,47,7,47,2,48,7,48,2,49,7,49,2,50,7,50,2,51,7,51,2,
-        52,7,52,2,53,7,53,2,54,7,54,1,0,1,0,1,1,1,1,1,2,1,2,1,2,1,3,1,3,
-        1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,
-        1,6,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,8,1,9,1,9,1,10,1,10,1,11,1,11,
-        1,12,1,12,1,13,1,13,1,14,1,14,1,14,1,15,1,15,1,15,1,16,1,16,1,17,
-        1,17,1,17,1,18,1,18,1,19,1,19,1,19,1,20,1,20,1,21,1,21,1,22,1,22,
-        1,22,1,22,1,23,1,23,1,23,1,23,1,24,1,24,1,24,1,25,1,25,1,25,1,25,
-        1,25,1,25,1,25,1,25,1,25,1,25,1,26,1,26,1,26,1,26,1,26,1,26,1,26,
-        1,26,1,27,1,27,1,27,1,27,1,27,1,27,1,27,1,28,1,28,1,29,1,29,1,29,
-        1,29,1,29,1,29,1,29,1,30,1,30,1,30,1,30,1,30,1,30,1,30,1,31,1,31,
-        1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,1,31,
-        1,31,1,31,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,1,32,
-        1,32,1,32,1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,
-        1,34,1,35,1,35,1,35,1,35,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,37,
-        1,37,1,38,1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,
-        1,40,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,41,1,42,1,42,1,42,1,42,
-        1,42,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,43,1,44,1,44,1,44,
-        1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,46,1,46,1,47,1,47,
-        1,47,1,47,1,47,1,48,1,48,1,48,1,48,1,48,1,48,1,49,1,49,5,49,345,
-        8,49,10,49,12,49,348,9,49,1,50,3,50,351,8,50,1,50,4,50,354,8,50,
-        11,50,12,50,355,1,50,1,50,4,50,360,8,50,11,50,12,50,361,3,50,364,
-        8,50,1,51,1,51,5,51,368,8,51,10,51,12,51,371,9,51,1,51,1,51,1,52,
-        1,52,1,53,4,53,378,8,53,11,53,12,53,379,1,53,1,53,1,54,1,54,1,54,
-        1,54,5,54,388,8,54,10,54,12,54,391,9,54,1,54,1,54,0,0,55,1,1,3,2,
-        5,3,7,4,9,5,11,6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,
-        15,31,16,33,17,35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,
-        26,53,27,55,28,57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,
-        37,75,38,77,39,79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,
-        48,97,49,99,50,101,51,103,52,105,0,107,53,109,54,1,0,6,3,0,65,90,
-        95,95,97,122,4,0,48,57,65,90,95,95,97,122,1,0,34,34,1,0,48,57,3,
-        0,9,10,13,13,32,32,2,0,10,10,13,13,400,0,1,1,0,0,0,0,3,1,0,0,0,0,
-        5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,0,0,15,
-        1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,0,0,25,
-        1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,0,0,35,
-        1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,0,0,45,
-        1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,0,0,55,
-        1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,0,0,65,
-        1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,0,0,75,
-        1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,0,0,85,
-        1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,0,0,95,
-        1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,0,0,0,
-        107,1,0,0,0,0,109,1,0,0,0,1,111,1,0,0,0,3,113,1,0,0,0,5,115,1,0,
-        0,0,7,118,1,0,0,0,9,123,1,0,0,0,11,128,1,0,0,0,13,131,1,0,0,0,15,
-        137,1,0,0,0,17,140,1,0,0,0,19,145,1,0,0,0,21,147,1,0,0,0,23,149,
-        1,0,0,0,25,151,1,0,0,0,27,153,1,0,0,0,29,155,1,0,0,0,31,158,1,0,
-        0,0,33,161,1,0,0,0,35,163,1,0,0,0,37,166,1,0,0,0,39,168,1,0,0,0,
-        41,171,1,0,0,0,43,173,1,0,0,0,45,175,1,0,0,0,47,179,1,0,0,0,49,183,
-        1,0,0,0,51,186,1,0,0,0,53,196,1,0,0,0,55,204,1,0,0,0,57,211,1,0,
-        0,0,59,213,1,0,0,0,61,220,1,0,0,0,63,227,1,0,0,0,65,244,1,0,0,0,
-        67,258,1,0,0,0,69,265,1,0,0,0,71,269,1,0,0,0,73,273,1,0,0,0,75,277,
-        1,0,0,0,77,282,1,0,0,0,79,286,1,0,0,0,81,290,1,0,0,0,83,295,1,0,
-        0,0,85,303,1,0,0,0,87,308,1,0,0,0,89,317,1,0,0,0,91,327,1,0,0,0,
-        93,329,1,0,0,0,95,331,1,0,0,0,97,336,1,0,0,0,99,342,1,0,0,0,101,
-        350,1,0,0,0,103,365,1,0,0,0,105,374,1,0,0,0,107,377,1,0,0,0,109,
-        383,1,0,0,0,111,112,5,59,0,0,112,2,1,0,0,0,113,114,5,61,0,0,114,
-        4,1,0,0,0,115,116,5,105,0,0,116,117,5,102,0,0,117,6,1,0,0,0,118,
-        119,5,116,0,0,119,120,5,104,0,0,120,121,5,101,0,0,121,122,5,110,
-        0,0,122,8,1,0,0,0,123,124,5,101,0,0,124,125,5,108,0,0,125,126,5,
-        115,0,0,126,127,5,101,0,0,127,10,1,0,0,0,128,129,5,102,0,0,129,130,
-        5,105,0,0,130,12,1,0,0,0,131,132,5,119,0,0,132,133,5,104,0,0,133,
-        134,5,105,0,0,134,135,5,108,0,0,135,136,5,101,0,0,136,14,1,0,0,0,
-        137,138,5,100,0,0,138,139,5,111,0,0,139,16,1,0,0,0,140,141,5,100,
-        0,0,141,142,5,111,0,0,142,143,5,110,0,0,143,144,5,101,0,0,144,18,
-        1,0,0,0,145,146,5,42,0,0,146,20,1,0,0,0,147,148,5,47,0,0,148,22,
-        1,0,0,0,149,150,5,43,0,0,150,24,1,0,0,0,151,152,5,45,0,0,152,26,
-        1,0,0,0,153,154,5,94,0,0,154,28,1,0,0,0,155,156,5,61,0,0,156,157,
-        5,61,0,0,157,30,1,0,0,0,158,159,5,33,0,0,159,160,5,61,0,0,160,32,
-        1,0,0,0,161,162,5,60,0,0,162,34,1,0,0,0,163,164,5,60,0,0,164,165,
-        5,61,0,0,165,36,1,0,0,0,166,167,5,62,0,0,167,38,1,0,0,0,168,169,
-        5,62,0,0,169,170,5,61,0,0,170,40,1,0,0,0,171,172,5,40,0,0,172,42,
-        1,0,0,0,173,174,5,41,0,0,174,44,1,0,0,0,175,176,5,110,0,0,176,177,
-        5,111,0,0,177,178,5,116,0,0,178,46,1,0,0,0,179,180,5,97,0,0,180,
-        181,5,110,0,0,181,182,5,100,0,0,182,48,1,0,0,0,183,184,5,111,0,0,
-        184,185,5,114,0,0,185,50,1,0,0,0,186,187,5,116,0,0,187,188,5,114,
-        0,0,188,189,5,97,0,0,189,190,5,110,0,0,190,191,5,115,0,0,191,192,
-        5,112,0,0,192,193,5,111,0,0,193,194,5,115,0,0,194,195,5,101,0,0,
-        195,52,1,0,0,0,196,197,5,105,0,0,197,198,5,110,0,0,198,199,5,118,
-        0,0,199,200,5,101,0,0,200,201,5,114,0,0,201,202,5,115,0,0,202,203,
-        5,101,0,0,203,54,1,0,0,0,204,205,5,109,0,0,205,206,5,97,0,0,206,
-        207,5,116,0,0,207,208,5,109,0,0,208,209,5,117,0,0,209,210,5,108,
-        0,0,210,56,1,0,0,0,211,212,5,44,0,0,212,58,1,0,0,0,213,214,5,109,
-        0,0,214,215,5,97,0,0,215,216,5,116,0,0,216,217,5,115,0,0,217,218,
-        5,117,0,0,218,219,5,109,0,0,219,60,1,0,0,0,220,221,5,109,0,0,221,
-        222,5,97,0,0,222,223,5,116,0,0,223,224,5,115,0,0,224,225,5,117,0,
-        0,225,226,5,98,0,0,226,62,1,0,0,0,227,228,5,108,0,0,228,229,5,105,
-        0,0,229,230,5,110,0,0,230,231,5,101,0,0,231,232,5,97,0,0,232,233,
-        5,114,0,0,233,234,5,82,0,0,234,235,5,101,0,0,235,236,5,103,0,0,236,
-        237,5,114,0,0,237,238,5,101,0,0,238,239,5,115,0,0,239,240,5,115,
-        0,0,240,241,5,105,0,0,241,242,5,111,0,0,242,243,5,110,0,0,243,64,
-        1,0,0,0,244,245,5,109,0,0,245,246,5,108,0,0,246,247,5,112,0,0,247,
-        248,5,67,0,0,248,249,5,108,0,0,249,250,5,97,0,0,250,251,5,115,0,
-        0,251,252,5,115,0,0,252,253,5,105,0,0,253,254,5,102,0,0,254,255,
-        5,105,0,0,255,256,5,101,0,0,256,257,5,114,0,0,257,66,1,0,0,0,258,
-        259,5,107,0,0,259,260,5,109,0,0,260,261,5,101,0,0,261,262,5,97,0,
-        0,262,263,5,110,0,0,263,264,5,115,0,0,264,68,1,0,0,0,265,266,5,115,
-        0,0,266,267,5,105,0,0,267,268,5,110,0,0,268,70,1,0,0,0,269,270,5,
-        99,0,0,270,271,5,111,0,0,271,272,5,115,0,0,272,72,1,0,0,0,273,274,
-        5,116,0,0,274,275,5,97,0,0,275,276,5,110,0,0,276,74,1,0,0,0,277,
-        278,5,115,0,0,278,279,5,113,0,0,279,280,5,114,0,0,280,281,5,116,
-        0,0,281,76,1,0,0,0,282,283,5,108,0,0,283,284,5,111,0,0,284,285,5,
-        103,0,0,285,78,1,0,0,0,286,287,5,101,0,0,287,288,5,120,0,0,288,289,
-        5,112,0,0,289,80,1,0,0,0,290,291,5,112,0,0,291,292,5,108,0,0,292,
-        293,5,111,0,0,293,294,5,116,0,0,294,82,1,0,0,0,295,296,5,115,0,0,
-        296,297,5,99,0,0,297,298,5,97,0,0,298,299,5,116,0,0,299,300,5,116,
-        0,0,300,301,5,101,0,0,301,302,5,114,0,0,302,84,1,0,0,0,303,304,5,
-        104,0,0,304,305,5,105,0,0,305,306,5,115,0,0,306,307,5,116,0,0,307,
-        86,1,0,0,0,308,309,5,114,0,0,309,310,5,101,0,0,310,311,5,97,0,0,
-        311,312,5,100,0,0,312,313,5,70,0,0,313,314,5,105,0,0,314,315,5,108,
-        0,0,315,316,5,101,0,0,316,88,1,0,0,0,317,318,5,119,0,0,318,319,5,
-        114,0,0,319,320,5,105,0,0,320,321,5,116,0,0,321,322,5,101,0,0,322,
-        323,5,70,0,0,323,324,5,105,0,0,324,325,5,108,0,0,325,326,5,101,0,
-        0,326,90,1,0,0,0,327,328,5,91,0,0,328,92,1,0,0,0,329,330,5,93,0,
-        0,330,94,1,0,0,0,331,332,5,116,0,0,332,333,5,114,0,0,333,334,5,117,
-        0,0,334,335,5,101,0,0,335,96,1,0,0,0,336,337,5,102,0,0,337,338,5,
-        97,0,0,338,339,5,108,0,0,339,340,5,115,0,0,340,341,5,101,0,0,341,
-        98,1,0,0,0,342,346,7,0,0,0,343,345,7,1,0,0,344,343,1,0,0,0,345,348,
-        1,0,0,0,346,344,1,0,0,0,346,347,1,0,0,0,347,100,1,0,0,0,348,346,
-        1,0,0,0,349,351,5,45,0,0,350,349,1,0,0,0,350,351,1,0,0,0,351,353,
-        1,0,0,0,352,354,3,105,52,0,353,352,1,0,0,0,354,355,1,0,0,0,355,353,
-        1,0,0,0,355,356,1,0,0,0,356,363,1,0,0,0,357,359,5,46,0,0,358,360,
-        3,105,52,0,359,358,1,0,0,0,360,361,1,0,0,0,361,359,1,0,0,0,361,362,
-        1,0,0,0,362,364,1,0,0,0,363,357,1,0,0,0,363,364,1,0,0,0,364,102,
-        1,0,0,0,365,369,5,34,0,0,366,368,8,2,0,0,367,366,1,0,0,0,368,371,
-        1,0,0,0,369,367,1,0,0,0,369,370,1,0,0,0,370,372,1,0,0,0,371,369,
-        1,0,0,0,372,373,5,34,0,0,373,104,1,0,0,0,374,375,7,3,0,0,375,106,
-        1,0,0,0,376,378,7,4,0,0,377,376,1,0,0,0,378,379,1,0,0,0,379,377,
-        1,0,0,0,379,380,1,0,0,0,380,381,1,0,0,0,381,382,6,53,0,0,382,108,
-        1,0,0,0,383,384,5,47,0,0,384,385,5,47,0,0,385,389,1,0,0,0,386,388,
-        8,5,0,0,387,386,1,0,0,0,388,391,1,0,0,0,389,387,1,0,0,0,389,390,
-        1,0,0,0,390,392,1,0,0,0,391,389,1,0,0,0,392,393,6,54,0,0,393,110,
-        1,0,0,0,9,0,346,350,355,361,363,369,379,389,1,6,0,0
+        52,7,52,2,53,7,53,2,54,7,54,2,55,7,55,2,56,7,56,2,57,7,57,1,0,1,
+        0,1,1,1,1,1,2,1,2,1,2,1,3,1,3,1,3,1,3,1,3,1,4,1,4,1,4,1,4,1,4,1,
+        5,1,5,1,5,1,6,1,6,1,6,1,6,1,6,1,6,1,7,1,7,1,7,1,8,1,8,1,8,1,8,1,
+        8,1,9,1,9,1,10,1,10,1,11,1,11,1,12,1,12,1,13,1,13,1,14,1,14,1,14,
+        1,15,1,15,1,15,1,16,1,16,1,17,1,17,1,17,1,18,1,18,1,19,1,19,1,19,
+        1,20,1,20,1,21,1,21,1,22,1,22,1,22,1,22,1,23,1,23,1,23,1,23,1,24,
+        1,24,1,24,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,25,1,26,
+        1,26,1,26,1,26,1,26,1,26,1,26,1,26,1,27,1,27,1,27,1,27,1,27,1,27,
+        1,27,1,28,1,28,1,29,1,29,1,29,1,29,1,29,1,29,1,29,1,30,1,30,1,30,
+        1,30,1,30,1,30,1,30,1,31,1,31,1,31,1,31,1,32,1,32,1,32,1,32,1,32,
+        1,32,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,33,1,34,1,34,1,34,1,34,
+        1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,1,34,
+        1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,1,35,
+        1,35,1,36,1,36,1,36,1,36,1,36,1,36,1,36,1,37,1,37,1,37,1,37,1,38,
+        1,38,1,38,1,38,1,39,1,39,1,39,1,39,1,40,1,40,1,40,1,40,1,40,1,41,
+        1,41,1,41,1,41,1,42,1,42,1,42,1,42,1,43,1,43,1,43,1,43,1,43,1,44,
+        1,44,1,44,1,44,1,44,1,44,1,44,1,44,1,45,1,45,1,45,1,45,1,45,1,46,
+        1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,46,1,47,1,47,1,47,1,47,1,47,
+        1,47,1,47,1,47,1,47,1,47,1,48,1,48,1,49,1,49,1,50,1,50,1,50,1,50,
+        1,50,1,51,1,51,1,51,1,51,1,51,1,51,1,52,1,52,5,52,369,8,52,10,52,
+        12,52,372,9,52,1,53,3,53,375,8,53,1,53,4,53,378,8,53,11,53,12,53,
+        379,1,53,1,53,4,53,384,8,53,11,53,12,53,385,3,53,388,8,53,1,54,1,
+        54,5,54,392,8,54,10,54,12,54,395,9,54,1,54,1,54,1,55,1,55,1,56,4,
+        56,402,8,56,11,56,12,56,403,1,56,1,56,1,57,1,57,1,57,1,57,5,57,412,
+        8,57,10,57,12,57,415,9,57,1,57,1,57,0,0,58,1,1,3,2,5,3,7,4,9,5,11,
+        6,13,7,15,8,17,9,19,10,21,11,23,12,25,13,27,14,29,15,31,16,33,17,
+        35,18,37,19,39,20,41,21,43,22,45,23,47,24,49,25,51,26,53,27,55,28,
+        57,29,59,30,61,31,63,32,65,33,67,34,69,35,71,36,73,37,75,38,77,39,
+        79,40,81,41,83,42,85,43,87,44,89,45,91,46,93,47,95,48,97,49,99,50,
+        101,51,103,52,105,53,107,54,109,55,111,0,113,56,115,57,1,0,6,3,0,
+        65,90,95,95,97,122,4,0,48,57,65,90,95,95,97,122,1,0,34,34,1,0,48,
+        57,3,0,9,10,13,13,32,32,2,0,10,10,13,13,424,0,1,1,0,0,0,0,3,1,0,
+        0,0,0,5,1,0,0,0,0,7,1,0,0,0,0,9,1,0,0,0,0,11,1,0,0,0,0,13,1,0,0,
+        0,0,15,1,0,0,0,0,17,1,0,0,0,0,19,1,0,0,0,0,21,1,0,0,0,0,23,1,0,0,
+        0,0,25,1,0,0,0,0,27,1,0,0,0,0,29,1,0,0,0,0,31,1,0,0,0,0,33,1,0,0,
+        0,0,35,1,0,0,0,0,37,1,0,0,0,0,39,1,0,0,0,0,41,1,0,0,0,0,43,1,0,0,
+        0,0,45,1,0,0,0,0,47,1,0,0,0,0,49,1,0,0,0,0,51,1,0,0,0,0,53,1,0,0,
+        0,0,55,1,0,0,0,0,57,1,0,0,0,0,59,1,0,0,0,0,61,1,0,0,0,0,63,1,0,0,
+        0,0,65,1,0,0,0,0,67,1,0,0,0,0,69,1,0,0,0,0,71,1,0,0,0,0,73,1,0,0,
+        0,0,75,1,0,0,0,0,77,1,0,0,0,0,79,1,0,0,0,0,81,1,0,0,0,0,83,1,0,0,
+        0,0,85,1,0,0,0,0,87,1,0,0,0,0,89,1,0,0,0,0,91,1,0,0,0,0,93,1,0,0,
+        0,0,95,1,0,0,0,0,97,1,0,0,0,0,99,1,0,0,0,0,101,1,0,0,0,0,103,1,0,
+        0,0,0,105,1,0,0,0,0,107,1,0,0,0,0,109,1,0,0,0,0,113,1,0,0,0,0,115,
+        1,0,0,0,1,117,1,0,0,0,3,119,1,0,0,0,5,121,1,0,0,0,7,124,1,0,0,0,
+        9,129,1,0,0,0,11,134,1,0,0,0,13,137,1,0,0,0,15,143,1,0,0,0,17,146,
+        1,0,0,0,19,151,1,0,0,0,21,153,1,0,0,0,23,155,1,0,0,0,25,157,1,0,
+        0,0,27,159,1,0,0,0,29,161,1,0,0,0,31,164,1,0,0,0,33,167,1,0,0,0,
+        35,169,1,0,0,0,37,172,1,0,0,0,39,174,1,0,0,0,41,177,1,0,0,0,43,179,
+        1,0,0,0,45,181,1,0,0,0,47,185,1,0,0,0,49,189,1,0,0,0,51,192,1,0,
+        0,0,53,202,1,0,0,0,55,210,1,0,0,0,57,217,1,0,0,0,59,219,1,0,0,0,
+        61,226,1,0,0,0,63,233,1,0,0,0,65,237,1,0,0,0,67,243,1,0,0,0,69,251,
+        1,0,0,0,71,268,1,0,0,0,73,282,1,0,0,0,75,289,1,0,0,0,77,293,1,0,
+        0,0,79,297,1,0,0,0,81,301,1,0,0,0,83,306,1,0,0,0,85,310,1,0,0,0,
+        87,314,1,0,0,0,89,319,1,0,0,0,91,327,1,0,0,0,93,332,1,0,0,0,95,341,
+        1,0,0,0,97,351,1,0,0,0,99,353,1,0,0,0,101,355,1,0,0,0,103,360,1,
+        0,0,0,105,366,1,0,0,0,107,374,1,0,0,0,109,389,1,0,0,0,111,398,1,
+        0,0,0,113,401,1,0,0,0,115,407,1,0,0,0,117,118,5,59,0,0,118,2,1,0,
+        0,0,119,120,5,61,0,0,120,4,1,0,0,0,121,122,5,105,0,0,122,123,5,102,
+        0,0,123,6,1,0,0,0,124,125,5,116,0,0,125,126,5,104,0,0,126,127,5,
+        101,0,0,127,128,5,110,0,0,128,8,1,0,0,0,129,130,5,101,0,0,130,131,
+        5,108,0,0,131,132,5,115,0,0,132,133,5,101,0,0,133,10,1,0,0,0,134,
+        135,5,102,0,0,135,136,5,105,0,0,136,12,1,0,0,0,137,138,5,119,0,0,
+        138,139,5,104,0,0,139,140,5,105,0,0,140,141,5,108,0,0,141,142,5,
+        101,0,0,142,14,1,0,0,0,143,144,5,100,0,0,144,145,5,111,0,0,145,16,
+        1,0,0,0,146,147,5,100,0,0,147,148,5,111,0,0,148,149,5,110,0,0,149,
+        150,5,101,0,0,150,18,1,0,0,0,151,152,5,42,0,0,152,20,1,0,0,0,153,
+        154,5,47,0,0,154,22,1,0,0,0,155,156,5,43,0,0,156,24,1,0,0,0,157,
+        158,5,45,0,0,158,26,1,0,0,0,159,160,5,94,0,0,160,28,1,0,0,0,161,
+        162,5,61,0,0,162,163,5,61,0,0,163,30,1,0,0,0,164,165,5,33,0,0,165,
+        166,5,61,0,0,166,32,1,0,0,0,167,168,5,60,0,0,168,34,1,0,0,0,169,
+        170,5,60,0,0,170,171,5,61,0,0,171,36,1,0,0,0,172,173,5,62,0,0,173,
+        38,1,0,0,0,174,175,5,62,0,0,175,176,5,61,0,0,176,40,1,0,0,0,177,
+        178,5,40,0,0,178,42,1,0,0,0,179,180,5,41,0,0,180,44,1,0,0,0,181,
+        182,5,110,0,0,182,183,5,111,0,0,183,184,5,116,0,0,184,46,1,0,0,0,
+        185,186,5,97,0,0,186,187,5,110,0,0,187,188,5,100,0,0,188,48,1,0,
+        0,0,189,190,5,111,0,0,190,191,5,114,0,0,191,50,1,0,0,0,192,193,5,
+        116,0,0,193,194,5,114,0,0,194,195,5,97,0,0,195,196,5,110,0,0,196,
+        197,5,115,0,0,197,198,5,112,0,0,198,199,5,111,0,0,199,200,5,115,
+        0,0,200,201,5,101,0,0,201,52,1,0,0,0,202,203,5,105,0,0,203,204,5,
+        110,0,0,204,205,5,118,0,0,205,206,5,101,0,0,206,207,5,114,0,0,207,
+        208,5,115,0,0,208,209,5,101,0,0,209,54,1,0,0,0,210,211,5,109,0,0,
+        211,212,5,97,0,0,212,213,5,116,0,0,213,214,5,109,0,0,214,215,5,117,
+        0,0,215,216,5,108,0,0,216,56,1,0,0,0,217,218,5,44,0,0,218,58,1,0,
+        0,0,219,220,5,109,0,0,220,221,5,97,0,0,221,222,5,116,0,0,222,223,
+        5,115,0,0,223,224,5,117,0,0,224,225,5,109,0,0,225,60,1,0,0,0,226,
+        227,5,109,0,0,227,228,5,97,0,0,228,229,5,116,0,0,229,230,5,115,0,
+        0,230,231,5,117,0,0,231,232,5,98,0,0,232,62,1,0,0,0,233,234,5,100,
+        0,0,234,235,5,101,0,0,235,236,5,116,0,0,236,64,1,0,0,0,237,238,5,
+        115,0,0,238,239,5,111,0,0,239,240,5,108,0,0,240,241,5,118,0,0,241,
+        242,5,101,0,0,242,66,1,0,0,0,243,244,5,100,0,0,244,245,5,101,0,0,
+        245,246,5,110,0,0,246,247,5,115,0,0,247,248,5,105,0,0,248,249,5,
+        116,0,0,249,250,5,121,0,0,250,68,1,0,0,0,251,252,5,108,0,0,252,253,
+        5,105,0,0,253,254,5,110,0,0,254,255,5,101,0,0,255,256,5,97,0,0,256,
+        257,5,114,0,0,257,258,5,82,0,0,258,259,5,101,0,0,259,260,5,103,0,
+        0,260,261,5,114,0,0,261,262,5,101,0,0,262,263,5,115,0,0,263,264,
+        5,115,0,0,264,265,5,105,0,0,265,266,5,111,0,0,266,267,5,110,0,0,
+        267,70,1,0,0,0,268,269,5,109,0,0,269,270,5,108,0,0,270,271,5,112,
+        0,0,271,272,5,67,0,0,272,273,5,108,0,0,273,274,5,97,0,0,274,275,
+        5,115,0,0,275,276,5,115,0,0,276,277,5,105,0,0,277,278,5,102,0,0,
+        278,279,5,105,0,0,279,280,5,101,0,0,280,281,5,114,0,0,281,72,1,0,
+        0,0,282,283,5,107,0,0,283,284,5,109,0,0,284,285,5,101,0,0,285,286,
+        5,97,0,0,286,287,5,110,0,0,287,288,5,115,0,0,288,74,1,0,0,0,289,
+        290,5,115,0,0,290,291,5,105,0,0,291,292,5,110,0,0,292,76,1,0,0,0,
+        293,294,5,99,0,0,294,295,5,111,0,0,295,296,5,115,0,0,296,78,1,0,
+        0,0,297,298,5,116,0,0,298,299,5,97,0,0,299,300,5,110,0,0,300,80,
+        1,0,0,0,301,302,5,115,0,0,302,303,5,113,0,0,303,304,5,114,0,0,304,
+        305,5,116,0,0,305,82,1,0,0,0,306,307,5,108,0,0,307,308,5,111,0,0,
+        308,309,5,103,0,0,309,84,1,0,0,0,310,311,5,101,0,0,311,312,5,120,
+        0,0,312,313,5,112,0,0,313,86,1,0,0,0,314,315,5,112,0,0,315,316,5,
+        108,0,0,316,317,5,111,0,0,317,318,5,116,0,0,318,88,1,0,0,0,319,320,
+        5,115,0,0,320,321,5,99,0,0,321,322,5,97,0,0,322,323,5,116,0,0,323,
+        324,5,116,0,0,324,325,5,101,0,0,325,326,5,114,0,0,326,90,1,0,0,0,
+        327,328,5,104,0,0,328,329,5,105,0,0,329,330,5,115,0,0,330,331,5,
+        116,0,0,331,92,1,0,0,0,332,333,5,114,0,0,333,334,5,101,0,0,334,335,
+        5,97,0,0,335,336,5,100,0,0,336,337,5,70,0,0,337,338,5,105,0,0,338,
+        339,5,108,0,0,339,340,5,101,0,0,340,94,1,0,0,0,341,342,5,119,0,0,
+        342,343,5,114,0,0,343,344,5,105,0,0,344,345,5,116,0,0,345,346,5,
+        101,0,0,346,347,5,70,0,0,347,348,5,105,0,0,348,349,5,108,0,0,349,
+        350,5,101,0,0,350,96,1,0,0,0,351,352,5,91,0,0,352,98,1,0,0,0,353,
+        354,5,93,0,0,354,100,1,0,0,0,355,356,5,116,0,0,356,357,5,114,0,0,
+        357,358,5,117,0,0,358,359,5,101,0,0,359,102,1,0,0,0,360,361,5,102,
+        0,0,361,362,5,97,0,0,362,363,5,108,0,0,363,364,5,115,0,0,364,365,
+        5,101,0,0,365,104,1,0,0,0,366,370,7,0,0,0,367,369,7,1,0,0,368,367,
+        1,0,0,0,369,372,1,0,0,0,370,368,1,0,0,0,370,371,1,0,0,0,371,106,
+        1,0,0,0,372,370,1,0,0,0,373,375,5,45,0,0,374,373,1,0,0,0,374,375,
+        1,0,0,0,375,377,1,0,0,0,376,378,3,111,55,0,377,376,1,0,0,0,378,379,
+        1,0,0,0,379,377,1,0,0,0,379,380,1,0,0,0,380,387,1,0,0,0,381,383,
+        5,46,0,0,382,384,3,111,55,0,383,382,1,0,0,0,384,385,1,0,0,0,385,
+        383,1,0,0,0,385,386,1,0,0,0,386,388,1,0,0,0,387,381,1,0,0,0,387,
+        388,1,0,0,0,388,108,1,0,0,0,389,393,5,34,0,0,390,392,8,2,0,0,391,
+        390,1,0,0,0,392,395,1,0,0,0,393,391,1,0,0,0,393,394,1,0,0,0,394,
+        396,1,0,0,0,395,393,1,0,0,0,396,397,5,34,0,0,397,110,1,0,0,0,398,
+        399,7,3,0,0,399,112,1,0,0,0,400,402,7,4,0,0,401,400,1,0,0,0,402,
+        403,1,0,0,0,403,401,1,0,0,0,403,404,1,0,0,0,404,405,1,0,0,0,405,
+        406,6,56,0,0,406,114,1,0,0,0,407,408,5,47,0,0,408,409,5,47,0,0,409,
+        413,1,0,0,0,410,412,8,5,0,0,411,410,1,0,0,0,412,415,1,0,0,0,413,
+        411,1,0,0,0,413,414,1,0,0,0,414,416,1,0,0,0,415,413,1,0,0,0,416,
+        417,6,57,0,0,417,116,1,0,0,0,9,0,370,374,379,385,387,393,403,413,
+        1,6,0,0
     ]
 
 class DeepLearningDSLLexer(Lexer):
@@ -203,13 +212,16 @@ class DeepLearningDSLLexer(Lexer):
     T__44 = 45
     T__45 = 46
     T__46 = 47
-    TRUE = 48
-    FALSE = 49
-    ID = 50
-    NUMBER = 51
-    STRING = 52
-    WS = 53
-    COMMENT = 54
+    T__47 = 48
+    T__48 = 49
+    T__49 = 50
+    TRUE = 51
+    FALSE = 52
+    ID = 53
+    NUMBER = 54
+    STRING = 55
+    WS = 56
+    COMMENT = 57
 
     channelNames = [ u"DEFAULT_TOKEN_CHANNEL", u"HIDDEN" ]
 
@@ -220,10 +232,10 @@ class DeepLearningDSLLexer(Lexer):
             "'do'", "'done'", "'*'", "'/'", "'+'", "'-'", "'^'", "'=='", 
             "'!='", "'<'", "'<='", "'>'", "'>='", "'('", "')'", "'not'", 
             "'and'", "'or'", "'transpose'", "'inverse'", "'matmul'", "','", 
-            "'matsum'", "'matsub'", "'linearRegression'", "'mlpClassifier'", 
-            "'kmeans'", "'sin'", "'cos'", "'tan'", "'sqrt'", "'log'", "'exp'", 
-            "'plot'", "'scatter'", "'hist'", "'readFile'", "'writeFile'", 
-            "'['", "']'", "'true'", "'false'" ]
+            "'matsum'", "'matsub'", "'det'", "'solve'", "'density'", "'linearRegression'", 
+            "'mlpClassifier'", "'kmeans'", "'sin'", "'cos'", "'tan'", "'sqrt'", 
+            "'log'", "'exp'", "'plot'", "'scatter'", "'hist'", "'readFile'", 
+            "'writeFile'", "'['", "']'", "'true'", "'false'" ]
 
     symbolicNames = [ "<INVALID>",
             "TRUE", "FALSE", "ID", "NUMBER", "STRING", "WS", "COMMENT" ]
@@ -235,8 +247,9 @@ class DeepLearningDSLLexer(Lexer):
                   "T__26", "T__27", "T__28", "T__29", "T__30", "T__31", 
                   "T__32", "T__33", "T__34", "T__35", "T__36", "T__37", 
                   "T__38", "T__39", "T__40", "T__41", "T__42", "T__43", 
-                  "T__44", "T__45", "T__46", "TRUE", "FALSE", "ID", "NUMBER", 
-                  "STRING", "DIGIT", "WS", "COMMENT" ]
+                  "T__44", "T__45", "T__46", "T__47", "T__48", "T__49", 
+                  "TRUE", "FALSE", "ID", "NUMBER", "STRING", "DIGIT", "WS", 
+                  "COMMENT" ]
 
     grammarFileName = "DeepLearningDSL.g4"
 
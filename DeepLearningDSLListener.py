@@ -89,21 +89,21 @@ class DeepLearningDSLListener(ParseTreeListener):
         pass
 
 
-    # Enter a parse tree produced by DeepLearningDSLParser#comparator.
-    def enterComparator(self, ctx:DeepLearningDSLParser.ComparatorContext):
+    # Enter a parse tree produced by DeepLearningDSLParser#matrixOperation.
+    def enterMatrixOperation(self, ctx:DeepLearningDSLParser.MatrixOperationContext):
         pass
 
-    # Exit a parse tree produced by DeepLearningDSLParser#comparator.
-    def exitComparator(self, ctx:DeepLearningDSLParser.ComparatorContext):
+    # Exit a parse tree produced by DeepLearningDSLParser#matrixOperation.
+    def exitMatrixOperation(self, ctx:DeepLearningDSLParser.MatrixOperationContext):
         pass
 
 
-    # Enter a parse tree produced by DeepLearningDSLParser#matrixOperation.
-    def enterMatrixOperation(self, ctx:DeepLearningDSLParser.MatrixOperationContext):
+    # Enter a parse tree produced by DeepLearningDSLParser#identifier.
+    def enterIdentifier(self, ctx:DeepLearningDSLParser.IdentifierContext):
         pass
 
-    # Exit a parse tree produced by DeepLearningDSLParser#matrixOperation.
-    def exitMatrixOperation(self, ctx:DeepLearningDSLParser.MatrixOperationContext):
+    # Exit a parse tree produced by DeepLearningDSLParser#identifier.
+    def exitIdentifier(self, ctx:DeepLearningDSLParser.IdentifierContext):
         pass
 
 
@@ -134,6 +134,15 @@ class DeepLearningDSLListener(ParseTreeListener):
         pass
 
 
+    # Enter a parse tree produced by DeepLearningDSLParser#readOperation.
+    def enterReadOperation(self, ctx:DeepLearningDSLParser.ReadOperationContext):
+        pass
+
+    # Exit a parse tree produced by DeepLearningDSLParser#readOperation.
+    def exitReadOperation(self, ctx:DeepLearningDSLParser.ReadOperationContext):
+        pass
+
+
     # Enter a parse tree produced by DeepLearningDSLParser#fileOperation.
     def enterFileOperation(self, ctx:DeepLearningDSLParser.FileOperationContext):
         pass
@@ -10,116 +10,124 @@ else:
 
 def serializedATN():
     return [
-        4,1,54,309,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
+        4,1,57,331,2,0,7,0,2,1,7,1,2,2,7,2,2,3,7,3,2,4,7,4,2,5,7,5,2,6,7,
         6,2,7,7,7,2,8,7,8,2,9,7,9,2,10,7,10,2,11,7,11,2,12,7,12,2,13,7,13,
-        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,1,0,5,0,38,8,0,10,0,12,0,
-        41,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,3,1,51,8,1,1,2,1,2,1,2,1,
-        2,1,2,1,3,1,3,1,3,1,4,1,4,3,4,63,8,4,1,5,1,5,1,5,1,5,5,5,69,8,5,
-        10,5,12,5,72,9,5,1,5,1,5,5,5,76,8,5,10,5,12,5,79,9,5,3,5,81,8,5,
-        1,5,1,5,1,6,1,6,1,6,1,6,5,6,89,8,6,10,6,12,6,92,9,6,1,6,1,6,1,7,
-        1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,3,7,111,
-        8,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,5,7,125,8,7,
-        10,7,12,7,128,9,7,1,8,1,8,1,8,1,8,1,8,1,8,1,8,3,8,137,8,8,1,8,1,
-        8,1,8,5,8,142,8,8,10,8,12,8,145,9,8,1,9,1,9,1,10,1,10,1,10,1,10,
-        1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
-        1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,1,10,
-        1,10,3,10,180,8,10,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,
-        1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,
-        1,11,3,11,205,8,11,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,
-        1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,
-        1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,3,12,237,8,12,1,13,1,13,
-        1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,
-        1,13,1,13,1,13,1,13,1,13,1,13,1,13,3,13,261,8,13,1,14,1,14,1,14,
-        1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,1,14,3,14,277,
-        8,14,1,15,1,15,1,15,1,15,3,15,283,8,15,1,16,1,16,1,16,1,16,5,16,
-        289,8,16,10,16,12,16,292,9,16,1,16,1,16,1,17,1,17,1,17,1,17,5,17,
-        300,8,17,10,17,12,17,303,9,17,3,17,305,8,17,1,17,1,17,1,17,0,2,14,
-        16,18,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,0,4,1,0,10,
-        11,1,0,12,13,1,0,15,20,1,0,24,25,337,0,39,1,0,0,0,2,50,1,0,0,0,4,
-        52,1,0,0,0,6,57,1,0,0,0,8,62,1,0,0,0,10,64,1,0,0,0,12,84,1,0,0,0,
-        14,110,1,0,0,0,16,136,1,0,0,0,18,146,1,0,0,0,20,179,1,0,0,0,22,204,
-        1,0,0,0,24,236,1,0,0,0,26,260,1,0,0,0,28,276,1,0,0,0,30,282,1,0,
-        0,0,32,284,1,0,0,0,34,295,1,0,0,0,36,38,3,2,1,0,37,36,1,0,0,0,38,
-        41,1,0,0,0,39,37,1,0,0,0,39,40,1,0,0,0,40,42,1,0,0,0,41,39,1,0,0,
-        0,42,43,5,0,0,1,43,1,1,0,0,0,44,51,3,4,2,0,45,51,3,6,3,0,46,51,3,
-        8,4,0,47,51,3,26,13,0,48,51,3,28,14,0,49,51,5,1,0,0,50,44,1,0,0,
-        0,50,45,1,0,0,0,50,46,1,0,0,0,50,47,1,0,0,0,50,48,1,0,0,0,50,49,
-        1,0,0,0,51,3,1,0,0,0,52,53,5,50,0,0,53,54,5,2,0,0,54,55,3,14,7,0,
-        55,56,5,1,0,0,56,5,1,0,0,0,57,58,3,14,7,0,58,59,5,1,0,0,59,7,1,0,
-        0,0,60,63,3,10,5,0,61,63,3,12,6,0,62,60,1,0,0,0,62,61,1,0,0,0,63,
-        9,1,0,0,0,64,65,5,3,0,0,65,66,3,16,8,0,66,70,5,4,0,0,67,69,3,2,1,
-        0,68,67,1,0,0,0,69,72,1,0,0,0,70,68,1,0,0,0,70,71,1,0,0,0,71,80,
-        1,0,0,0,72,70,1,0,0,0,73,77,5,5,0,0,74,76,3,2,1,0,75,74,1,0,0,0,
-        76,79,1,0,0,0,77,75,1,0,0,0,77,78,1,0,0,0,78,81,1,0,0,0,79,77,1,
-        0,0,0,80,73,1,0,0,0,80,81,1,0,0,0,81,82,1,0,0,0,82,83,5,6,0,0,83,
-        11,1,0,0,0,84,85,5,7,0,0,85,86,3,16,8,0,86,90,5,8,0,0,87,89,3,2,
-        1,0,88,87,1,0,0,0,89,92,1,0,0,0,90,88,1,0,0,0,90,91,1,0,0,0,91,93,
-        1,0,0,0,92,90,1,0,0,0,93,94,5,9,0,0,94,13,1,0,0,0,95,96,6,7,-1,0,
-        96,97,5,21,0,0,97,98,3,14,7,0,98,99,5,22,0,0,99,111,1,0,0,0,100,
-        111,3,32,16,0,101,111,3,34,17,0,102,111,5,51,0,0,103,111,5,52,0,
-        0,104,111,5,50,0,0,105,111,3,20,10,0,106,111,3,24,12,0,107,111,3,
-        22,11,0,108,111,5,48,0,0,109,111,5,49,0,0,110,95,1,0,0,0,110,100,
-        1,0,0,0,110,101,1,0,0,0,110,102,1,0,0,0,110,103,1,0,0,0,110,104,
-        1,0,0,0,110,105,1,0,0,0,110,106,1,0,0,0,110,107,1,0,0,0,110,108,
-        1,0,0,0,110,109,1,0,0,0,111,126,1,0,0,0,112,113,10,15,0,0,113,114,
-        7,0,0,0,114,125,3,14,7,16,115,116,10,14,0,0,116,117,7,1,0,0,117,
-        125,3,14,7,15,118,119,10,13,0,0,119,120,5,14,0,0,120,125,3,14,7,
-        14,121,122,10,12,0,0,122,123,7,2,0,0,123,125,3,14,7,13,124,112,1,
-        0,0,0,124,115,1,0,0,0,124,118,1,0,0,0,124,121,1,0,0,0,125,128,1,
-        0,0,0,126,124,1,0,0,0,126,127,1,0,0,0,127,15,1,0,0,0,128,126,1,0,
-        0,0,129,130,6,8,-1,0,130,131,3,14,7,0,131,132,3,18,9,0,132,133,3,
-        14,7,0,133,137,1,0,0,0,134,135,5,23,0,0,135,137,3,16,8,2,136,129,
-        1,0,0,0,136,134,1,0,0,0,137,143,1,0,0,0,138,139,10,1,0,0,139,140,
-        7,3,0,0,140,142,3,16,8,2,141,138,1,0,0,0,142,145,1,0,0,0,143,141,
-        1,0,0,0,143,144,1,0,0,0,144,17,1,0,0,0,145,143,1,0,0,0,146,147,7,
-        2,0,0,147,19,1,0,0,0,148,149,5,26,0,0,149,150,5,21,0,0,150,151,3,
-        14,7,0,151,152,5,22,0,0,152,180,1,0,0,0,153,154,5,27,0,0,154,155,
-        5,21,0,0,155,156,3,14,7,0,156,157,5,22,0,0,157,180,1,0,0,0,158,159,
-        5,28,0,0,159,160,5,21,0,0,160,161,3,14,7,0,161,162,5,29,0,0,162,
-        163,3,14,7,0,163,164,5,22,0,0,164,180,1,0,0,0,165,166,5,30,0,0,166,
-        167,5,21,0,0,167,168,3,14,7,0,168,169,5,29,0,0,169,170,3,14,7,0,
-        170,171,5,22,0,0,171,180,1,0,0,0,172,173,5,31,0,0,173,174,5,21,0,
-        0,174,175,3,14,7,0,175,176,5,29,0,0,176,177,3,14,7,0,177,178,5,22,
-        0,0,178,180,1,0,0,0,179,148,1,0,0,0,179,153,1,0,0,0,179,158,1,0,
-        0,0,179,165,1,0,0,0,179,172,1,0,0,0,180,21,1,0,0,0,181,182,5,32,
-        0,0,182,183,5,21,0,0,183,184,3,14,7,0,184,185,5,29,0,0,185,186,3,
-        14,7,0,186,187,5,22,0,0,187,205,1,0,0,0,188,189,5,33,0,0,189,190,
-        5,21,0,0,190,191,3,14,7,0,191,192,5,29,0,0,192,193,3,14,7,0,193,
-        194,5,29,0,0,194,195,3,14,7,0,195,196,5,22,0,0,196,205,1,0,0,0,197,
-        198,5,34,0,0,198,199,5,21,0,0,199,200,3,14,7,0,200,201,5,29,0,0,
-        201,202,3,14,7,0,202,203,5,22,0,0,203,205,1,0,0,0,204,181,1,0,0,
-        0,204,188,1,0,0,0,204,197,1,0,0,0,205,23,1,0,0,0,206,207,5,35,0,
-        0,207,208,5,21,0,0,208,209,3,14,7,0,209,210,5,22,0,0,210,237,1,0,
-        0,0,211,212,5,36,0,0,212,213,5,21,0,0,213,214,3,14,7,0,214,215,5,
-        22,0,0,215,237,1,0,0,0,216,217,5,37,0,0,217,218,5,21,0,0,218,219,
-        3,14,7,0,219,220,5,22,0,0,220,237,1,0,0,0,221,222,5,38,0,0,222,223,
-        5,21,0,0,223,224,3,14,7,0,224,225,5,22,0,0,225,237,1,0,0,0,226,227,
-        5,39,0,0,227,228,5,21,0,0,228,229,3,14,7,0,229,230,5,22,0,0,230,
-        237,1,0,0,0,231,232,5,40,0,0,232,233,5,21,0,0,233,234,3,14,7,0,234,
-        235,5,22,0,0,235,237,1,0,0,0,236,206,1,0,0,0,236,211,1,0,0,0,236,
-        216,1,0,0,0,236,221,1,0,0,0,236,226,1,0,0,0,236,231,1,0,0,0,237,
-        25,1,0,0,0,238,239,5,41,0,0,239,240,5,21,0,0,240,241,3,14,7,0,241,
-        242,5,29,0,0,242,243,3,14,7,0,243,244,5,22,0,0,244,245,5,1,0,0,245,
-        261,1,0,0,0,246,247,5,42,0,0,247,248,5,21,0,0,248,249,3,14,7,0,249,
-        250,5,29,0,0,250,251,3,14,7,0,251,252,5,22,0,0,252,253,5,1,0,0,253,
-        261,1,0,0,0,254,255,5,43,0,0,255,256,5,21,0,0,256,257,3,14,7,0,257,
-        258,5,22,0,0,258,259,5,1,0,0,259,261,1,0,0,0,260,238,1,0,0,0,260,
-        246,1,0,0,0,260,254,1,0,0,0,261,27,1,0,0,0,262,263,5,44,0,0,263,
-        264,5,21,0,0,264,265,3,14,7,0,265,266,5,22,0,0,266,267,5,1,0,0,267,
-        277,1,0,0,0,268,269,5,45,0,0,269,270,5,21,0,0,270,271,3,14,7,0,271,
-        272,5,29,0,0,272,273,3,14,7,0,273,274,5,22,0,0,274,275,5,1,0,0,275,
-        277,1,0,0,0,276,262,1,0,0,0,276,268,1,0,0,0,277,29,1,0,0,0,278,283,
-        5,51,0,0,279,283,5,52,0,0,280,283,3,32,16,0,281,283,3,34,17,0,282,
-        278,1,0,0,0,282,279,1,0,0,0,282,280,1,0,0,0,282,281,1,0,0,0,283,
-        31,1,0,0,0,284,285,5,46,0,0,285,290,3,34,17,0,286,287,5,29,0,0,287,
-        289,3,34,17,0,288,286,1,0,0,0,289,292,1,0,0,0,290,288,1,0,0,0,290,
-        291,1,0,0,0,291,293,1,0,0,0,292,290,1,0,0,0,293,294,5,47,0,0,294,
-        33,1,0,0,0,295,304,5,46,0,0,296,301,3,14,7,0,297,298,5,29,0,0,298,
-        300,3,14,7,0,299,297,1,0,0,0,300,303,1,0,0,0,301,299,1,0,0,0,301,
-        302,1,0,0,0,302,305,1,0,0,0,303,301,1,0,0,0,304,296,1,0,0,0,304,
-        305,1,0,0,0,305,306,1,0,0,0,306,307,5,47,0,0,307,35,1,0,0,0,21,39,
-        50,62,70,77,80,90,110,124,126,136,143,179,204,236,260,276,282,290,
-        301,304
+        2,14,7,14,2,15,7,15,2,16,7,16,2,17,7,17,2,18,7,18,1,0,5,0,40,8,0,
+        10,0,12,0,43,9,0,1,0,1,0,1,1,1,1,1,1,1,1,1,1,1,1,3,1,53,8,1,1,2,
+        1,2,1,2,1,2,1,2,1,3,1,3,1,3,1,4,1,4,3,4,65,8,4,1,5,1,5,1,5,1,5,5,
+        5,71,8,5,10,5,12,5,74,9,5,1,5,1,5,5,5,78,8,5,10,5,12,5,81,9,5,3,
+        5,83,8,5,1,5,1,5,1,6,1,6,1,6,1,6,5,6,91,8,6,10,6,12,6,94,9,6,1,6,
+        1,6,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,
+        1,7,3,7,114,8,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,1,7,
+        5,7,128,8,7,10,7,12,7,131,9,7,1,8,1,8,1,8,1,8,3,8,137,8,8,1,8,1,
+        8,1,8,5,8,142,8,8,10,8,12,8,145,9,8,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,
+        1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,1,9,3,9,195,8,9,1,10,1,10,1,11,1,
+        11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,
+        11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,1,11,3,11,222,8,11,1,12,1,
+        12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,
+        12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,12,1,
+        12,1,12,1,12,3,12,254,8,12,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,
+        13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,13,1,
+        13,1,13,3,13,278,8,13,1,14,1,14,1,14,1,14,1,14,1,15,1,15,1,15,1,
+        15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,1,15,3,15,299,8,
+        15,1,16,1,16,1,16,1,16,3,16,305,8,16,1,17,1,17,1,17,1,17,5,17,311,
+        8,17,10,17,12,17,314,9,17,1,17,1,17,1,18,1,18,1,18,1,18,5,18,322,
+        8,18,10,18,12,18,325,9,18,3,18,327,8,18,1,18,1,18,1,18,0,2,14,16,
+        19,0,2,4,6,8,10,12,14,16,18,20,22,24,26,28,30,32,34,36,0,5,1,0,10,
+        11,1,0,12,13,1,0,15,20,1,0,24,25,2,0,32,34,53,53,362,0,41,1,0,0,
+        0,2,52,1,0,0,0,4,54,1,0,0,0,6,59,1,0,0,0,8,64,1,0,0,0,10,66,1,0,
+        0,0,12,86,1,0,0,0,14,113,1,0,0,0,16,136,1,0,0,0,18,194,1,0,0,0,20,
+        196,1,0,0,0,22,221,1,0,0,0,24,253,1,0,0,0,26,277,1,0,0,0,28,279,
+        1,0,0,0,30,298,1,0,0,0,32,304,1,0,0,0,34,306,1,0,0,0,36,317,1,0,
+        0,0,38,40,3,2,1,0,39,38,1,0,0,0,40,43,1,0,0,0,41,39,1,0,0,0,41,42,
+        1,0,0,0,42,44,1,0,0,0,43,41,1,0,0,0,44,45,5,0,0,1,45,1,1,0,0,0,46,
+        53,3,4,2,0,47,53,3,30,15,0,48,53,3,6,3,0,49,53,3,8,4,0,50,53,3,26,
+        13,0,51,53,5,1,0,0,52,46,1,0,0,0,52,47,1,0,0,0,52,48,1,0,0,0,52,
+        49,1,0,0,0,52,50,1,0,0,0,52,51,1,0,0,0,53,3,1,0,0,0,54,55,3,20,10,
+        0,55,56,5,2,0,0,56,57,3,14,7,0,57,58,5,1,0,0,58,5,1,0,0,0,59,60,
+        3,14,7,0,60,61,5,1,0,0,61,7,1,0,0,0,62,65,3,10,5,0,63,65,3,12,6,
+        0,64,62,1,0,0,0,64,63,1,0,0,0,65,9,1,0,0,0,66,67,5,3,0,0,67,68,3,
+        16,8,0,68,72,5,4,0,0,69,71,3,2,1,0,70,69,1,0,0,0,71,74,1,0,0,0,72,
+        70,1,0,0,0,72,73,1,0,0,0,73,82,1,0,0,0,74,72,1,0,0,0,75,79,5,5,0,
+        0,76,78,3,2,1,0,77,76,1,0,0,0,78,81,1,0,0,0,79,77,1,0,0,0,79,80,
+        1,0,0,0,80,83,1,0,0,0,81,79,1,0,0,0,82,75,1,0,0,0,82,83,1,0,0,0,
+        83,84,1,0,0,0,84,85,5,6,0,0,85,11,1,0,0,0,86,87,5,7,0,0,87,88,3,
+        16,8,0,88,92,5,8,0,0,89,91,3,2,1,0,90,89,1,0,0,0,91,94,1,0,0,0,92,
+        90,1,0,0,0,92,93,1,0,0,0,93,95,1,0,0,0,94,92,1,0,0,0,95,96,5,9,0,
+        0,96,13,1,0,0,0,97,98,6,7,-1,0,98,99,5,21,0,0,99,100,3,14,7,0,100,
+        101,5,22,0,0,101,114,1,0,0,0,102,114,3,34,17,0,103,114,3,36,18,0,
+        104,114,5,54,0,0,105,114,5,55,0,0,106,114,3,20,10,0,107,114,3,18,
+        9,0,108,114,3,24,12,0,109,114,3,22,11,0,110,114,3,28,14,0,111,114,
+        5,51,0,0,112,114,5,52,0,0,113,97,1,0,0,0,113,102,1,0,0,0,113,103,
+        1,0,0,0,113,104,1,0,0,0,113,105,1,0,0,0,113,106,1,0,0,0,113,107,
+        1,0,0,0,113,108,1,0,0,0,113,109,1,0,0,0,113,110,1,0,0,0,113,111,
+        1,0,0,0,113,112,1,0,0,0,114,129,1,0,0,0,115,116,10,16,0,0,116,117,
+        7,0,0,0,117,128,3,14,7,17,118,119,10,15,0,0,119,120,7,1,0,0,120,
+        128,3,14,7,16,121,122,10,14,0,0,122,123,5,14,0,0,123,128,3,14,7,
+        15,124,125,10,13,0,0,125,126,7,2,0,0,126,128,3,14,7,14,127,115,1,
+        0,0,0,127,118,1,0,0,0,127,121,1,0,0,0,127,124,1,0,0,0,128,131,1,
+        0,0,0,129,127,1,0,0,0,129,130,1,0,0,0,130,15,1,0,0,0,131,129,1,0,
+        0,0,132,133,6,8,-1,0,133,134,5,23,0,0,134,137,3,16,8,3,135,137,3,
+        14,7,0,136,132,1,0,0,0,136,135,1,0,0,0,137,143,1,0,0,0,138,139,10,
+        2,0,0,139,140,7,3,0,0,140,142,3,16,8,3,141,138,1,0,0,0,142,145,1,
+        0,0,0,143,141,1,0,0,0,143,144,1,0,0,0,144,17,1,0,0,0,145,143,1,0,
+        0,0,146,147,5,26,0,0,147,148,5,21,0,0,148,149,3,14,7,0,149,150,5,
+        22,0,0,150,195,1,0,0,0,151,152,5,27,0,0,152,153,5,21,0,0,153,154,
+        3,14,7,0,154,155,5,22,0,0,155,195,1,0,0,0,156,157,5,28,0,0,157,158,
+        5,21,0,0,158,159,3,14,7,0,159,160,5,29,0,0,160,161,3,14,7,0,161,
+        162,5,22,0,0,162,195,1,0,0,0,163,164,5,30,0,0,164,165,5,21,0,0,165,
+        166,3,14,7,0,166,167,5,29,0,0,167,168,3,14,7,0,168,169,5,22,0,0,
+        169,195,1,0,0,0,170,171,5,31,0,0,171,172,5,21,0,0,172,173,3,14,7,
+        0,173,174,5,29,0,0,174,175,3,14,7,0,175,176,5,22,0,0,176,195,1,0,
+        0,0,177,178,5,32,0,0,178,179,5,21,0,0,179,180,3,14,7,0,180,181,5,
+        22,0,0,181,195,1,0,0,0,182,183,5,33,0,0,183,184,5,21,0,0,184,185,
+        3,14,7,0,185,186,5,29,0,0,186,187,3,14,7,0,187,188,5,22,0,0,188,
+        195,1,0,0,0,189,190,5,34,0,0,190,191,5,21,0,0,191,192,3,14,7,0,192,
+        193,5,22,0,0,193,195,1,0,0,0,194,146,1,0,0,0,194,151,1,0,0,0,194,
+        156,1,0,0,0,194,163,1,0,0,0,194,170,1,0,0,0,194,177,1,0,0,0,194,
+        182,1,0,0,0,194,189,1,0,0,0,195,19,1,0,0,0,196,197,7,4,0,0,197,21,
+        1,0,0,0,198,199,5,35,0,0,199,200,5,21,0,0,200,201,3,14,7,0,201,202,
+        5,29,0,0,202,203,3,14,7,0,203,204,5,22,0,0,204,222,1,0,0,0,205,206,
+        5,36,0,0,206,207,5,21,0,0,207,208,3,14,7,0,208,209,5,29,0,0,209,
+        210,3,14,7,0,210,211,5,29,0,0,211,212,3,14,7,0,212,213,5,22,0,0,
+        213,222,1,0,0,0,214,215,5,37,0,0,215,216,5,21,0,0,216,217,3,14,7,
+        0,217,218,5,29,0,0,218,219,3,14,7,0,219,220,5,22,0,0,220,222,1,0,
+        0,0,221,198,1,0,0,0,221,205,1,0,0,0,221,214,1,0,0,0,222,23,1,0,0,
+        0,223,224,5,38,0,0,224,225,5,21,0,0,225,226,3,14,7,0,226,227,5,22,
+        0,0,227,254,1,0,0,0,228,229,5,39,0,0,229,230,5,21,0,0,230,231,3,
+        14,7,0,231,232,5,22,0,0,232,254,1,0,0,0,233,234,5,40,0,0,234,235,
+        5,21,0,0,235,236,3,14,7,0,236,237,5,22,0,0,237,254,1,0,0,0,238,239,
+        5,41,0,0,239,240,5,21,0,0,240,241,3,14,7,0,241,242,5,22,0,0,242,
+        254,1,0,0,0,243,244,5,42,0,0,244,245,5,21,0,0,245,246,3,14,7,0,246,
+        247,5,22,0,0,247,254,1,0,0,0,248,249,5,43,0,0,249,250,5,21,0,0,250,
+        251,3,14,7,0,251,252,5,22,0,0,252,254,1,0,0,0,253,223,1,0,0,0,253,
+        228,1,0,0,0,253,233,1,0,0,0,253,238,1,0,0,0,253,243,1,0,0,0,253,
+        248,1,0,0,0,254,25,1,0,0,0,255,256,5,44,0,0,256,257,5,21,0,0,257,
+        258,3,14,7,0,258,259,5,29,0,0,259,260,3,14,7,0,260,261,5,22,0,0,
+        261,262,5,1,0,0,262,278,1,0,0,0,263,264,5,45,0,0,264,265,5,21,0,
+        0,265,266,3,14,7,0,266,267,5,29,0,0,267,268,3,14,7,0,268,269,5,22,
+        0,0,269,270,5,1,0,0,270,278,1,0,0,0,271,272,5,46,0,0,272,273,5,21,
+        0,0,273,274,3,14,7,0,274,275,5,22,0,0,275,276,5,1,0,0,276,278,1,
+        0,0,0,277,255,1,0,0,0,277,263,1,0,0,0,277,271,1,0,0,0,278,27,1,0,
+        0,0,279,280,5,47,0,0,280,281,5,21,0,0,281,282,3,14,7,0,282,283,5,
+        22,0,0,283,29,1,0,0,0,284,285,5,47,0,0,285,286,5,21,0,0,286,287,
+        3,14,7,0,287,288,5,22,0,0,288,289,5,1,0,0,289,299,1,0,0,0,290,291,
+        5,48,0,0,291,292,5,21,0,0,292,293,3,14,7,0,293,294,5,29,0,0,294,
+        295,3,14,7,0,295,296,5,22,0,0,296,297,5,1,0,0,297,299,1,0,0,0,298,
+        284,1,0,0,0,298,290,1,0,0,0,299,31,1,0,0,0,300,305,5,54,0,0,301,
+        305,5,55,0,0,302,305,3,34,17,0,303,305,3,36,18,0,304,300,1,0,0,0,
+        304,301,1,0,0,0,304,302,1,0,0,0,304,303,1,0,0,0,305,33,1,0,0,0,306,
+        307,5,49,0,0,307,312,3,36,18,0,308,309,5,29,0,0,309,311,3,36,18,
+        0,310,308,1,0,0,0,311,314,1,0,0,0,312,310,1,0,0,0,312,313,1,0,0,
+        0,313,315,1,0,0,0,314,312,1,0,0,0,315,316,5,50,0,0,316,35,1,0,0,
+        0,317,326,5,49,0,0,318,323,3,14,7,0,319,320,5,29,0,0,320,322,3,14,
+        7,0,321,319,1,0,0,0,322,325,1,0,0,0,323,321,1,0,0,0,323,324,1,0,
+        0,0,324,327,1,0,0,0,325,323,1,0,0,0,326,318,1,0,0,0,326,327,1,0,
+        0,0,327,328,1,0,0,0,328,329,5,50,0,0,329,37,1,0,0,0,21,41,52,64,
+        72,79,82,92,113,127,129,136,143,194,221,253,277,298,304,312,323,
+        326
     ]
 
 class DeepLearningDSLParser ( Parser ):
@@ -137,10 +145,11 @@ class DeepLearningDSLParser ( Parser ):
                      "'+'", "'-'", "'^'", "'=='", "'!='", "'<'", "'<='", 
                      "'>'", "'>='", "'('", "')'", "'not'", "'and'", "'or'", 
                      "'transpose'", "'inverse'", "'matmul'", "','", "'matsum'", 
-                     "'matsub'", "'linearRegression'", "'mlpClassifier'", 
-                     "'kmeans'", "'sin'", "'cos'", "'tan'", "'sqrt'", "'log'", 
-                     "'exp'", "'plot'", "'scatter'", "'hist'", "'readFile'", 
-                     "'writeFile'", "'['", "']'", "'true'", "'false'" ]
+                     "'matsub'", "'det'", "'solve'", "'density'", "'linearRegression'", 
+                     "'mlpClassifier'", "'kmeans'", "'sin'", "'cos'", "'tan'", 
+                     "'sqrt'", "'log'", "'exp'", "'plot'", "'scatter'", 
+                     "'hist'", "'readFile'", "'writeFile'", "'['", "']'", 
+                     "'true'", "'false'" ]
 
     symbolicNames = [ "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
@@ -154,7 +163,8 @@ class DeepLearningDSLParser ( Parser ):
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
                       "<INVALID>", "<INVALID>", "<INVALID>", "<INVALID>", 
-                      "TRUE", "FALSE", "ID", "NUMBER", "STRING", "WS", "COMMENT" ]
+                      "<INVALID>", "<INVALID>", "<INVALID>", "TRUE", "FALSE", 
+                      "ID", "NUMBER", "STRING", "WS", "COMMENT" ]
 
     RULE_program = 0
     RULE_statement = 1
@@ -165,21 +175,23 @@ class DeepLearningDSLParser ( Parser ):
     RULE_whileStatement = 6
     RULE_expression = 7
     RULE_booleanExpression = 8
-    RULE_comparator = 9
-    RULE_matrixOperation = 10
+    RULE_matrixOperation = 9
+    RULE_identifier = 10
     RULE_mlOperation = 11
     RULE_trigFunction = 12
     RULE_plotStatement = 13
-    RULE_fileOperation = 14
-    RULE_literal = 15
-    RULE_matrixLiteral = 16
-    RULE_listLiteral = 17
+    RULE_readOperation = 14
+    RULE_fileOperation = 15
+    RULE_literal = 16
+    RULE_matrixLiteral = 17
+    RULE_listLiteral = 18
 
     ruleNames =  [ "program", "statement", "assignment", "expressionStatement", 
                    "controlStructure", "ifStatement", "whileStatement", 
-                   "expression", "booleanExpression", "comparator", "matrixOperation", 
-                   "mlOperation", "trigFunction", "plotStatement", "fileOperation", 
-                   "literal", "matrixLiteral", "listLiteral" ]
+                   "expression", "booleanExpression", "matrixOperation", 
+                   "identifier", "mlOperation", "trigFunction", "plotStatement", 
+                   "readOperation", "fileOperation", "literal", "matrixLiteral", 
+                   "listLiteral" ]
 
     EOF = Token.EOF
     T__0=1
@@ -229,13 +241,16 @@ class DeepLearningDSLParser ( Parser ):
     T__44=45
     T__45=46
     T__46=47
-    TRUE=48
-    FALSE=49
-    ID=50
-    NUMBER=51
-    STRING=52
-    WS=53
-    COMMENT=54
+    T__47=48
+    T__48=49
+    T__49=50
+    TRUE=51
+    FALSE=52
+    ID=53
+    NUMBER=54
+    STRING=55
+    WS=56
+    COMMENT=57
 
     def __init__(self, input:TokenStream, output:TextIO = sys.stdout):
         super().__init__(input, output)
@@ -290,17 +305,17 @@ class DeepLearningDSLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 39
+            self.state = 41
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 8866461164503178) != 0):
-                self.state = 36
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 70931693529202826) != 0):
+                self.state = 38
                 self.statement()
-                self.state = 41
+                self.state = 43
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 42
+            self.state = 44
             self.match(DeepLearningDSLParser.EOF)
         except RecognitionException as re:
             localctx.exception = re
@@ -322,6 +337,10 @@ class DeepLearningDSLParser ( Parser ):
             return self.getTypedRuleContext(DeepLearningDSLParser.AssignmentContext,0)
 
 
+        def fileOperation(self):
+            return self.getTypedRuleContext(DeepLearningDSLParser.FileOperationContext,0)
+
+
         def expressionStatement(self):
             return self.getTypedRuleContext(DeepLearningDSLParser.ExpressionStatementContext,0)
 
@@ -334,10 +353,6 @@ class DeepLearningDSLParser ( Parser ):
             return self.getTypedRuleContext(DeepLearningDSLParser.PlotStatementContext,0)
 
 
-        def fileOperation(self):
-            return self.getTypedRuleContext(DeepLearningDSLParser.FileOperationContext,0)
-
-
         def getRuleIndex(self):
             return DeepLearningDSLParser.RULE_statement
 
@@ -363,42 +378,42 @@ class DeepLearningDSLParser ( Parser ):
         localctx = DeepLearningDSLParser.StatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 2, self.RULE_statement)
         try:
-            self.state = 50
+            self.state = 52
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,1,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 44
+                self.state = 46
                 self.assignment()
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 45
-                self.expressionStatement()
+                self.state = 47
+                self.fileOperation()
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 46
-                self.controlStructure()
+                self.state = 48
+                self.expressionStatement()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 47
-                self.plotStatement()
+                self.state = 49
+                self.controlStructure()
                 pass
 
             elif la_ == 5:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 48
-                self.fileOperation()
+                self.state = 50
+                self.plotStatement()
                 pass
 
             elif la_ == 6:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 49
+                self.state = 51
                 self.match(DeepLearningDSLParser.T__0)
                 pass
 
@@ -419,8 +434,9 @@ class DeepLearningDSLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def ID(self):
-            return self.getToken(DeepLearningDSLParser.ID, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(DeepLearningDSLParser.IdentifierContext,0)
+
 
         def expression(self):
             return self.getTypedRuleContext(DeepLearningDSLParser.ExpressionContext,0)
@@ -452,13 +468,13 @@ class DeepLearningDSLParser ( Parser ):
         self.enterRule(localctx, 4, self.RULE_assignment)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 52
-            self.match(DeepLearningDSLParser.ID)
-            self.state = 53
-            self.match(DeepLearningDSLParser.T__1)
             self.state = 54
-            self.expression(0)
+            self.identifier()
             self.state = 55
+            self.match(DeepLearningDSLParser.T__1)
+            self.state = 56
+            self.expression(0)
+            self.state = 57
             self.match(DeepLearningDSLParser.T__0)
         except RecognitionException as re:
             localctx.exception = re
@@ -506,9 +522,9 @@ class DeepLearningDSLParser ( Parser ):
         self.enterRule(localctx, 6, self.RULE_expressionStatement)
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 57
+            self.state = 59
             self.expression(0)
-            self.state = 58
+            self.state = 60
             self.match(DeepLearningDSLParser.T__0)
         except RecognitionException as re:
             localctx.exception = re
@@ -559,17 +575,17 @@ class DeepLearningDSLParser ( Parser ):
         localctx = DeepLearningDSLParser.ControlStructureContext(self, self._ctx, self.state)
         self.enterRule(localctx, 8, self.RULE_controlStructure)
         try:
-            self.state = 62
+            self.state = 64
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [3]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 60
+                self.state = 62
                 self.ifStatement()
                 pass
             elif token in [7]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 61
+                self.state = 63
                 self.whileStatement()
                 pass
             else:
@@ -629,41 +645,41 @@ class DeepLearningDSLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 64
+            self.state = 66
             self.match(DeepLearningDSLParser.T__2)
-            self.state = 65
+            self.state = 67
             self.booleanExpression(0)
-            self.state = 66
+            self.state = 68
             self.match(DeepLearningDSLParser.T__3)
-            self.state = 70
+            self.state = 72
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 8866461164503178) != 0):
-                self.state = 67
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 70931693529202826) != 0):
+                self.state = 69
                 self.statement()
-                self.state = 72
+                self.state = 74
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 80
+            self.state = 82
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             if _la==5:
-                self.state = 73
+                self.state = 75
                 self.match(DeepLearningDSLParser.T__4)
-                self.state = 77
+                self.state = 79
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
-                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 8866461164503178) != 0):
-                    self.state = 74
+                while (((_la) & ~0x3f) == 0 and ((1 << _la) & 70931693529202826) != 0):
+                    self.state = 76
                     self.statement()
-                    self.state = 79
+                    self.state = 81
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 82
+            self.state = 84
             self.match(DeepLearningDSLParser.T__5)
         except RecognitionException as re:
             localctx.exception = re
@@ -719,23 +735,23 @@ class DeepLearningDSLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 84
+            self.state = 86
             self.match(DeepLearningDSLParser.T__6)
-            self.state = 85
+            self.state = 87
             self.booleanExpression(0)
-            self.state = 86
+            self.state = 88
             self.match(DeepLearningDSLParser.T__7)
-            self.state = 90
+            self.state = 92
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 8866461164503178) != 0):
-                self.state = 87
+            while (((_la) & ~0x3f) == 0 and ((1 << _la) & 70931693529202826) != 0):
+                self.state = 89
                 self.statement()
-                self.state = 92
+                self.state = 94
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 93
+            self.state = 95
             self.match(DeepLearningDSLParser.T__8)
         except RecognitionException as re:
             localctx.exception = re
@@ -775,8 +791,9 @@ class DeepLearningDSLParser ( Parser ):
         def STRING(self):
             return self.getToken(DeepLearningDSLParser.STRING, 0)
 
-        def ID(self):
-            return self.getToken(DeepLearningDSLParser.ID, 0)
+        def identifier(self):
+            return self.getTypedRuleContext(DeepLearningDSLParser.IdentifierContext,0)
+
 
         def matrixOperation(self):
             return self.getTypedRuleContext(DeepLearningDSLParser.MatrixOperationContext,0)
@@ -790,6 +807,10 @@ class DeepLearningDSLParser ( Parser ):
             return self.getTypedRuleContext(DeepLearningDSLParser.MlOperationContext,0)
 
 
+        def readOperation(self):
+            return self.getTypedRuleContext(DeepLearningDSLParser.ReadOperationContext,0)
+
+
         def TRUE(self):
             return self.getToken(DeepLearningDSLParser.TRUE, 0)
 
@@ -825,71 +846,76 @@ class DeepLearningDSLParser ( Parser ):
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 110
+            self.state = 113
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,7,self._ctx)
             if la_ == 1:
-                self.state = 96
+                self.state = 98
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 97
+                self.state = 99
                 self.expression(0)
-                self.state = 98
+                self.state = 100
                 self.match(DeepLearningDSLParser.T__21)
                 pass
 
             elif la_ == 2:
-                self.state = 100
+                self.state = 102
                 self.matrixLiteral()
                 pass
 
             elif la_ == 3:
-                self.state = 101
+                self.state = 103
                 self.listLiteral()
                 pass
 
             elif la_ == 4:
-                self.state = 102
+                self.state = 104
                 self.match(DeepLearningDSLParser.NUMBER)
                 pass
 
             elif la_ == 5:
-                self.state = 103
+                self.state = 105
                 self.match(DeepLearningDSLParser.STRING)
                 pass
 
             elif la_ == 6:
-                self.state = 104
-                self.match(DeepLearningDSLParser.ID)
+                self.state = 106
+                self.identifier()
                 pass
 
             elif la_ == 7:
-                self.state = 105
+                self.state = 107
                 self.matrixOperation()
                 pass
 
             elif la_ == 8:
-                self.state = 106
+                self.state = 108
                 self.trigFunction()
                 pass
 
             elif la_ == 9:
-                self.state = 107
+                self.state = 109
                 self.mlOperation()
                 pass
 
             elif la_ == 10:
-                self.state = 108
-                self.match(DeepLearningDSLParser.TRUE)
+                self.state = 110
+                self.readOperation()
                 pass
 
             elif la_ == 11:
-                self.state = 109
+                self.state = 111
+                self.match(DeepLearningDSLParser.TRUE)
+                pass
+
+            elif la_ == 12:
+                self.state = 112
                 self.match(DeepLearningDSLParser.FALSE)
                 pass
 
 
             self._ctx.stop = self._input.LT(-1)
-            self.state = 126
+            self.state = 129
             self._errHandler.sync(self)
             _alt = self._interp.adaptivePredict(self._input,9,self._ctx)
             while _alt!=2 and _alt!=ATN.INVALID_ALT_NUMBER:
@@ -897,17 +923,17 @@ class DeepLearningDSLParser ( Parser ):
                     if self._parseListeners is not None:
                         self.triggerExitRuleEvent()
                     _prevctx = localctx
-                    self.state = 124
+                    self.state = 127
                     self._errHandler.sync(self)
                     la_ = self._interp.adaptivePredict(self._input,8,self._ctx)
                     if la_ == 1:
                         localctx = DeepLearningDSLParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 112
-                        if not self.precpred(self._ctx, 15):
+                        self.state = 115
+                        if not self.precpred(self._ctx, 16):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 15)")
-                        self.state = 113
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 16)")
+                        self.state = 116
                         localctx.op = self._input.LT(1)
                         _la = self._input.LA(1)
                         if not(_la==10 or _la==11):
@@ -915,18 +941,18 @@ class DeepLearningDSLParser ( Parser ):
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 114
-                        self.expression(16)
+                        self.state = 117
+                        self.expression(17)
                         pass
 
                     elif la_ == 2:
                         localctx = DeepLearningDSLParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 115
-                        if not self.precpred(self._ctx, 14):
+                        self.state = 118
+                        if not self.precpred(self._ctx, 15):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 14)")
-                        self.state = 116
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 15)")
+                        self.state = 119
                         localctx.op = self._input.LT(1)
                         _la = self._input.LA(1)
                         if not(_la==12 or _la==13):
@@ -934,31 +960,31 @@ class DeepLearningDSLParser ( Parser ):
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 117
-                        self.expression(15)
+                        self.state = 120
+                        self.expression(16)
                         pass
 
                     elif la_ == 3:
                         localctx = DeepLearningDSLParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 118
-                        if not self.precpred(self._ctx, 13):
+                        self.state = 121
+                        if not self.precpred(self._ctx, 14):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 13)")
-                        self.state = 119
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 14)")
+                        self.state = 122
                         localctx.op = self.match(DeepLearningDSLParser.T__13)
-                        self.state = 120
-                        self.expression(14)
+                        self.state = 123
+                        self.expression(15)
                         pass
 
                     elif la_ == 4:
                         localctx = DeepLearningDSLParser.ExpressionContext(self, _parentctx, _parentState)
                         self.pushNewRecursionContext(localctx, _startState, self.RULE_expression)
-                        self.state = 121
-                        if not self.precpred(self._ctx, 12):
+                        self.state = 124
+                        if not self.precpred(self._ctx, 13):
                             from antlr4.error.Errors import FailedPredicateException
-                            raise FailedPredicateException(self, "self.precpred(self._ctx, 12)")
-                        self.state = 122
+                            raise FailedPredicateException(self, "self.precpred(self._ctx, 13)")
+                        self.state = 125
                         localctx.op = self._input.LT(1)
                         _la = self._input.LA(1)
                         if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2064384) != 0)):
@@ -966,12 +992,12 @@ class DeepLearningDSLParser ( Parser ):
                         else:
                             self._errHandler.reportMatch(self)
                             self.consume()
-                        self.state = 123
-                        self.expression(13)
+                        self.state = 126
+                        self.expression(14)
                         pass
 
              
-                self.state = 128
+                self.state = 131
                 self._errHandler.sync(self)
                 _alt = self._interp.adaptivePredict(self._input,9,self._ctx)
 
@@ -991,17 +1017,6 @@ class DeepLearningDSLParser ( Parser ):
             super().__init__(parent, invokingState)
             self.parser = parser
 
-        def expression(self, i:int=None):
-            if i is None:
-                return self.getTypedRuleContexts(DeepLearningDSLParser.ExpressionContext)
-            else:
-                return self.getTypedRuleContext(DeepLearningDSLParser.ExpressionContext,i)
-
-
-        def comparator(self):
-            return self.getTypedRuleContext(DeepLearningDSLParser.ComparatorContext,0)
-
-
         def booleanExpression(self, i:int=None):
             if i is None:
                 return self.getTypedRuleContexts(DeepLearningDSLParser.BooleanExpressionContext)
@@ -1009,6 +1024,10 @@ class DeepLearningDSLParser ( Parser ):
                 return self.getTypedRuleContext(DeepLearningDSLParser.BooleanExpressionContext,i)
 
 
+        def expression(self):
+            return self.getTypedRuleContext(DeepLearningDSLParser.ExpressionContext,0)
+
+
         def getRuleIndex(self):
             return DeepLearningDSLParser.RULE_booleanExpression
 
@@ -1041,19 +1060,15 @@ class DeepLearningDSLParser ( Parser ):
             self.state = 136
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [21, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 46, 48, 49, 50, 51, 52]:
-                self.state = 130
-                self.expression(0)
-                self.state = 131
-                self.comparator()
-                self.state = 132
-                self.expression(0)
-                pass
-            elif token in [23]:
-                self.state = 134
+            if token in [23]:
+                self.state = 133
                 self.match(DeepLearningDSLParser.T__22)
+                self.state = 134
+                self.booleanExpression(3)
+                pass
+            elif token in [21, 26, 27, 28, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 47, 49, 51, 52, 53, 54, 55]:
                 self.state = 135
-                self.booleanExpression(2)
+                self.expression(0)
                 pass
             else:
                 raise NoViableAltException(self)
@@ -1070,9 +1085,9 @@ class DeepLearningDSLParser ( Parser ):
                     localctx = DeepLearningDSLParser.BooleanExpressionContext(self, _parentctx, _parentState)
                     self.pushNewRecursionContext(localctx, _startState, self.RULE_booleanExpression)
                     self.state = 138
-                    if not self.precpred(self._ctx, 1):
+                    if not self.precpred(self._ctx, 2):
                         from antlr4.error.Errors import FailedPredicateException
-                        raise FailedPredicateException(self, "self.precpred(self._ctx, 1)")
+                        raise FailedPredicateException(self, "self.precpred(self._ctx, 2)")
                     self.state = 139
                     _la = self._input.LA(1)
                     if not(_la==24 or _la==25):
@@ -1081,7 +1096,7 @@ class DeepLearningDSLParser ( Parser ):
                         self._errHandler.reportMatch(self)
                         self.consume()
                     self.state = 140
-                    self.booleanExpression(2) 
+                    self.booleanExpression(3) 
                 self.state = 145
                 self._errHandler.sync(self)
                 _alt = self._interp.adaptivePredict(self._input,11,self._ctx)
@@ -1095,57 +1110,6 @@ class DeepLearningDSLParser ( Parser ):
         return localctx
 
 
-    class ComparatorContext(ParserRuleContext):
-        __slots__ = 'parser'
-
-        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
-            super().__init__(parent, invokingState)
-            self.parser = parser
-
-
-        def getRuleIndex(self):
-            return DeepLearningDSLParser.RULE_comparator
-
-        def enterRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "enterComparator" ):
-                listener.enterComparator(self)
-
-        def exitRule(self, listener:ParseTreeListener):
-            if hasattr( listener, "exitComparator" ):
-                listener.exitComparator(self)
-
-        def accept(self, visitor:ParseTreeVisitor):
-            if hasattr( visitor, "visitComparator" ):
-                return visitor.visitComparator(self)
-            else:
-                return visitor.visitChildren(self)
-
-
-
-
-    def comparator(self):
-
-        localctx = DeepLearningDSLParser.ComparatorContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 18, self.RULE_comparator)
-        self._la = 0 # Token type
-        try:
-            self.enterOuterAlt(localctx, 1)
-            self.state = 146
-            _la = self._input.LA(1)
-            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 2064384) != 0)):
-                self._errHandler.recoverInline(self)
-            else:
-                self._errHandler.reportMatch(self)
-                self.consume()
-        except RecognitionException as re:
-            localctx.exception = re
-            self._errHandler.reportError(self, re)
-            self._errHandler.recover(self, re)
-        finally:
-            self.exitRule()
-        return localctx
-
-
     class MatrixOperationContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -1183,76 +1147,113 @@ class DeepLearningDSLParser ( Parser ):
     def matrixOperation(self):
 
         localctx = DeepLearningDSLParser.MatrixOperationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 20, self.RULE_matrixOperation)
+        self.enterRule(localctx, 18, self.RULE_matrixOperation)
         try:
-            self.state = 179
+            self.state = 194
             self._errHandler.sync(self)
             token = self._input.LA(1)
             if token in [26]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 148
+                self.state = 146
                 self.match(DeepLearningDSLParser.T__25)
-                self.state = 149
+                self.state = 147
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 150
+                self.state = 148
                 self.expression(0)
-                self.state = 151
+                self.state = 149
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             elif token in [27]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 153
+                self.state = 151
                 self.match(DeepLearningDSLParser.T__26)
-                self.state = 154
+                self.state = 152
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 155
+                self.state = 153
                 self.expression(0)
-                self.state = 156
+                self.state = 154
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             elif token in [28]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 158
+                self.state = 156
                 self.match(DeepLearningDSLParser.T__27)
-                self.state = 159
+                self.state = 157
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 160
+                self.state = 158
                 self.expression(0)
-                self.state = 161
+                self.state = 159
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 162
+                self.state = 160
                 self.expression(0)
-                self.state = 163
+                self.state = 161
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             elif token in [30]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 165
+                self.state = 163
                 self.match(DeepLearningDSLParser.T__29)
-                self.state = 166
+                self.state = 164
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 167
+                self.state = 165
                 self.expression(0)
-                self.state = 168
+                self.state = 166
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 169
+                self.state = 167
                 self.expression(0)
-                self.state = 170
+                self.state = 168
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             elif token in [31]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 172
+                self.state = 170
                 self.match(DeepLearningDSLParser.T__30)
-                self.state = 173
+                self.state = 171
                 self.match(DeepLearningDSLParser.T__20)
+                self.state = 172
+                self.expression(0)
+                self.state = 173
+                self.match(DeepLearningDSLParser.T__28)
                 self.state = 174
                 self.expression(0)
                 self.state = 175
+                self.match(DeepLearningDSLParser.T__21)
+                pass
+            elif token in [32]:
+                self.enterOuterAlt(localctx, 6)
+                self.state = 177
+                self.match(DeepLearningDSLParser.T__31)
+                self.state = 178
+                self.match(DeepLearningDSLParser.T__20)
+                self.state = 179
+                self.expression(0)
+                self.state = 180
+                self.match(DeepLearningDSLParser.T__21)
+                pass
+            elif token in [33]:
+                self.enterOuterAlt(localctx, 7)
+                self.state = 182
+                self.match(DeepLearningDSLParser.T__32)
+                self.state = 183
+                self.match(DeepLearningDSLParser.T__20)
+                self.state = 184
+                self.expression(0)
+                self.state = 185
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 176
+                self.state = 186
                 self.expression(0)
-                self.state = 177
+                self.state = 187
+                self.match(DeepLearningDSLParser.T__21)
+                pass
+            elif token in [34]:
+                self.enterOuterAlt(localctx, 8)
+                self.state = 189
+                self.match(DeepLearningDSLParser.T__33)
+                self.state = 190
+                self.match(DeepLearningDSLParser.T__20)
+                self.state = 191
+                self.expression(0)
+                self.state = 192
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             else:
@@ -1267,6 +1268,59 @@ class DeepLearningDSLParser ( Parser ):
         return localctx
 
 
+    class IdentifierContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def ID(self):
+            return self.getToken(DeepLearningDSLParser.ID, 0)
+
+        def getRuleIndex(self):
+            return DeepLearningDSLParser.RULE_identifier
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterIdentifier" ):
+                listener.enterIdentifier(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitIdentifier" ):
+                listener.exitIdentifier(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitIdentifier" ):
+                return visitor.visitIdentifier(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def identifier(self):
+
+        localctx = DeepLearningDSLParser.IdentifierContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 20, self.RULE_identifier)
+        self._la = 0 # Token type
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 196
+            _la = self._input.LA(1)
+            if not((((_la) & ~0x3f) == 0 and ((1 << _la) & 9007229319512064) != 0)):
+                self._errHandler.recoverInline(self)
+            else:
+                self._errHandler.reportMatch(self)
+                self.consume()
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class MlOperationContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -1306,56 +1360,56 @@ class DeepLearningDSLParser ( Parser ):
         localctx = DeepLearningDSLParser.MlOperationContext(self, self._ctx, self.state)
         self.enterRule(localctx, 22, self.RULE_mlOperation)
         try:
-            self.state = 204
+            self.state = 221
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [32]:
+            if token in [35]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 181
-                self.match(DeepLearningDSLParser.T__31)
-                self.state = 182
+                self.state = 198
+                self.match(DeepLearningDSLParser.T__34)
+                self.state = 199
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 183
+                self.state = 200
                 self.expression(0)
-                self.state = 184
+                self.state = 201
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 185
+                self.state = 202
                 self.expression(0)
-                self.state = 186
+                self.state = 203
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [33]:
+            elif token in [36]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 188
-                self.match(DeepLearningDSLParser.T__32)
-                self.state = 189
+                self.state = 205
+                self.match(DeepLearningDSLParser.T__35)
+                self.state = 206
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 190
+                self.state = 207
                 self.expression(0)
-                self.state = 191
+                self.state = 208
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 192
+                self.state = 209
                 self.expression(0)
-                self.state = 193
+                self.state = 210
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 194
+                self.state = 211
                 self.expression(0)
-                self.state = 195
+                self.state = 212
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [34]:
+            elif token in [37]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 197
-                self.match(DeepLearningDSLParser.T__33)
-                self.state = 198
+                self.state = 214
+                self.match(DeepLearningDSLParser.T__36)
+                self.state = 215
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 199
+                self.state = 216
                 self.expression(0)
-                self.state = 200
+                self.state = 217
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 201
+                self.state = 218
                 self.expression(0)
-                self.state = 202
+                self.state = 219
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             else:
@@ -1406,73 +1460,73 @@ class DeepLearningDSLParser ( Parser ):
         localctx = DeepLearningDSLParser.TrigFunctionContext(self, self._ctx, self.state)
         self.enterRule(localctx, 24, self.RULE_trigFunction)
         try:
-            self.state = 236
+            self.state = 253
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [35]:
+            if token in [38]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 206
-                self.match(DeepLearningDSLParser.T__34)
-                self.state = 207
+                self.state = 223
+                self.match(DeepLearningDSLParser.T__37)
+                self.state = 224
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 208
+                self.state = 225
                 self.expression(0)
-                self.state = 209
+                self.state = 226
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [36]:
+            elif token in [39]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 211
-                self.match(DeepLearningDSLParser.T__35)
-                self.state = 212
+                self.state = 228
+                self.match(DeepLearningDSLParser.T__38)
+                self.state = 229
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 213
+                self.state = 230
                 self.expression(0)
-                self.state = 214
+                self.state = 231
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [37]:
+            elif token in [40]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 216
-                self.match(DeepLearningDSLParser.T__36)
-                self.state = 217
+                self.state = 233
+                self.match(DeepLearningDSLParser.T__39)
+                self.state = 234
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 218
+                self.state = 235
                 self.expression(0)
-                self.state = 219
+                self.state = 236
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [38]:
+            elif token in [41]:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 221
-                self.match(DeepLearningDSLParser.T__37)
-                self.state = 222
+                self.state = 238
+                self.match(DeepLearningDSLParser.T__40)
+                self.state = 239
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 223
+                self.state = 240
                 self.expression(0)
-                self.state = 224
+                self.state = 241
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [39]:
+            elif token in [42]:
                 self.enterOuterAlt(localctx, 5)
-                self.state = 226
-                self.match(DeepLearningDSLParser.T__38)
-                self.state = 227
+                self.state = 243
+                self.match(DeepLearningDSLParser.T__41)
+                self.state = 244
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 228
+                self.state = 245
                 self.expression(0)
-                self.state = 229
+                self.state = 246
                 self.match(DeepLearningDSLParser.T__21)
                 pass
-            elif token in [40]:
+            elif token in [43]:
                 self.enterOuterAlt(localctx, 6)
-                self.state = 231
-                self.match(DeepLearningDSLParser.T__39)
-                self.state = 232
+                self.state = 248
+                self.match(DeepLearningDSLParser.T__42)
+                self.state = 249
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 233
+                self.state = 250
                 self.expression(0)
-                self.state = 234
+                self.state = 251
                 self.match(DeepLearningDSLParser.T__21)
                 pass
             else:
@@ -1526,54 +1580,54 @@ class DeepLearningDSLParser ( Parser ):
         localctx = DeepLearningDSLParser.PlotStatementContext(self, self._ctx, self.state)
         self.enterRule(localctx, 26, self.RULE_plotStatement)
         try:
-            self.state = 260
+            self.state = 277
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [41]:
+            if token in [44]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 238
-                self.match(DeepLearningDSLParser.T__40)
-                self.state = 239
+                self.state = 255
+                self.match(DeepLearningDSLParser.T__43)
+                self.state = 256
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 240
+                self.state = 257
                 self.expression(0)
-                self.state = 241
+                self.state = 258
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 242
+                self.state = 259
                 self.expression(0)
-                self.state = 243
+                self.state = 260
                 self.match(DeepLearningDSLParser.T__21)
-                self.state = 244
+                self.state = 261
                 self.match(DeepLearningDSLParser.T__0)
                 pass
-            elif token in [42]:
+            elif token in [45]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 246
-                self.match(DeepLearningDSLParser.T__41)
-                self.state = 247
+                self.state = 263
+                self.match(DeepLearningDSLParser.T__44)
+                self.state = 264
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 248
+                self.state = 265
                 self.expression(0)
-                self.state = 249
+                self.state = 266
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 250
+                self.state = 267
                 self.expression(0)
-                self.state = 251
+                self.state = 268
                 self.match(DeepLearningDSLParser.T__21)
-                self.state = 252
+                self.state = 269
                 self.match(DeepLearningDSLParser.T__0)
                 pass
-            elif token in [43]:
+            elif token in [46]:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 254
-                self.match(DeepLearningDSLParser.T__42)
-                self.state = 255
+                self.state = 271
+                self.match(DeepLearningDSLParser.T__45)
+                self.state = 272
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 256
+                self.state = 273
                 self.expression(0)
-                self.state = 257
+                self.state = 274
                 self.match(DeepLearningDSLParser.T__21)
-                self.state = 258
+                self.state = 275
                 self.match(DeepLearningDSLParser.T__0)
                 pass
             else:
@@ -1588,6 +1642,60 @@ class DeepLearningDSLParser ( Parser ):
         return localctx
 
 
+    class ReadOperationContext(ParserRuleContext):
+        __slots__ = 'parser'
+
+        def __init__(self, parser, parent:ParserRuleContext=None, invokingState:int=-1):
+            super().__init__(parent, invokingState)
+            self.parser = parser
+
+        def expression(self):
+            return self.getTypedRuleContext(DeepLearningDSLParser.ExpressionContext,0)
+
+
+        def getRuleIndex(self):
+            return DeepLearningDSLParser.RULE_readOperation
+
+        def enterRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "enterReadOperation" ):
+                listener.enterReadOperation(self)
+
+        def exitRule(self, listener:ParseTreeListener):
+            if hasattr( listener, "exitReadOperation" ):
+                listener.exitReadOperation(self)
+
+        def accept(self, visitor:ParseTreeVisitor):
+            if hasattr( visitor, "visitReadOperation" ):
+                return visitor.visitReadOperation(self)
+            else:
+                return visitor.visitChildren(self)
+
+
+
+
+    def readOperation(self):
+
+        localctx = DeepLearningDSLParser.ReadOperationContext(self, self._ctx, self.state)
+        self.enterRule(localctx, 28, self.RULE_readOperation)
+        try:
+            self.enterOuterAlt(localctx, 1)
+            self.state = 279
+            self.match(DeepLearningDSLParser.T__46)
+            self.state = 280
+            self.match(DeepLearningDSLParser.T__20)
+            self.state = 281
+            self.expression(0)
+            self.state = 282
+            self.match(DeepLearningDSLParser.T__21)
+        except RecognitionException as re:
+            localctx.exception = re
+            self._errHandler.reportError(self, re)
+            self._errHandler.recover(self, re)
+        finally:
+            self.exitRule()
+        return localctx
+
+
     class FileOperationContext(ParserRuleContext):
         __slots__ = 'parser'
 
@@ -1625,39 +1733,39 @@ class DeepLearningDSLParser ( Parser ):
     def fileOperation(self):
 
         localctx = DeepLearningDSLParser.FileOperationContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 28, self.RULE_fileOperation)
+        self.enterRule(localctx, 30, self.RULE_fileOperation)
         try:
-            self.state = 276
+            self.state = 298
             self._errHandler.sync(self)
             token = self._input.LA(1)
-            if token in [44]:
+            if token in [47]:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 262
-                self.match(DeepLearningDSLParser.T__43)
-                self.state = 263
+                self.state = 284
+                self.match(DeepLearningDSLParser.T__46)
+                self.state = 285
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 264
+                self.state = 286
                 self.expression(0)
-                self.state = 265
+                self.state = 287
                 self.match(DeepLearningDSLParser.T__21)
-                self.state = 266
+                self.state = 288
                 self.match(DeepLearningDSLParser.T__0)
                 pass
-            elif token in [45]:
+            elif token in [48]:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 268
-                self.match(DeepLearningDSLParser.T__44)
-                self.state = 269
+                self.state = 290
+                self.match(DeepLearningDSLParser.T__47)
+                self.state = 291
                 self.match(DeepLearningDSLParser.T__20)
-                self.state = 270
+                self.state = 292
                 self.expression(0)
-                self.state = 271
+                self.state = 293
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 272
+                self.state = 294
                 self.expression(0)
-                self.state = 273
+                self.state = 295
                 self.match(DeepLearningDSLParser.T__21)
-                self.state = 274
+                self.state = 296
                 self.match(DeepLearningDSLParser.T__0)
                 pass
             else:
@@ -1716,32 +1824,32 @@ class DeepLearningDSLParser ( Parser ):
     def literal(self):
 
         localctx = DeepLearningDSLParser.LiteralContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 30, self.RULE_literal)
+        self.enterRule(localctx, 32, self.RULE_literal)
         try:
-            self.state = 282
+            self.state = 304
             self._errHandler.sync(self)
             la_ = self._interp.adaptivePredict(self._input,17,self._ctx)
             if la_ == 1:
                 self.enterOuterAlt(localctx, 1)
-                self.state = 278
+                self.state = 300
                 self.match(DeepLearningDSLParser.NUMBER)
                 pass
 
             elif la_ == 2:
                 self.enterOuterAlt(localctx, 2)
-                self.state = 279
+                self.state = 301
                 self.match(DeepLearningDSLParser.STRING)
                 pass
 
             elif la_ == 3:
                 self.enterOuterAlt(localctx, 3)
-                self.state = 280
+                self.state = 302
                 self.matrixLiteral()
                 pass
 
             elif la_ == 4:
                 self.enterOuterAlt(localctx, 4)
-                self.state = 281
+                self.state = 303
                 self.listLiteral()
                 pass
 
@@ -1792,28 +1900,28 @@ class DeepLearningDSLParser ( Parser ):
     def matrixLiteral(self):
 
         localctx = DeepLearningDSLParser.MatrixLiteralContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 32, self.RULE_matrixLiteral)
+        self.enterRule(localctx, 34, self.RULE_matrixLiteral)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 284
-            self.match(DeepLearningDSLParser.T__45)
-            self.state = 285
+            self.state = 306
+            self.match(DeepLearningDSLParser.T__48)
+            self.state = 307
             self.listLiteral()
-            self.state = 290
+            self.state = 312
             self._errHandler.sync(self)
             _la = self._input.LA(1)
             while _la==29:
-                self.state = 286
+                self.state = 308
                 self.match(DeepLearningDSLParser.T__28)
-                self.state = 287
+                self.state = 309
                 self.listLiteral()
-                self.state = 292
+                self.state = 314
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
 
-            self.state = 293
-            self.match(DeepLearningDSLParser.T__46)
+            self.state = 315
+            self.match(DeepLearningDSLParser.T__49)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1860,34 +1968,34 @@ class DeepLearningDSLParser ( Parser ):
     def listLiteral(self):
 
         localctx = DeepLearningDSLParser.ListLiteralContext(self, self._ctx, self.state)
-        self.enterRule(localctx, 34, self.RULE_listLiteral)
+        self.enterRule(localctx, 36, self.RULE_listLiteral)
         self._la = 0 # Token type
         try:
             self.enterOuterAlt(localctx, 1)
-            self.state = 295
-            self.match(DeepLearningDSLParser.T__45)
-            self.state = 304
+            self.state = 317
+            self.match(DeepLearningDSLParser.T__48)
+            self.state = 326
             self._errHandler.sync(self)
             _la = self._input.LA(1)
-            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 8798291443580928) != 0):
-                self.state = 296
+            if (((_la) & ~0x3f) == 0 and ((1 << _la) & 70527073250181120) != 0):
+                self.state = 318
                 self.expression(0)
-                self.state = 301
+                self.state = 323
                 self._errHandler.sync(self)
                 _la = self._input.LA(1)
                 while _la==29:
-                    self.state = 297
+                    self.state = 319
                     self.match(DeepLearningDSLParser.T__28)
-                    self.state = 298
+                    self.state = 320
                     self.expression(0)
-                    self.state = 303
+                    self.state = 325
                     self._errHandler.sync(self)
                     _la = self._input.LA(1)
 
 
 
-            self.state = 306
-            self.match(DeepLearningDSLParser.T__46)
+            self.state = 328
+            self.match(DeepLearningDSLParser.T__49)
         except RecognitionException as re:
             localctx.exception = re
             self._errHandler.reportError(self, re)
@@ -1911,24 +2019,24 @@ class DeepLearningDSLParser ( Parser ):
 
     def expression_sempred(self, localctx:ExpressionContext, predIndex:int):
             if predIndex == 0:
-                return self.precpred(self._ctx, 15)
+                return self.precpred(self._ctx, 16)
          
 
             if predIndex == 1:
-                return self.precpred(self._ctx, 14)
+                return self.precpred(self._ctx, 15)
          
 
             if predIndex == 2:
-                return self.precpred(self._ctx, 13)
+                return self.precpred(self._ctx, 14)
          
 
             if predIndex == 3:
-                return self.precpred(self._ctx, 12)
+                return self.precpred(self._ctx, 13)
          
 
     def booleanExpression_sempred(self, localctx:BooleanExpressionContext, predIndex:int):
             if predIndex == 4:
-                return self.precpred(self._ctx, 1)
+                return self.precpred(self._ctx, 2)
          
 
 
@@ -54,13 +54,13 @@ class DeepLearningDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by DeepLearningDSLParser#comparator.
-    def visitComparator(self, ctx:DeepLearningDSLParser.ComparatorContext):
+    # Visit a parse tree produced by DeepLearningDSLParser#matrixOperation.
+    def visitMatrixOperation(self, ctx:DeepLearningDSLParser.MatrixOperationContext):
         return self.visitChildren(ctx)
 
 
-    # Visit a parse tree produced by DeepLearningDSLParser#matrixOperation.
-    def visitMatrixOperation(self, ctx:DeepLearningDSLParser.MatrixOperationContext):
+    # Visit a parse tree produced by DeepLearningDSLParser#identifier.
+    def visitIdentifier(self, ctx:DeepLearningDSLParser.IdentifierContext):
         return self.visitChildren(ctx)
 
 
@@ -79,6 +79,11 @@ class DeepLearningDSLVisitor(ParseTreeVisitor):
         return self.visitChildren(ctx)
 
 
+    # Visit a parse tree produced by DeepLearningDSLParser#readOperation.
+    def visitReadOperation(self, ctx:DeepLearningDSLParser.ReadOperationContext):
+        return self.visitChildren(ctx)
+
+
     # Visit a parse tree produced by DeepLearningDSLParser#fileOperation.
     def visitFileOperation(self, ctx:DeepLearningDSLParser.FileOperationContext):
         return self.visitChildren(ctx)
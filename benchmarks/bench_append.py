@@ -0,0 +1,66 @@
+"""Benchmark: series construidas con x = x + [i] dentro de un while.
+
+Genera un script que agrega un elemento por iteración hasta tener size
+elementos y lo ejecuta con cada motor con el optimizador (la lista se
+extiende en su lugar) y, para los tamaños chicos, sin él (cada suma copia la
+lista entera). Uso:
+
+    python benchmarks/bench_append.py [--size=1000000] [--max-plain=30000] [--runs=1]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLFrontend import parse_tree, build_program
+from main import DSLInterpreter, get_option
+
+def make_script(size):
+    """Script que acumula size elementos en una serie"""
+    return f"x = [];\ni = 0;\nwhile i < {size} do\n  x = x + [i];\n  i = i + 1;\ndone\n"
+
+def run(engine, optimize, tree, size):
+    """Optimiza (si corresponde) y ejecuta el árbol; retorna (segundos, serie)"""
+    interpreter = DSLInterpreter(engine=engine, use_cache=False, optimize=optimize)
+    # Sin límite de operaciones: se mide el bucle, no el presupuesto
+    interpreter.runtime.budget.configure(max_operations=None)
+    program = interpreter.optimize_program(build_program(tree))
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        interpreter.engine.execute(program)
+    return time.perf_counter() - start, interpreter.runtime.variables["x"]
+
+def best_time(engine, optimize, tree, size, runs):
+    """Mejor tiempo de varias ejecuciones, en segundos"""
+    best = None
+    for _ in range(runs):
+        elapsed, series = run(engine, optimize, tree, size)
+        if series != [float(i) for i in range(size)]:
+            print(f"❌ El motor {engine} construyó otra serie")
+            sys.exit(1)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    """Compara cada motor con y sin el optimizador para series de largo creciente"""
+    size = int(get_option("size", "1000000"))
+    max_plain = int(get_option("max-plain", "30000"))
+    runs = int(get_option("runs", "1"))
+    
+    print(f"📂 Serie de hasta {size} elementos con x = x + [i] (mejor de {runs})")
+    print("-" * 60)
+    print(f"{'elementos':>10}  {'motor':<10}{'sin optimizar':>16}{'optimizado':>16}")
+    for length in (size // 100, size // 10, size):
+        tree, _ = parse_tree(make_script(length))
+        for engine in ("ast", "closure", "vm", "python"):
+            optimized = best_time(engine, True, tree, length, runs)
+            plain = f"{best_time(engine, False, tree, length, runs):>13.2f} s" if length <= max_plain else f"{'-':>15}"
+            print(f"{length:>10}  {engine:<10}{plain}{optimized:>14.2f} s")
+    print("-" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark: backends de las operaciones de matrices.
+
+Mide matmul, transpose y matsum sobre matrices aleatorias de n x n con el
+backend python y, si NumPy está instalado, con el backend numpy, y verifica
+que los resultados coincidan: transpuesta y suma exactamente, el producto
+dentro de una tolerancia relativa (BLAS suma en otro orden). Uso:
+
+    python benchmarks/bench_backends.py [--sizes=100,200,500] [--tol=1e-12]
+"""
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLRuntime import DSLRuntime
+from DSLVector import DSLMatrix, DSLVector
+from main import get_option
+
+def best_time(function, runs=3):
+    """Mejor tiempo de varias ejecuciones, en segundos, y el último resultado"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def random_matrix(rng, n):
+    """Matriz n x n de números entre -1 y 1"""
+    return DSLMatrix(DSLVector(rng.uniform(-1, 1) for _ in range(n * n)), n, n)
+
+def max_relative_difference(expected, actual):
+    """Mayor diferencia entre dos matrices, relativa al mayor valor absoluto"""
+    scale = max(map(abs, expected.data), default=0.0) or 1.0
+    return max((abs(a - b) for a, b in zip(expected.data, actual.data)), default=0.0) / scale
+
+def main():
+    """Compara los tiempos de cada operación y backend; retorna False si los
+    resultados no coinciden"""
+    sizes = [int(size) for size in get_option("sizes", "100,200,500").split(",")]
+    tolerance = float(get_option("tol", "1e-12"))
+    rng = random.Random(0)
+    backends = ["python"]
+    runtime = DSLRuntime()
+    try:
+        runtime.set_backend("numpy")
+        backends.append("numpy")
+    except ValueError as e:
+        print(f"⚠️  {e}: solo se mide el backend python")
+
+    operations = [("matmul", runtime._matrix_multiply, True),
+                  ("transpose", runtime._transpose, False),
+                  ("matsum", runtime._matrix_add, True)]
+    ok = True
+    print(f"{'operación':<22}" + "".join(f"{name:>12}" for name in backends) + f"{'aceleración':>13}{'dif. relativa':>15}")
+    print("-" * (50 + 12 * len(backends)))
+    for n in sizes:
+        a, b = random_matrix(rng, n), random_matrix(rng, n)
+        for label, operation, binary in operations:
+            args = (a, b) if binary else (a,)
+            # El producto en Python puro tarda segundos con n grande: una vez
+            runs = 1 if label == "matmul" and n >= 300 else 3
+            times, results = [], []
+            for name in backends:
+                runtime.set_backend(name)
+                elapsed, result = best_time(lambda: operation(*args), runs if name == "python" else 3)
+                times.append(elapsed)
+                results.append(result)
+            line = f"{label + f' {n}x{n}':<22}" + "".join(f"{elapsed:>10.4f} s" for elapsed in times)
+            if len(backends) > 1:
+                difference = max_relative_difference(results[0], results[1])
+                # Transpuesta y suma no reordenan operaciones: deben ser iguales
+                limit = tolerance if label == "matmul" else 0.0
+                mark = "✅" if difference <= limit else "❌"
+                ok = ok and difference <= limit
+                line += f"{times[0] / times[1]:>12.1f}x{difference:>13.1e} {mark}"
+            print(line)
+    print("-" * (50 + 12 * len(backends)))
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -0,0 +1,132 @@
+"""Benchmark de regresión: tiempo de arranque en frío de main.py.
+
+Mide en procesos nuevos el arranque de Python solo (referencia), main.py con
+un script vacío, con un artefacto .dslc, con un script de una línea, con un
+script pequeño (un while contado corto, como el de ejemplos.dsl) y su .dslc,
+y el REPL que termina en seguida. Falla (código de salida 1) si el script
+vacío o el pequeño superan su presupuesto por encima de la referencia, si el
+script vacío, los .dslc o el REPL importan antlr4, o si algún caso importa
+numpy. Uso:
+
+    python benchmarks/bench_cold_start.py [--runs=21] [--budget-ms=25] [--small-budget-ms=60]
+"""
+import os
+import sys
+import time
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import get_option
+
+MAIN = os.path.join(ROOT, "main.py")
+# Presupuesto por defecto para el script vacío, por encima de `python -c pass`
+DEFAULT_BUDGET_MS = 25.0
+# Presupuesto por defecto para el script pequeño (incluye parsear con ANTLR)
+DEFAULT_SMALL_BUDGET_MS = 60.0
+# Script pequeño: bucles cortos como este no deben importar NumPy
+SMALL_SCRIPT = """x = [];
+seno = [];
+i = 0;
+while i < 20 do
+  rad = (i * 3.14159) / 180;
+  s = sin(rad);
+  x = x + [i];
+  seno = seno + [s * 10 + 10];
+  i = i + 1;
+done
+total = i * 2 + 1;
+"""
+
+def run(command):
+    """Ejecuta un proceso nuevo y retorna su duración en segundos"""
+    start = time.perf_counter()
+    subprocess.run(command, cwd=ROOT, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                   stderr=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - start
+
+def imported_packages(command):
+    """Paquetes de nivel superior que importa el proceso"""
+    stderr = subprocess.run([sys.executable, "-X", "importtime"] + command[1:], cwd=ROOT,
+                            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True, check=True).stderr
+    return {line.split("|")[-1].strip().split(".")[0] for line in stderr.splitlines()
+            if line.startswith("import time:")}
+
+def main():
+    """Mide cada caso y verifica el presupuesto"""
+    runs = int(get_option("runs", "21"))
+    budget_ms = float(get_option("budget-ms", DEFAULT_BUDGET_MS))
+    small_budget_ms = float(get_option("small-budget-ms", DEFAULT_SMALL_BUDGET_MS))
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        empty = os.path.join(work_dir, "vacio.dsl")
+        tiny = os.path.join(work_dir, "linea.dsl")
+        artifact = os.path.join(work_dir, "linea.dslc")
+        small = os.path.join(work_dir, "pequeno.dsl")
+        small_artifact = os.path.join(work_dir, "pequeno.dslc")
+        with open(empty, 'w', encoding='utf-8'):
+            pass
+        with open(tiny, 'w', encoding='utf-8') as f:
+            f.write("x = 1;\n")
+        with open(small, 'w', encoding='utf-8') as f:
+            f.write(SMALL_SCRIPT)
+        for source, target in ((tiny, artifact), (small, small_artifact)):
+            subprocess.run([sys.executable, MAIN, source, "--compile", "-o", target], cwd=ROOT,
+                           stdout=subprocess.DEVNULL, check=True)
+        
+        # (nombre, comando, no debe importar antlr4)
+        cases = [
+            ("python -c pass", [sys.executable, "-c", "pass"], False),
+            ("script vacío", [sys.executable, MAIN, empty], True),
+            ("artefacto .dslc", [sys.executable, MAIN, artifact], True),
+            ("REPL (sale al leer EOF)", [sys.executable, MAIN], True),
+            ("script de una línea", [sys.executable, MAIN, tiny, "--no-cache"], False),
+            ("script pequeño", [sys.executable, MAIN, small, "--no-cache"], False),
+            ("artefacto .dslc pequeño", [sys.executable, MAIN, small_artifact], True),
+        ]
+        
+        samples = {name: [] for name, _, _ in cases}
+        for _ in range(runs):
+            # Intercalar los casos para que el ruido de la máquina los afecte por igual
+            for name, command, _ in cases:
+                samples[name].append(run(command))
+        
+        failures = []
+        for name, command, antlr_free in cases:
+            packages = imported_packages(command)
+            if antlr_free and "antlr4" in packages:
+                failures.append(f"{name}: importa antlr4")
+            if "numpy" in packages:
+                failures.append(f"{name}: importa numpy")
+    
+    baseline = statistics.median(samples["python -c pass"]) * 1000
+    print(f"⏱️  Arranque en frío ({runs} procesos por caso, medianas)")
+    print("-" * 64)
+    print(f"{'caso':<28}{'tiempo':>12}{'sobre python':>16}")
+    for name, _, _ in cases:
+        median = statistics.median(samples[name]) * 1000
+        print(f"{name:<28}{median:>9.1f} ms{median - baseline:>13.1f} ms")
+    print("-" * 64)
+    
+    empty_overhead = statistics.median(samples["script vacío"]) * 1000 - baseline
+    if empty_overhead > budget_ms:
+        failures.append(f"script vacío: {empty_overhead:.1f} ms sobre python (presupuesto {budget_ms:.1f} ms)")
+    small_overhead = statistics.median(samples["script pequeño"]) * 1000 - baseline
+    if small_overhead > small_budget_ms:
+        failures.append(f"script pequeño: {small_overhead:.1f} ms sobre python "
+                        f"(presupuesto {small_budget_ms:.1f} ms)")
+    
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print(f"✅ Script vacío dentro del presupuesto ({empty_overhead:.1f} ms ≤ {budget_ms:.1f} ms)")
+    print(f"✅ Script pequeño dentro del presupuesto ({small_overhead:.1f} ms ≤ {small_budget_ms:.1f} ms)")
+    print("✅ Ningún caso importa numpy")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: caché de factorizaciones LU.
+
+Ejecuta un script con un while que resuelve iterations sistemas contra la
+misma matriz A de n x n, cada uno con la solución del anterior (iteración
+inversa: el lado derecho cambia, así que solve no es un invariante del
+bucle), con la caché de factorizaciones y sin ella (max_bytes=0), con cada
+backend. Verifica que las variables finales sean iguales en los dos casos.
+Uso:
+
+    python benchmarks/bench_factorizations.py [--sizes=50,100,200] [--iterations=20]
+"""
+import io
+import os
+import sys
+import time
+import random
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import DSLInterpreter, get_option
+from DSLVector import DSLMatrix, DSLVector
+
+SCRIPT = """
+i = 0;
+while i < {iterations} do
+  x = solve(A, x);
+  i = i + 1;
+done
+"""
+
+def run(backend, cached, matrix, vector, iterations):
+    """Ejecuta el script; retorna (segundos, variables, factorizaciones calculadas)"""
+    interpreter = DSLInterpreter(engine="closure", use_cache=False)
+    runtime = interpreter.runtime
+    runtime.set_backend(backend)
+    if not cached:
+        runtime._factorization_cache().max_bytes = 0
+    runtime.variables["A"] = matrix
+    runtime.variables["x"] = vector
+    code = SCRIPT.format(iterations=iterations)
+    with redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        interpreter.execute_code(code)
+        elapsed = time.perf_counter() - start
+    return elapsed, dict(runtime.variables), runtime.factorizations.misses
+
+def main():
+    """Compara los tiempos con y sin caché; retorna False si los resultados difieren"""
+    sizes = [int(size) for size in get_option("sizes", "50,100,200").split(",")]
+    iterations = int(get_option("iterations", "20"))
+    rng = random.Random(0)
+    backends = ["python"]
+    try:
+        DSLInterpreter(engine="closure", use_cache=False).runtime.set_backend("numpy")
+        backends.append("numpy")
+    except ValueError as e:
+        print(f"⚠️  {e}: solo se mide el backend python")
+    
+    ok = True
+    print(f"📂 {iterations} vueltas de x = solve(A, x) con la misma matriz A")
+    print(f"{'backend':<10}{'tamaño':<10}{'sin caché':>12}{'con caché':>12}{'mejora':>9}{'fallos de caché':>17}")
+    print("-" * 70)
+    for n in sizes:
+        data = DSLVector(rng.uniform(-1, 1) / n for _ in range(n * n))
+        for i in range(n):
+            data[i * (n + 1)] += 1.0
+        matrix = DSLMatrix(data, n, n)
+        vector = DSLVector(rng.uniform(-1, 1) for _ in range(n))
+        for backend in backends:
+            plain_time, plain, plain_count = run(backend, False, matrix, vector, iterations)
+            cached_time, cached, cached_count = run(backend, True, matrix, vector, iterations)
+            same = plain == cached
+            ok = ok and same
+            print(f"{backend:<10}{f'{n}x{n}':<10}{plain_time:>10.3f} s{cached_time:>10.3f} s"
+                  f"{plain_time / cached_time:>8.1f}x{f'{plain_count} -> {cached_count}':>17} {'✅' if same else '❌'}")
+    print("-" * 70)
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
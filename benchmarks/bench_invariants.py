@@ -0,0 +1,77 @@
+"""Benchmark: expresiones invariantes dentro de un while.
+
+Genera un script que en cada iteración suma al acumulado el producto
+matmul(W, transpose(X)) de dos matrices size x size que el bucle no
+modifica, y lo ejecuta con cada motor con y sin el optimizador. Uso:
+
+    python benchmarks/bench_invariants.py [--size=30] [--loops=50] [--runs=3]
+"""
+import io
+import os
+import sys
+import time
+import random
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLFrontend import parse_tree, build_program
+from main import DSLInterpreter, get_option
+
+def make_matrix(size, rng):
+    """Literal de una matriz size x size con números aleatorios"""
+    return "[" + ", ".join("[" + ", ".join(f"{rng.uniform(-1, 1):.4f}" for _ in range(size)) + "]"
+                           for _ in range(size)) + "]"
+
+def make_script(size, loops, seed=0):
+    """Script con matmul(W, transpose(X)) invariante dentro de un while"""
+    rng = random.Random(seed)
+    # W y X se reasignan para que el optimizador no los pliegue al compilar
+    return (f"W = {make_matrix(size, rng)};\nW = matsum(W, W);\n"
+            f"X = {make_matrix(size, rng)};\nX = matsub(X, W);\n"
+            f"acc = matsub(W, W);\ni = 0;\n"
+            f"while i < {loops} do\n"
+            f"  acc = matsum(acc, matmul(W, transpose(X)));\n"
+            f"  i = i + 1;\n"
+            f"done\n")
+
+def best_time(function, runs):
+    """Mejor tiempo de varias ejecuciones, en segundos"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def run(engine, optimize, tree):
+    """Optimiza (si corresponde) y ejecuta el árbol con un intérprete nuevo"""
+    interpreter = DSLInterpreter(engine=engine, use_cache=False, optimize=optimize)
+    with redirect_stdout(io.StringIO()):
+        interpreter.engine.execute(interpreter.optimize_program(build_program(tree)))
+    return interpreter.runtime.variables["acc"]
+
+def main():
+    """Compara cada motor con y sin el optimizador"""
+    size = int(get_option("size", "30"))
+    loops = int(get_option("loops", "50"))
+    runs = int(get_option("runs", "3"))
+    # El parseo es igual con y sin optimizador: se hace una sola vez
+    tree, _ = parse_tree(make_script(size, loops))
+    
+    print(f"📂 matmul {size}x{size} invariante dentro de un while de {loops} iteraciones (mejor de {runs})")
+    print("-" * 60)
+    print(f"{'motor':<10}{'sin optimizar':>16}{'optimizado':>16}{'mejora':>10}")
+    for engine in ("ast", "closure", "vm", "python"):
+        if run(engine, False, tree) != run(engine, True, tree):
+            print(f"❌ El motor {engine} da otro resultado con el optimizador")
+            sys.exit(1)
+        plain = best_time(lambda: run(engine, False, tree), runs)
+        optimized = best_time(lambda: run(engine, True, tree), runs)
+        print(f"{engine:<10}{plain * 1000:>13.1f} ms{optimized * 1000:>13.1f} ms{plain / optimized:>9.1f}x")
+    print("-" * 60)
+
+if __name__ == "__main__":
+    main()
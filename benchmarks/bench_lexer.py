@@ -0,0 +1,68 @@
+"""Benchmark: DSLFastLexer vs el lexer generado por ANTLR.
+
+Genera un script con un matrixLiteral grande (el caso de los scripts con
+datos en línea) y mide cuánto tarda cada lexer en producir todos los tokens,
+y el parseo completo con cada uno. Uso:
+
+    python benchmarks/bench_lexer.py [--rows=500] [--cols=20] [--runs=3]
+"""
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLFrontend import create_lexer, parse_tree
+from main import get_option
+
+def make_script(rows, cols, seed=0):
+    """Script con una matriz de rows x cols números y un poco de código"""
+    rng = random.Random(seed)
+    matrix = ",\n  ".join("[" + ", ".join(f"{rng.uniform(-100, 100):.4f}" for _ in range(cols)) + "]"
+                          for _ in range(rows))
+    return f"// datos en línea\ndatos = [\n  {matrix}\n];\nt = transpose(datos);\n"
+
+def best_time(function, runs):
+    """Mejor tiempo de varias ejecuciones, en segundos"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def lex_all(code, lexer):
+    """Produce todos los tokens del código; retorna cuántos hubo"""
+    source = create_lexer(code, lexer)
+    count = 0
+    while source.nextToken().type != -1:
+        count += 1
+    return count
+
+def main():
+    """Mide lexing y parseo completo con ambos lexers"""
+    rows = int(get_option("rows", "500"))
+    cols = int(get_option("cols", "20"))
+    runs = int(get_option("runs", "3"))
+    code = make_script(rows, cols)
+    tokens = lex_all(code, "fast")
+    
+    print(f"📂 Script sintético: matriz {rows}x{cols}, {len(code) / 1024:.0f} KiB, {tokens} tokens (mejor de {runs})")
+    print("-" * 60)
+    print(f"{'lexer':<10}{'solo lexing':>16}{'parseo completo':>20}")
+    results = {}
+    for lexer in ("antlr", "fast"):
+        lex_time = best_time(lambda: lex_all(code, lexer), runs)
+        parse_time = best_time(lambda: parse_tree(code, "auto", lexer), runs)
+        results[lexer] = (lex_time, parse_time)
+        print(f"{lexer:<10}{lex_time * 1000:>13.1f} ms{parse_time * 1000:>17.1f} ms")
+    print("-" * 60)
+    antlr_lex, antlr_parse = results["antlr"]
+    fast_lex, fast_parse = results["fast"]
+    print(f"Lexing {antlr_lex / fast_lex:.1f}x más rápido; parseo completo {antlr_parse / fast_parse:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark: det, solve e inverse (LU con pivoteo parcial) según el tamaño.
+
+Para cada n de la grilla genera una matriz n x n aleatoria cercana a la
+identidad y un vector b, y mide det, solve(A, b) e
+inverse(A) con el backend python y, si NumPy está instalado, con numpy.
+Verifica el residuo relativo |A x - b| / |b| de cada solve y que los dos
+backends coincidan dentro de la tolerancia. El backend python se mide hasta
+--max-python (su costo crece como n^3). Uso:
+
+    python benchmarks/bench_linalg.py [--sizes=2,10,50,100,200,500,1000] [--max-python=500] [--tol=1e-9]
+"""
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLRuntime import DSLRuntime
+from DSLVector import DSLMatrix, DSLVector
+from main import get_option
+
+def timed(function):
+    """(segundos, resultado) de una ejecución"""
+    start = time.perf_counter()
+    result = function()
+    return time.perf_counter() - start, result
+
+def random_system(rng, n):
+    """Identidad más ruido de hasta 1/n (bien condicionada y con el
+    determinante lejos de desbordarse) y un vector de n números"""
+    data = DSLVector(rng.uniform(-1, 1) / n for _ in range(n * n))
+    for i in range(n):
+        data[i * (n + 1)] += 1.0
+    return DSLMatrix(data, n, n), DSLVector(rng.uniform(-1, 1) for _ in range(n))
+
+def residual(runtime, matrix, x, b):
+    """|A x - b| / |b| en norma infinito"""
+    product = runtime._matrix_multiply(matrix, DSLMatrix(DSLVector(x), len(x), 1)).data
+    return max(abs(p - v) for p, v in zip(product, b)) / max(map(abs, b))
+
+def relative_difference(left, right):
+    """Mayor diferencia entre dos secuencias de números, relativa al mayor
+    valor absoluto de la primera"""
+    scale = max(map(abs, left), default=0.0) or 1.0
+    return max((abs(a - b) for a, b in zip(left, right)), default=0.0) / scale
+
+def main():
+    """Imprime la tabla de tiempos; retorna False si un residuo o la
+    diferencia entre backends supera la tolerancia"""
+    sizes = [int(size) for size in get_option("sizes", "2,10,50,100,200,500,1000").split(",")]
+    max_python = int(get_option("max-python", "500"))
+    tolerance = float(get_option("tol", "1e-9"))
+    rng = random.Random(0)
+    runtimes = {}
+    for name in ("python", "numpy"):
+        runtime = DSLRuntime()
+        try:
+            runtime.set_backend(name)
+        except ValueError as e:
+            print(f"⚠️  {e}: solo se mide el backend python")
+            continue
+        runtimes[name] = runtime
+    
+    operations = [("det", lambda rt, a, b: rt._determinant(a)),
+                  ("solve", lambda rt, a, b: rt._solve(a, b)),
+                  ("inverse", lambda rt, a, b: rt._inverse(a))]
+    ok = True
+    print(f"{'operación':<18}" + "".join(f"{name:>12}" for name in runtimes) + f"{'residuo':>12}{'dif. relativa':>15}")
+    print("-" * (45 + 12 * len(runtimes)))
+    for n in sizes:
+        matrix, b = random_system(rng, n)
+        for label, operation in operations:
+            times, results = [], {}
+            for name, runtime in runtimes.items():
+                if name == "python" and n > max_python:
+                    times.append(None)
+                    continue
+                elapsed, results[name] = timed(lambda: operation(runtime, matrix, b))
+                times.append(elapsed)
+            line = f"{f'{label} {n}x{n}':<18}" + "".join(" " * 12 if elapsed is None else f"{elapsed:>10.4f} s"
+                                                         for elapsed in times)
+            checks = []
+            if label == "solve":
+                worst = max(residual(runtimes["python"], matrix, x, b) for x in results.values())
+                checks.append(worst)
+                line += f"{worst:>12.1e}"
+            else:
+                line += " " * 12
+            if len(results) == 2:
+                left, right = results["python"], results["numpy"]
+                if label == "det":
+                    difference = abs(left - right) / (abs(left) or 1.0)
+                else:
+                    difference = relative_difference(getattr(left, "data", left), getattr(right, "data", right))
+                checks.append(difference)
+                line += f"{difference:>15.1e}"
+            passed = all(check <= tolerance for check in checks)
+            ok = ok and passed
+            print(line + (" ✅" if passed else " ❌"))
+    print("-" * (45 + 12 * len(runtimes)))
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
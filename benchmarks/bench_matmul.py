@@ -0,0 +1,84 @@
+"""Benchmark: productos de matrices en Python puro.
+
+Para cada tamaño de la grilla multiplica dos matrices aleatorias con el
+triple bucle sobre listas anidadas (la implementación anterior de matmul),
+con multiply_lists (listas sin empaquetar), con PythonBackend (DSLMatrix)
+y, si está instalado, con NumPy. Los productos en Python puro deben dar los
+mismos bits que el triple bucle. Uso:
+
+    python benchmarks/bench_matmul.py [--sizes=32x32x32,64x64x64,128x128x128,256x256x256]
+
+Cada tamaño es filas x internas x columnas (n solo equivale a nxnxn).
+"""
+import os
+import sys
+import time
+import random
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLBackend import PythonBackend, load_backend, multiply_lists
+from DSLVector import DSLMatrix
+from main import get_option
+
+def best_time(function, runs):
+    """Mejor tiempo de varias ejecuciones, en segundos, y el último resultado"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def naive_multiply(m1, m2):
+    """El triple bucle i-j-k que usaba matmul antes"""
+    rows1, cols1, cols2 = len(m1), len(m1[0]), len(m2[0])
+    result = [[0] * cols2 for _ in range(rows1)]
+    for i in range(rows1):
+        for j in range(cols2):
+            for k in range(cols1):
+                result[i][j] += m1[i][k] * m2[k][j]
+    return result
+
+def parse_size(text):
+    """'n' o 'filasxinternasxcolumnas'"""
+    parts = [int(part) for part in text.split("x")]
+    return tuple(parts * 3) if len(parts) == 1 else tuple(parts)
+
+def main():
+    """Imprime la grilla de tiempos; retorna False si algún producto en
+    Python puro no da los mismos bits que el triple bucle"""
+    sizes = [parse_size(size) for size in get_option("sizes", "32,64,128,256").split(",")]
+    rng = random.Random(0)
+    packed = PythonBackend()
+    numpy_backend = load_backend("auto")
+    if numpy_backend.name != "numpy":
+        numpy_backend = None
+    
+    names = ["triple bucle", "listas", "empaquetado"] + (["numpy"] if numpy_backend else [])
+    ok = True
+    print(f"{'tamaño':<16}" + "".join(f"{name:>15}" for name in names) + f"{'aceleración':>13}")
+    print("-" * (30 + 15 * len(names)))
+    for rows, inner, cols in sizes:
+        left = [[rng.uniform(-1, 1) for _ in range(inner)] for _ in range(rows)]
+        right = [[rng.uniform(-1, 1) for _ in range(cols)] for _ in range(inner)]
+        left_packed, right_packed = DSLMatrix.from_rows(left), DSLMatrix.from_rows(right)
+        runs = 1 if rows * inner * cols > 10**6 else 3
+        
+        naive_time, expected = best_time(lambda: naive_multiply(left, right), runs)
+        lists_time, lists_result = best_time(lambda: multiply_lists(left, right), runs)
+        packed_time, packed_result = best_time(lambda: packed.multiply(left_packed, right_packed), runs)
+        times = [naive_time, lists_time, packed_time]
+        if numpy_backend:
+            times.append(best_time(lambda: numpy_backend.multiply(left_packed, right_packed), 3)[0])
+        same = lists_result == expected and packed_result == expected
+        ok = ok and same
+        print(f"{f'{rows}x{inner}x{cols}':<16}" + "".join(f"{elapsed:>13.4f} s" for elapsed in times)
+              + f"{naive_time / packed_time:>12.1f}x {'✅' if same else '❌'}")
+    print("-" * (30 + 15 * len(names)))
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
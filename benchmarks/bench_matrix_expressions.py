@@ -0,0 +1,93 @@
+"""Benchmark: expresiones de matrices fusionadas (ast.MatrixExpression).
+
+Para cada expresión calcula el mismo grafo operación por operación (como
+antes: cada transpose y cada matmul crean una matriz intermedia) y fusionado
+(DSLMatrixGraph.evaluate), con el backend python y, si NumPy está instalado,
+con numpy. Mide el tiempo y la memoria máxima que se reservó durante el
+cálculo (tracemalloc, sin contar las matrices de entrada) y verifica que los
+resultados coincidan: los mismos bits si el producto no se reasoció, dentro
+de --tol si sí. Uso:
+
+    python benchmarks/bench_matrix_expressions.py [--n=200] [--tol=1e-12]
+"""
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLRuntime import DSLRuntime
+from DSLMatrixGraph import evaluate, _evaluate_stepwise
+from DSLVector import DSLMatrix, DSLVector
+from main import get_option
+
+def random_matrix(rng, rows, cols):
+    """Matriz rows x cols de números entre -1 y 1"""
+    return DSLMatrix(DSLVector(rng.uniform(-1, 1) for _ in range(rows * cols)), rows, cols)
+
+def measure(function):
+    """(segundos, bytes máximos reservados, resultado) de una ejecución"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def expressions(rng, n):
+    """(nombre, ops, valores, se reasocia) de cada expresión medida"""
+    a, b, c = random_matrix(rng, n, n), random_matrix(rng, n, n), random_matrix(rng, n, n)
+    x = DSLVector(rng.uniform(-1, 1) for _ in range(n))
+    return [
+        ("matmul(A^T, B)", ['$', 'transpose', '$', 'matmul'], [a, b], False),
+        ("matmul(A, B^T)", ['$', '$', 'transpose', 'matmul'], [a, b], False),
+        ("A B + C", ['$', '$', 'matmul', '$', 'matsum'], [a, b, c], False),
+        ("C - A^T B", ['$', '$', 'transpose', '$', 'matmul', 'matsub'], [c, a, b], False),
+        ("(A B)^T", ['$', '$', 'matmul', 'transpose'], [a, b], False),
+        ("(A B) x", ['$', '$', 'matmul', '$', 'matmul'], [a, b, x], True),
+        ("(A B) C x", ['$', '$', 'matmul', '$', 'matmul', '$', 'matmul'], [a, b, c, x], True),
+    ]
+
+def main():
+    """Imprime la tabla de tiempos y memoria; retorna False si algún
+    resultado fusionado no coincide con el calculado por pasos"""
+    n = int(get_option("n", "200"))
+    tolerance = float(get_option("tol", "1e-12"))
+    rng = random.Random(0)
+    backends = ["python"]
+    try:
+        DSLRuntime().set_backend("numpy")
+        backends.append("numpy")
+    except ValueError as e:
+        print(f"⚠️  {e}: solo se mide el backend python")
+    
+    ok = True
+    print(f"Matrices de {n}x{n}")
+    print(f"{'expresión':<26}{'por pasos':>20}{'fusionada':>20}{'aceleración':>13}{'memoria':>10}")
+    print("-" * 92)
+    for backend in backends:
+        runtime = DSLRuntime()
+        runtime.set_backend(backend)
+        for label, ops, values, reassociated in expressions(rng, n):
+            step_time, step_peak, expected = measure(lambda: _evaluate_stepwise(runtime, ops, values))
+            fused_time, fused_peak, result = measure(lambda: evaluate(runtime, ops, values))
+            if reassociated or backend != "python":
+                scale = max(map(abs, expected.data), default=0.0) or 1.0
+                same = max(abs(p - q) for p, q in zip(expected.data, result.data)) / scale <= tolerance
+            else:
+                same = expected.data == result.data
+            same = same and (expected.rows, expected.cols) == (result.rows, result.cols)
+            ok = ok and same
+            print(f"{f'{label} [{backend}]':<26}"
+                  f"{step_time:>9.4f} s{step_peak / 2**20:>7.1f} MiB"
+                  f"{fused_time:>9.4f} s{fused_peak / 2**20:>7.1f} MiB"
+                  f"{step_time / fused_time:>12.1f}x{step_peak / max(fused_peak, 1):>9.1f}x {'✅' if same else '❌'}")
+    print("-" * 92)
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
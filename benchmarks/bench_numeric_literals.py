@@ -0,0 +1,69 @@
+"""Benchmark: literales numéricos grandes (datos en línea).
+
+Genera un script con una matriz rows x cols de números que se evalúa dentro
+de un while, y mide por separado la reducción del árbol de ANTLR al AST y la
+ejecución con cada motor. Uso:
+
+    python benchmarks/bench_numeric_literals.py [--rows=500] [--cols=200] [--loops=20] [--runs=3]
+"""
+import io
+import os
+import sys
+import time
+import random
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLFrontend import parse_tree, build_program
+from main import DSLInterpreter, get_option
+
+def make_script(rows, cols, loops, seed=0):
+    """Script que evalúa una matriz literal de rows x cols en cada iteración"""
+    rng = random.Random(seed)
+    matrix = ",\n    ".join("[" + ", ".join(f"{rng.uniform(-100, 100):.4f}" for _ in range(cols)) + "]"
+                            for _ in range(rows))
+    return f"i = 0;\nwhile i < {loops} do\n  datos = [\n    {matrix}\n  ];\n  i = i + 1;\ndone\n"
+
+def best_time(function, runs):
+    """Mejor tiempo de varias ejecuciones, en segundos"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def main():
+    """Mide la reducción al AST y la ejecución con cada motor"""
+    rows = int(get_option("rows", "500"))
+    cols = int(get_option("cols", "200"))
+    loops = int(get_option("loops", "20"))
+    runs = int(get_option("runs", "3"))
+    code = make_script(rows, cols, loops)
+    tree, _ = parse_tree(code)
+    
+    print(f"📂 Matriz literal {rows}x{cols} ({rows * cols} números) evaluada {loops} veces (mejor de {runs})")
+    print("-" * 60)
+    lower_time = best_time(lambda: build_program(tree), runs)
+    print(f"{'reducción al AST':<24}{lower_time * 1000:>12.1f} ms")
+    for engine in ("visitor", "ast", "closure", "vm", "python"):
+        samples = []
+        for _ in range(runs):
+            # AST nuevo en cada corrida: la materialización de las constantes se mide
+            program = build_program(tree)
+            interpreter = DSLInterpreter(engine=engine, use_cache=False)
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                if engine == "visitor":
+                    interpreter.runtime.visit(tree)
+                else:
+                    interpreter.engine.execute(program)
+            samples.append(time.perf_counter() - start)
+        print(f"{'motor ' + engine:<24}{min(samples) * 1000:>12.1f} ms")
+    print("-" * 60)
+
+if __name__ == "__main__":
+    main()
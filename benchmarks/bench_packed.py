@@ -0,0 +1,86 @@
+"""Benchmark: memoria de los datos numéricos empaquetados.
+
+Escribe un CSV de rows x cols números, lo lee con readFile (una DSLMatrix) y
+compara la memoria que ocupa con la de la misma tabla como listas de filas
+de floats, que es como se guardaba antes. También mide una serie de rows
+números como DSLVector y como lista, y el tiempo de matsum sobre la tabla
+en ambas formas. Uso:
+
+    python benchmarks/bench_packed.py [--rows=1000000] [--cols=3]
+"""
+import io
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLRuntime import DSLRuntime
+from DSLVector import DSLVector
+from main import get_option
+
+def measure(build):
+    """Construye un valor; retorna (valor, bytes que sigue ocupando)"""
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, size
+
+def best_time(function, runs=3):
+    """Mejor tiempo de varias ejecuciones, en segundos"""
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def as_lists(matrix):
+    """La tabla como listas de filas de floats"""
+    return [row.tolist() for row in matrix]
+
+def report(label, packed_size, list_size):
+    """Imprime una fila de la comparación de memoria"""
+    print(f"{label:<26}{packed_size / 2**20:>11.1f} MiB{list_size / 2**20:>11.1f} MiB{list_size / packed_size:>9.1f}x")
+
+def main():
+    """Compara la memoria y el tiempo de los datos empaquetados y las listas"""
+    rows = int(get_option("rows", "1000000"))
+    cols = int(get_option("cols", "3"))
+    rng = random.Random(0)
+    runtime = DSLRuntime()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "datos.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            for _ in range(rows):
+                f.write(",".join(f"{rng.uniform(-100, 100):.4f}" for _ in range(cols)) + "\n")
+        with redirect_stdout(io.StringIO()):
+            matrix, matrix_size = measure(lambda: runtime._read_file(path))
+            read_time = best_time(lambda: runtime._read_file(path), 1)
+    lists, lists_size = measure(lambda: as_lists(matrix))
+    values = [rng.uniform(-100, 100) for _ in range(rows)]
+    _, vector_size = measure(lambda: DSLVector(values))
+    # Floats nuevos, como los de una lista construida elemento a elemento
+    _, series_size = measure(lambda: list(map(float, map(str, values))))
+    
+    print(f"📂 CSV de {rows}x{cols} números leído en {read_time:.2f} s")
+    print("-" * 60)
+    print(f"{'':<26}{'empaquetado':>15}{'listas':>15}{'ahorro':>10}")
+    report(f"tabla {rows}x{cols}", matrix_size, lists_size)
+    report(f"serie de {rows}", vector_size, series_size)
+    
+    packed_time = best_time(lambda: runtime._matrix_add(matrix, matrix))
+    list_time = best_time(lambda: runtime._matrix_add(lists, lists))
+    print(f"{'matsum de la tabla':<26}{packed_time:>13.2f} s{list_time:>13.2f} s{list_time / packed_time:>9.1f}x")
+    print("-" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark: latencia del primer parseo con el parser en frío y con la caché
+de DFA cargada (generada con `main.py --warm-parser`).
+
+Cada medición corre en un proceso nuevo, que es lo que le pasa a cada job del
+planificador. Uso:
+
+    python benchmarks/bench_parser_cache.py [script.dsl] [--corpus=paridad] [--runs=15]
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import get_option
+
+
+# Código que ejecuta cada proceso hijo: carga opcional de la caché y un parseo
+CHILD = """
+import sys, time, json
+start = time.perf_counter()
+from DSLFrontend import parse_tree, load_dfa_cache
+imported = time.perf_counter()
+loaded = load_dfa_cache() if sys.argv[1] == 'warm' else False
+ready = time.perf_counter()
+with open(sys.argv[2], encoding='utf-8') as f:
+    code = f.read()
+parse_start = time.perf_counter()
+tree, mode = parse_tree(code)
+done = time.perf_counter()
+print(json.dumps({'loaded': loaded, 'import': imported - start, 'load': ready - imported,
+                  'parse': done - parse_start, 'mode': mode}))
+"""
+
+def measure(kind, script, cache_dir):
+    """Mide un primer parseo en un proceso nuevo"""
+    env = dict(os.environ, DSL_CACHE_DIR=cache_dir, PYTHONPATH=ROOT)
+    output = subprocess.run([sys.executable, "-c", CHILD, kind, script], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    """Genera la caché con el corpus y compara primer parseo frío vs caliente"""
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    script = os.path.abspath(args[0] if args else os.path.join(ROOT, "ejemplos.dsl"))
+    corpus = os.path.abspath(get_option("corpus", os.path.join(ROOT, "paridad")))
+    runs = int(get_option("runs", "15"))
+    
+    with tempfile.TemporaryDirectory() as cold_dir, tempfile.TemporaryDirectory() as warm_dir:
+        env = dict(os.environ, DSL_CACHE_DIR=warm_dir)
+        subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), "--warm-parser", corpus],
+                       cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        
+        results = {"frío": [], "caliente": []}
+        for _ in range(runs):
+            # Alternar para que el ruido de la máquina afecte a ambos por igual
+            results["frío"].append(measure("cold", script, cold_dir))
+            results["caliente"].append(measure("warm", script, warm_dir))
+    
+    print(f"📂 Script: {os.path.relpath(script, ROOT)}   corpus: {os.path.relpath(corpus, ROOT)}   ({runs} procesos c/u)")
+    print("-" * 72)
+    print(f"{'parser':<10}{'carga caché':>14}{'primer parseo':>16}{'total':>12}   modo")
+    for name, samples in results.items():
+        if name == "caliente" and not all(sample["loaded"] for sample in samples):
+            print("❌ La caché no se cargó en algún proceso")
+            sys.exit(1)
+        load = statistics.median(sample["load"] for sample in samples) * 1000
+        parse = statistics.median(sample["parse"] for sample in samples) * 1000
+        total = statistics.median(sample["load"] + sample["parse"] for sample in samples) * 1000
+        print(f"{name:<10}{load:>11.1f} ms{parse:>13.1f} ms{total:>9.1f} ms   {samples[0]['mode']}")
+    print("-" * 72)
+    print("Medianas. 'total' = carga de la caché + primer parseo.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark: matrices dispersas (CSR) contra densas según la densidad.
+
+Para cada densidad de la grilla genera una matriz n x n con esa fracción de
+valores distintos de 0 y la usa como DSLMatrix y como DSLSparseMatrix en
+matmul (disperso por denso y disperso por disperso), transpose y matsum,
+con el backend python y, si NumPy está instalado, con numpy. Mide el tiempo
+y la memoria máxima reservada durante la operación (tracemalloc), muestra
+cuánto ocupa cada representación y verifica que los resultados coincidan
+dentro de --tol. Uso:
+
+    python benchmarks/bench_sparse.py [--n=300] [--densities=0.001,0.01,0.05,0.2] [--tol=1e-12]
+"""
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from DSLRuntime import DSLRuntime
+from DSLVector import DSLMatrix, DSLSparseMatrix, DSLVector
+from main import get_option
+
+def measure(function):
+    """(segundos, bytes máximos reservados, resultado) de una ejecución"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+def random_sparse(rng, n, density):
+    """Matriz n x n densa con density * n * n valores distintos de 0 en
+    posiciones al azar"""
+    data = DSLVector([0.0]) * (n * n)
+    for position in rng.sample(range(n * n), max(1, round(density * n * n))):
+        data[position] = rng.uniform(-1, 1)
+    return DSLMatrix(data, n, n)
+
+def storage(matrix):
+    """Bytes de los arrays que guardan una matriz"""
+    if isinstance(matrix, DSLSparseMatrix):
+        return sum(part.itemsize * len(part) for part in (matrix.values, matrix.indices, matrix.indptr))
+    return matrix.data.itemsize * len(matrix.data)
+
+def dense_values(matrix):
+    """Valores de una matriz fila por fila, sea densa o dispersa"""
+    return matrix.to_dense().data if isinstance(matrix, DSLSparseMatrix) else matrix.data
+
+def operations(runtime, dense, sparse, other):
+    """(nombre, cálculo denso, cálculo disperso) de cada operación medida"""
+    return [
+        ("matmul(S, D)", lambda: runtime._matrix_multiply(dense, other),
+         lambda: runtime._matrix_multiply(sparse, other)),
+        ("matmul(S, S)", lambda: runtime._matrix_multiply(dense, dense),
+         lambda: runtime._matrix_multiply(sparse, sparse)),
+        ("transpose(S)", lambda: runtime._transpose(dense), lambda: runtime._transpose(sparse)),
+        ("matsum(S, S)", lambda: runtime._matrix_add(dense, dense), lambda: runtime._matrix_add(sparse, sparse)),
+    ]
+
+def main():
+    """Imprime la tabla de tiempos y memoria; retorna False si algún
+    resultado disperso no coincide con el denso"""
+    n = int(get_option("n", "300"))
+    densities = [float(density) for density in get_option("densities", "0.001,0.01,0.05,0.2").split(",")]
+    tolerance = float(get_option("tol", "1e-12"))
+    rng = random.Random(0)
+    backends = ["python"]
+    try:
+        DSLRuntime().set_backend("numpy")
+        backends.append("numpy")
+    except ValueError as e:
+        print(f"⚠️  {e}: solo se mide el backend python")
+    
+    ok = True
+    other = DSLMatrix(DSLVector(rng.uniform(-1, 1) for _ in range(n * n)), n, n)
+    print(f"Matrices de {n}x{n}")
+    print(f"{'operación':<30}{'densa':>20}{'dispersa':>20}{'aceleración':>13}{'memoria':>10}")
+    print("-" * 96)
+    for density in densities:
+        dense = random_sparse(rng, n, density)
+        sparse = DSLSparseMatrix.from_dense(dense)
+        print(f"densidad {density:g}: {sparse.nnz} valores, "
+              f"{storage(dense) / 2**10:.1f} KiB densa, {storage(sparse) / 2**10:.1f} KiB dispersa")
+        for backend in backends:
+            runtime = DSLRuntime()
+            runtime.set_backend(backend)
+            for label, dense_operation, sparse_operation in operations(runtime, dense, sparse, other):
+                dense_time, dense_peak, expected = measure(dense_operation)
+                sparse_time, sparse_peak, result = measure(sparse_operation)
+                expected, result = dense_values(expected), dense_values(result)
+                scale = max(map(abs, expected), default=0.0) or 1.0
+                same = (len(expected) == len(result)
+                        and max((abs(p - q) for p, q in zip(expected, result)), default=0.0) / scale <= tolerance)
+                ok = ok and same
+                print(f"{f'  {label} [{backend}]':<30}"
+                      f"{dense_time:>9.4f} s{dense_peak / 2**20:>7.1f} MiB"
+                      f"{sparse_time:>9.4f} s{sparse_peak / 2**20:>7.1f} MiB"
+                      f"{dense_time / sparse_time:>12.1f}x{dense_peak / max(sparse_peak, 1):>9.1f}x "
+                      f"{'✅' if same else '❌'}")
+    print("-" * 96)
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
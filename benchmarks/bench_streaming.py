@@ -0,0 +1,88 @@
+"""Benchmark: memoria pico y latencia de la primera salida con y sin --stream.
+
+Genera scripts de distintos largos (asignaciones, un while corto y datos en
+línea, repetidos) y ejecuta cada uno en un proceso nuevo de main.py, con el
+modo normal (parsea todo antes de ejecutar) y con --stream. Uso:
+
+    python benchmarks/bench_streaming.py [--statements=40000] [--engine=closure]
+"""
+import os
+import sys
+import json
+import subprocess
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import get_option
+
+MAIN = os.path.join(ROOT, "main.py")
+
+# Proceso intermedio: ejecuta main.py, anota cuándo aparece la primera
+# asignación y lee la memoria pico del hijo (ru_maxrss, en KiB en Linux)
+CHILD = """
+import sys, time, json, resource, subprocess
+start = time.perf_counter()
+process = subprocess.Popen(sys.argv[1:], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+first = None
+for line in process.stdout:
+    if first is None and line.startswith("📝"):
+        first = time.perf_counter() - start
+process.wait()
+total = time.perf_counter() - start
+print(json.dumps({'first': first, 'total': total, 'ok': process.returncode == 0,
+                  'rss_kib': resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss}))
+"""
+
+BLOCK = """a = {i};
+b = a * 2 + 1;
+i = 0;
+while i < 3 do
+  b = b + i;
+  i = i + 1;
+done
+datos = [[1, 2, 3], [4, 5, 6]];
+t = transpose(datos);
+"""
+
+def write_script(path, statements):
+    """Escribe un script de aproximadamente statements statements"""
+    per_block = 6
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(statements // per_block):
+            f.write(BLOCK.format(i=i))
+
+def measure(script, engine, stream):
+    """Ejecuta main.py en un proceso nuevo y retorna sus mediciones"""
+    command = [sys.executable, MAIN, script, f"--engine={engine}"] + (["--stream"] if stream else [])
+    output = subprocess.run([sys.executable, "-c", CHILD] + command, cwd=ROOT,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    """Compara modo normal y --stream para scripts de largo creciente"""
+    statements = int(get_option("statements", "40000"))
+    engine = get_option("engine", "closure")
+    sizes = [statements // 8, statements // 4, statements // 2, statements]
+    
+    print(f"📂 Scripts generados, motor {engine}")
+    print("-" * 78)
+    print(f"{'statements':>10}{'MiB':>7}   {'modo':<8}{'memoria pico':>14}{'primera salida':>17}{'total':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for size in sizes:
+            script = os.path.join(work_dir, f"script_{size}.dsl")
+            write_script(script, size)
+            megabytes = os.path.getsize(script) / (1024 * 1024)
+            for stream in (False, True):
+                result = measure(script, engine, stream)
+                if not result["ok"]:
+                    print(f"❌ Falló la ejecución de {script}")
+                    sys.exit(1)
+                mode = "stream" if stream else "normal"
+                print(f"{size:>10}{megabytes:>7.1f}   {mode:<8}{result['rss_kib'] / 1024:>11.1f} MiB"
+                      f"{result['first'] * 1000:>14.0f} ms{result['total']:>9.1f} s")
+    print("-" * 78)
+
+if __name__ == "__main__":
+    main()
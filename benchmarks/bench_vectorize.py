@@ -0,0 +1,77 @@
+"""Benchmark: while contados calculados por vectores.
+
+Genera el bucle de ejemplos.dsl (seno y coseno escalados de un ángulo que
+avanza un paso fijo) con loops vueltas y lo ejecuta con cada motor después
+del optimizador, con el bucle vectorizado y con el while normal. Uso:
+
+    python benchmarks/bench_vectorize.py [--loops=10000] [--runs=3]
+"""
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import DSLAst as ast
+from DSLFrontend import parse_tree, build_program
+from DSLVectorizer import vector_backend
+from main import DSLInterpreter, get_option
+
+def make_script(loops):
+    """El bucle de ejemplos.dsl con loops vueltas"""
+    return (f"x = [];\nseno = [];\ncoseno = [];\ni = 0;\n"
+            f"while i < {loops} do\n"
+            f"  rad = (i * 3.14159) / 180;\n"
+            f"  s = sin(rad);\n"
+            f"  c = cos(rad);\n"
+            f"  x = x + [i];\n"
+            f"  seno = seno + [s * 10 + 10];\n"
+            f"  coseno = coseno + [c * 10 + 10];\n"
+            f"  i = i + 1;\n"
+            f"done\n")
+
+def scalar_loops(program):
+    """El mismo programa con los while contados sin vectorizar"""
+    return ast.Program([statement.loop if isinstance(statement, ast.VectorLoop) else statement
+                        for statement in program.body], program.line)
+
+def run(engine, tree, vectorize):
+    """Optimiza y ejecuta el árbol con un intérprete nuevo; retorna (segundos, salida)"""
+    interpreter = DSLInterpreter(engine=engine, use_cache=False)
+    program = interpreter.optimize_program(build_program(tree))
+    if not vectorize:
+        program = scalar_loops(program)
+    output = io.StringIO()
+    start = time.perf_counter()
+    with redirect_stdout(output):
+        interpreter.engine.execute(program)
+    return time.perf_counter() - start, output.getvalue()
+
+def best_time(engine, tree, vectorize, runs):
+    """Mejor tiempo de varias ejecuciones, en segundos, y la salida"""
+    samples = [run(engine, tree, vectorize) for _ in range(runs)]
+    return min(elapsed for elapsed, _ in samples), samples[0][1]
+
+def main():
+    """Compara cada motor con el bucle vectorizado y con el while normal"""
+    loops = int(get_option("loops", "10000"))
+    runs = int(get_option("runs", "3"))
+    tree, _ = parse_tree(make_script(loops))
+    
+    print(f"📂 Bucle de ejemplos.dsl con {loops} vueltas, vectores con {vector_backend('auto', loops).name} (mejor de {runs})")
+    print("-" * 60)
+    print(f"{'motor':<10}{'while normal':>16}{'vectorizado':>16}{'mejora':>10}")
+    for engine in ("ast", "closure", "vm", "python"):
+        plain, plain_output = best_time(engine, tree, False, runs)
+        vectorized, vector_output = best_time(engine, tree, True, runs)
+        if plain_output != vector_output:
+            print(f"❌ El motor {engine} informa otra cosa con el bucle vectorizado")
+            sys.exit(1)
+        print(f"{engine:<10}{plain * 1000:>13.1f} ms{vectorized * 1000:>13.1f} ms{plain / vectorized:>9.1f}x")
+    print("-" * 60)
+
+if __name__ == "__main__":
+    main()
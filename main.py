@@ -1,53 +1,132 @@
 import sys
-import traceback
-from antlr4 import *
-from antlr4.error.ErrorListener import ErrorListener
-from DeepLearningDSLLexer import DeepLearningDSLLexer
-from DeepLearningDSLParser import DeepLearningDSLParser
-from DSLInterpreterVisitor import DSLInterpreterVisitor
+import os
+from DSLRuntime import DSLRuntime
+from DSLBudget import DEFAULT_MAX_OPERATIONS
+from DSLArtifact import ARTIFACT_EXTENSION, write_artifact, read_artifact
 
-class DSLErrorListener(ErrorListener):
-    """Maneja errores de parsing personalizado"""
-    
-    def __init__(self):
-        super().__init__()
-        self.errors = []
-    
-    def syntaxError(self, recognizer, offendingSymbol, line, column, msg, e):
-        error_msg = f"Error de sintaxis en línea {line}, columna {column}: {msg}"
-        self.errors.append(error_msg)
-        print(f"❌ {error_msg}")
+# Los módulos pesados se importan recién cuando se usan: antlr4, el lexer, el
+# parser y los visitors al parsear (ver DSLFrontend.py), cada motor al
+# elegirlo y las herramientas (paridad, bytecode, traducción) al pedirlas.
+# Un artefacto .dslc o un script vacío no cargan ANTLR.
 
 class DSLInterpreter:
     """Clase principal del intérprete"""
     
-    def __init__(self):
-        self.visitor = DSLInterpreterVisitor()
+    PARSE_MODES = ("auto", "sll", "ll")
+    # "fast" es el lexer escrito a mano (DSLFastLexer); "antlr" el generado
+    LEXERS = ("fast", "antlr")
+    # Motores de ejecución; "visitor" recorre directamente el árbol de ANTLR
+    # y sirve de referencia para los demás
+    ENGINES = {
+        "closure": ("DSLClosureCompiler", "DSLClosureCompiler"),
+        "vm": ("DSLBytecode", "DSLVirtualMachine"),
+        "python": ("DSLTranspiler", "DSLPythonEngine"),
+        "ast": ("DSLAstInterpreter", "DSLAstInterpreter"),
+        "visitor": None,
+    }
+    
+    def __init__(self, parse_mode="auto", engine="closure", use_cache=True, lexer="fast", optimize=True):
+        if parse_mode not in self.PARSE_MODES:
+            raise ValueError(f"Modo de parsing no válido: {parse_mode}")
+        if lexer not in self.LEXERS:
+            raise ValueError(f"Lexer no válido: {lexer}")
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor de ejecución no válido: {engine}")
+        if engine == "visitor":
+            from DSLInterpreterVisitor import DSLInterpreterVisitor
+            self.runtime = DSLInterpreterVisitor()
+        else:
+            self.runtime = DSLRuntime()
+        self.engine_name = engine
+        self.engine = self.load_engine(engine)(self.runtime) if self.ENGINES[engine] else None
+        if engine == "python" and use_cache:
+            from DSLTranspiler import DSLCodeCache
+            if optimize:
+                from DSLOptimizer import OPTIMIZER_VERSION
+                self.engine.cache = DSLCodeCache(variant=f"opt{OPTIMIZER_VERSION}")
+            else:
+                self.engine.cache = DSLCodeCache()
+        self.use_cache = use_cache
+        self.optimize = optimize
         self.history = []
+        self.parse_mode = parse_mode
+        self.lexer = lexer
+        self.last_parse_mode = None
+        # Operaciones binarias del último programa optimizado y cuántas se especializaron
+        self.last_operations = None
+        self.last_specialized = None
+    
+    @classmethod
+    def load_engine(cls, engine):
+        """Importa el módulo de un motor y retorna su clase"""
+        module_name, class_name = cls.ENGINES[engine]
+        return getattr(__import__(module_name), class_name)
+    
+    def parse_code(self, code):
+        """Parsea código DSL en dos etapas (SLL y, si falla, LL completo).
+        
+        Retorna el árbol del programa o None si hay errores de sintaxis.
+        El modo que finalmente se usó queda en self.last_parse_mode.
+        """
+        from DSLFrontend import parse_tree, load_dfa_cache
+        if self.use_cache:
+            load_dfa_cache()
+        tree, self.last_parse_mode = parse_tree(code, self.parse_mode, self.lexer)
+        return tree
+    
+    def build_program(self, code):
+        """Parsea código DSL y lo reduce al AST compacto, optimizado salvo con
+        --no-opt (None si hay errores)"""
+        tree = self.parse_code(code)
+        if tree is None:
+            return None
+        from DSLFrontend import build_program
+        return self.optimize_program(build_program(tree))
+    
+    def optimize_program(self, program, variables=None):
+        """Aplica el optimizador (plegado, invariantes, tipos) si está activo.
+        Con variables (los valores actuales del runtime) los tipos de entrada
+        se conocen: solo para un programa que se ejecuta ya y no va a caché."""
+        if not self.optimize:
+            return program
+        from DSLOptimizer import optimize_program
+        program, optimizer = optimize_program(program, variables)
+        self.last_operations, self.last_specialized = optimizer.operations, optimizer.specialized
+        return program
     
     def execute_code(self, code):
         """Ejecuta código DSL y retorna el resultado"""
         try:
-            # Crear lexer y parser
-            input_stream = InputStream(code)
-            lexer = DeepLearningDSLLexer(input_stream)
-            stream = CommonTokenStream(lexer)
-            parser = DeepLearningDSLParser(stream)
-            
-            # Configurar manejo de errores
-            error_listener = DSLErrorListener()
-            parser.removeErrorListeners()
-            parser.addErrorListener(error_listener)
+            if not code.strip():
+                # Nada que ejecutar: ni siquiera hace falta cargar el parser
+                return True
+            # Cada script o línea del REPL empieza con el presupuesto entero
+            self.runtime.budget.reset()
             
-            # Parsear el código
-            tree = parser.program()
+            # El motor python puede tener el programa ya compilado en caché
+            cache = getattr(self.engine, "cache", None)
+            code_object = cache.get(code) if cache else None
             
-            # Si hay errores de parsing, no continuar
-            if error_listener.errors:
-                return False
-            
-            # Visitar el árbol y ejecutar
-            result = self.visitor.visit(tree)
+            if code_object is not None:
+                self.last_parse_mode = "caché"
+                result = self.engine.run(code_object)
+            elif self.engine is None:
+                # Motor de referencia: visitar el árbol y ejecutar
+                tree = self.parse_code(code)
+                if tree is None:
+                    return False
+                result = self.runtime.visit(tree)
+            else:
+                # Reducir el árbol al AST compacto y ejecutarlo
+                program = self.build_program(code)
+                if program is None:
+                    return False
+                if cache:
+                    code_object = self.engine.compile(program)
+                    cache.put(code, code_object)
+                    result = self.engine.run(code_object)
+                else:
+                    result = self.engine.execute(program)
             
             # Guardar en historial
             self.history.append(code.strip())
@@ -57,18 +136,126 @@ class DSLInterpreter:
         except Exception as e:
             print(f"❌ Error de ejecución: {str(e)}")
             if "--debug" in sys.argv:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    def execute_stream(self, reader, chunk_size=None):
+        """Ejecuta un script leído de un archivo abierto, un statement de nivel
+        superior a la vez: cada uno se parsea, se ejecuta y se descarta antes de
+        leer el siguiente. Se detiene en el primer error (los statements
+        anteriores ya se ejecutaron)."""
+        from DSLFrontend import stream_trees, build_program, load_dfa_cache
+        if self.use_cache:
+            load_dfa_cache()
+        try:
+            self.last_parse_mode = None
+            # El presupuesto es del script entero, no de cada statement
+            self.runtime.budget.reset()
+            operations = specialized = 0
+            for tree, mode in stream_trees(reader, self.parse_mode, chunk_size):
+                # El modo informado es el más costoso que hizo falta
+                if self.last_parse_mode != "LL":
+                    self.last_parse_mode = mode
+                if tree is None:
+                    return False
+                if self.engine is None:
+                    self.runtime.visit(tree)
+                else:
+                    program = self.optimize_program(build_program(tree), self.runtime.variables)
+                    if self.optimize:
+                        operations += self.last_operations
+                        specialized += self.last_specialized
+                        self.last_operations, self.last_specialized = operations, specialized
+                    self.engine.execute(program)
+            return True
+        except Exception as e:
+            print(f"❌ Error de ejecución: {str(e)}")
+            if "--debug" in sys.argv:
+                import traceback
+                traceback.print_exc()
+            return False
+    
+    def execute_program(self, program):
+        """Ejecuta un ast.Program ya parseado (por ejemplo de un artefacto .dslc)"""
+        if self.engine is None:
+            print("❌ El motor visitor necesita el código fuente; usa otro motor para .dslc")
+            return False
+        try:
+            self.last_parse_mode = "artefacto"
+            self.runtime.budget.reset()
+            self.engine.execute(program)
+            return True
+        except Exception as e:
+            print(f"❌ Error de ejecución: {str(e)}")
+            if "--debug" in sys.argv:
+                import traceback
                 traceback.print_exc()
             return False
     
+    def compile_code(self, code, output):
+        """Parsea código DSL y escribe el programa resultante en un artefacto .dslc"""
+        program = self.build_program(code)
+        if program is None:
+            return False
+        write_artifact(program, output)
+        print(f"📦 Artefacto escrito en: {output}")
+        return True
+    
+    def disassemble_code(self, code):
+        """Compila código DSL a bytecode y muestra su desensamblado"""
+        program = self.build_program(code)
+        if program is None:
+            return False
+        from DSLBytecode import DSLBytecodeCompiler, disassemble
+        print(disassemble(DSLBytecodeCompiler().compile(program)))
+        return True
+    
+    def dump_optimized(self, code):
+        """Muestra el programa después del optimizador y qué se plegó"""
+        tree = self.parse_code(code)
+        if tree is None:
+            return False
+        from DSLFrontend import build_program
+        from DSLOptimizer import optimize_program, format_program
+        program, optimizer = optimize_program(build_program(tree))
+        print(format_program(program))
+        print("-" * 60)
+        print(f"🔧 {optimizer.folded} expresiones plegadas, {optimizer.propagated} usos de variables propagados, "
+              f"{optimizer.hoisted} expresiones invariantes en bucles, "
+              f"{optimizer.accumulators} acumulaciones en su lugar, {optimizer.vectorized} bucles vectorizados")
+        print(f"⚡ {optimizer.specialized} de {optimizer.operations} operaciones especializadas por tipo")
+        return True
+    
+    def print_stats(self):
+        """Muestra el modo de parsing, las operaciones especializadas y las
+        factorizaciones reutilizadas (--stats)"""
+        if self.last_parse_mode:
+            print(f"🔍 Modo de parsing: {self.last_parse_mode}")
+        if self.last_operations is not None:
+            print(f"⚡ Operaciones especializadas: {self.last_specialized} de {self.last_operations}")
+        factorizations = self.runtime.factorizations
+        if factorizations is not None and (factorizations.hits or factorizations.misses):
+            print(f"🧮 Factorizaciones LU: {factorizations.misses} calculadas, {factorizations.hits} reutilizadas")
+    
+    def transpile_code(self, code):
+        """Traduce código DSL a Python y muestra el módulo generado"""
+        program = self.build_program(code)
+        if program is None:
+            return False
+        from DSLTranspiler import DSLTranspiler
+        print(DSLTranspiler().translate(program))
+        return True
+    
     def show_variables(self):
         """Muestra todas las variables definidas"""
-        if not self.visitor.variables:
+        if not self.runtime.variables:
             print("📝 No hay variables definidas")
             return
         
         print("\n📝 Variables definidas:")
         print("-" * 50)
-        for name, value in self.visitor.variables.items():
+        for name, value in self.runtime.variables.items():
             value_str = str(value)
             if len(value_str) > 100:
                 value_str = value_str[:97] + "..."
@@ -99,6 +286,9 @@ MATRICES:
   transpuesta = transpose(matriz);
   inversa = inverse(matriz);
   producto = matmul(matriz, matriz);
+  determinante = det(matriz);
+  x = solve(matriz, [1, 2]);
+  d = density(matriz);
 
 OPERACIONES MATEMÁTICAS:
   resultado = x + 5 * 2;
@@ -153,7 +343,7 @@ EJEMPLOS:
     
     def clear_session(self):
         """Limpia variables y historial"""
-        self.visitor.variables.clear()
+        self.runtime.variables.clear()
         self.history.clear()
         print("🧹 Sesión limpiada - variables e historial eliminados")
     
@@ -210,32 +400,491 @@ EJEMPLOS:
             except Exception as e:
                 print(f"❌ Error inesperado: {str(e)}")
                 if "--debug" in sys.argv:
+                    import traceback
                     traceback.print_exc()
 
+def get_option(name, default=None):
+    """Obtiene el valor de una opción de la forma --nombre=valor"""
+    prefix = f"--{name}="
+    for arg in sys.argv[1:]:
+        if arg.startswith(prefix):
+            return arg[len(prefix):]
+    return default
+
+PARITY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "paridad")
+# Presupuesto de operaciones de --parity: alcanza para los scripts de paridad
+# y hace que los que lo agotan fallen rápido y en el mismo punto
+PARITY_MAX_OPERATIONS = 100_000
+# Diferencia relativa (y absoluta cerca de 0) admitida entre el visitor y la
+# referencia sin fusionar: reasociar un producto de matrices cambia el orden
+# de las sumas y con eso los últimos bits
+PARITY_TOLERANCE = 1e-9
+
+def get_budget_options():
+    """Límites de --max-ops, --timeout y --max-memory (None: sin límite).
+    --max-ops=0 quita el límite de operaciones."""
+    max_operations = int(get_option("max-ops", DEFAULT_MAX_OPERATIONS)) or None
+    timeout = get_option("timeout")
+    max_memory = get_option("max-memory")
+    return (max_operations, float(timeout) if timeout is not None else None,
+            float(max_memory) if max_memory is not None else None)
+
+def typed_variables(runtime):
+    """Variables del runtime como nombre -> (tipo, valor): una lista y un
+    DSLVector con los mismos números son iguales, pero los motores deben
+    coincidir también en la representación"""
+    return {name: (type(value).__name__, value) for name, value in runtime.variables.items()}
+
+def close_values(expected, actual, tolerance):
+    """True si dos valores del DSL son iguales salvo sus números, que pueden
+    diferir en tolerance (relativa, o absoluta cerca de 0)"""
+    import math
+    from DSLVector import DSLVector, DSLMatrix, DSLSparseMatrix
+    if isinstance(expected, float) and isinstance(actual, float):
+        return (math.isclose(expected, actual, rel_tol=tolerance, abs_tol=tolerance)
+                or expected != expected and actual != actual)
+    if type(expected) is not type(actual):
+        return False
+    if isinstance(expected, DSLSparseMatrix):
+        expected, actual = expected.to_dense(), actual.to_dense()
+    if isinstance(expected, DSLMatrix):
+        return ((expected.rows, expected.cols) == (actual.rows, actual.cols)
+                and close_values(expected.data, actual.data, tolerance))
+    if isinstance(expected, dict):
+        return expected.keys() == actual.keys() and all(
+            close_values(expected[key], actual[key], tolerance) for key in expected)
+    if isinstance(expected, (list, tuple, DSLVector)):
+        return len(expected) == len(actual) and all(
+            close_values(p, q, tolerance) for p, q in zip(expected, actual))
+    return expected == actual
+
+def close_text(expected, actual, tolerance):
+    """True si dos líneas de salida son iguales salvo sus números, que pueden
+    diferir en tolerance"""
+    import re
+    number = r'(-?\d+(?:\.\d+)?(?:e[-+]?\d+)?)'
+    expected_parts, actual_parts = re.split(number, expected), re.split(number, actual)
+    if len(expected_parts) != len(actual_parts):
+        return False
+    return all(p == q if index % 2 == 0 else close_values(float(p), float(q), tolerance)
+               for index, (p, q) in enumerate(zip(expected_parts, actual_parts)))
+
+def parity_differences(result, reference, name, same_line, same_variable):
+    """Diferencias de un resultado de run_parity (éxito, salida, variables)
+    con la referencia name, como líneas para mostrar; vacía si coinciden"""
+    differences = []
+    if result[0] != reference[0]:
+        differences.append(f"éxito: {result[0]} ({name}: {reference[0]})")
+    expected_lines = reference[1].splitlines()
+    actual_lines = result[1].splitlines()
+    for line_no, (expected, actual) in enumerate(zip(expected_lines, actual_lines), 1):
+        if not same_line(expected, actual):
+            differences.append(f"salida línea {line_no}: {actual!r} ({name}: {expected!r})")
+            break
+    else:
+        if len(expected_lines) != len(actual_lines):
+            differences.append(f"salida: {len(actual_lines)} líneas ({name}: {len(expected_lines)})")
+    for variable in sorted(set(result[2]) | set(reference[2])):
+        if variable not in result[2] or variable not in reference[2] \
+                or not same_variable(reference[2][variable], result[2][variable]):
+            differences.append(f"variable {variable}: {result[2].get(variable)!r} "
+                               f"({name}: {reference[2].get(variable)!r})")
+    return differences
+
+def run_parity(filenames, parse_mode="auto", backend="auto"):
+    """Ejecuta cada script con todos los motores y compara salida y variables
+    contra el motor de referencia (visitor). Retorna True si todos coinciden.
+    Todos usan el mismo backend de matrices."""
+    import io
+    import glob
+    import random
+    import operator
+    from contextlib import redirect_stdout
+    from DSLArtifact import dump_program, load_program
+    
+    if not filenames:
+        filenames = sorted(glob.glob(os.path.join(PARITY_DIR, "*.dsl")))
+        filenames.append(os.path.join(os.path.dirname(PARITY_DIR), "ejemplos.dsl"))
+    
+    all_match = True
+    for filename in filenames:
+        with open(filename, 'r', encoding='utf-8') as f:
+            code = f.read()
+        
+        results = {}
+        for engine in DSLInterpreter.ENGINES:
+            # Las operaciones de ML usan números aleatorios
+            random.seed(0)
+            interpreter = DSLInterpreter(parse_mode=parse_mode, engine=engine, use_cache=False)
+            interpreter.runtime.budget.configure(PARITY_MAX_OPERATIONS)
+            interpreter.runtime.set_backend(backend)
+            output = io.StringIO()
+            with redirect_stdout(output):
+                success = interpreter.execute_code(code)
+            results[engine] = (success, output.getvalue(), typed_variables(interpreter.runtime))
+        
+        # El mismo programa guardado y leído como artefacto .dslc
+        random.seed(0)
+        interpreter = DSLInterpreter(parse_mode=parse_mode)
+        interpreter.runtime.budget.configure(PARITY_MAX_OPERATIONS)
+        interpreter.runtime.set_backend(backend)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            program = interpreter.build_program(code)
+            success = program is not None and interpreter.execute_program(load_program(dump_program(program)))
+        results["dslc"] = (success, output.getvalue(), typed_variables(interpreter.runtime))
+        
+        # Modo streaming, con bloques de lectura diminutos para cortar tokens
+        random.seed(0)
+        interpreter = DSLInterpreter(parse_mode=parse_mode, use_cache=False)
+        interpreter.runtime.budget.configure(PARITY_MAX_OPERATIONS)
+        interpreter.runtime.set_backend(backend)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            success = interpreter.execute_stream(io.StringIO(code), chunk_size=7)
+        results["stream"] = (success, output.getvalue(), typed_variables(interpreter.runtime))
+        
+        # Referencia sin fusionar: el visitor con las expresiones de matrices
+        # operación por operación. Todos los motores comparten el planificador
+        # de DSLMatrixGraph, así que sin ella un error al fusionar o reasociar
+        # no se notaría; los números se comparan dentro de PARITY_TOLERANCE
+        random.seed(0)
+        interpreter = DSLInterpreter(parse_mode=parse_mode, engine="visitor", use_cache=False)
+        interpreter.runtime.budget.configure(PARITY_MAX_OPERATIONS)
+        interpreter.runtime.set_backend(backend)
+        interpreter.runtime.fuse_matrices = False
+        output = io.StringIO()
+        with redirect_stdout(output):
+            success = interpreter.execute_code(code)
+        unfused = (success, output.getvalue(), typed_variables(interpreter.runtime))
+        
+        reference = results["visitor"]
+        print(f"📂 {filename}")
+        differences = parity_differences(reference, unfused, "sin fusionar",
+                                         lambda p, q: close_text(p, q, PARITY_TOLERANCE),
+                                         lambda p, q: close_values(p, q, PARITY_TOLERANCE))
+        if not differences:
+            print(f"  ✅ visitor: coincide con el visitor sin fusionar (tolerancia {PARITY_TOLERANCE:g})")
+        else:
+            all_match = False
+            print(f"  ❌ visitor: difiere del visitor sin fusionar (tolerancia {PARITY_TOLERANCE:g})")
+        for difference in differences:
+            print(f"     {difference}")
+        for engine, result in results.items():
+            if engine == "visitor":
+                continue
+            if result == reference:
+                print(f"  ✅ {engine}: coincide con visitor")
+                continue
+            
+            all_match = False
+            print(f"  ❌ {engine}: difiere de visitor")
+            for difference in parity_differences(result, reference, "visitor", str.__eq__, operator.eq):
+                print(f"     {difference}")
+    
+    return all_match
+
+def warm_parser(paths, parse_mode="auto"):
+    """Parsea un corpus de scripts y guarda los DFA de predicción del parser.
+    Retorna True si todos los scripts parsearon sin errores."""
+    import glob
+    from DSLFrontend import parse_tree
+    from DSLParserCache import save_parser_cache, count_dfa_states
+    
+    filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            filenames.extend(sorted(glob.glob(os.path.join(path, "**", "*.dsl"), recursive=True)))
+        else:
+            filenames.append(path)
+    if not filenames:
+        print("❌ No se encontraron scripts .dsl para calentar el parser")
+        return False
+    
+    all_parsed = True
+    for filename in filenames:
+        with open(filename, 'r', encoding='utf-8') as f:
+            tree, _ = parse_tree(f.read(), parse_mode)
+        if tree is None:
+            print(f"⚠️  {filename}: errores de sintaxis (sus estados igual se guardan)")
+            all_parsed = False
+    
+    path = save_parser_cache()
+    print(f"🔥 Parser calentado con {len(filenames)} scripts: {count_dfa_states()} estados DFA")
+    print(f"💾 Caché guardada en: {path}")
+    return all_parsed
+
+def _fuzz_lexer_source(rng):
+    """Genera un fragmento aleatorio de código DSL (válido o no) para el lexer"""
+    from DSLFastLexer import LITERAL_TYPES
+    letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+    digits = "0123456789"
+    generators = [
+        lambda: rng.choice(list(LITERAL_TYPES)),
+        lambda: rng.choice(letters) + "".join(rng.choice(letters + digits) for _ in range(rng.randint(0, 6))),
+        lambda: rng.choice(["if", "done", "not", "sin", "true"]) + rng.choice(["", "x", "_", "2"]),
+        lambda: ("-" if rng.random() < 0.3 else "") + "".join(rng.choice(digits) for _ in range(rng.randint(1, 4)))
+                + (("." + "".join(rng.choice(digits) for _ in range(rng.randint(0, 3)))) if rng.random() < 0.4 else ""),
+        lambda: '"' + "".join(rng.choice(letters + digits + " \n\t,;-") for _ in range(rng.randint(0, 8)))
+                + ('"' if rng.random() < 0.9 else ""),
+        lambda: "//" + "".join(rng.choice(letters + " ;/\"") for _ in range(rng.randint(0, 8)))
+                + rng.choice(["\n", "\r\n", ""]),
+        lambda: "".join(rng.choice(" \t\r\n") for _ in range(rng.randint(1, 3))),
+        lambda: rng.choice(["@", "#", "$", ".", "!", "?", "~", "'", "{", "}", ":", "|", "ñ", "é", "\f", "\v", "&"]),
+    ]
+    weights = [6, 6, 2, 6, 2, 1, 6, 1]
+    return "".join(rng.choices(generators, weights)[0]() for _ in range(rng.randint(1, 40)))
+
+def _lex_tokens(lexer):
+    """Lista de tokens (tipo, texto, inicio, fin, línea, columna, canal) y errores léxicos"""
+    import io
+    from contextlib import redirect_stdout
+    from DSLFrontend import DSLErrorListener
+    
+    listener = DSLErrorListener()
+    lexer.removeErrorListeners()
+    lexer.addErrorListener(listener)
+    tokens = []
+    with redirect_stdout(io.StringIO()):
+        while True:
+            token = lexer.nextToken()
+            tokens.append((token.type, token.text, token.start, token.stop,
+                           token.line, token.column, token.channel))
+            if token.type == -1:
+                break
+    return tokens, listener.errors
+
+def run_lexer_fuzz(filenames, cases=2000, seed=0):
+    """Test diferencial: compara los tokens de DSLFastLexer (con todo el código
+    y leyendo por bloques diminutos, como en --stream) y del lexer generado
+    sobre los scripts dados (o paridad/ y ejemplos.dsl) y un corpus aleatorio.
+    Retorna True si coinciden en todos los casos."""
+    import io
+    import glob
+    import random
+    from DSLFrontend import create_lexer
+    from DSLFastLexer import DSLFastLexer
+    
+    if not filenames:
+        filenames = sorted(glob.glob(os.path.join(PARITY_DIR, "*.dsl")))
+        filenames.append(os.path.join(os.path.dirname(PARITY_DIR), "ejemplos.dsl"))
+    sources = []
+    for filename in filenames:
+        with open(filename, 'r', encoding='utf-8') as f:
+            sources.append(f.read())
+    rng = random.Random(seed)
+    sources.extend(_fuzz_lexer_source(rng) for _ in range(cases))
+    
+    mismatches = 0
+    for source in sources:
+        reference = _lex_tokens(create_lexer(source, "antlr"))
+        fast = _lex_tokens(create_lexer(source, "fast"))
+        if fast == reference:
+            fast = _lex_tokens(DSLFastLexer("", io.StringIO(source), chunk_size=3))
+        if fast == reference:
+            continue
+        mismatches += 1
+        if mismatches <= 5:
+            print(f"❌ Difiere en: {source!r}")
+            for fast_token, antlr_token in zip(fast[0] + fast[1], reference[0] + reference[1]):
+                if fast_token != antlr_token:
+                    print(f"     rápido: {fast_token}")
+                    print(f"     antlr:  {antlr_token}")
+                    break
+    
+    print(f"🔤 Lexer rápido vs generado: {len(sources) - mismatches}/{len(sources)} casos coinciden "
+          f"({len(filenames)} scripts + {cases} aleatorios, semilla {seed})")
+    return mismatches == 0
+
+def _parse_import_times(stderr):
+    """Lee la salida de -X importtime: lista de (módulo, nivel, propio, acumulado) en µs"""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), level, int(self_us), int(cumulative_us)))
+    return entries
+
+def report_import_time(argv, top=10):
+    """Ejecuta main.py con los argumentos dados bajo -X importtime y muestra
+    un resumen de lo que cuesta importar cada parte. Retorna el código de salida."""
+    import subprocess
+    
+    def import_times(command):
+        completed = subprocess.run([sys.executable, "-X", "importtime"] + command,
+                                   capture_output=True, text=True, stdin=subprocess.DEVNULL)
+        return completed.returncode, _parse_import_times(completed.stderr)
+    
+    # Lo que importa el propio intérprete de Python al arrancar no cuenta
+    _, baseline = import_times(["-c", "pass"])
+    startup = {name for name, _, _, _ in baseline}
+    returncode, entries = import_times([os.path.abspath(__file__)] + argv)
+    entries = [entry for entry in entries if entry[0] not in startup]
+    
+    project_dir = os.path.dirname(os.path.abspath(__file__))
+    groups = {"proyecto": [0, 0], "antlr4": [0, 0], "stdlib y otros": [0, 0]}
+    for name, _, self_us, _ in entries:
+        package = name.split(".")[0]
+        if package == "antlr4":
+            group = "antlr4"
+        elif os.path.exists(os.path.join(project_dir, package + ".py")):
+            group = "proyecto"
+        else:
+            group = "stdlib y otros"
+        groups[group][0] += self_us
+        groups[group][1] += 1
+    
+    total_us = sum(self_us for _, _, self_us, _ in entries)
+    print(f"⏱️  Imports de main.py {' '.join(argv)}: {total_us / 1000:.1f} ms en {len(entries)} módulos")
+    print("-" * 60)
+    for group, (self_us, count) in groups.items():
+        print(f"  {group:<16}{self_us / 1000:>8.1f} ms  ({count} módulos)")
+    print("-" * 60)
+    print("Imports de nivel superior más costosos (acumulado):")
+    roots = sorted((entry for entry in entries if entry[1] == 0), key=lambda entry: -entry[3])
+    for name, _, _, cumulative_us in roots[:top]:
+        print(f"  {name:<32}{cumulative_us / 1000:>8.1f} ms")
+    return returncode
+
 def main():
     """Función principal"""
     print("🔧 Inicializando intérprete DSL Deep Learning...")
     
-    interpreter = DSLInterpreter()
+    if "--import-time" in sys.argv:
+        sys.exit(report_import_time([arg for arg in sys.argv[1:] if arg != "--import-time"]))
+    
+    parse_mode = get_option("parse-mode", "auto")
+    if parse_mode not in DSLInterpreter.PARSE_MODES:
+        print(f"❌ Modo de parsing no válido: '{parse_mode}' (opciones: auto, sll, ll)")
+        sys.exit(1)
+    
+    engine = get_option("engine", "closure")
+    if engine not in DSLInterpreter.ENGINES:
+        print(f"❌ Motor no válido: '{engine}' (opciones: {', '.join(DSLInterpreter.ENGINES)})")
+        sys.exit(1)
+    
+    lexer = get_option("lexer", "fast")
+    if lexer not in DSLInterpreter.LEXERS:
+        print(f"❌ Lexer no válido: '{lexer}' (opciones: {', '.join(DSLInterpreter.LEXERS)})")
+        sys.exit(1)
+    
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    output = None
+    if "-o" in args:
+        index = args.index("-o")
+        if index + 1 >= len(args):
+            print("❌ Falta el nombre del archivo de salida después de -o")
+            sys.exit(1)
+        output = args[index + 1]
+        del args[index:index + 2]
+    
+    backend = get_option("backend", "auto")
+    try:
+        # Verifica el backend (numpy debe estar instalado) antes de ejecutar
+        DSLRuntime().set_backend(backend)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    if "--parity" in sys.argv:
+        sys.exit(0 if run_parity(args, parse_mode, backend) else 1)
+    
+    if "--fuzz-lexer" in sys.argv:
+        cases = int(get_option("cases", "2000"))
+        seed = int(get_option("seed", "0"))
+        sys.exit(0 if run_lexer_fuzz(args, cases, seed) else 1)
+    
+    if "--warm-parser" in sys.argv:
+        sys.exit(0 if warm_parser(args or [PARITY_DIR], parse_mode) else 1)
+    
+    try:
+        budget = get_budget_options()
+    except ValueError:
+        print("❌ --max-ops, --timeout y --max-memory necesitan un número")
+        sys.exit(1)
+    
+    interpreter = DSLInterpreter(parse_mode=parse_mode, engine=engine,
+                                 use_cache="--no-cache" not in sys.argv, lexer=lexer,
+                                 optimize="--no-opt" not in sys.argv)
+    interpreter.runtime.budget.configure(*budget)
+    interpreter.runtime.set_backend(backend)
     
     # Si hay argumentos, ejecutar archivo
-    if len(sys.argv) > 1 and not sys.argv[1].startswith("--"):
-        filename = sys.argv[1]
+    if args:
+        filename = args[0]
         try:
+            if filename.endswith(ARTIFACT_EXTENSION):
+                # Programa precompilado: no se parsea ni se carga ANTLR
+                program = read_artifact(filename)
+                print(f"📂 Ejecutando artefacto: {filename}")
+                print("-" * 60)
+                success = interpreter.execute_program(program)
+                if not success:
+                    print("❌ Error al ejecutar archivo")
+                    sys.exit(1)
+                print("✅ Archivo ejecutado correctamente")
+                return
+            
+            if "--stream" in sys.argv:
+                # Parsear y ejecutar statement por statement mientras se lee
+                if lexer != "fast":
+                    print("❌ --stream necesita el lexer rápido (--lexer=fast)")
+                    sys.exit(1)
+                print(f"📂 Ejecutando archivo (streaming): {filename}")
+                print("-" * 60)
+                with open(filename, 'r', encoding='utf-8') as f:
+                    success = interpreter.execute_stream(f)
+                if "--stats" in sys.argv:
+                    interpreter.print_stats()
+                if not success:
+                    print("❌ Error al ejecutar archivo")
+                    sys.exit(1)
+                print("✅ Archivo ejecutado correctamente")
+                return
+            
             with open(filename, 'r', encoding='utf-8') as f:
                 code = f.read()
             
+            if "--compile" in sys.argv:
+                # Solo parsear y guardar el programa como artefacto .dslc
+                output = output or os.path.splitext(filename)[0] + ARTIFACT_EXTENSION
+                print(f"📂 Compilando: {filename}")
+                sys.exit(0 if interpreter.compile_code(code, output) else 1)
+            
+            if "--dis" in sys.argv:
+                # Solo mostrar el bytecode, sin ejecutar
+                print(f"📂 Bytecode de: {filename}")
+                print("-" * 60)
+                sys.exit(0 if interpreter.disassemble_code(code) else 1)
+            
+            if "--dump-opt" in sys.argv:
+                # Solo mostrar el programa optimizado, sin ejecutar
+                print(f"📂 Programa optimizado: {filename}")
+                print("-" * 60)
+                sys.exit(0 if interpreter.dump_optimized(code) else 1)
+            
+            if "--emit-python" in sys.argv:
+                # Solo mostrar el módulo Python generado, sin ejecutar
+                print(f"📂 Python generado para: {filename}")
+                print("-" * 60)
+                sys.exit(0 if interpreter.transpile_code(code) else 1)
+            
             print(f"📂 Ejecutando archivo: {filename}")
             print("-" * 60)
             
             success = interpreter.execute_code(code)
             
+            if "--stats" in sys.argv:
+                interpreter.print_stats()
+            
             if success:
                 print("✅ Archivo ejecutado correctamente")
             else:
                 print("❌ Error al ejecutar archivo")
                 sys.exit(1)
-                
+        
         except FileNotFoundError:
             print(f"❌ Error: No se encontró el archivo '{filename}'")
             sys.exit(1)